@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+atomic_write.py — 品質スクリプト共通の書き戻しレイヤー.
+
+CONTEXT.json 等の JSON 書き戻しを以下の方針で一元化する:
+- 直列化済みバイト列をディスク上の内容と比較し、変更がなければ書き込まない
+- 実書き込みは同一ディレクトリの一時ファイル → os.replace によるアトミックリネーム
+- 一時ファイルは1つずつ書き込み・fsync・close し、全件そろってからリネーム
+  (同時に開くのは1ファイルのみ)。ディレクトリの fsync はリネーム後にまとめて行う
+- 追記専用ファイル (JSONL アーカイブ等) への追記も同じバッチで扱い、
+  置換より先に永続化する (アーカイブ → 本体切り詰めの順序を保証)
+
+Ctrl-C 等で中断された場合でも、対象ファイルは「旧内容」か「新内容」の
+どちらかになり、書きかけの JSON が残ることはない。
+
+Usage:
+    from atomic_write import WriteBatch, write_json_atomic
+
+    with WriteBatch() as batch:          # 正常終了時に commit, 例外時に abort
+        batch.stage_json(path, data)
+
+    write_json_atomic(path, data)        # 単発書き込み
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+import json_codec
+
+TEMP_PREFIX = ".tmp-"
+
+# mkstemp は 0600 で作成するため、新規ファイルには umask 準拠のモードを付与
+# (umask は初回の新規ファイル作成時に取得。import 時に umask を変更しない)
+_default_file_mode: int | None = None
+_UMASK_LOCK = threading.Lock()
+
+
+def _read_umask() -> int:
+    # Linux: /proc から副作用なしで取得。なければ umask(0) → 復元 (一瞬だけプロセス全体の umask が 0 になる)
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+def _default_mode() -> int:
+    global _default_file_mode
+    with _UMASK_LOCK:
+        if _default_file_mode is None:
+            _default_file_mode = 0o666 & ~_read_umask()
+        return _default_file_mode
+
+
+# ── Serialization ─────────────────────────────────────────────────────────
+
+def dump_json_bytes(data: Any) -> bytes:
+    """リポジトリ標準の JSON 書式 (indent=2, ensure_ascii=False, 末尾改行) でバイト列化."""
+    return json_codec.dump_bytes(data, newline=True)
+
+
+def _read_bytes(path: Path) -> bytes | None:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _ends_with_newline(path: Path) -> bool:
+    with open(path, "rb") as f:
+        f.seek(-1, os.SEEK_END)
+        return f.read(1) == b"\n"
+
+
+def _target_mode(path: Path) -> int:
+    try:
+        return path.stat().st_mode & 0o7777
+    except OSError:
+        return _default_mode()
+
+
+def _fsync_dir(directory: Path) -> None:
+    """ディレクトリエントリ (リネーム結果) を永続化。非対応環境では無視."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# ── Write Batch ───────────────────────────────────────────────────────────
+
+class WriteBatch:
+    """変更のあったファイルだけをまとめてアトミックに書き戻すバッチ.
+
+    stage() は差分判定のみ行い、実書き込みは commit() で一括実行する。
+    stage_append() の追記は commit() 時に置換より先に書き込まれる。
+    予約内容は drain()/absorb() でプロセス間受け渡しが可能
+    (ProcessPoolExecutor のワーカー → 親プロセス)。
+    """
+
+    def __init__(self, durable: bool = True):
+        self.durable = durable
+        self._pending: dict[Path, bytes] = {}
+        self._appends: dict[Path, list[bytes]] = {}
+        self._temps: list[Path] = []
+        self.written: list[Path] = []
+        self.appended: list[Path] = []
+        self.skipped: list[Path] = []
+
+    def __len__(self) -> int:
+        return len(self._pending) + len(self._appends)
+
+    def __enter__(self) -> "WriteBatch":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
+
+    def stage(self, path: Path, content: bytes) -> bool:
+        """書き込み予約。ディスク上と同一内容なら予約せず False を返す."""
+        path = Path(path)
+        if _read_bytes(path) == content:
+            self._pending.pop(path, None)
+            self.skipped.append(path)
+            return False
+        self._pending[path] = content
+        return True
+
+    def stage_json(self, path: Path, data: Any) -> bool:
+        """JSON データを標準書式で直列化して予約."""
+        return self.stage(path, dump_json_bytes(data))
+
+    def stage_append(self, path: Path, content: bytes) -> bool:
+        """追記予約。空なら予約せず False を返す."""
+        if not content:
+            return False
+        self._appends.setdefault(Path(path), []).append(content)
+        return True
+
+    def drain(self) -> dict[str, list[tuple[str, bytes]]]:
+        """予約済みの書き込みを取り出してクリア (pickle 可能な形式)."""
+        items = {
+            "replace": [(str(p), c) for p, c in self._pending.items()],
+            "append": [(str(p), b"".join(cs)) for p, cs in self._appends.items()],
+        }
+        self._pending.clear()
+        self._appends.clear()
+        return items
+
+    def absorb(self, items: dict[str, list[tuple[str, bytes]]]) -> None:
+        """drain() の結果を取り込む。差分判定は stage() 時点で済んでいる."""
+        for path, content in items.get("replace", []):
+            self._pending[Path(path)] = content
+        for path, content in items.get("append", []):
+            self.stage_append(Path(path), content)
+
+    def _commit_appends(self) -> list[Path]:
+        """追記を書き込み、置換より先に fsync する."""
+        appended = []
+        for path, chunks in self._appends.items():
+            content = b"".join(chunks)
+            with open(path, "ab") as f:
+                # 中断で改行なしの末尾行が残っていても行境界を保つ
+                if f.tell() > 0 and not _ends_with_newline(path):
+                    content = b"\n" + content
+                f.write(content)
+                f.flush()
+                if self.durable:
+                    os.fsync(f.fileno())
+            appended.append(path)
+        self._appends.clear()
+        return appended
+
+    def commit(self) -> list[Path]:
+        """予約済みファイルを一括書き込み。書き込んだパスのリストを返す.
+
+        1) 1ファイルずつ一時ファイルへ書き込み → fsync → close (開いたままにするのは常に1つ:
+           ファイル数がディスクリプタ上限 RLIMIT_NOFILE を超えても EMFILE にならない)
+        2) 全一時ファイルを os.replace でリネーム
+        3) 影響ディレクトリをまとめて fsync
+
+        追記予約があれば 1) より前に書き込み・fsync する。
+        """
+        if self._appends:
+            try:
+                appended = self._commit_appends()
+            except BaseException:
+                # アーカイブ未確定のまま本体を置換しない
+                self.abort()
+                raise
+            if self.durable:
+                for directory in {p.parent for p in appended}:
+                    _fsync_dir(directory)
+            self.appended.extend(appended)
+        if not self._pending:
+            return []
+        items = list(self._pending.items())
+        try:
+            for path, content in items:
+                fd, tmp = tempfile.mkstemp(prefix=TEMP_PREFIX + path.name + ".",
+                                           dir=path.parent)
+                self._temps.append(Path(tmp))
+                with os.fdopen(fd, "wb") as f:
+                    os.fchmod(f.fileno(), _target_mode(path))
+                    f.write(content)
+                    f.flush()
+                    if self.durable:
+                        os.fsync(f.fileno())
+
+            written = []
+            for (path, _), tmp_path in zip(items, self._temps):
+                os.replace(tmp_path, path)
+                written.append(path)
+            self._temps.clear()
+        except BaseException:
+            self.abort()
+            raise
+
+        if self.durable:
+            for directory in {p.parent for p in written}:
+                _fsync_dir(directory)
+        self._pending.clear()
+        self.written.extend(written)
+        return written
+
+    def abort(self) -> None:
+        """予約を破棄し、残った一時ファイルを削除."""
+        for tmp_path in self._temps:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+        self._temps.clear()
+        self._pending.clear()
+        self._appends.clear()
+
+
+# ── Convenience ───────────────────────────────────────────────────────────
+
+def write_bytes_atomic(path: Path, content: bytes, durable: bool = True) -> bool:
+    """単一ファイルを差分判定付きでアトミックに書き込む。書き込んだら True."""
+    batch = WriteBatch(durable=durable)
+    if not batch.stage(path, content):
+        return False
+    batch.commit()
+    return True
+
+
+def write_json_atomic(path: Path, data: Any, durable: bool = True) -> bool:
+    """JSON を標準書式で差分判定付きアトミック書き込み。書き込んだら True."""
+    return write_bytes_atomic(path, dump_json_bytes(data), durable=durable)
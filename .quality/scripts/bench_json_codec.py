@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+JSON Codec Benchmark — 大規模 scan-status.json / competitor-registry.json のパース・直列化計測
+
+合成した scan-status.json (候補 + 履歴) と competitor-registry.json (機能 × アプリ評価) を
+サイズごとに生成し、json_codec の各バックエンド (orjson / 標準 json) で
+loads / dump_bytes (indent=2) を計測する。計測前に両バックエンドの出力が
+バイト単位で同一であることを確認する (不一致ならエラー終了)。
+
+計測シナリオ (ファイル × バックエンドごと):
+- loads       バイト列 → Python オブジェクト
+- dump_bytes  Python オブジェクト → indent=2 + 末尾改行のバイト列
+
+Usage:
+    python3 bench_json_codec.py                        # 1000 / 10000 / 50000 候補
+    python3 bench_json_codec.py --sizes 1000 --repeat 10
+    python3 bench_json_codec.py --output bench.json
+"""
+
+import argparse
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+from json_codec import BACKENDS, HAS_ORJSON, JsonCodec  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BENCH_OUTPUT_DIR = PROJECT_ROOT / ".quality" / "cache" / "bench"
+BENCH_FORMAT_VERSION = 1
+
+DEFAULT_SIZES = (1000, 10000, 50000)
+OPERATIONS = ("loads", "dump_bytes")
+
+_STATUSES = ("pending_review", "approved", "rejected", "converted", "merged", "deferred")
+_TOPICS = ("音声入力", "怪獣ボイス", "発音評価", "リスニング", "語彙復習", "会話練習",
+           "通知", "オンボーディング", "サブスクリプション", "ランキング")
+
+
+# ── Generator ─────────────────────────────────────────────────────────────
+
+def _timestamp(rng: random.Random) -> str:
+    return (f"2026-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            f"T{rng.randint(0, 23):02d}:{rng.randint(0, 59):02d}:00+00:00")
+
+
+def scan_status_document(size: int, seed: int = 0) -> dict:
+    """scan-status.json v3 相当 (候補 size 件, 1候補あたり履歴 0-6 件)。"""
+    rng = random.Random(seed)
+    candidates = []
+    for i in range(size):
+        topic = rng.choice(_TOPICS)
+        status = rng.choice(_STATUSES)
+        candidates.append({
+            "id": f"MI-{i:06d}",
+            "title": f"{topic}の改善案 {i}",
+            "summary": f"競合アプリ {rng.randint(1, 40)} 件で{topic}の新機能を確認。" * rng.randint(1, 4),
+            "status": status,
+            "japan_fit": round(rng.uniform(0, 10), 1),
+            "impact_score": round(rng.uniform(0, 100), 2),
+            "source_docs": [f"MI-2026{rng.randint(1, 12):02d}-{n:03d}.md" for n in range(rng.randint(0, 3))],
+            "doc_path": None if status != "converted" else f"docs/features/{i:03d}-mi/BRIEF.md",
+            "tags": rng.sample(_TOPICS, k=rng.randint(0, 3)),
+            "history": [
+                {"at": _timestamp(rng), "from": rng.choice(_STATUSES), "to": status,
+                 "actor": rng.choice(("ai", "human")), "note": None}
+                for _ in range(rng.randint(0, 6))
+            ],
+        })
+    scans = [{"id": f"scan-{n:04d}", "phase": "completed", "started_at": _timestamp(rng),
+              "candidates_found": rng.randint(0, 50)} for n in range(max(1, size // 100))]
+    return {"schema_version": 3, "scans": scans, "candidates": candidates}
+
+
+def competitor_registry_document(size: int, seed: int = 0) -> dict:
+    """competitor-registry.json 相当 (機能 size 件 × アプリ評価 0-12 件)。"""
+    rng = random.Random(seed + 1)
+    apps = [{"id": f"app-{j:03d}", "name": f"競合アプリ {j}"} for j in range(20)]
+    features = [
+        {
+            "id": f"comp-{i:05d}",
+            "name": f"{rng.choice(_TOPICS)} {i}",
+            "hackathon_project_coverage": ",".join(f"{n:03d}" for n in range(rng.randint(0, 3))),
+            "assessments": {
+                f"app-{j:03d}": {"level": rng.choice(("none", "basic", "advanced")),
+                                 "score": round(rng.uniform(0, 5), 1), "verified": rng.random() < 0.5}
+                for j in range(rng.randint(0, 12))
+            },
+        }
+        for i in range(size)
+    ]
+    return {"version": 2, "apps": apps, "features": features}
+
+
+DOCUMENTS = {
+    "scan-status.json": scan_status_document,
+    "competitor-registry.json": competitor_registry_document,
+}
+
+
+# ── Runner ────────────────────────────────────────────────────────────────
+
+def _median_seconds(fn, repeat: int) -> tuple[float, float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples), min(samples)
+
+
+def available_backends() -> list[str]:
+    return [b for b in BACKENDS if b != "orjson" or HAS_ORJSON]
+
+
+def bench_document(name: str, data: dict, repeat: int) -> list[dict]:
+    """1ドキュメントを全バックエンドで計測。出力がバイト不一致なら ValueError。"""
+    codecs = {b: JsonCodec(b) for b in available_backends()}
+    encoded = {b: c.dump_bytes(data, newline=True) for b, c in codecs.items()}
+    reference = encoded["json"]
+    for backend, raw in encoded.items():
+        if raw != reference:
+            raise ValueError(f"{name}: {backend} の出力が標準 json とバイト不一致")
+        if codecs[backend].loads(raw) != data:
+            raise ValueError(f"{name}: {backend} の loads 結果が元データと不一致")
+
+    results = []
+    for backend, codec in codecs.items():
+        timings = {
+            "loads": _median_seconds(lambda: codec.loads(reference), repeat),
+            "dump_bytes": _median_seconds(lambda: codec.dump_bytes(data, newline=True), repeat),
+        }
+        for op, (median, minimum) in timings.items():
+            results.append({"file": name, "bytes": len(reference), "backend": backend,
+                            "operation": op, "seconds_median": round(median, 6),
+                            "seconds_min": round(minimum, 6)})
+    return results
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmark(sizes: list[int], repeat: int = 5, seed: int = 0) -> dict:
+    """サイズ × ドキュメントごとに計測。結果ドキュメント (JSON化可能) を返す。"""
+    results = []
+    for size in sizes:
+        for name, generate in DOCUMENTS.items():
+            for row in bench_document(name, generate(size, seed), repeat):
+                results.append({"size": size, **row})
+    return {
+        "format_version": BENCH_FORMAT_VERSION,
+        "benchmark": "json_codec",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "backends": available_backends(),
+        "config": {"sizes": sizes, "repeat": repeat, "seed": seed},
+        "results": results,
+    }
+
+
+def speedups(doc: dict) -> list[dict]:
+    """(size, file, operation) ごとの 標準 json / orjson の比。orjson 未導入なら空。"""
+    by_key = {(r["size"], r["file"], r["operation"], r["backend"]): r for r in doc["results"]}
+    rows = []
+    for (size, name, op, backend), r in by_key.items():
+        if backend != "orjson":
+            continue
+        base = by_key[(size, name, op, "json")]
+        if r["seconds_median"] > 0:
+            rows.append({"size": size, "file": name, "operation": op,
+                         "speedup": round(base["seconds_median"] / r["seconds_median"], 2)})
+    return rows
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON コーデック (orjson / 標準 json) ベンチマーク")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="候補・機能数 (デフォルト: 1000 10000 50000)")
+    parser.add_argument("--repeat", type=int, default=5, help="各計測の繰り返し回数 (デフォルト: 5)")
+    parser.add_argument("--seed", type=int, default=0, help="データ生成シード")
+    parser.add_argument("--output", type=Path, default=None,
+                        help=f"結果JSON (デフォルト: {BENCH_OUTPUT_DIR.relative_to(PROJECT_ROOT)}/json_codec-<commit>.json)")
+    args = parser.parse_args()
+
+    try:
+        doc = run_benchmark(args.sizes, repeat=args.repeat, seed=args.seed)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    doc["speedups"] = speedups(doc)
+
+    output = args.output or BENCH_OUTPUT_DIR / f"json_codec-{doc['git_commit'] or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(json_codec.dump_bytes(doc, newline=True))
+
+    print(f"\n── JSON Codec Benchmark (commit {doc['git_commit'] or '-'}, repeat {args.repeat}, "
+          f"default backend {json_codec.BACKEND}) ──")
+    print(f"  {'size':>6s} {'file':26s} {'MB':>6s} {'backend':8s} {'operation':11s} {'median':>10s}")
+    for r in doc["results"]:
+        print(f"  {r['size']:>6d} {r['file']:26s} {r['bytes'] / 1e6:6.1f} {r['backend']:8s} "
+              f"{r['operation']:11s} {r['seconds_median']:9.4f}s")
+    if doc["speedups"]:
+        print("\n  orjson / 標準 json (出力はバイト同一):")
+        for s in doc["speedups"]:
+            print(f"  {s['size']:>6d} {s['file']:26s} {s['operation']:11s} {s['speedup']:6.2f}x")
+    else:
+        print("\n  orjson 未インストール: 標準 json のみ計測")
+    print(f"\n結果: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+NavGraphValidator Benchmark — 大規模 nav-graph.json での走査回数・実行時間の計測
+
+合成した nav-graph.json (feature ごとのタブ・ページ・ダイアログ, trigger, guard, flow。
+各ルールが検出する不備も一定割合で混入) に対し、2つの実行方式を計測する。
+計測前に両方式のイシューが完全に一致することを確認する (不一致ならエラー終了)。
+
+計測シナリオ:
+- per-rule     索引 + ルールごとに個別の走査 (ルール単位でドキュメントを走査していた従来構成と同じ)
+- single       全ルールのコールバックを1回の走査で実行 (NavGraphValidator.validate)
+- incremental  1 trigger の遷移先だけが異なる前版のスナップショット (保存済みファイル) から
+               差分のみ再評価 (NavGraphValidator.validate_incremental, スナップショット読み込み込み)
+
+Usage:
+    python3 bench_nav_graph.py                          # 20000 screens
+    python3 bench_nav_graph.py --screens 5000 20000 --repeat 5
+    python3 bench_nav_graph.py --output bench.json
+"""
+
+import argparse
+import importlib.util
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+BENCH_OUTPUT_DIR = PROJECT_ROOT / ".quality" / "cache" / "bench"
+BENCH_FORMAT_VERSION = 1
+
+DEFAULT_SIZES = (20000,)
+MODES = ("per-rule", "single", "incremental")
+SCREENS_PER_FEATURE = 40
+
+
+def _load_validator_module():
+    path = Path(__file__).with_name("nav-graph-validator.py")
+    spec = importlib.util.spec_from_file_location("nav_graph_validator", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# ── Generator ─────────────────────────────────────────────────────────────
+
+def synthetic_nav_graph(screens: int, triggers_per_screen: int = 4, seed: int = 0) -> dict:
+    """nav-graph.json 相当 (screens 件, 平均 triggers_per_screen 件の trigger, screens/20 件の flow)。
+
+    feature ごとにタブ1枚 + ページ + ダイアログを持ち、大半の trigger は同一 feature 内、
+    一部は他 feature へ遷移する。約1%ずつ orphan / dead-end / 存在しない参照 / 重複ID /
+    出口のない閉路を含む。
+    """
+    rng = random.Random(seed)
+    ids = [f"SCR-{i // SCREENS_PER_FEATURE:03d}-{i % SCREENS_PER_FEATURE:03d}" for i in range(screens)]
+    doc_screens: dict = {}
+    trigger_ids: list = []
+
+    for i, sid in enumerate(ids):
+        feature = i // SCREENS_PER_FEATURE
+        local = i % SCREENS_PER_FEATURE
+        base = feature * SCREENS_PER_FEATURE
+        size = min(SCREENS_PER_FEATURE, screens - base)
+        screen_type = "tab" if local == 0 else ("dialog" if rng.random() < 0.1 else "page")
+        screen = {
+            "id": sid,
+            "name": "Login" if i == 0 else f"Screen {feature}-{local}",
+            "screen_type": screen_type,
+            "feature": f"{feature:03d}-feature",
+            "file": f"lib/features/f{feature:03d}/presentation/pages/screen_{local}.dart",
+            "triggers": [],
+        }
+        if screen_type == "tab":
+            screen["tab_index"] = feature
+        roll = rng.random()
+        count = 0 if roll < 0.01 else rng.randint(1, 2 * triggers_per_screen - 1)
+        for k in range(count):
+            if rng.random() < 0.85:
+                target = ids[base + rng.randrange(size)]
+            else:
+                target = ids[rng.randrange(screens)]
+            if rng.random() < 0.005:
+                target = f"SCR-MISSING-{i}"
+            trigger = {"id": f"TRG-{i:06d}-{k}", "target": target,
+                       "gesture": rng.choice(("tap", "longPress", "swipe"))}
+            if rng.random() < 0.05:
+                fallback = ids[base] if rng.random() < 0.9 else f"SCR-GONE-{i}"
+                trigger["guards"] = [{"condition": "isLoggedIn", "fallback_screen": fallback,
+                                      "fallback_type": "redirect"}]
+            if rng.random() < 0.002 and trigger_ids:
+                trigger["id"] = rng.choice(trigger_ids)  # 重複 trigger ID
+            trigger_ids.append(trigger["id"])
+            screen["triggers"].append(trigger)
+        doc_screens[sid] = screen
+
+    # 出口のない閉路 (2画面ループ) と orphan を末尾の feature に追加
+    for n in range(max(1, screens // 1000)):
+        a, b = f"SCR-LOOP-{n:04d}-A", f"SCR-LOOP-{n:04d}-B"
+        doc_screens[a] = {"id": a, "name": f"Loop {n} A", "screen_type": "page",
+                          "triggers": [{"id": f"TRG-LOOP-{n}-A", "target": b}]}
+        doc_screens[b] = {"id": b, "name": f"Loop {n} B", "screen_type": "page",
+                          "triggers": [{"id": f"TRG-LOOP-{n}-B", "target": a}]}
+        doc_screens[f"{a}-entry"] = {"id": a if n % 5 == 0 else f"{a}-entry",  # 一部は重複 screen ID
+                                     "name": f"Loop {n} entry", "screen_type": "page",
+                                     "triggers": [{"id": f"TRG-LOOP-{n}-E", "target": a}]}
+
+    flows: dict = {}
+    for n in range(max(1, screens // 20)):
+        start = rng.randrange(screens)
+        steps = []
+        sid = ids[start]
+        for _ in range(rng.randint(2, 5)):
+            triggers = doc_screens[sid]["triggers"]
+            trigger = rng.choice(triggers) if triggers else None
+            steps.append({"screen": sid, "trigger": trigger["id"] if trigger else None})
+            if trigger is None or trigger["target"] not in doc_screens:
+                break
+            sid = trigger["target"]
+        if rng.random() < 0.01:
+            steps[-1]["trigger"] = "TRG-UNKNOWN"
+        flows[f"FLOW-{n:05d}"] = {"id": f"FLOW-{n:05d}", "name": f"Flow {n}", "steps": steps}
+
+    return {"version": "1.0", "screens": doc_screens, "flows": flows}
+
+
+# ── Runner ────────────────────────────────────────────────────────────────
+
+def previous_version(doc: dict) -> dict:
+    """incremental の前版: 中央付近の screen の最初の trigger の遷移先だけが異なる"""
+    previous = json_codec.loads(json_codec.dump_bytes(doc, pretty=False))
+    screens = list(previous["screens"].values())
+    for screen in screens[len(screens) // 2:]:
+        if screen["triggers"]:
+            screen["triggers"][0]["target"] = screens[0]["id"]
+            break
+    return previous
+
+
+def run_mode(module, nav_path: Path, root: Path, mode: str) -> tuple[list, int]:
+    """1方式で全ルールを実行。(イシュー, 走査回数) を返す。"""
+    validator = module.NavGraphValidator(nav_path, root, root / "nav-graph.schema.json")
+    if mode == "single":
+        result = validator.validate()
+        return result.issues, validator.passes
+    if mode == "incremental":
+        result = validator.validate_incremental(module.load_snapshot(root / "snapshot.json"))
+        if result.incremental["full"]:
+            raise ValueError(f"incremental: 全体検証にフォールバック ({result.incremental['reason']})")
+        return result.issues, validator.passes
+    validator.load()
+    validator.run_rules(())
+    issues = []
+    for rule in module.RULE_ORDER:
+        issues.extend(validator.run_rules((rule,), index=False)[rule])
+    return issues, validator.passes
+
+
+def bench_size(screens: int, triggers_per_screen: int, repeat: int, seed: int) -> list[dict]:
+    """1サイズを全方式で計測。方式間でイシューが異なれば ValueError。"""
+    module = _load_validator_module()
+    doc = synthetic_nav_graph(screens, triggers_per_screen, seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        nav_path = root / "nav-graph.json"
+        nav_path.write_bytes(json_codec.dump_bytes(previous_version(doc)))
+        previous = module.NavGraphValidator(nav_path, root, root / "nav-graph.schema.json")
+        previous.validate_incremental(None)
+        module.save_snapshot(root / "snapshot.json", previous.snapshot())
+        nav_path.write_bytes(json_codec.dump_bytes(doc))
+
+        reference = None
+        rows = []
+        for mode in MODES:
+            issues, passes = run_mode(module, nav_path, root, mode)
+            if reference is None:
+                reference = issues
+            elif issues != reference:
+                raise ValueError(f"{screens} screens: {mode} のイシューが per-rule と不一致")
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                run_mode(module, nav_path, root, mode)
+                samples.append(time.perf_counter() - start)
+            rows.append({
+                "screens": len(doc["screens"]),
+                "triggers": sum(len(s["triggers"]) for s in doc["screens"].values()),
+                "flows": len(doc["flows"]),
+                "mode": mode,
+                "passes": passes,
+                "issues": len(issues),
+                "seconds_median": round(statistics.median(samples), 6),
+                "seconds_min": round(min(samples), 6),
+            })
+    return rows
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmark(sizes: list[int], triggers_per_screen: int = 4, repeat: int = 3, seed: int = 0) -> dict:
+    """サイズごとに計測。結果ドキュメント (JSON化可能) を返す。"""
+    results = []
+    for size in sizes:
+        for row in bench_size(size, triggers_per_screen, repeat, seed):
+            results.append({"size": size, **row})
+    return {
+        "format_version": BENCH_FORMAT_VERSION,
+        "benchmark": "nav_graph",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"sizes": sizes, "triggers_per_screen": triggers_per_screen,
+                   "repeat": repeat, "seed": seed},
+        "results": results,
+    }
+
+
+def speedups(doc: dict) -> list[dict]:
+    """サイズごとの per-rule / single, per-rule / incremental の比 (時間) と走査回数。"""
+    by_key = {(r["size"], r["mode"]): r for r in doc["results"]}
+    rows = []
+    for size in doc["config"]["sizes"]:
+        base, single, incremental = (by_key[(size, mode)] for mode in MODES)
+        if single["seconds_median"] > 0 and incremental["seconds_median"] > 0:
+            rows.append({"size": size,
+                         "speedup": round(base["seconds_median"] / single["seconds_median"], 2),
+                         "incremental_speedup": round(base["seconds_median"] / incremental["seconds_median"], 2),
+                         "passes": f"{base['passes']} → {single['passes']}"})
+    return rows
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="NavGraphValidator (ルール別走査 / 1回走査 / 差分) ベンチマーク")
+    parser.add_argument("--screens", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="screen 数 (デフォルト: 20000)")
+    parser.add_argument("--triggers-per-screen", type=int, default=4, help="screen あたりの平均 trigger 数")
+    parser.add_argument("--repeat", type=int, default=3, help="各計測の繰り返し回数 (デフォルト: 3)")
+    parser.add_argument("--seed", type=int, default=0, help="データ生成シード")
+    parser.add_argument("--output", type=Path, default=None,
+                        help=f"結果JSON (デフォルト: {BENCH_OUTPUT_DIR.relative_to(PROJECT_ROOT)}/nav_graph-<commit>.json)")
+    args = parser.parse_args()
+
+    try:
+        doc = run_benchmark(args.screens, args.triggers_per_screen, repeat=args.repeat, seed=args.seed)
+    except ValueError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    doc["speedups"] = speedups(doc)
+
+    output = args.output or BENCH_OUTPUT_DIR / f"nav_graph-{doc['git_commit'] or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_bytes(json_codec.dump_bytes(doc, newline=True))
+
+    print(f"\n── NavGraphValidator Benchmark (commit {doc['git_commit'] or '-'}, repeat {args.repeat}) ──")
+    print(f"  {'size':>6s} {'screens':>8s} {'triggers':>9s} {'mode':11s} {'passes':>6s} {'issues':>7s} {'median':>10s}")
+    for r in doc["results"]:
+        print(f"  {r['size']:>6d} {r['screens']:>8d} {r['triggers']:>9d} {r['mode']:11s} "
+              f"{r['passes']:>6d} {r['issues']:>7d} {r['seconds_median']:9.4f}s")
+    print("\n  per-rule / single, per-rule / incremental (イシューは同一):")
+    for s in doc["speedups"]:
+        print(f"  {s['size']:>6d} {s['speedup']:6.2f}x  走査 {s['passes']}   incremental {s['incremental_speedup']:6.2f}x")
+    print(f"\n結果: {output}")
+
+
+if __name__ == "__main__":
+    main()
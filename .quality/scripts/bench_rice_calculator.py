@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+RICE Calculator Benchmark — 合成コーパスによるスケール計測
+
+リポジトリには Feature が1件しかないため、現実的な Feature ディレクトリ
+(BRIEF.md Format A/B, SPEC.md, CONTEXT.json) と competitor-registry.json /
+gap-candidates.json を N 件生成し、rice_calculator.py を計測する。
+
+計測シナリオ (サイズごと):
+- process_feature_nocache  パースキャッシュなしで全Featureを処理
+- process_feature_cold     空のパースキャッシュで全Featureを処理
+- process_feature_warm     同じキャッシュで再処理 (全ヒット)
+- main_cold                main() 全体 (パースキャッシュファイルなし)
+- main_warm                main() 全体 (前回実行のキャッシュファイルあり)
+
+結果は JSON (git commit / Python / プラットフォーム情報付き) に保存し、
+--compare で過去結果との比較・回帰検出を行う。
+
+Usage:
+    python3 bench_rice_calculator.py                          # 100 / 1000 / 10000
+    python3 bench_rice_calculator.py --sizes 100 1000 --repeat 5
+    python3 bench_rice_calculator.py --jobs 4                 # main() を --jobs 4 で計測
+    python3 bench_rice_calculator.py --output bench.json --compare base.json --max-regression 0.2
+    python3 bench_rice_calculator.py --generate-only /tmp/corpus --sizes 1000
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import check_cache  # noqa: E402
+import context_corpus  # noqa: E402
+import priority_index  # noqa: E402
+import rice_calculator  # noqa: E402
+from rice_calculator import (  # noqa: E402
+    PROJECT_ROOT,
+    GapData,
+    ParseCache,
+    RegistryData,
+    discover_feature_dirs,
+    process_feature,
+)
+
+# ── Constants ─────────────────────────────────────────────────────────────
+
+DEFAULT_SIZES = (100, 1000, 10000)
+BENCH_OUTPUT_DIR = PROJECT_ROOT / ".quality" / "cache" / "bench"
+BENCH_FORMAT_VERSION = 1
+
+SCENARIOS = (
+    "process_feature_nocache",
+    "process_feature_cold",
+    "process_feature_warm",
+    "main_cold",
+    "main_warm",
+)
+
+_CORE_GOALS = (
+    "すべてのユーザーに {topic} を提供し、Freemium の収益を改善する。",
+    "大半の学習者の {topic} 継続率 (retention) を高める。",
+    "特定の上級者向けに critical な {topic} 機能を追加する。",
+    "{topic} の体験を改善する。",
+    "全体ユーザーの LTV を {topic} で向上させる。",
+)
+_TOPICS = ("音声入力", "怪獣ボイス", "発音評価", "リスニング", "語彙復習", "会話練習",
+           "通知", "オンボーディング", "サブスクリプション", "ランキング")
+_METRICS = ("| MRR | ¥{n}K+ |", "| 継続率 | retention {n}% |", "| DAU | +{n}% |",
+            "| コンバージョン率 | {n}% |", "| LTV | ${n}+ |")
+_STATES = ("Planning", "Implementing", "Implementing", "Testing", "Done", "Archived")
+_SEVERITIES = ("CRITICAL", "HIGH", "MEDIUM", "LOW", "N/A")
+_PHASES = ("exploration", "mvp", "growth", "stability")
+
+
+# ── Corpus Generator ──────────────────────────────────────────────────────
+
+def _prose(rng: random.Random, sentences: int) -> str:
+    words = ("学習者", "体験", "音声", "評価", "改善", "画面", "フロー", "データ", "同期", "表示")
+    return "".join(
+        "".join(rng.choice(words) for _ in range(rng.randint(4, 9))) + "。"
+        for _ in range(sentences)
+    )
+
+
+def _brief_format_a(rng: random.Random, fid: str, topic: str) -> str:
+    metrics = "\n".join(rng.choice(_METRICS).format(n=rng.randint(3, 500))
+                        for _ in range(rng.randint(0, 4)))
+    stories = "\n".join(f"- 学習者は{topic}で{_prose(rng, 1)}したい" for _ in range(rng.randint(1, 8)))
+    hard = "\n".join(f"- [x] {_prose(rng, 1)}" for _ in range(rng.randint(0, 5)))
+    soft = "\n".join(f"- [ ] {_prose(rng, 1)}" for _ in range(rng.randint(0, 4)))
+    sections = [
+        f"# Feature Brief: {fid}\n",
+        f"## 0. Original Request\n\n> {_prose(rng, 2)}\n",
+        "## 1. Problem & Why\n\n"
+        f"### Core Goal\n\n{rng.choice(_CORE_GOALS).format(topic=topic)}\n\n"
+        f"### User Value\n\n{_prose(rng, rng.randint(1, 4))}\n\n"
+        f"### Business Metric\n\n| 指標 | 目標 |\n|------|------|\n{metrics}\n",
+        f"## 2. User Stories\n\n{stories}\n",
+        "## 3. User Journey\n\n" + "\n".join(f"{i}. {_prose(rng, 1)}" for i in range(1, rng.randint(2, 8))) + "\n",
+        f"## 4. Acceptance Criteria (BDD)\n\n- Unit Test: {topic}_test.dart 通過\n",
+        f"## 5. Scope Boundaries\n\n### In Scope\n- {_prose(rng, 1)}\n\n### Out of Scope\n- {_prose(rng, 1)}\n",
+        f"## 6. Constraints\n\n### Hard Constraints (違反禁止)\n{hard}\n\n### Soft Constraints (推奨)\n{soft}\n",
+        f"## 7. Business Metrics\n\n- {_prose(rng, rng.randint(1, 3))}\n",
+    ]
+    # 一部のセクションを欠落させ、完成度にばらつきを持たせる
+    keep = [s for i, s in enumerate(sections) if i < 3 or rng.random() > 0.15]
+    return "\n---\n\n".join(keep) + "\n" + _prose(rng, rng.randint(0, 60)) + "\n"
+
+
+def _brief_format_b(rng: random.Random, fid: str, topic: str) -> str:
+    metric = rng.choice(_METRICS).format(n=rng.randint(3, 500)).strip("| ").replace(" | ", " ")
+    return (
+        f"# Feature Brief: {fid}\n\n---\n\n"
+        f"## 0. Original Request\n\n> {_prose(rng, 1)}\n\n---\n\n"
+        "## 1. Problem & Why\n\n*この機能がなぜ必要かを記述します。*\n"
+        f"- **Core Goal**: {rng.choice(_CORE_GOALS).format(topic=topic)}\n"
+        f"- **User Value**: {_prose(rng, 1)}\n"
+        f"- **Business Metric**: {metric}\n\n---\n\n"
+        f"## 2. User Stories\n\n- 学習者は{topic}を直接使いたい\n\n---\n\n"
+        f"## 5. Scope Boundaries\n\n### In Scope\n- {_prose(rng, 1)}\n\n---\n\n"
+        f"## 6. Constraints\n\n### Hard Constraints (違反禁止)\n- [x] {_prose(rng, 1)}\n"
+    )
+
+
+def _spec(rng: random.Random, num: int, topic: str) -> str:
+    frs = "\n".join(f"- FR-{i:03d}: {_prose(rng, 1)}" for i in range(1, rng.randint(1, 25)))
+    acs = "\n".join(f"- AC-{i}: Given {topic} When 操作 Then 表示" for i in range(1, rng.randint(1, 15)))
+    files = "\n".join(f"- lib/features/f{num}/presentation/w{i}.dart" for i in range(rng.randint(0, 30)))
+    return f"# SPEC-{num:03d}\n\n## Requirements\n\n{frs}\n\n## Acceptance\n\n{acs}\n\n## Files\n\n{files}\n"
+
+
+def _context(rng: random.Random, fid: str, topic: str) -> dict:
+    fr_total = rng.randint(0, 20)
+    history = [
+        {"timestamp": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00+00:00",
+         "actor": "ai", "rice_score": round(rng.uniform(0, 10), 2),
+         "adjusted_score": round(rng.uniform(0, 10), 2)}
+        for _ in range(rng.randint(0, 12))
+    ]
+    return {
+        "feature_id": fid,
+        "title": f"{topic} {fid}",
+        "progress": {"percentage": rng.choice((0, 0, 10, 35, 50, 80, 100)),
+                     "fr_total": fr_total, "fr_completed": rng.randint(0, fr_total)},
+        "quick_resume": {"current_state": rng.choice(_STATES)},
+        "references": {"research_links": {
+            "research_ids": [f"R-2025{rng.randint(1, 12):02d}01-{i:03d}" for i in range(rng.randint(0, 6))]}},
+        "priority": {
+            "schema": rng.choice(("rice-v2", "rice-v2", "rice-v1")),
+            "phase": rng.choice(_PHASES),
+            "calculated": {"adjusted_score": round(rng.uniform(0, 10), 2)},
+            "manual_override": rng.choice((1.0, 1.0, 1.2, 0.8, {"value": 1.1, "reason": "bench"})),
+            "history": history,
+        },
+    }
+
+
+def generate_corpus(root: Path, count: int, seed: int = 0,
+                    registry_size: Optional[int] = None,
+                    gap_size: Optional[int] = None) -> Path:
+    """root 配下に docs/features/* と docs/analysis/*.json を生成。root を返す。
+
+    registry_size / gap_size 省略時は Feature 数に比例 (それぞれ count/2, count/3)。
+    """
+    rng = random.Random(seed)
+    features_dir = root / "docs" / "features"
+    analysis_dir = root / "docs" / "analysis"
+    features_dir.mkdir(parents=True, exist_ok=True)
+    analysis_dir.mkdir(parents=True, exist_ok=True)
+
+    width = max(3, len(str(count)))
+    nums = list(range(1, count + 1))
+    for num in nums:
+        topic = rng.choice(_TOPICS)
+        fid = f"{num:0{width}d}-bench-{topic}"
+        fd = features_dir / fid
+        fd.mkdir(exist_ok=True)
+        if rng.random() < 0.95:
+            writer = _brief_format_a if rng.random() < 0.7 else _brief_format_b
+            (fd / "BRIEF.md").write_text(writer(rng, fid, topic), encoding="utf-8")
+        if rng.random() < 0.8:
+            (fd / f"SPEC-{num:0{width}d}-bench.md").write_text(_spec(rng, num, topic), encoding="utf-8")
+        (fd / "CONTEXT.json").write_text(
+            json.dumps(_context(rng, fid, topic), ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    registry_size = max(1, count // 2) if registry_size is None else registry_size
+    gap_size = max(1, count // 3) if gap_size is None else gap_size
+    registry = {
+        "apps": [{"id": f"app-{i:03d}"} for i in range(20)],
+        "features": [
+            {
+                "id": f"comp-{i:05d}",
+                "hackathon_project_coverage": ",".join(
+                    f"{n:0{width}d}" + ("-partial" if rng.random() < 0.2 else "")
+                    for n in rng.sample(nums, k=min(len(nums), rng.randint(0, 3)))),
+                "assessments": {f"app-{j:03d}": {} for j in range(rng.randint(0, 12))},
+            }
+            for i in range(registry_size)
+        ],
+    }
+    gaps = {
+        "candidates": [
+            {
+                "id": f"gap-{i:05d}",
+                "existing_feature_id": f"{rng.choice(nums):0{width}d}" if rng.random() < 0.8 else "",
+                "gap_severity": rng.choice(_SEVERITIES),
+                "opportunity_score": round(rng.uniform(0, 10), 1),
+                "is_industry_standard": rng.random() < 0.3,
+            }
+            for i in range(gap_size)
+        ],
+    }
+    (analysis_dir / "competitor-registry.json").write_text(
+        json.dumps(registry, ensure_ascii=False, indent=2), encoding="utf-8")
+    (analysis_dir / "gap-candidates.json").write_text(
+        json.dumps(gaps, ensure_ascii=False, indent=2), encoding="utf-8")
+    return root
+
+
+# ── Runner ────────────────────────────────────────────────────────────────
+
+@contextlib.contextmanager
+def corpus_paths(root: Path):
+    """rice_calculator / priority_index のパス定数を合成コーパスへ一時的に差し替え。"""
+    cache_dir = root / ".quality" / "cache"
+    patches = [
+        (rice_calculator, "PROJECT_ROOT", root),
+        (rice_calculator, "FEATURES_DIR", root / "docs" / "features"),
+        (rice_calculator, "REGISTRY_PATH", root / "docs" / "analysis" / "competitor-registry.json"),
+        (rice_calculator, "GAP_CANDIDATES_PATH", root / "docs" / "analysis" / "gap-candidates.json"),
+        (rice_calculator, "PARSE_CACHE_PATH", cache_dir / "rice_parse_cache.json"),
+        (priority_index, "PRIORITY_INDEX_PATH", cache_dir / "priority-index.json"),
+    ]
+    saved = [(mod, name, getattr(mod, name)) for mod, name, _ in patches]
+    for mod, name, value in patches:
+        setattr(mod, name, value)
+    try:
+        yield
+    finally:
+        for mod, name, value in saved:
+            setattr(mod, name, value)
+
+
+def _run_process_features(feature_dirs: list[Path], registry: RegistryData, gaps: GapData,
+                          cache: Optional[ParseCache]) -> list[dict]:
+    return [process_feature(fd, registry, gaps, None, False, False, parse_cache=cache)
+            for fd in feature_dirs]
+
+
+def _run_main(argv: list[str]) -> None:
+    saved = sys.argv
+    sys.argv = ["rice_calculator.py", *argv]
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            rice_calculator.main()
+    except SystemExit:
+        pass
+    finally:
+        sys.argv = saved
+
+
+def _drop_memo_caches() -> None:
+    """プロセス内のファイル読み込み LRU / ダイジェストのメモを破棄 (コールド計測の前に呼ぶ)"""
+    context_corpus.clear_cache()
+    check_cache.clear_digest_cache()
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench_size(root: Path, repeat: int, jobs: int) -> dict[str, list[float]]:
+    """生成済みコーパスで全シナリオを repeat 回計測。シナリオ → 秒数リスト。"""
+    timings: dict[str, list[float]] = {name: [] for name in SCENARIOS}
+    parse_cache_path = root / ".quality" / "cache" / "rice_parse_cache.json"
+    main_args = ["--jobs", str(jobs)]
+    with corpus_paths(root):
+        registry = RegistryData()
+        gaps = GapData()
+        feature_dirs = discover_feature_dirs()
+        for _ in range(repeat):
+            _drop_memo_caches()
+            timings["process_feature_nocache"].append(
+                _timed(lambda: _run_process_features(feature_dirs, registry, gaps, None)))
+            cache = ParseCache()
+            _drop_memo_caches()
+            timings["process_feature_cold"].append(
+                _timed(lambda: _run_process_features(feature_dirs, registry, gaps, cache)))
+            timings["process_feature_warm"].append(
+                _timed(lambda: _run_process_features(feature_dirs, registry, gaps, cache)))
+
+            parse_cache_path.unlink(missing_ok=True)
+            _drop_memo_caches()
+            timings["main_cold"].append(_timed(lambda: _run_main(main_args)))
+            timings["main_warm"].append(_timed(lambda: _run_main(main_args)))
+    return timings
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                             capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def run_benchmark(sizes: list[int], repeat: int = 3, jobs: int = 1, seed: int = 0,
+                  registry_size: Optional[int] = None, gap_size: Optional[int] = None,
+                  workdir: Optional[Path] = None) -> dict:
+    """サイズごとにコーパスを生成して計測。結果ドキュメント (JSON化可能) を返す。"""
+    results = []
+    with tempfile.TemporaryDirectory(prefix="rice-bench-", dir=workdir) as tmp:
+        for size in sizes:
+            root = Path(tmp) / f"n{size}"
+            gen_start = time.perf_counter()
+            generate_corpus(root, size, seed=seed, registry_size=registry_size, gap_size=gap_size)
+            gen_seconds = time.perf_counter() - gen_start
+            timings = bench_size(root, repeat, jobs)
+            for scenario, samples in timings.items():
+                median = statistics.median(samples)
+                results.append({
+                    "size": size,
+                    "scenario": scenario,
+                    "samples": [round(s, 6) for s in samples],
+                    "seconds_min": round(min(samples), 6),
+                    "seconds_median": round(median, 6),
+                    "per_feature_us": round(median / size * 1e6, 2),
+                })
+            results.append({"size": size, "scenario": "generate_corpus",
+                            "samples": [round(gen_seconds, 6)],
+                            "seconds_min": round(gen_seconds, 6),
+                            "seconds_median": round(gen_seconds, 6),
+                            "per_feature_us": round(gen_seconds / size * 1e6, 2)})
+            shutil.rmtree(root, ignore_errors=True)
+
+    return {
+        "format_version": BENCH_FORMAT_VERSION,
+        "benchmark": "rice_calculator",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {"sizes": sizes, "repeat": repeat, "jobs": jobs, "seed": seed,
+                   "registry_size": registry_size, "gap_size": gap_size},
+        "results": results,
+    }
+
+
+def compare_results(base: dict, current: dict, max_regression: float) -> tuple[list[str], bool]:
+    """(size, scenario) ごとに median を比較。回帰閾値超過があれば False。"""
+    base_map = {(r["size"], r["scenario"]): r for r in base.get("results", [])}
+    lines = []
+    ok = True
+    for r in current["results"]:
+        if r["scenario"] == "generate_corpus":
+            continue
+        prev = base_map.get((r["size"], r["scenario"]))
+        if prev is None or prev["seconds_median"] <= 0:
+            continue
+        ratio = r["seconds_median"] / prev["seconds_median"]
+        flag = ""
+        if ratio > 1 + max_regression:
+            flag = "  ❌ REGRESSION"
+            ok = False
+        lines.append(f"  {r['size']:>6d} {r['scenario']:26s} {prev['seconds_median']:9.4f}s → "
+                     f"{r['seconds_median']:9.4f}s ({ratio:5.2f}x){flag}")
+    return lines, ok
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="RICE Calculator 合成コーパスベンチマーク")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="Feature数 (デフォルト: 100 1000 10000)")
+    parser.add_argument("--repeat", type=int, default=3, help="各シナリオの繰り返し回数 (デフォルト: 3)")
+    parser.add_argument("--jobs", type=int, default=1, help="main() に渡す --jobs (デフォルト: 1)")
+    parser.add_argument("--seed", type=int, default=0, help="コーパス生成シード")
+    parser.add_argument("--registry-size", type=int, default=None,
+                        help="competitor-registry features 数 (デフォルト: N/2)")
+    parser.add_argument("--gap-size", type=int, default=None,
+                        help="gap-candidates 数 (デフォルト: N/3)")
+    parser.add_argument("--workdir", type=Path, default=None, help="コーパス生成先の親ディレクトリ")
+    parser.add_argument("--output", type=Path, default=None,
+                        help=f"結果JSON (デフォルト: {BENCH_OUTPUT_DIR.relative_to(PROJECT_ROOT)}/rice_calculator-<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None, help="比較対象の過去結果JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2,
+                        help="--compare 時の許容劣化率 (デフォルト: 0.2 = +20%%)")
+    parser.add_argument("--generate-only", type=Path, metavar="DIR",
+                        help="計測せずコーパスのみ DIR に生成 (--sizes の先頭値を使用)")
+    args = parser.parse_args()
+
+    if args.generate_only:
+        generate_corpus(args.generate_only, args.sizes[0], seed=args.seed,
+                        registry_size=args.registry_size, gap_size=args.gap_size)
+        print(f"コーパス生成: {args.generate_only} ({args.sizes[0]} features)")
+        return
+
+    doc = run_benchmark(args.sizes, repeat=args.repeat, jobs=args.jobs, seed=args.seed,
+                        registry_size=args.registry_size, gap_size=args.gap_size,
+                        workdir=args.workdir)
+
+    output = args.output or BENCH_OUTPUT_DIR / f"rice_calculator-{doc['git_commit'] or 'unknown'}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(doc, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    print(f"\n── RICE Calculator Benchmark (commit {doc['git_commit'] or '-'}, "
+          f"repeat {args.repeat}, jobs {args.jobs}) ──")
+    print(f"  {'size':>6s} {'scenario':26s} {'median':>10s} {'min':>10s} {'µs/feature':>11s}")
+    for r in doc["results"]:
+        print(f"  {r['size']:>6d} {r['scenario']:26s} {r['seconds_median']:9.4f}s "
+              f"{r['seconds_min']:9.4f}s {r['per_feature_us']:11.1f}")
+    print(f"\n結果: {output}")
+
+    if args.compare:
+        base = json.loads(args.compare.read_text(encoding="utf-8"))
+        lines, ok = compare_results(base, doc, args.max_regression)
+        print(f"\n── Compare vs {base.get('git_commit') or args.compare} ──")
+        print("\n".join(lines) if lines else "  (共通シナリオなし)")
+        if not ok:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,9 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import json_codec  # noqa: E402
+
 # ── Project Root ──────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 FEATURES_DIR = PROJECT_ROOT / "docs" / "features"
@@ -53,8 +56,7 @@ def _load_context(feature_dir: Path) -> dict | None:
     if not ctx_path.exists():
         return None
     try:
-        with ctx_path.open("r", encoding="utf-8") as f:
-            return json.load(f)
+        return json_codec.load_path(ctx_path)
     except (json.JSONDecodeError, OSError):
         return None
 
@@ -476,13 +478,10 @@ def regenerate_brief(feature_dir: Path, apply: bool, verbose: bool) -> dict:
         ctx_path = feature_dir / "CONTEXT.json"
         if ctx_path.exists():
             try:
-                ctx_data = json.loads(ctx_path.read_text(encoding="utf-8"))
+                ctx_data = json_codec.load_path(ctx_path)
                 if "artifacts" in ctx_data:
                     ctx_data["artifacts"]["brief_format_version"] = "v2.0"
-                    ctx_path.write_text(
-                        json.dumps(ctx_data, ensure_ascii=False, indent=2) + "\n",
-                        encoding="utf-8",
-                    )
+                    ctx_path.write_bytes(json_codec.dump_bytes(ctx_data, newline=True))
             except (json.JSONDecodeError, KeyError):
                 pass  # CONTEXT.json破損時は無視（BRIEF再生成が主目的）
         result["action"] = "regenerate"
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+changed_scope.py — git diff に基づく検証対象 Feature の絞り込み.
+
+pre-commit 等で全 Feature を毎回検証しないよう、`git diff --name-only` の変更パス
+(--changed-since では未追跡ファイルも含む) を影響する Feature ID
+(docs/features/ のディレクトリ名) に変換する。
+
+- docs/features/<id>/...      → <id>
+- src/features/<name>/...     → feature-registry.json mappings[<name>]
+- feature-registry.json / docs/_templates/ の変更 → 全 Feature (full)
+- 全体チェック (D1, D5, D8 等) は呼び出し側でスコープに関係なく全件実行すること
+
+Usage:
+    from changed_scope import add_scope_arguments, scope_from_args
+
+    add_scope_arguments(parser)                 # --changed-since <ref> / --staged
+    scope = scope_from_args(args, parser)       # None = 全 Feature
+    dirs = scope.filter_dirs(dirs) if scope else dirs
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+from context_corpus import load_json  # noqa: E402
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+FEATURES_DOCS_PREFIX = "docs/features/"
+FEATURES_SRC_PREFIX = "src/features/"
+REGISTRY_REL = "docs/features/feature-registry.json"
+
+# 変更されると全 Feature が影響を受ける入力 (ファイル or ディレクトリ接頭辞)
+GLOBAL_INPUTS = (REGISTRY_REL, "docs/_templates/")
+
+
+@dataclass
+class ChangeScope:
+    """変更パスと影響 Feature ID。full=True なら全 Feature が対象。"""
+
+    paths: list[str]
+    feature_ids: set[str] = field(default_factory=set)
+    full: bool = False
+    source: str = ""
+
+    def includes(self, feature_id: str) -> bool:
+        return self.full or feature_id in self.feature_ids
+
+    def filter_dirs(self, feature_dirs: Iterable[Path]) -> list[Path]:
+        return [d for d in feature_dirs if self.includes(d.name)]
+
+    def touches(self, *paths: Path) -> bool:
+        """指定ファイル (絶対パス or プロジェクトルート相対) のいずれかが変更されたか。"""
+        targets = {_relative(Path(p)) for p in paths}
+        return any(p in targets for p in self.paths)
+
+    def describe(self) -> str:
+        target = "全Feature" if self.full else f"{len(self.feature_ids)} Feature"
+        return f"{self.source}: 変更 {len(self.paths)} ファイル → {target}"
+
+
+def _relative(path: Path) -> str:
+    if path.is_absolute():
+        try:
+            path = path.relative_to(PROJECT_ROOT)
+        except ValueError:
+            return path.as_posix()
+    return path.as_posix()
+
+
+# ── git ───────────────────────────────────────────────────────────────────
+
+def git_changed_paths(since: Optional[str] = None, staged: bool = False,
+                      root: Path = PROJECT_ROOT) -> list[str]:
+    """変更ファイル (ルート相対 POSIX パス, ソート済み)。
+
+    staged=True: インデックスの変更 (`git diff --cached`)
+    since=<ref>: <ref> と作業ツリーの差分 (ステージ済み + 未ステージ)
+                 + 未追跡ファイル (`git ls-files --others --exclude-standard`)
+    リネームは旧パス/新パスの両方を返す。git 失敗時は ValueError。
+    """
+    # --relative: リポジトリがプロジェクトルートより上にあってもルート相対で返す
+    cmd = ["git", "diff", "--name-only", "--no-renames", "--relative", "-z"]
+    if staged:
+        cmd.append("--cached")
+    if since:
+        cmd.extend([since, "--"])
+    names = _git_names(cmd, root)
+    if not staged:
+        # 新規ファイルは git add されるまで diff に現れない (ls-files も cwd 相対)
+        names += _git_names(["git", "ls-files", "--others", "--exclude-standard", "-z"], root)
+    return sorted({n for n in names if n})
+
+
+def _git_names(cmd: list[str], root: Path) -> list[str]:
+    """NUL 区切りのパス一覧を返す git コマンドを実行。失敗時は ValueError。"""
+    try:
+        result = subprocess.run(cmd, cwd=root, capture_output=True)
+    except OSError as e:
+        raise ValueError(f"git 実行失敗: {e}") from e
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", "replace").strip()
+        raise ValueError(f"{cmd[0]} {cmd[1]} 失敗: {message or result.returncode}")
+    return result.stdout.decode("utf-8", "surrogateescape").split("\0")
+
+
+# ── Path → Feature ────────────────────────────────────────────────────────
+
+def load_mappings(registry_path: Path = PROJECT_ROOT / REGISTRY_REL) -> dict[str, str]:
+    """feature-registry.json の src名 → docs Feature ID (読み込み失敗時は空)。"""
+    try:
+        registry = load_json(registry_path)
+    except (OSError, ValueError):
+        return {}
+    mappings = registry.get("mappings") if isinstance(registry, dict) else None
+    return dict(mappings) if isinstance(mappings, dict) else {}
+
+
+def features_for_paths(paths: Iterable[str], mappings: dict[str, str],
+                       source: str = "") -> ChangeScope:
+    """変更パス (ルート相対) → ChangeScope。"""
+    paths = sorted({_relative(Path(p)) for p in paths})
+    scope = ChangeScope(paths=paths, source=source)
+    for rel in paths:
+        if any(rel == g or (g.endswith("/") and rel.startswith(g)) for g in GLOBAL_INPUTS):
+            scope.full = True
+            continue
+        for prefix in (FEATURES_DOCS_PREFIX, FEATURES_SRC_PREFIX):
+            if not rel.startswith(prefix):
+                continue
+            name, sep, _ = rel[len(prefix):].partition("/")
+            if not sep:
+                # docs/features/index.md 等の直下ファイル (全体チェックの対象)
+                break
+            if prefix == FEATURES_DOCS_PREFIX:
+                scope.feature_ids.add(name)
+            elif name in mappings:
+                # 未登録の src/features/<name> は D1 (全体チェック) で検出
+                scope.feature_ids.add(mappings[name])
+            break
+    return scope
+
+
+def resolve_scope(since: Optional[str] = None, staged: bool = False,
+                  root: Path = PROJECT_ROOT) -> ChangeScope:
+    """git diff → ChangeScope。"""
+    paths = git_changed_paths(since, staged, root)
+    source = "staged" if staged else f"changed since {since}"
+    return features_for_paths(paths, load_mappings(root / REGISTRY_REL), source)
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────
+
+def add_scope_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--changed-since", metavar="REF",
+                       help="REF からの変更 (git diff + 未追跡ファイル) に影響する Feature のみ検証")
+    group.add_argument("--staged", action="store_true",
+                       help="ステージ済みの変更に影響する Feature のみ検証 (pre-commit 用)")
+
+
+def scope_from_args(args: argparse.Namespace,
+                    parser: argparse.ArgumentParser) -> Optional[ChangeScope]:
+    """--changed-since / --staged 指定時の ChangeScope (未指定なら None = 全 Feature)。"""
+    if not (args.changed_since or args.staged):
+        return None
+    try:
+        return resolve_scope(args.changed_since, args.staged)
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    cli = argparse.ArgumentParser(description="git diff → 影響 Feature ID 一覧")
+    add_scope_arguments(cli)
+    cli_args = cli.parse_args()
+    if not (cli_args.changed_since or cli_args.staged):
+        cli_args.changed_since = "HEAD"
+    result = scope_from_args(cli_args, cli)
+    print(result.describe())
+    for feature_id in sorted(result.feature_ids):
+        print(f"  {feature_id}")
+    sys.exit(0)
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+check_cache.py — 検証チェック結果の入力ハッシュキャッシュ.
+
+入力ファイルの純関数であるチェック (validate_ui_flow V1–V12, NavGraphValidator,
+validate_docs_consistency D5 等) について、宣言した入力の内容ダイジェスト +
+スクリプト自体のダイジェストをキーに結果を永続化し、何も変わっていなければ
+チェックを実行せずに前回の結果を返す。
+
+- 入力: Path (ファイル内容), Listing(dir) (ディレクトリ直下の名前一覧), str (任意の値)
+- スクリプト (バージョン) が変われば全エントリが自動的に不一致になる
+- 保存時にサイズ上限 (デフォルト 4 MiB, QUALITY_CHECK_CACHE_MAX_BYTES) を超えた分は
+  最も古く使われたエントリから破棄
+- キャッシュから返した結果は呼び出し側でレポートに明示すること (古いキャッシュの不具合を可視化)
+
+Usage:
+    from check_cache import CheckCache, Listing, script_version
+
+    cache = CheckCache()
+    value, hit = cache.cached("ui-flow/V8", [ui_flow_path, Listing(FEATURES_DIR)],
+                              script_version(__file__), compute, encode=asdict,
+                              decode=lambda d: CheckResult(**d))
+    cache.save()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable, NamedTuple, Optional, Union
+
+import json_codec
+from atomic_write import write_bytes_atomic
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CHECK_CACHE_PATH = PROJECT_ROOT / ".quality" / "cache" / "check_results.json"
+CHECK_CACHE_MAX_BYTES = 4 * 1024 * 1024
+MAX_BYTES_ENV = "QUALITY_CHECK_CACHE_MAX_BYTES"
+
+
+class Listing(NamedTuple):
+    """ディレクトリ直下のエントリ名一覧を入力とする (ファイル内容は含まない)。"""
+    path: Path
+
+
+CacheInput = Union[Path, Listing, str]
+
+
+# ── Digests ───────────────────────────────────────────────────────────────
+
+# (path, mtime_ns, size, inode) → sha256: 常駐プロセスで同じファイルを再ハッシュしない
+_FILE_DIGESTS: dict[tuple, str] = {}
+_DIGEST_LOCK = threading.Lock()
+
+
+def file_digest(path: Path) -> str:
+    """ファイル内容の sha256 (存在しなければ "-")。"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return "-"
+    sig = (os.fspath(path), st.st_mtime_ns, st.st_size, st.st_ino)
+    with _DIGEST_LOCK:
+        digest = _FILE_DIGESTS.get(sig)
+    if digest is None:
+        try:
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return "-"
+        with _DIGEST_LOCK:
+            _FILE_DIGESTS[sig] = digest
+    return digest
+
+
+def clear_digest_cache() -> None:
+    """file_digest のメモを破棄 (ベンチマークのコールド計測用)。"""
+    with _DIGEST_LOCK:
+        _FILE_DIGESTS.clear()
+
+
+def script_version(*paths) -> str:
+    """チェックを実装するスクリプトのダイジェスト (コード変更でキャッシュ無効化)。"""
+    return hashlib.sha256("".join(file_digest(Path(p)) for p in paths).encode()).hexdigest()[:16]
+
+
+def input_digest(item: CacheInput) -> str:
+    if isinstance(item, Listing):
+        try:
+            names = sorted(os.listdir(item.path))
+        except OSError:
+            return "listing:-"
+        return "listing:" + hashlib.sha256("\0".join(names).encode("utf-8", "surrogateescape")).hexdigest()
+    if isinstance(item, Path):
+        return "file:" + file_digest(item)
+    return "value:" + hashlib.sha256(str(item).encode("utf-8")).hexdigest()
+
+
+def make_key(check_id: str, inputs: Iterable[CacheInput], version: str) -> str:
+    h = hashlib.sha256(f"{CheckCache.FORMAT_VERSION}\0{check_id}\0{version}".encode())
+    for item in inputs:
+        h.update(b"\0" + input_digest(item).encode())
+    return f"{check_id}:{h.hexdigest()}"
+
+
+# ── Cache ─────────────────────────────────────────────────────────────────
+
+class CheckCache:
+    """チェック結果の永続キャッシュ (スレッドセーフ: quality_runner の並行チェックで共有)。"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: Optional[Path] = CHECK_CACHE_PATH, max_bytes: Optional[int] = None):
+        self.path = path
+        if max_bytes is None:
+            max_bytes = int(os.environ.get(MAX_BYTES_ENV, CHECK_CACHE_MAX_BYTES))
+        self.max_bytes = max_bytes
+        self.entries: dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        if path is not None:
+            self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            data = json_codec.loads(self.path.read_bytes())
+        except (json.JSONDecodeError, OSError):
+            return  # 破損キャッシュは無視 (次回保存で再生成)
+        if data.get("format_version") == self.FORMAT_VERSION:
+            self.entries = data.get("entries", {})
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            entry["used"] = time.time()
+            self._dirty = True
+            return entry["value"]
+
+    def put(self, key: str, value: Any) -> None:
+        size = len(json_codec.dump_bytes(value, pretty=False))
+        with self._lock:
+            self.entries[key] = {"value": value, "size": size, "used": time.time()}
+            self._dirty = True
+
+    def cached(self, check_id: str, inputs: Iterable[CacheInput], version: str,
+               compute: Callable[[], Any], encode: Callable[[Any], Any] = lambda v: v,
+               decode: Callable[[Any], Any] = lambda v: v) -> tuple[Any, bool]:
+        """キャッシュ済みなら decode(保存値), なければ compute() して保存。Returns (結果, hit)。"""
+        key = make_key(check_id, inputs, version)
+        stored = self.get(key)
+        if stored is not None:
+            return decode(stored), True
+        value = compute()
+        self.put(key, encode(value))
+        return value, False
+
+    def _evict(self) -> None:
+        total = sum(e["size"] for e in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for key in sorted(self.entries, key=lambda k: self.entries[k]["used"]):
+            total -= self.entries.pop(key)["size"]
+            self.evictions += 1
+            if total <= self.max_bytes:
+                break
+
+    def save(self) -> None:
+        """変更があれば保存 (サイズ上限超過分は LRU で破棄)。"""
+        with self._lock:
+            if self.path is None or not self._dirty:
+                return
+            self._evict()
+            payload = {"format_version": self.FORMAT_VERSION, "entries": self.entries}
+            content = json_codec.dump_bytes(payload, pretty=False)
+            self._dirty = False
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # キャッシュは再生成可能なため fsync 不要
+        write_bytes_atomic(self.path, content, durable=False)
+
+    def summary(self) -> str:
+        return (f"チェックキャッシュ: {self.hits} hit / {self.misses} miss, "
+                f"{len(self.entries)} entries, {self.evictions} evicted")
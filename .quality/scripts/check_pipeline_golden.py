@@ -25,6 +25,9 @@ import re
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import json_codec  # noqa: E402
+
 
 SCAN_STATUS_PATH = Path(".claude/skills/market-intelligence-scanner/assets/scan-status.json")
 FEATURES_DIR = Path("docs/features")
@@ -47,8 +50,7 @@ def check_pipeline_golden(verbose: bool = False) -> dict:
         return {"status": "error", "errors": ["scan-status.json ファイルが見つかりません"], "warnings": [], "info": []}
 
     try:
-        with open(SCAN_STATUS_PATH, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.load_path(SCAN_STATUS_PATH)
     except json.JSONDecodeError as e:
         return {"status": "error", "errors": [f"JSONパース失敗: {e}"], "warnings": [], "info": []}
 
@@ -247,7 +249,7 @@ def main():
 
     if args.json:
         result["checked_at"] = datetime.now(timezone.utc).isoformat()
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(json_codec.dumps(result))
     else:
         summary = result["summary"]
         print(f"\n🔍 パイプラインゴールデンテスト")
@@ -17,12 +17,15 @@ Options:
   --json            JSON形式で出力
 """
 
-import json
 import sys
 import argparse
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+from context_corpus import load_json  # noqa: E402
+import json_codec  # noqa: E402
+
 
 STALE_THRESHOLD_DAYS = 14
 FEATURES_DIR = Path("docs/features")
@@ -50,9 +53,8 @@ def check_stale_priorities(threshold_days: int = STALE_THRESHOLD_DAYS) -> list[d
 
     for context_file in context_files:
         try:
-            with open(context_file, encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            data = load_json(context_file)
+        except (ValueError, OSError) as e:
             print(f"⚠️  ファイル読み取りエラー: {context_file} - {e}", file=sys.stderr)
             continue
 
@@ -124,7 +126,7 @@ def main():
             "threshold_days": args.threshold,
             "checked_at": datetime.now(timezone.utc).isoformat()
         }
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(json_codec.dumps(result))
     else:
         # コンソール出力
         total_checked = len(list(FEATURES_DIR.glob("*/CONTEXT.json")))
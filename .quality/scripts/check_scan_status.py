@@ -23,6 +23,17 @@ import argparse
 from datetime import datetime, timezone
 from pathlib import Path
 
+# source_docs / doc_path の存在確認を1回のディレクトリ走査で応答
+sys.path.insert(0, str(Path(__file__).parent))
+try:
+    from path_index import get_index
+
+    HAS_PATH_INDEX = True
+except ImportError:
+    HAS_PATH_INDEX = False
+
+import json_codec  # noqa: E402
+
 
 SCAN_STATUS_PATH = Path(".claude/skills/market-intelligence-scanner/assets/scan-status.json")
 SCHEMA_PATH = Path(".claude/skills/market-intelligence-scanner/references/scan-status-schema.json")
@@ -67,8 +78,7 @@ def _load_from_schema() -> tuple[set, set, dict, dict, list]:
         return _FALLBACK_STATUSES, _FALLBACK_PHASES, _FALLBACK_CONDITIONAL_REQUIRED, _FALLBACK_TRANSITIONS, load_warnings
 
     try:
-        with open(SCHEMA_PATH, encoding="utf-8") as f:
-            schema = json.load(f)
+        schema = json_codec.load_path(SCHEMA_PATH)
     except (json.JSONDecodeError, IOError) as e:
         load_warnings.append(f"スキーマパース失敗 ({e}), fallback を使用")
         return _FALLBACK_STATUSES, _FALLBACK_PHASES, _FALLBACK_CONDITIONAL_REQUIRED, _FALLBACK_TRANSITIONS, load_warnings
@@ -121,6 +131,13 @@ def _load_from_schema() -> tuple[set, set, dict, dict, list]:
 VALID_STATUSES, VALID_PHASES, CONDITIONAL_REQUIRED, VALID_TRANSITIONS, _SCHEMA_LOAD_WARNINGS = _load_from_schema()
 
 
+def _path_exists(path: str) -> bool:
+    """カレントディレクトリ相対パスの存在確認。"""
+    if HAS_PATH_INDEX:
+        return get_index(Path.cwd()).exists(path)
+    return Path(path).exists()
+
+
 def parse_iso_datetime(dt_str: str) -> datetime:
     """ISO 8601 形式の datetime 文字列をパースします。"""
     dt_str = dt_str.replace("Z", "+00:00")
@@ -146,7 +163,7 @@ def check_scan_status(fix: bool = False) -> dict:
     try:
         with open(SCAN_STATUS_PATH, encoding="utf-8") as f:
             raw_content = f.read()
-        data = json.loads(raw_content)
+        data = json_codec.loads(raw_content)
     except json.JSONDecodeError as e:
         return {"status": "error", "errors": [f"JSONパース失敗: {e}"], "warnings": [], "fixes": []}
 
@@ -230,14 +247,13 @@ def check_scan_status(fix: bool = False) -> dict:
         if isinstance(source_docs, list):
             for doc_name in source_docs:
                 if isinstance(doc_name, str) and doc_name:
-                    doc_full_path = Path(f"docs/research/{doc_name}")
-                    if not doc_full_path.exists():
+                    if not _path_exists(f"docs/research/{doc_name}"):
                         warnings.append(f"candidate[{cid}]: source_docs '{doc_name}' ファイルが存在しません")
 
         # ── [v3 新規ルール 7] doc_path ファイル存在検証 ──
         doc_path = candidate.get("doc_path")
         if doc_path and isinstance(doc_path, str):
-            if not Path(doc_path).exists():
+            if not _path_exists(doc_path):
                 errors.append(f"candidate[{cid}]: doc_path '{doc_path}' ファイルが存在しません")
 
         # history 配列の検証 (v2+ 専用)
@@ -344,9 +360,7 @@ def check_scan_status(fix: bool = False) -> dict:
     if fix and fixes_applied:
         backup_path = SCAN_STATUS_PATH.with_suffix(".json.check-bak")
         backup_path.write_text(raw_content, encoding="utf-8")
-        with open(SCAN_STATUS_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.write("\n")
+        SCAN_STATUS_PATH.write_bytes(json_codec.dump_bytes(data, newline=True))
 
     # 8. ステータス別カウント集計（main() での二重読み取り防止）
     status_counts = {}
@@ -381,7 +395,7 @@ def main():
 
     if args.json:
         result["checked_at"] = datetime.now(timezone.utc).isoformat()
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        print(json_codec.dumps(result))
     else:
         summary = result["summary"]
         ssot = summary.get("ssot_source", "unknown")
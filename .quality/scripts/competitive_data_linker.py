@@ -16,13 +16,17 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import json
 import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+import context_corpus  # noqa: E402
+from atomic_write import WriteBatch, write_json_atomic  # noqa: E402
+
 # ---------------------------------------------------------------------------
 # Path Constants
 # ---------------------------------------------------------------------------
@@ -86,16 +90,19 @@ def _token_similarity(a: str, b: str) -> float:
 # ---------------------------------------------------------------------------
 
 def load_json(path: Path) -> Any:
-    """JSONファイルを読み込む。"""
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    """JSONファイルを読み込む (context_corpus 経由, 書き換え用の複製)。"""
+    return context_corpus.load_json(path, mutable=True)
 
 
-def save_json(path: Path, data: Any) -> None:
-    """JSONファイルを保存する (indent=2, ensure_ascii=False)。"""
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+def save_json(path: Path, data: Any, batch: WriteBatch | None = None) -> bool:
+    """JSONファイルを保存する (indent=2, ensure_ascii=False)。
+
+    内容不変なら書き込まない。batch指定時はコミットまで予約のみ。
+    書き込み (予約) した場合 True を返す。
+    """
+    if batch is None:
+        return write_json_atomic(path, data)
+    return batch.stage_json(path, data)
 
 
 def discover_features(features_dir: Path, feature_filter: str | None = None) -> list[Path]:
@@ -306,6 +313,7 @@ def main() -> int:
     updated_count = 0
     skipped_count = 0
 
+    batch = WriteBatch()
     for ctx_path in ctx_paths:
         ctx_data = load_json(ctx_path)
         feature_id = ctx_data.get("feature_id", ctx_path.parent.name)
@@ -322,7 +330,7 @@ def main() -> int:
         if changed:
             updated_count += 1
             if args.apply:
-                save_json(ctx_path, ctx_data)
+                save_json(ctx_path, ctx_data, batch)
         else:
             skipped_count += 1
 
@@ -341,6 +349,9 @@ def main() -> int:
             "changed": changed,
         })
 
+    # 変更のあったCONTEXT.jsonを一括アトミック書き込み
+    written = batch.commit()
+
     # Summary table
     print(f"{'Feature':>8}  {'Title':<32} {'Comp IDs':<30} {'Tier':<6} {'Severity':<10} {'Status':<8}")
     print("-" * 100)
@@ -352,6 +363,8 @@ def main() -> int:
 
     print("-" * 100)
     print(f"Total: {len(results)} features | Updated: {updated_count} | Skipped: {skipped_count}")
+    if args.apply:
+        print(f"Written: {len(written)} files")
     if not args.apply and updated_count > 0:
         print(f"\n(Dry-runモード: --applyフラグで実行すると{updated_count}件のファイルが変更されます)")
 
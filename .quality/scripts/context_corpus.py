@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+context_corpus.py — Feature コーパス (CONTEXT.json / BRIEF.md / SPEC) の共有メモ化ローダー.
+
+品質スクリプト (rice_calculator, feature_doctor, check_priority_stale,
+feedback_loop_updater, competitive_data_linker, validate_docs_consistency 等) が
+同一プロセス内で同じ CONTEXT.json を個別にパースしないよう、ファイル単位で
+(path, mtime_ns, size, inode) をキーにパース結果をキャッシュする (LRU で上限管理)。
+
+- ファイルが更新されれば stat が変わるため自動で再パース (明示的な無効化は不要)
+- load_json(mutable=False) は共有オブジェクトを返す: 呼び出し側で変更しないこと
+- 書き換える呼び出し側は mutable=True (キャッシュから JSON ツリーを複製, 再パースより高速)
+- パース失敗はキャッシュしない (例外は json.load と同一: OSError / ValueError)
+
+Usage:
+    from context_corpus import load_context, load_corpus, load_json
+
+    ctx = load_context(feature_dir)                     # None = なし/破損 (読み取り専用)
+    data = load_json(path, mutable=True)                # 書き戻し用コピー
+    for record in load_corpus(FEATURES_DIR):            # 全Featureを1回ずつロード
+        record.id, record.context, record.brief_path, record.spec_path
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import json_codec
+
+# キャッシュ上限 (CONTEXT.json + BRIEF.md + 分析JSON。超過分は最も古く参照されたものから破棄)
+CORPUS_CACHE_MAX_ENTRIES = 4096
+
+CONTEXT_FILE = "CONTEXT.json"
+BRIEF_FILE = "BRIEF.md"
+SPEC_GLOB = "SPEC*.md"
+
+
+# ── File Cache ────────────────────────────────────────────────────────────
+
+class FileCache:
+    """stat シグネチャ検証付き LRU キャッシュ。値は (種別, パス) 単位で保持。
+
+    quality_runner.py の並行チェックから共有されるため、辞書操作はロックで保護する
+    (読み込み・パース自体はロック外: 同一ファイルの同時ミスは重複パースになるだけ)。
+    """
+
+    def __init__(self, max_entries: int = CORPUS_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[tuple, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, path: Path, loader: Callable[[bytes], Any]) -> Any:
+        """path の内容を loader(raw) で変換した値。stat 不変ならキャッシュを返す。"""
+        key = (kind, os.fspath(path))
+        # 読み込み前に stat: 読み込み中に更新されても次回アクセスでシグネチャ不一致 → 再パース
+        st = os.stat(key[1])
+        sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == sig:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        with open(key[1], "rb") as f:
+            value = loader(f.read())
+        with self._lock:
+            self._entries[key] = (sig, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = (self.hits / total * 100) if total else 0.0
+        return (f"コーパスキャッシュ: {self.hits} hit / {self.misses} miss ({rate:.0f}%), "
+                f"{len(self)} entries, {self.evictions} evicted")
+
+
+# プロセス共有キャッシュ
+_CACHE = FileCache()
+
+
+def get_cache() -> FileCache:
+    return _CACHE
+
+
+def clear_cache() -> None:
+    _CACHE.clear()
+
+
+def _tree_copy(value: Any) -> Any:
+    """JSON ツリー (dict/list/スカラー) の高速複製 (copy.deepcopy の約3倍速)。"""
+    t = type(value)
+    if t is dict:
+        return {k: _tree_copy(v) for k, v in value.items()}
+    if t is list:
+        return [_tree_copy(v) for v in value]
+    return value
+
+
+# ── Loaders ───────────────────────────────────────────────────────────────
+
+def load_bytes(path: Path) -> bytes:
+    """ファイル内容 (bytes)。OSError はそのまま送出。"""
+    return _CACHE.get("bytes", path, bytes)
+
+
+def load_text(path: Path) -> str:
+    """UTF-8 テキスト (Path.read_text() と同一の改行正規化)。"""
+    return _CACHE.get("text", path, _decode_text)
+
+
+def _decode_text(raw: bytes) -> str:
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def load_json(path: Path, mutable: bool = False) -> Any:
+    """JSON ファイル。例外は json.load と同一 (OSError / json.JSONDecodeError / UnicodeDecodeError)。
+
+    Args:
+        mutable: True なら呼び出し側専用の複製を返す (書き換え・書き戻しする場合)
+    """
+    value = _CACHE.get("json", path, json_codec.loads)
+    return _tree_copy(value) if mutable else value
+
+
+def load_context(feature_dir: Path, mutable: bool = False) -> Optional[dict]:
+    """Feature の CONTEXT.json。ファイルなし/パース失敗なら None。"""
+    try:
+        return load_json(feature_dir / CONTEXT_FILE, mutable=mutable)
+    except (OSError, ValueError):
+        return None
+
+
+# ── Corpus ────────────────────────────────────────────────────────────────
+
+@dataclass
+class FeatureRecord:
+    """Feature 1件分。context は共有オブジェクト (読み取り専用)。"""
+
+    feature_dir: Path
+    context: Optional[dict]
+    error: Optional[str]
+    brief_path: Optional[Path]
+    spec_path: Optional[Path]
+
+    @property
+    def id(self) -> str:
+        return self.feature_dir.name
+
+    def brief_text(self) -> Optional[str]:
+        if self.brief_path is None:
+            return None
+        try:
+            return load_text(self.brief_path)
+        except (OSError, UnicodeDecodeError):
+            return None
+
+
+def load_feature(feature_dir: Path) -> FeatureRecord:
+    """Feature ディレクトリ1件をロード (CONTEXT.json パース + BRIEF/SPEC パス解決)。"""
+    context, error = None, None
+    try:
+        context = load_json(feature_dir / CONTEXT_FILE)
+        if not isinstance(context, dict):
+            context, error = None, "CONTEXT.jsonのトップレベルがオブジェクトではありません"
+    except FileNotFoundError:
+        error = "CONTEXT.jsonなし"
+    except (OSError, ValueError) as e:
+        error = f"JSON読み込み失敗: {e}"
+    brief = feature_dir / BRIEF_FILE
+    specs = sorted(feature_dir.glob(SPEC_GLOB))
+    return FeatureRecord(feature_dir, context, error,
+                         brief if brief.is_file() else None, specs[0] if specs else None)
+
+
+def load_corpus(features_dir: Path) -> list[FeatureRecord]:
+    """CONTEXT.json を持つ全 Feature (ディレクトリ名順)。"""
+    if not features_dir.is_dir():
+        return []
+    dirs = sorted(d for d in features_dir.iterdir()
+                  if d.is_dir() and (d / CONTEXT_FILE).exists())
+    return [load_feature(d) for d in dirs]
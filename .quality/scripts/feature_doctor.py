@@ -14,12 +14,15 @@ Exit Codes:
 
 Usage:
   python3 feature_doctor.py [--fix] [--json] [--feature <id>] [--no-sync]
+                            [--changed-since <ref> | --staged]
 
 Options:
   --fix       自動復旧を試行 (テンプレート基盤の補完、欠落CONTEXT.jsonの生成)
   --json      JSON形式で出力
   --feature   特定のfeature IDのみ検査 (部分一致許可)
   --no-sync   related_code/FR状態の自動整理(verify_feature_status)をスキップ
+  --changed-since / --staged
+              git diff で変更された Feature のみ検査 (テンプレート/スキーマ変更時は全件)
 """
 
 from __future__ import annotations
@@ -34,6 +37,13 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import WriteBatch, write_json_atomic  # noqa: E402
+from changed_scope import ChangeScope, add_scope_arguments, scope_from_args  # noqa: E402
+from context_corpus import load_json  # noqa: E402
+import json_codec  # noqa: E402
+
 FEATURES_DIR = Path("docs/features")
 TEMPLATE_PATH = Path("docs/_templates/context_template.json")
 SCHEMA_PATH = Path("docs/_templates/context_schema.json")
@@ -51,8 +61,8 @@ def _now_iso() -> str:
 
 
 def _load_json(path: Path) -> Any:
-    with path.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    # 修復で書き換えるため複製を受け取る (パース自体は context_corpus で1回)
+    return load_json(path, mutable=True)
 
 
 def _strip_comments(value: Any) -> Any:
@@ -81,10 +91,12 @@ def _deep_merge_missing(target: dict, defaults: dict) -> bool:
     return modified
 
 
-def _safe_write_json(path: Path, data: dict) -> None:
-    encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
-    content = encoder.encode(data)
-    path.write_text(content + "\n", encoding="utf-8")
+def _safe_write_json(path: Path, data: dict, batch: WriteBatch | None = None) -> None:
+    """差分がある場合のみアトミックに書き込む。batch指定時はコミットまで予約のみ。"""
+    if batch is None:
+        write_json_atomic(path, data)
+    else:
+        batch.stage_json(path, data)
 
 
 def _find_spec_path(feature_dir: Path) -> str | None:
@@ -134,7 +146,7 @@ def _contains_placeholder(value: Any) -> bool:
 # Core logic
 # ----------------------------
 
-def _feature_dirs(feature_filter: str | None) -> list[Path]:
+def _feature_dirs(feature_filter: str | None, scope: ChangeScope | None = None) -> list[Path]:
     if not FEATURES_DIR.exists():
         return []
 
@@ -146,6 +158,8 @@ def _feature_dirs(feature_filter: str | None) -> list[Path]:
             continue
         if feature_filter and feature_filter not in entry.name:
             continue
+        if scope is not None and not scope.includes(entry.name):
+            continue
         dirs.append(entry)
     return sorted(dirs)
 
@@ -561,20 +575,19 @@ def _run_verify_status(fix: bool, feature_filter: str | None) -> tuple[bool, str
     return False, result.stderr.strip() or result.stdout.strip() or "verify_feature_status 失敗"
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="CONTEXT.json状態診断および復旧")
-    parser.add_argument("--fix", action="store_true", help="自動復旧を試行")
-    parser.add_argument("--json", action="store_true", help="JSON形式で出力")
-    parser.add_argument("--feature", help="特定のfeature IDのみ検査")
-    parser.add_argument("--no-sync", action="store_true", help="verify_feature_statusをスキップ")
-    args = parser.parse_args()
+def run_doctor(fix: bool, feature_filter: str | None, sync: bool,
+               scope: ChangeScope | None = None) -> tuple[dict, str | None]:
+    """全Featureを診断 (fix時は復旧を書き戻し)。Returns (summary, verify_feature_status の結果)。
+
+    scope 指定時は影響 Feature のみ診断 (verify_feature_status はリポジトリ全体で実行)。
 
+    テンプレート/スキーマがなければ FileNotFoundError。
+    quality_runner.py から同一プロセスで呼び出される (出力なし)。
+    """
     if not TEMPLATE_PATH.exists():
-        print("❌ context_template.json なし", file=sys.stderr)
-        sys.exit(1)
+        raise FileNotFoundError("context_template.json なし")
     if not SCHEMA_PATH.exists():
-        print("❌ context_schema.json なし", file=sys.stderr)
-        sys.exit(1)
+        raise FileNotFoundError("context_schema.json なし")
 
     raw_template = _strip_comments(_load_json(TEMPLATE_PATH))
     schema = _load_json(SCHEMA_PATH)
@@ -595,18 +608,20 @@ def main() -> None:
         "items": [],
     }
 
-    for feature_dir in _feature_dirs(args.feature):
+    # 書き戻しは1バッチに集約 (verify_feature_status 実行前にコミット)
+    batch = WriteBatch()
+    for feature_dir in _feature_dirs(feature_filter, scope):
         summary["checked"] += 1
         context_path = feature_dir / "CONTEXT.json"
 
         if not context_path.exists():
-            if args.fix:
+            if fix:
                 stub = _create_stub_context(
                     feature_dir,
                     raw_template,
                     reason="CONTEXT.json なし",
                 )
-                _safe_write_json(context_path, stub)
+                _safe_write_json(context_path, stub, batch)
                 summary["fixed"] += 1
                 summary["warnings"] += 1
                 summary["items"].append(
@@ -632,13 +647,13 @@ def main() -> None:
 
         # JSON破損復旧
         try:
-            _load_json(context_path)
+            load_json(context_path)
         except json.JSONDecodeError:
             context, warnings, errors, modified = _repair_invalid_json(
                 context_path,
                 feature_dir,
                 raw_template,
-                args.fix,
+                fix,
             )
             summary["warnings"] += len(warnings)
             summary["errors"] += len(errors)
@@ -664,11 +679,11 @@ def main() -> None:
             artifact_required,
             state_enum,
             version_enum,
-            args.fix,
+            fix,
         )
 
         if context is not None and modified:
-            _safe_write_json(context_path, context)
+            _safe_write_json(context_path, context, batch)
             summary["fixed"] += 1
 
         summary["warnings"] += len(warnings)
@@ -682,21 +697,52 @@ def main() -> None:
             }
         )
 
+    batch.commit()
+
     # related_code/FR状態の整理
     sync_note = None
-    if not args.no_sync:
-        ok, note = _run_verify_status(args.fix, args.feature)
+    if sync:
+        ok, note = _run_verify_status(fix, feature_filter)
         sync_note = note
         if not ok:
             summary["warnings"] += 1
+    return summary, sync_note
+
+
+def doctor_exit_code(summary: dict) -> int:
+    """エラーあり=1, 警告のみ=2, 正常=0。"""
+    if summary["errors"] > 0:
+        return 1
+    if summary["warnings"] > 0:
+        return 2
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CONTEXT.json状態診断および復旧")
+    parser.add_argument("--fix", action="store_true", help="自動復旧を試行")
+    parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+    parser.add_argument("--feature", help="特定のfeature IDのみ検査")
+    parser.add_argument("--no-sync", action="store_true", help="verify_feature_statusをスキップ")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    scope = scope_from_args(args, parser)
+
+    try:
+        summary, sync_note = run_doctor(args.fix, args.feature, sync=not args.no_sync, scope=scope)
+    except FileNotFoundError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
 
     if args.json:
         if sync_note:
             summary["verify_feature_status"] = sync_note
-        print(json.dumps(summary, indent=2, ensure_ascii=False))
+        print(json_codec.dumps(summary))
     else:
         print("\n🩺 Feature Doctor 結果")
         print("=" * 60)
+        if scope is not None:
+            print(f"Scope: {scope.describe()}")
         for item in summary["items"]:
             if item["status"] == "ok":
                 continue
@@ -712,11 +758,7 @@ def main() -> None:
         if sync_note:
             print(f"verify_feature_status: {sync_note}")
 
-    if summary["errors"] > 0:
-        sys.exit(1)
-    if summary["warnings"] > 0:
-        sys.exit(2)
-    sys.exit(0)
+    sys.exit(doctor_exit_code(summary))
 
 
 if __name__ == "__main__":
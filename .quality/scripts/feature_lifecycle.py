@@ -14,31 +14,30 @@ Usage:
         continue
 """
 
-import json
+import sys
 from pathlib import Path
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+import context_corpus  # noqa: E402
+
 # 非アクティブなライフサイクル状態 (この状態の Feature はパイプライン処理対象から除外)
 INACTIVE_STATES = frozenset({"Archived", "Failed"})
 
 
-def load_context(feature_dir: Path) -> Optional[dict]:
+def load_context(feature_dir: Path, mutable: bool = False) -> Optional[dict]:
     """Feature ディレクトリから CONTEXT.json をロードする。
 
+    context_corpus の共有キャッシュ経由 (同一プロセス内の再パースなし)。
+
     Args:
         feature_dir: Feature ディレクトリパス (例: docs/features/032-text-adventure-mode/)
+        mutable: True なら書き換え用の複製を返す (False は共有オブジェクト: 変更禁止)
 
     Returns:
         パース済み CONTEXT.json dict、または None (ファイルなし/パース失敗)
     """
-    ctx_path = feature_dir / "CONTEXT.json"
-    if not ctx_path.exists():
-        return None
-    try:
-        with open(ctx_path, encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
-        return None
+    return context_corpus.load_context(feature_dir, mutable=mutable)
 
 
 def get_lifecycle_state(context: dict) -> str:
@@ -13,12 +13,16 @@ Usage:
 """
 
 import argparse
-import json
 import re
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).parent))
+
+from atomic_write import WriteBatch, write_json_atomic  # noqa: E402
+from context_corpus import load_json  # noqa: E402
+
 # ── Project Root ──────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 FEATURES_DIR = PROJECT_ROOT / "docs" / "features"
@@ -28,21 +32,18 @@ EXCLUDE_DIRS = {"_templates", "candidates", "priority"}
 
 
 def _load_json(path: Path) -> dict | None:
-    """JSON ファイルをロードする。"""
-    if not path.exists():
-        return None
+    """JSON ファイルをロードする (context_corpus 経由, 書き換え用の複製)。"""
     try:
-        with path.open("r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, OSError):
+        return load_json(path, mutable=True)
+    except (OSError, ValueError):
         return None
 
 
-def _save_json(path: Path, data: dict) -> None:
-    """JSON ファイルを保存する。"""
-    with path.open("w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+def _save_json(path: Path, data: dict, batch: WriteBatch | None = None) -> bool:
+    """JSON ファイルを保存する (内容不変なら書き込まない)。"""
+    if batch is None:
+        return write_json_atomic(path, data)
+    return batch.stage_json(path, data)
 
 
 def _discover_features(feature_filter: str | None) -> list[Path]:
@@ -282,12 +283,17 @@ def main() -> None:
 
     # 適用
     if args.apply and all_changes:
-        if gap_changes:
-            _save_json(GAP_CANDIDATES_PATH, gap_data)
-            print(f"\n[APPLIED] {GAP_CANDIDATES_PATH.relative_to(PROJECT_ROOT)}")
-        if reg_changes:
-            _save_json(REGISTRY_PATH, registry)
-            print(f"[APPLIED] {REGISTRY_PATH.relative_to(PROJECT_ROOT)}")
+        # 2ファイルを1つのバッチでコミット (各ファイルの置換はアトミックだが、2ファイルの組としては
+        # アトミックではない: リネームの間で中断すると片方だけ更新された状態になり得る)
+        with WriteBatch() as batch:
+            if gap_changes:
+                _save_json(GAP_CANDIDATES_PATH, gap_data, batch)
+            if reg_changes:
+                _save_json(REGISTRY_PATH, registry, batch)
+        if batch.written:
+            print()
+        for path in batch.written:
+            print(f"[APPLIED] {path.relative_to(PROJECT_ROOT)}")
     elif all_changes:
         print("\n[DRY-RUN] --apply フラグで実行するとファイルが更新されます。")
 
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+file_watcher.py — 品質スクリプト用のファイル変更監視 (inotify + ポーリングフォールバック).
+
+監視対象はルートディレクトリ + 深さ (0 = 直下のファイルのみ, 1 = 1階層下のサブディレクトリ内まで)
+で指定し、accept() を通過したパスの変更 (作成/更新/削除/リネーム) を返す。
+
+- Linux: inotify (ctypes 経由, 追加依存なし)。新規サブディレクトリは自動で監視追加
+- その他 / inotify 不可: (mtime_ns, size) スナップショット比較のポーリング
+- デバウンス: 最初のイベント後、debounce 秒間イベントが途切れるまで集約してから返す
+- 自己書き込み除外: expect_writes() で記録した stat と一致する変更は無視する
+  (rice_calculator --watch --apply が書き戻した CONTEXT.json で再計算がループしない)
+
+Usage:
+    watcher = create_watcher([(FEATURES_DIR, 1), (ANALYSIS_DIR, 0)], accept=is_relevant)
+    while True:
+        changed = watcher.wait()            # set[Path] (OVERFLOW を含む場合は全体再スキャン)
+        ...
+        watcher.expect_writes(batch.written)
+    watcher.close()
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+# イベントキュー溢れ等で個別パスが不明な場合の番兵 (呼び出し側で全体再スキャン)
+OVERFLOW = Path("<overflow>")
+
+DEFAULT_DEBOUNCE = 0.3
+DEFAULT_POLL_INTERVAL = 1.0
+# デバウンス集約の上限 (連続書き込みが続いても最長この倍率で打ち切る)
+MAX_DEBOUNCE_FACTOR = 10
+
+# ── inotify 定数 (linux/inotify.h) ──
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+_WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+               | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+WatchSpec = tuple[Path, int]
+
+
+def _signature(path: Path) -> Optional[tuple[int, int, int]]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+# ── Base ──────────────────────────────────────────────────────────────────
+
+class _BaseWatcher:
+    """デバウンス・自己書き込み除外の共通部分。サブクラスは _read(timeout) を実装。"""
+
+    backend = "base"
+
+    def __init__(self, specs: Iterable[WatchSpec], accept: Callable[[Path], bool],
+                 debounce: float = DEFAULT_DEBOUNCE):
+        self.specs = [(Path(root), depth) for root, depth in specs]
+        self.accept = accept
+        self.debounce = debounce
+        self._expected: dict[Path, tuple[int, int, int]] = {}
+
+    def _read(self, timeout: Optional[float]) -> set[Path]:
+        raise NotImplementedError
+
+    def expect_writes(self, paths: Iterable[Path]) -> None:
+        """自分で書き込んだパスを記録。現在の stat と一致する間の変更通知は無視する。"""
+        for path in paths:
+            sig = _signature(Path(path))
+            if sig is not None:
+                self._expected[Path(path)] = sig
+
+    def _filter(self, paths: set[Path]) -> set[Path]:
+        out = set()
+        for path in paths:
+            if path == OVERFLOW:
+                out.add(OVERFLOW)
+                continue
+            if not self.accept(path):
+                continue
+            expected = self._expected.get(path)
+            if expected is not None:
+                if _signature(path) == expected:
+                    continue
+                # 外部から更新された: 以降は通常の変更として扱う
+                del self._expected[path]
+            out.add(path)
+        return out
+
+    def wait(self, timeout: Optional[float] = None) -> set[Path]:
+        """変更を待機し、デバウンス後の変更パス集合を返す (timeout 経過時は空集合)。"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            changed = self._filter(self._read(remaining))
+            if changed:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+
+        # 静穏期間 (debounce) が来るまで集約
+        hard_stop = time.monotonic() + self.debounce * MAX_DEBOUNCE_FACTOR
+        while time.monotonic() < hard_stop:
+            more = self._filter(self._read(self.debounce))
+            if not more:
+                break
+            changed |= more
+        return changed
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+# ── Polling ───────────────────────────────────────────────────────────────
+
+class PollingWatcher(_BaseWatcher):
+    """(inode, mtime_ns, size) スナップショット比較による監視。"""
+
+    backend = "polling"
+
+    def __init__(self, specs: Iterable[WatchSpec], accept: Callable[[Path], bool],
+                 debounce: float = DEFAULT_DEBOUNCE, interval: float = DEFAULT_POLL_INTERVAL):
+        super().__init__(specs, accept, debounce)
+        self.interval = interval
+        self._snapshot = self._scan()
+
+    def _scan(self) -> dict[Path, tuple[int, int, int]]:
+        snapshot: dict[Path, tuple[int, int, int]] = {}
+        for root, depth in self.specs:
+            _scan_dir(root, depth, snapshot)
+        return snapshot
+
+    def _read(self, timeout: Optional[float]) -> set[Path]:
+        # デバウンス中は短い間隔で再スキャン (静穏判定を debounce 秒で行うため)
+        step = self.interval if timeout is None else min(self.interval, timeout)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            time.sleep(step)
+            current = self._scan()
+            changed = {p for p in current.keys() | self._snapshot.keys()
+                       if current.get(p) != self._snapshot.get(p)}
+            self._snapshot = current
+            if changed or (deadline is not None and time.monotonic() >= deadline):
+                return changed
+
+
+def _scan_dir(directory: Path, depth: int, out: dict) -> None:
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if depth > 0:
+                    _scan_dir(Path(entry.path), depth - 1, out)
+            elif entry.is_file():
+                st = entry.stat()
+                out[Path(entry.path)] = (st.st_ino, st.st_mtime_ns, st.st_size)
+        except OSError:
+            continue
+
+
+# ── inotify ───────────────────────────────────────────────────────────────
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+_LIBC = _load_libc()
+HAS_INOTIFY = _LIBC is not None
+
+
+class InotifyWatcher(_BaseWatcher):
+    """Linux inotify による監視。未作成のルートは親側の生成を定期確認して後から追加する。"""
+
+    backend = "inotify"
+
+    def __init__(self, specs: Iterable[WatchSpec], accept: Callable[[Path], bool],
+                 debounce: float = DEFAULT_DEBOUNCE, interval: float = DEFAULT_POLL_INTERVAL):
+        super().__init__(specs, accept, debounce)
+        if _LIBC is None:
+            raise OSError("inotify は利用できません")
+        self.interval = interval
+        self._fd = _LIBC.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self._wd: dict[int, tuple[Path, int]] = {}
+        self._pending = list(self.specs)
+        self._attach_pending()
+
+    def _add_watch(self, directory: Path, depth: int, found: Optional[set] = None) -> bool:
+        wd = _LIBC.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            return False
+        self._wd[wd] = (directory, depth)
+        try:
+            entries = list(os.scandir(directory))
+        except OSError:
+            return True
+        for entry in entries:
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir and depth > 0:
+                self._add_watch(Path(entry.path), depth - 1, found)
+            elif not is_dir and found is not None:
+                # 監視開始前に作成されたファイルも変更として通知 (新規ディレクトリの取りこぼし防止)
+                found.add(Path(entry.path))
+        return True
+
+    def _attach_pending(self, found: Optional[set] = None) -> None:
+        still = []
+        for root, depth in self._pending:
+            if not (root.is_dir() and self._add_watch(root, depth, found)):
+                still.append((root, depth))
+        self._pending = still
+
+    def _read(self, timeout: Optional[float]) -> set[Path]:
+        changed: set[Path] = set()
+        if self._pending:
+            self._attach_pending(changed)
+            if changed:
+                return changed
+            # 未作成ルートの出現を interval ごとに確認
+            timeout = self.interval if timeout is None else min(timeout, self.interval)
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        try:
+            buf = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return changed
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+            self._handle(wd, mask, name, changed)
+        return changed
+
+    def _handle(self, wd: int, mask: int, name: bytes, changed: set) -> None:
+        if mask & IN_Q_OVERFLOW:
+            changed.add(OVERFLOW)
+            return
+        watched = self._wd.get(wd)
+        if watched is None:
+            return
+        directory, depth = watched
+        if mask & IN_IGNORED:
+            # 監視ディレクトリ自体が削除された: ルートなら再出現待ちへ
+            del self._wd[wd]
+            if (directory, depth) in self.specs:
+                self._pending.append((directory, depth))
+            return
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF) or not name:
+            return
+        path = directory / os.fsdecode(name)
+        if mask & IN_ISDIR:
+            if depth > 0 and mask & (IN_CREATE | IN_MOVED_TO):
+                self._add_watch(path, depth - 1, changed)
+            elif depth > 0 and mask & (IN_DELETE | IN_MOVED_FROM):
+                # ディレクトリごと消えた: 配下の既知パスは呼び出し側で存在確認する
+                changed.add(path)
+            return
+        changed.add(path)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_watcher(specs: Iterable[WatchSpec], accept: Callable[[Path], bool],
+                   debounce: float = DEFAULT_DEBOUNCE, polling: bool = False,
+                   interval: float = DEFAULT_POLL_INTERVAL) -> _BaseWatcher:
+    """inotify が使えればそれを、不可ならポーリング監視を返す。"""
+    specs = list(specs)
+    if not polling and HAS_INOTIFY:
+        try:
+            return InotifyWatcher(specs, accept, debounce, interval)
+        except OSError as e:
+            print(f"WARNING: inotify 初期化失敗 ({e}), ポーリングへフォールバック",
+                  file=sys.stderr)
+    return PollingWatcher(specs, accept, debounce, interval)
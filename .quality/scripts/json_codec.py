@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+json_codec.py — 品質スクリプト共通の JSON エンコード/デコード層.
+
+orjson がインストールされていれば使用し、なければ標準 json にフォールバックする。
+どちらのバックエンドでも出力バイト列は同一 (リポジトリの差分を安定させるため):
+
+- pretty=True : json.dumps(indent=2, ensure_ascii=False) と同一 (ファイル書き出し標準)
+- pretty=False: json.dumps(separators=(",", ":"), ensure_ascii=False) と同一 (キャッシュ等)
+
+orjson と標準 json で書式が異なる値 (指数表記・1e-4 未満の float, NaN/Infinity,
+64bit を超える int, 非文字列キー, 深すぎる入れ子等) を含む場合はその呼び出しのみ
+標準 json で直列化する。デコードも orjson が拒否する入力 (NaN リテラル, 孤立サロゲート等)
+は標準 json で再試行し、64bit を超えうる整数リテラルを含む入力は最初から標準 json で読む。
+受理範囲・結果・例外 (ValueError 系) は json.loads と同一。
+
+バックエンドは環境変数 QUALITY_JSON_BACKEND (auto / orjson / json) で切り替え可能。
+
+Usage:
+    import json_codec
+
+    data = json_codec.load_path(path)                   # json.load と同等
+    data = json_codec.loads(raw_bytes)                  # bytes / str
+    raw = json_codec.dump_bytes(data, newline=True)     # indent=2 + 末尾改行
+    print(json_codec.dumps(report))                     # indent=2 の str
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from typing import Any, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+BACKEND_ENV = "QUALITY_JSON_BACKEND"
+BACKENDS = ("orjson", "json")
+
+# 以下の検査は数十MBの出力でも直列化本体より十分安いこと (文字列内の誤検知は標準 json に回るだけ)。
+# 先頭が文字クラスの正規表現は全位置で照合が走るため、リテラル始まりの検索 + 前後確認で行う。
+
+# orjson の float 書式が repr() と異なる箇所: 指数表記 ("1e16" vs "1e+16")
+_EXPONENT = re.compile(rb"e[-+]?[0-9]")
+# 同: 1e-4 未満の固定小数表記 ("0.00001" vs "1e-05")
+_TINY_FLOAT = b"0.0000"
+# orjson は 64bit を超える整数リテラルを float に変換するため、19桁以上の数字列は標準 json で読む
+_DIGITS_TO_ZERO = bytes.maketrans(b"123456789", b"000000000")
+_LONG_DIGITS = b"0" * 19
+_SCALAR_TYPES = {str, int, bool, type(None)}
+
+
+def _float_format_differs(out: bytes) -> bool:
+    if _TINY_FLOAT in out:
+        return True
+    return any(out[m.start() - 1:m.start()].isdigit() for m in _EXPONENT.finditer(out))
+
+
+def _has_long_digits(data: Union[bytes, bytearray, str]) -> bool:
+    if isinstance(data, str):
+        data = data.encode("utf-8", "surrogatepass")
+    return _LONG_DIGITS in data.translate(_DIGITS_TO_ZERO)
+
+
+def _has_nonfinite(obj: Any) -> bool:
+    """NaN / Infinity を含むか (orjson は null に変換してしまうため)。x - x は有限なら 0.0。"""
+    if isinstance(obj, float):
+        return bool(obj - obj)
+    if not isinstance(obj, (dict, list, tuple)):
+        return False  # トップレベルのスカラー (None / str / int)
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        for value in (container.values() if isinstance(container, dict) else container):
+            kind = type(value)
+            if kind in _SCALAR_TYPES:
+                continue
+            if isinstance(value, float):
+                if value - value:
+                    return True
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+    return False
+
+
+class JsonCodec:
+    """バックエンド固定のコーデック (ベンチマーク・比較テスト用。通常はモジュール関数を使う)。"""
+
+    def __init__(self, backend: str = "json"):
+        if backend not in BACKENDS:
+            raise ValueError(f"不明な JSON バックエンド: {backend} (有効: {', '.join(BACKENDS)})")
+        if backend == "orjson" and not HAS_ORJSON:
+            raise ValueError("orjson がインストールされていません")
+        self.backend = backend
+
+    # ── デコード ──
+
+    def loads(self, data: Union[bytes, bytearray, str]) -> Any:
+        """json.loads と同一の結果・例外。"""
+        if self.backend == "orjson" and not _has_long_digits(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass  # 標準 json で再試行 (受理できれば同じ値, できなければ同じ例外)
+        return json.loads(data)
+
+    def load_path(self, path: Union[str, os.PathLike]) -> Any:
+        with open(path, "rb") as f:
+            return self.loads(f.read())
+
+    # ── エンコード ──
+
+    def dump_bytes(self, obj: Any, *, pretty: bool = True, sort_keys: bool = False,
+                   newline: bool = False) -> bytes:
+        """UTF-8 バイト列 (pretty=True: indent=2, False: 区切り空白なし)。"""
+        if self.backend == "orjson":
+            out = self._orjson_dumps(obj, pretty, sort_keys)
+            if out is not None:
+                return out + b"\n" if newline else out
+        if pretty:
+            text = json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys)
+        return (text + "\n" if newline else text).encode("utf-8")
+
+    def dumps(self, obj: Any, *, pretty: bool = True, sort_keys: bool = False) -> str:
+        return self.dump_bytes(obj, pretty=pretty, sort_keys=sort_keys).decode("utf-8")
+
+    @staticmethod
+    def _orjson_dumps(obj: Any, pretty: bool, sort_keys: bool) -> bytes | None:
+        """orjson で直列化。標準 json と書式が一致しない可能性があれば None。"""
+        # dataclass / datetime は標準 json が拒否するため orjson でも直列化しない
+        option = orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            out = orjson.dumps(obj, option=option)
+        except TypeError:
+            return None  # 64bit 超の int, 非文字列キー, 未対応型, 循環参照等
+        if _float_format_differs(out):
+            return None
+        if b"null" in out and _has_nonfinite(obj):
+            return None
+        return out
+
+
+def _default_backend() -> str:
+    requested = os.environ.get(BACKEND_ENV, "auto").strip().lower()
+    if requested == "json" or not HAS_ORJSON:
+        return "json"
+    return "orjson"
+
+
+_CODEC = JsonCodec(_default_backend())
+BACKEND = _CODEC.backend
+
+loads = _CODEC.loads
+load_path = _CODEC.load_path
+dump_bytes = _CODEC.dump_bytes
+dumps = _CODEC.dumps
@@ -25,6 +25,8 @@ import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
+import json_codec
+
 
 SCAN_STATUS_PATH = Path(".claude/skills/market-intelligence-scanner/assets/scan-status.json")
 
@@ -159,8 +161,7 @@ def migrate(dry_run: bool = False, no_backup: bool = False) -> dict:
         return {"status": "error", "message": "scan-status.json ファイルが見つかりません"}
 
     try:
-        with open(SCAN_STATUS_PATH, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.load_path(SCAN_STATUS_PATH)
     except json.JSONDecodeError as e:
         return {"status": "error", "message": f"JSON パース失敗: {e}"}
 
@@ -211,9 +212,7 @@ def migrate(dry_run: bool = False, no_backup: bool = False) -> dict:
         result["backup_path"] = str(backup_path)
 
     # 5. 保存
-    with open(SCAN_STATUS_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.write("\n")
+    SCAN_STATUS_PATH.write_bytes(json_codec.dump_bytes(data, newline=True))
 
     return result
 
@@ -20,12 +20,25 @@ Exit codes:
 
 import argparse
 import glob
-import json
 import re
 import sys
 from pathlib import Path
 from typing import Optional
 
+# S1 の glob / S2 の存在確認を1回のディレクトリ走査で応答
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+
+# feature 別シャード構成 (docs/navigation/nav-graph/manifest.json) の読み込み
+from nav_graph_shards import ShardedNavGraph, find_manifest  # noqa: E402
+
+try:
+    from path_index import get_index
+
+    HAS_PATH_INDEX = True
+except ImportError:
+    HAS_PATH_INDEX = False
+
 
 def find_project_root(start: Optional[str] = None) -> Path:
     """package.jsonを探してプロジェクトルートを返却"""
@@ -38,12 +51,17 @@ def find_project_root(start: Optional[str] = None) -> Path:
 
 
 def load_nav_graph(project_root: Path) -> Optional[dict]:
-    """nav-graph.jsonをロード。存在しなければNoneを返却。"""
+    """nav-graph.jsonをロード。存在しなければNoneを返却。
+
+    シャード構成では全シャードをマージする (S1-S3 はすべてのscreenのfile / routeが必要)。
+    """
     path = project_root / "docs" / "navigation" / "nav-graph.json"
+    manifest = find_manifest(path)
+    if manifest is not None:
+        return ShardedNavGraph(manifest).load()
     if not path.exists():
         return None
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return json_codec.load_path(path)
 
 
 def is_barrel_file(filepath: Path) -> bool:
@@ -76,8 +94,12 @@ def scan_code_pages(project_root: Path) -> list[str]:
 
     barrelファイルは除外。_frag.dartはタブフラグメントのため含む。
     """
-    pattern = str(project_root / "lib" / "features" / "*" / "presentation" / "pages" / "**" / "*.dart")
-    all_files = sorted(glob.glob(pattern, recursive=True))
+    if HAS_PATH_INDEX:
+        rel_pattern = "lib/features/*/presentation/pages/**/*.dart"
+        all_files = [str(project_root / p) for p in get_index(project_root).glob(rel_pattern)]
+    else:
+        pattern = str(project_root / "lib" / "features" / "*" / "presentation" / "pages" / "**" / "*.dart")
+        all_files = sorted(glob.glob(pattern, recursive=True))
 
     pages = []
     for filepath_str in all_files:
@@ -176,9 +198,13 @@ def check_s2(
     Returns: [(screen_id, file_path), ...]
     """
     missing = []
+    index = get_index(project_root) if HAS_PATH_INDEX else None
     for file_path, screen_id in nav_file_set.items():
-        full_path = project_root / file_path
-        if not full_path.exists():
+        if index is not None:
+            found = index.exists(file_path)
+        else:
+            found = (project_root / file_path).exists()
+        if not found:
             missing.append((screen_id, file_path))
     return sorted(missing, key=lambda x: x[0])
 
@@ -6,6 +6,10 @@ Usage:
     python nav-graph-to-mermaid.py --feature 022
     python nav-graph-to-mermaid.py --output docs/navigation/nav-graph.mmd
     python nav-graph-to-mermaid.py --project-root /path/to/project
+    python nav-graph-to-mermaid.py docs/navigation/nav-graph/ --feature 022   # シャード構成
+
+シャード構成 (nav_graph_shards.py) では --feature 指定時に該当 feature のシャードのみを読み、
+他 feature への遷移先は manifest の ID 索引 (screen ID → feature, name) から補う。
 """
 
 from __future__ import annotations
@@ -16,6 +20,11 @@ import sys
 from collections import defaultdict
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import json_codec  # noqa: E402
+from nav_graph_core import find_entry_screen  # noqa: E402
+from nav_graph_shards import ShardedNavGraph, ShardManifestError, UNASSIGNED_FEATURE, find_manifest  # noqa: E402
+
 # screen_type → 絵文字マッピング
 SCREEN_TYPE_EMOJI = {
     "tab": "\U0001f3e0",        # 🏠
@@ -120,32 +129,6 @@ def build_trigger_lines(source_screen: dict, all_screens: dict) -> list[str]:
     return lines
 
 
-def find_entry_screen(screens: dict) -> str | None:
-    """アプリのエントリーポイントscreenを推論する。
-
-    優先順位:
-    1. entry_conditionsに'none'のみがありscreen_typeが'page'のログイン/スプラッシュ
-    2. tab_index == 0のタブscreen
-    3. 最初のscreen（fallback）
-    """
-    # ログイン/スプラッシュscreenを探索
-    for screen in screens.values():
-        name_lower = screen.get("name", "").lower()
-        if any(kw in name_lower for kw in ("login", "splash", "onboarding")):
-            return screen["id"]
-
-    # tab_index 0
-    for screen in screens.values():
-        if screen.get("tab_index") == 0:
-            return screen["id"]
-
-    # fallback: 最初のもの
-    if screens:
-        return next(iter(screens.values()))["id"]
-
-    return None
-
-
 def group_screens_by_feature(screens: dict) -> dict[str, list[dict]]:
     """screensをfeature基準でグルーピング。"""
     groups: dict[str, list[dict]] = defaultdict(list)
@@ -296,15 +279,55 @@ def generate_feature_flow(screens: dict, feature_num: str) -> str:
     return "\n".join(lines) + "\n"
 
 
-def load_nav_graph(path: Path) -> dict:
-    """nav-graph.jsonファイルをロード。"""
+def external_screen_stubs(screens: dict, sharded: ShardedNavGraph, loaded: list) -> dict:
+    """読み込んだscreenから遷移する他シャードのscreenを、ID索引からstate表示用のスタブとして生成。
+
+    generate_feature_flowの外部screen表示はid / name / featureのみ参照する。
+    """
+    index = sharded.id_index(exclude=loaded)
+    stubs: dict[str, dict] = {}
+    for screen in screens.values():
+        for trigger in screen.get("triggers", []):
+            refs = [trigger.get("target")]
+            refs += [guard.get("fallback_screen") for guard in trigger.get("guards", [])]
+            for ref in refs:
+                if ref and ref not in screens and ref in index.screens:
+                    stub = {"id": ref, "name": index.names[ref]}
+                    if index.screens[ref] != UNASSIGNED_FEATURE:
+                        stub["feature"] = index.screens[ref]
+                    stubs[ref] = stub
+    return stubs
+
+
+def load_sharded_nav_graph(manifest: Path, feature_num: str | None = None) -> dict:
+    """シャード構成をロード。feature_num指定時は該当シャード + 外部遷移先スタブのみ。"""
+    try:
+        sharded = ShardedNavGraph(manifest)
+        if feature_num is None:
+            return sharded.load()
+        loaded = sharded.select([feature_num])
+        data = sharded.load(loaded)
+    except json.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in {manifest.parent}: {e}", file=sys.stderr)
+        sys.exit(1)
+    except (OSError, ShardManifestError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    data["screens"].update(external_screen_stubs(data["screens"], sharded, loaded))
+    return data
+
+
+def load_nav_graph(path: Path, feature_num: str | None = None) -> dict:
+    """nav-graph.jsonファイル (またはシャード構成) をロード。"""
+    manifest = find_manifest(path)
+    if manifest is not None:
+        return load_sharded_nav_graph(manifest, feature_num)
     if not path.exists():
         print(f"Error: File not found: {path}", file=sys.stderr)
         sys.exit(1)
 
     try:
-        with open(path, encoding="utf-8") as f:
-            return json.load(f)
+        return json_codec.load_path(path)
     except json.JSONDecodeError as e:
         print(f"Error: Invalid JSON in {path}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -317,6 +340,9 @@ def resolve_nav_graph_path(args: argparse.Namespace) -> Path:
     1. 明示的な引数として渡されたパス
     2. --project-root基準のdocs/navigation/nav-graph.json
     3. CWD基準のdocs/navigation/nav-graph.json
+
+    nav-graph.jsonがなくdocs/navigation/nav-graph/manifest.jsonがあればシャード構成として読む
+    (load_nav_graph)。
     """
     if args.input:
         return Path(args.input)
@@ -333,7 +359,7 @@ def main() -> None:
         "input",
         nargs="?",
         default=None,
-        help="nav-graph.jsonファイルパス（デフォルト: docs/navigation/nav-graph.json）",
+        help="nav-graph.jsonまたはシャードディレクトリのパス（デフォルト: docs/navigation/nav-graph.json）",
     )
     parser.add_argument(
         "--feature",
@@ -357,14 +383,14 @@ def main() -> None:
     args = parser.parse_args()
 
     nav_path = resolve_nav_graph_path(args)
-    data = load_nav_graph(nav_path)
+    feature_num = args.feature.zfill(3) if args.feature else None  # '22' → '022'
+    data = load_nav_graph(nav_path, feature_num)
 
     screens: dict = data.get("screens", {})
     if not screens:
         print("Warning: No screens found in nav-graph.json", file=sys.stderr)
         result = "stateDiagram-v2\n    note right of [*] : Empty nav graph\n"
-    elif args.feature:
-        feature_num = args.feature.zfill(3)  # '22' → '022'
+    elif feature_num:
         result = generate_feature_flow(screens, feature_num)
     else:
         result = generate_master_flow(screens)
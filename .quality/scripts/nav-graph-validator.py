@@ -8,6 +8,13 @@ Usage:
     python nav-graph-validator.py [path-to-nav-graph.json]
     python nav-graph-validator.py --project-root /path/to/project
     python nav-graph-validator.py --json-only
+    python nav-graph-validator.py --no-cache        # 結果キャッシュを使わない
+    python nav-graph-validator.py --incremental     # 前回スナップショットとの差分のみ再評価
+    python nav-graph-validator.py --feature 022     # シャード構成: feature 022 のシャードのみ検証
+
+nav-graph.json の代わりにシャード構成 (docs/navigation/nav-graph/manifest.json + feature 別ファイル,
+nav_graph_shards.py) も読み込める。--feature 指定時は該当シャードのみを読み、他シャードへの参照
+(V4/V7/V8) は manifest の ID 索引で判定する (全 screen が必要な V2/V5/V9/V10 は実行しない)。
 
 Validation Rules:
     V1: JSON Schema compliance (BLOCKING)
@@ -18,6 +25,8 @@ Validation Rules:
     V6: Code file existence (WARNING)
     V7: Guard consistency (WARNING)
     V8: Flow path validity (BLOCKING)
+    V9: Unreachable screens (WARNING)
+    V10: Closed loops without exit (WARNING)
 
 Exit codes:
     0: All pass (no BLOCKING, no WARNING)
@@ -25,14 +34,16 @@ Exit codes:
     2: WARNING only (no BLOCKING)
 """
 
+import base64
+import hashlib
 import json
 import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
-# jsonschemaはオプション依存
+# jsonschemaはオプション依存 (V1 はコンパイル済み検証コードで実行, jsonschema はスキーマ自体の検査に使用)
 try:
     import jsonschema
 
@@ -40,12 +51,63 @@ try:
 except ImportError:
     HAS_JSONSCHEMA = False
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import json_codec  # noqa: E402
+from atomic_write import write_bytes_atomic  # noqa: E402
+from schema_compiler import SchemaCompileError, get_validator  # noqa: E402
+
+_SchemaError = jsonschema.SchemaError if HAS_JSONSCHEMA else ()
+
+# 入力ハッシュによる結果キャッシュ (nav-graph.json/スキーマ不変ならルールを実行しない)
+try:
+    from check_cache import CheckCache, file_digest, script_version
+
+    HAS_CHECK_CACHE = True
+except ImportError:
+    HAS_CHECK_CACHE = False
+
+# 到達可能性・強連結成分 (V9/V10): screen ID を整数化した CSR グラフ
+from nav_graph_core import TERMINAL_TYPES, NavGraph, NavGraphBuilder  # noqa: E402
+
+# feature 別シャード構成 (manifest + シャードファイル) の遅延読み込み
+from nav_graph_shards import ShardedNavGraph, ShardManifestError, find_manifest  # noqa: E402
+
+# screen.file の存在確認を1回のディレクトリ走査で応答 (V6)
+try:
+    from path_index import get_index
+
+    HAS_PATH_INDEX = True
+except ImportError:
+    HAS_PATH_INDEX = False
+
+RULE_ORDER = ("V1", "V2", "V3", "V4", "V5", "V6", "V7", "V8", "V9", "V10")
+# nav-graph.json + スキーマの純関数であるルール (V6 はファイルシステムを参照するため毎回実行)
+CACHEABLE_RULES = ("V1", "V2", "V3", "V4", "V5", "V7", "V8", "V9", "V10")
+
+# 一部のシャードのみ読み込んだ場合に実行するルール (シャード外への参照は manifest の ID 索引で判定)
+SHARD_SCOPE_RULES = ("V1", "V3", "V4", "V6", "V7", "V8")
+
+# V10: 1つの閉路について表示する screen 数の上限
+MAX_LOOP_SCREENS_SHOWN = 5
+
+# インクリメンタル検証: イシューを screen / flow 単位で保存し、影響を受けた単位のみ再評価するルール
+# (それ以外のキャッシュ可能ルールはドキュメント全体の関数のため、入力が変わればルールごと再実行)
+SCREEN_RULES = ("V2", "V3", "V4", "V7")
+FLOW_RULES = ("V8",)
+UNIT_RULES = SCREEN_RULES + FLOW_RULES
+GLOBAL_RULES = ("V1", "V5", "V9", "V10")
+UNIT_SEVERITY = {"V2": "WARNING", "V3": "WARNING", "V4": "BLOCKING", "V7": "WARNING", "V8": "BLOCKING"}
+# ID 索引 (NavGraphValidator の "_" + 名前の属性, スナップショットにそのまま保存)
+INDEX_NAMES = ("screen_ids", "trigger_ids", "trigger_map", "target_map", "fallback_map",
+               "flow_ids", "flow_entries")
+SNAPSHOT_FORMAT_VERSION = 1
+
 
 @dataclass
 class Issue:
     """検証イシュー"""
 
-    rule: str  # V1-V8
+    rule: str  # V1-V10
     severity: str  # BLOCKING | WARNING
     message: str
 
@@ -65,6 +127,9 @@ class ValidationResult:
 
     issues: list = field(default_factory=list)
     stats: ValidationStats = field(default_factory=ValidationStats)
+    cached_rules: list = field(default_factory=list)  # 結果キャッシュから返したルール
+    incremental: Optional[dict] = None  # validate_incremental の再評価範囲 (None = 通常の検証)
+    shards: Optional[dict] = None  # シャード構成の読み込み範囲 (None = 単一ファイル)
 
     @property
     def blocking_issues(self) -> list:
@@ -83,6 +148,116 @@ class ValidationResult:
         return len(self.warning_issues) > 0
 
 
+# 常駐プロセス (validation_daemon.py) 向け: スキーマファイル単位でコンパイル済み Validator を再利用
+# (path → ((mtime_ns, size), validator)。ファイル更新時は再コンパイル)
+_SCHEMA_VALIDATORS: dict = {}
+
+
+def _compiled_validator(schema_path: Path):
+    """jsonschema.validate() と同一のスキーマ検査 + 検証器生成 (キャッシュ付き)
+
+    検証器は schema_compiler の生成コード (コンパイル不可なスキーマは jsonschema)。
+    jsonschema 未インストールかつコンパイル不可なら SchemaCompileError。
+    """
+    st = schema_path.stat()
+    sig = (st.st_mtime_ns, st.st_size)
+    cached = _SCHEMA_VALIDATORS.get(str(schema_path))
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    schema = json_codec.load_path(schema_path)
+    if HAS_JSONSCHEMA:
+        jsonschema.validators.validator_for(schema).check_schema(schema)
+    validator = get_validator(schema)
+    _SCHEMA_VALIDATORS[str(schema_path)] = (sig, validator)
+    return validator
+
+
+# ── インクリメンタル検証のスナップショット ──
+# 単位 (screen / flow) ごとに内容ダイジェストと「事実」(索引への寄与。コンパクト JSON 文字列) を保存する。
+#   screen: [sid, head, triggers]  head = [id, screen_type, name, tab_index] (エントリー推論・V9 表示)
+#                                  triggers = [[trigger_id, target, [fallback_screen, ...]], ...]
+#   flow:   [fid, 最初の step.screen]
+# 事実は変更された単位の索引の取り消し・比較にのみ使うため、読み込み時は文字列のまま保持する
+# (大量の小さなリストを生成しない)。
+
+
+def _digest(value) -> str:
+    # base64 (16進は長い数字列を含みやすく json_codec の読み込みが標準 json に回る)
+    return base64.b64encode(hashlib.sha256(json_codec.dump_bytes(value, pretty=False)).digest()[:18]).decode()
+
+
+def _screen_facts(screen_key, screen: dict) -> list:
+    triggers = []
+    for trigger in screen.get("triggers", []):
+        fallbacks = [guard.get("fallback_screen") for guard in trigger.get("guards") or ()
+                     if guard.get("fallback_screen")]
+        triggers.append([trigger.get("id"), trigger.get("target"), fallbacks])
+    head = [screen.get("id"), screen.get("screen_type"), screen.get("name"), screen.get("tab_index")]
+    return [screen.get("id", screen_key), head, triggers]
+
+
+def _flow_facts(flow_key, flow_data: dict) -> list:
+    return [flow_data.get("id", flow_key), _flow_entry(flow_data)]
+
+
+def _encode_facts(facts: list) -> str:
+    return json_codec.dumps(facts, pretty=False)
+
+
+def _id_facts(facts: list) -> tuple:
+    """V5 (重複ID) の入力: screen ID と trigger ID 列"""
+    return facts[0], [trigger[0] for trigger in facts[2]]
+
+
+def _graph_facts(facts: list) -> tuple:
+    """V9 / V10 (グラフ) の入力: ノード属性と辺 (target, fallback)"""
+    return facts[0], facts[1], [trigger[1:] for trigger in facts[2]]
+
+
+def _rest_digest(data: dict) -> str:
+    """screens / flows 以外 (V1 のみが参照) のダイジェスト"""
+    return _digest([list(data), {key: value for key, value in data.items() if key not in ("screens", "flows")}])
+
+
+def _diff_units(units: dict, digests: dict) -> tuple[dict, list]:
+    """(新しいダイジェスト, 追加・変更されたキー)"""
+    new_digests = {}
+    changed = []
+    for key, unit in units.items():
+        digest = new_digests[key] = _digest(unit)
+        if digests.get(key) != digest:
+            changed.append(key)
+    return new_digests, changed
+
+
+def _same_order(units: dict, digests: dict) -> bool:
+    """前回からある単位の並び順が変わっていないか (イシュー順・重複ID・エントリー推論が依存)"""
+    return [key for key in units if key in digests] == [key for key in digests if key in units]
+
+
+def _snapshot_version(schema_path: Path) -> tuple:
+    """(ルール実装のダイジェスト, V1 の入力)。check_cache がなければ (None, None) = 常に全体検証"""
+    if not HAS_CHECK_CACHE:
+        return None, None
+    rules = script_version(__file__, Path(__file__).with_name("nav_graph_core.py"),
+                           Path(__file__).with_name("schema_compiler.py"))
+    return rules, f"{file_digest(schema_path)}:jsonschema={HAS_JSONSCHEMA}"
+
+
+def load_snapshot(path: Path) -> Optional[dict]:
+    """保存済みスナップショット (なし・破損は None = 全体検証)"""
+    try:
+        return json_codec.load_path(path)
+    except (OSError, ValueError):
+        return None
+
+
+def save_snapshot(path: Path, snapshot: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # スナップショットは再生成可能なため fsync 不要
+    write_bytes_atomic(path, json_codec.dump_bytes(snapshot, pretty=False), durable=False)
+
+
 def detect_project_root(start_path: Path) -> Optional[Path]:
     """package.jsonを基準にプロジェクトルートを探索"""
     current = start_path.resolve()
@@ -96,24 +271,60 @@ def detect_project_root(start_path: Path) -> Optional[Path]:
 class NavGraphValidator:
     """NAV-GRAPH検証器"""
 
-    def __init__(self, nav_graph_path: Path, project_root: Path, schema_path: Optional[Path] = None):
+    def __init__(self, nav_graph_path: Path, project_root: Path, schema_path: Optional[Path] = None,
+                 cache=None, features: Optional[list] = None):
         self.nav_graph_path = nav_graph_path
         self.project_root = project_root
         self.schema_path = schema_path or (project_root / "docs" / "navigation" / "nav-graph.schema.json")
         self.data: dict = {}
         self.result = ValidationResult()
+        self.cache = cache  # check_cache.CheckCache (None = 常に全ルール実行)
+        self.features = features  # シャード構成で読み込む feature (None = 全シャード)
+        self._sharded: Optional[ShardedNavGraph] = None
+        # 読み込んでいないシャードの ID 索引 (V4/V7/V8 のシャード横断参照)
+        self._external_screens: dict = {}   # screen ID -> feature
+        self._external_triggers: dict = {}  # trigger ID -> 所属 screen ID
+
+        # パース済みデータのキャッシュ (ID → 出現回数。インクリメンタル検証で差分更新できるよう集合ではなく計数)
+        self._screen_ids: dict = {}
+        self._trigger_ids: dict = {}
+        self._flow_ids: dict = {}
+        self._trigger_map: dict = {}    # trigger_id -> screen_id (所属画面, 重複時は最後のもの)
+        self._target_map: dict = {}     # trigger.target -> 参照数 (逆引き: 被参照の有無)
+        self._fallback_map: dict = {}   # guard.fallback_screen -> 参照数
+        self._flow_entries: dict = {}   # フローの最初の step.screen -> フロー数
+        self._graph: Optional[NavGraph] = None
+        self.passes = 0  # ドキュメントの走査回数 (全ルールを1回の走査で実行)
+
+        # インクリメンタル検証の状態 (snapshot() で保存, validate_incremental で復元)
+        self._screen_digests: Optional[dict] = None  # screen キー -> 内容ダイジェスト
+        self._screen_facts: dict = {}                # screen キー -> 索引への寄与 (JSON 文字列)
+        self._flow_digests: dict = {}
+        self._flow_facts: dict = {}
+        self._unit_issues: dict = {}    # UNIT_RULES: rule -> {screen / flow キー -> [Issue]}
+        self._global_issues: dict = {}  # GLOBAL_RULES: rule -> [Issue]
+        self._version: tuple = (None, None)
+        self._rest = ""
 
-        # パース済みデータのキャッシュ
-        self._screen_ids: set = set()
-        self._trigger_ids: set = set()
-        self._flow_ids: set = set()
-        self._trigger_map: dict = {}  # trigger_id -> screen_id (所属画面)
+    @property
+    def graph(self) -> NavGraph:
+        """CSR グラフ (通常は V9/V10 と同じ走査で構築済み)"""
+        if self._graph is None:
+            self._graph = NavGraph.from_data(self.data)
+        return self._graph
 
     def load(self) -> bool:
-        """nav-graph.jsonをロード"""
+        """nav-graph.json (またはシャード構成の manifest + 該当シャード) をロード"""
+        manifest = find_manifest(self.nav_graph_path)
+        if manifest is not None:
+            return self._load_shards(manifest)
+        if self.features is not None:
+            self.result.issues.append(
+                Issue("V1", "BLOCKING", f"feature 指定はシャード構成でのみ有効です: {self.nav_graph_path}")
+            )
+            return False
         try:
-            text = self.nav_graph_path.read_text(encoding="utf-8")
-            self.data = json.loads(text)
+            self.data = json_codec.load_path(self.nav_graph_path)
             return True
         except json.JSONDecodeError as e:
             self.result.issues.append(
@@ -126,316 +337,843 @@ class NavGraphValidator:
             )
             return False
 
-    def _index_data(self):
-        """スクリーン、トリガー、フローIDのインデクシング"""
-        screens = self.data.get("screens", {})
-        flows = self.data.get("flows", {})
-
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
-            self._screen_ids.add(sid)
-            for trigger in screen.get("triggers", []):
-                tid = trigger.get("id")
-                if tid:
-                    self._trigger_ids.add(tid)
-                    self._trigger_map[tid] = sid
-
-        for flow_key, flow_data in flows.items():
-            fid = flow_data.get("id", flow_key)
-            self._flow_ids.add(fid)
-
+    def _load_shards(self, manifest: Path) -> bool:
+        try:
+            self._sharded = ShardedNavGraph(manifest)
+            keys = self._sharded.select(self.features)
+            if not keys:
+                raise ShardManifestError(f"該当するシャードがありません: {', '.join(self.features)}")
+            self.data = self._sharded.load(keys)
+        except json.JSONDecodeError as e:
+            self.result.issues.append(Issue("V1", "BLOCKING", f"JSONパースエラー: {e}"))
+            return False
+        except FileNotFoundError as e:
+            self.result.issues.append(Issue("V1", "BLOCKING", f"ファイルが見つかりません: {e.filename}"))
+            return False
+        except ShardManifestError as e:
+            self.result.issues.append(Issue("V1", "BLOCKING", f"シャード構成エラー: {e}"))
+            return False
+        index = self._sharded.id_index(exclude=keys)
+        self._external_screens, self._external_triggers = index.screens, index.triggers
+        self.result.shards = {
+            "loaded": keys,
+            "total": len(self._sharded.shards),
+            "skipped_rules": [rule for rule in RULE_ORDER if rule not in self._scope_rules()],
+        }
+        return True
+
+    def _scope_rules(self) -> tuple:
+        """読み込み範囲で実行できるルール (一部のシャードのみなら SHARD_SCOPE_RULES)"""
+        if self._sharded is not None and self.features is not None:
+            return SHARD_SCOPE_RULES
+        return RULE_ORDER
+
+    def _input_paths(self) -> list:
+        """結果キャッシュの入力ファイル (シャード構成では manifest + 読み込んだシャード)"""
+        if self._sharded is None:
+            return [self.nav_graph_path]
+        return [self._sharded.manifest_path, *self._sharded.paths(self.result.shards["loaded"])]
+
+    def _register_index(self, walk: "Traversal"):
+        """スクリーン、トリガー、フローIDのインデクシング (V2/V4/V7/V8 が参照, 走査本体が直接更新)"""
+        walk.index_ids(*(getattr(self, "_" + name) for name in INDEX_NAMES))
+        walk.on_finish(self._update_stats)
+
+    def _update_stats(self):
         self.result.stats = ValidationStats(
             screen_count=len(self._screen_ids),
             trigger_count=len(self._trigger_ids),
             flow_count=len(self._flow_ids),
         )
 
-    def validate_v1_schema(self):
-        """V1: JSON Schema compliance (BLOCKING)"""
-        if not HAS_JSONSCHEMA:
-            self.result.issues.append(
-                Issue("V1", "WARNING", "jsonschema未インストール - V1スキーマ検証スキップ (pip install jsonschema)")
-            )
+    def _register_graph(self, walk: "Traversal"):
+        """CSR グラフを同じ走査で構築 (V9/V10 で共有, 構築済みなら何もしない)"""
+        if self._graph is not None or walk.shared.get("graph"):
             return
+        walk.shared["graph"] = True
+        builder = NavGraphBuilder()
+
+        def on_screen(sid, screen_key, screen):
+            builder.add_screen(sid, screen)
+
+        def on_step(fid, index, step):
+            if index == 0:
+                builder.add_flow_entry(step.get("screen"))
+
+        def finish():
+            self._graph = builder.build()
+
+        def on_trigger(sid, tid, target, trigger):
+            builder.add_trigger(target, trigger.get("guards"))
 
+        walk.on_screen(on_screen)
+        walk.on_trigger(on_trigger)
+        walk.on_step(on_step)
+        walk.on_finish(finish)
+
+    def run_rules(self, rules, index: bool = True, data: Optional[dict] = None,
+                  units: Optional[dict] = None) -> dict:
+        """指定ルールを1回の走査で実行し、ルール → イシューのリストを返す
+
+        各ルールは走査コールバックと集計 (finish) を登録するだけで、走査自体は
+        ルール数によらず1回。ルール内のイシュー順は screens / triggers / flows の出現順。
+        index=False は索引済み (前回の run_rules / スナップショット) の場合のみ。
+        data: 走査対象 (デフォルト self.data。インクリメンタル検証では変更部分のみの部分ドキュメント)
+        units: 指定すると UNIT_RULES のイシューを units[rule][screen / flow キー] にも記録
+        """
+        walk = Traversal()
+        if index:
+            self._register_index(walk)
+        found = {}
+        for rule in rules:
+            issues = found[rule] = []
+            by_unit = units.setdefault(rule, {}) if units is not None and rule in UNIT_RULES else None
+            getattr(self, RULE_METHODS[rule])(walk, _emitter(walk, issues, by_unit))
+        walk.run(self.data if data is None else data)
+        self.passes += walk.passes
+        return found
+
+    def _rule_v1_schema(self, walk: "Traversal", emit):
+        """V1: JSON Schema compliance (BLOCKING)"""
+        walk.on_finish(lambda: self._check_schema(emit))
+
+    def _check_schema(self, emit):
         if not self.schema_path.exists():
-            self.result.issues.append(
-                Issue("V1", "WARNING", f"スキーマファイルが見つかりません: {self.schema_path}")
-            )
+            emit(Issue("V1", "WARNING", f"スキーマファイルが見つかりません: {self.schema_path}"))
             return
 
         try:
-            schema_text = self.schema_path.read_text(encoding="utf-8")
-            schema = json.loads(schema_text)
-            jsonschema.validate(instance=self.data, schema=schema)
-        except jsonschema.ValidationError as e:
-            # 最も有用な情報のみ抽出
-            path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "(root)"
-            self.result.issues.append(
-                Issue("V1", "BLOCKING", f"スキーマ違反 at {path}: {e.message}")
-            )
-        except jsonschema.SchemaError as e:
-            self.result.issues.append(
-                Issue("V1", "WARNING", f"スキーマファイル自体のエラー: {e.message}")
+            validator = _compiled_validator(self.schema_path)
+            # 最も有用な情報のみ抽出 (jsonschema.exceptions.best_match と同一の選択)
+            e = validator.best_match(self.data)
+            if e is not None:
+                path = " -> ".join(str(p) for p in e.absolute_path) if e.absolute_path else "(root)"
+                emit(Issue("V1", "BLOCKING", f"スキーマ違反 at {path}: {e.message}"))
+        except SchemaCompileError as e:
+            emit(
+                Issue("V1", "WARNING",
+                      f"jsonschema未インストールかつスキーマをコンパイルできません - V1スキーマ検証スキップ"
+                      f" (pip install jsonschema): {e}")
             )
+        except _SchemaError as e:
+            emit(Issue("V1", "WARNING", f"スキーマファイル自体のエラー: {e.message}"))
         except json.JSONDecodeError as e:
-            self.result.issues.append(
-                Issue("V1", "WARNING", f"スキーマファイルのJSONパースエラー: {e}")
-            )
+            emit(Issue("V1", "WARNING", f"スキーマファイルのJSONパースエラー: {e}"))
 
-    def validate_v2_orphan_screens(self):
+    def _rule_v2_orphan_screens(self, walk: "Traversal", emit):
         """V2: Orphan screen detection (WARNING)
 
         incoming triggerがないスクリーンを検出します。
         例外: tabタイプのスクリーン、フローの最初のstepスクリーン
         """
-        screens = self.data.get("screens", {})
-        flows = self.data.get("flows", {})
-
-        # すべてのtriggerのtargetから逆方向マップを構築
-        targeted_screens: set = set()
-        for screen in screens.values():
-            for trigger in screen.get("triggers", []):
-                target = trigger.get("target")
-                if target:
-                    targeted_screens.add(target)
-
-        # フローの最初のstepスクリーンを収集
-        flow_entry_screens: set = set()
-        for flow_data in flows.values():
-            steps = flow_data.get("steps", [])
-            if steps:
-                first_screen = steps[0].get("screen")
-                if first_screen:
-                    flow_entry_screens.add(first_screen)
-
-        # Orphan検出
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
+        candidates: list = []  # (screen_key, sid, screen) — tab 以外
 
+        def on_screen(sid, screen_key, screen):
             # 例外1: tabタイプ
-            if screen.get("screen_type") == "tab":
-                continue
-
-            # 例外2: フローエントリーポイント
-            if sid in flow_entry_screens:
-                continue
+            if screen.get("screen_type") != "tab":
+                candidates.append((screen_key, sid, screen))
+
+        def finish():
+            # すべての trigger の target / フロー開始画面は索引 (_target_map / _flow_entries) を参照
+            for screen_key, sid, screen in candidates:
+                # 例外2: フローエントリーポイント
+                if sid in self._flow_entries:
+                    continue
+                # incoming triggerがなければorphan
+                if sid not in self._target_map:
+                    name = screen.get("name", "?")
+                    emit(Issue("V2", "WARNING", f"orphan screen: {sid} ({name}) - incoming triggerなし"),
+                         screen_key)
 
-            # incoming triggerがなければorphan
-            if sid not in targeted_screens:
-                name = screen.get("name", "?")
-                self.result.issues.append(
-                    Issue("V2", "WARNING", f"orphan screen: {sid} ({name}) - incoming triggerなし")
-                )
+        walk.on_screen(on_screen)
+        walk.on_finish(finish)
 
-    def validate_v3_dead_ends(self):
+    def _rule_v3_dead_ends(self, walk: "Traversal", emit):
         """V3: Dead-end detection (WARNING)
 
         triggers配列が空のスクリーンを検出します。
         例外: dialog, bottomSheet, overlayタイプ（ターミナル画面）
         """
-        screens = self.data.get("screens", {})
-        terminal_types = {"dialog", "bottomSheet", "overlay"}
-
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
-            triggers = screen.get("triggers", [])
-            screen_type = screen.get("screen_type", "page")
-
-            if screen_type in terminal_types:
-                continue
 
-            if len(triggers) == 0:
+        def on_screen(sid, screen_key, screen):
+            if screen.get("screen_type", "page") in TERMINAL_TYPES:
+                return
+            if len(screen.get("triggers", [])) == 0:
                 name = screen.get("name", "?")
-                self.result.issues.append(
-                    Issue("V3", "WARNING", f"dead-end screen: {sid} ({name}) - triggersが空")
-                )
+                emit(Issue("V3", "WARNING", f"dead-end screen: {sid} ({name}) - triggersが空"))
+
+        walk.on_screen(on_screen)
 
-    def validate_v4_reference_integrity(self):
+    def _rule_v4_reference_integrity(self, walk: "Traversal", emit):
         """V4: Reference integrity (BLOCKING)
 
         すべてのtrigger.targetが実際に存在するscreen IDを参照しているか検証します。
+        (後方の screen への参照があるため、判定は全 screen の走査後)
         """
-        screens = self.data.get("screens", {})
+        references: list = []  # (screen_key, trigger_id, screen_id, target)
 
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
-            for trigger in screen.get("triggers", []):
-                tid = trigger.get("id", "?")
-                target = trigger.get("target")
-                if target and target not in self._screen_ids:
-                    self.result.issues.append(
-                        Issue(
-                            "V4",
-                            "BLOCKING",
-                            f"trigger {tid} (in {sid}) targets non-existent screen {target}",
-                        )
-                    )
+        def on_trigger(sid, tid, target, trigger):
+            if target:
+                references.append((walk.unit, trigger.get("id", "?"), sid, target))
+
+        def finish():
+            for screen_key, tid, sid, target in references:
+                if target not in self._screen_ids and target not in self._external_screens:
+                    emit(Issue("V4", "BLOCKING", f"trigger {tid} (in {sid}) targets non-existent screen {target}"),
+                         screen_key)
+
+        walk.on_trigger(on_trigger)
+        walk.on_finish(finish)
 
-    def validate_v5_duplicate_ids(self):
+    def _rule_v5_duplicate_ids(self, walk: "Traversal", emit):
         """V5: Duplicate IDs (BLOCKING)
 
-        screen, trigger, flow IDの重複を検出します。
+        screen, trigger, flow IDの重複を検出します。(screen → trigger → flow の順に報告)
         """
-        screens = self.data.get("screens", {})
-        flows = self.data.get("flows", {})
-
-        # Screen ID重複チェック
         seen_screen_ids: dict = {}
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
+        seen_trigger_ids: dict = {}
+        seen_flow_ids: dict = {}
+        screen_issues: list = []
+        trigger_issues: list = []
+        flow_issues: list = []
+
+        def on_screen(sid, screen_key, screen):
             if sid in seen_screen_ids:
-                self.result.issues.append(
+                screen_issues.append(
                     Issue("V5", "BLOCKING", f"duplicate screen ID: {sid} (keys: {seen_screen_ids[sid]}, {screen_key})")
                 )
             else:
                 seen_screen_ids[sid] = screen_key
 
-        # Trigger ID重複チェック
-        seen_trigger_ids: dict = {}
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
-            for trigger in screen.get("triggers", []):
-                tid = trigger.get("id")
-                if not tid:
-                    continue
-                if tid in seen_trigger_ids:
-                    self.result.issues.append(
-                        Issue(
-                            "V5",
-                            "BLOCKING",
-                            f"duplicate trigger ID: {tid} (in {seen_trigger_ids[tid]} and {sid})",
-                        )
-                    )
-                else:
-                    seen_trigger_ids[tid] = sid
+        def on_trigger(sid, tid, target, trigger):
+            if not tid:
+                return
+            if tid in seen_trigger_ids:
+                trigger_issues.append(
+                    Issue("V5", "BLOCKING", f"duplicate trigger ID: {tid} (in {seen_trigger_ids[tid]} and {sid})")
+                )
+            else:
+                seen_trigger_ids[tid] = sid
 
-        # Flow ID重複チェック
-        seen_flow_ids: dict = {}
-        for flow_key, flow_data in flows.items():
-            fid = flow_data.get("id", flow_key)
+        def on_flow(fid, flow_key, flow_data):
             if fid in seen_flow_ids:
-                self.result.issues.append(
+                flow_issues.append(
                     Issue("V5", "BLOCKING", f"duplicate flow ID: {fid} (keys: {seen_flow_ids[fid]}, {flow_key})")
                 )
             else:
                 seen_flow_ids[fid] = flow_key
 
-    def validate_v6_code_files(self):
+        def finish():
+            for issue in screen_issues + trigger_issues + flow_issues:
+                emit(issue)
+
+        walk.on_screen(on_screen)
+        walk.on_trigger(on_trigger)
+        walk.on_flow(on_flow)
+        walk.on_finish(finish)
+
+    def _rule_v6_code_files(self, walk: "Traversal", emit):
         """V6: Code file existence (WARNING)
 
         screen.fileパスが実際にディスク上に存在するか確認します。
         """
-        screens = self.data.get("screens", {})
+        index = get_index(self.project_root) if HAS_PATH_INDEX else None
 
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
+        def on_screen(sid, screen_key, screen):
             file_path = screen.get("file")
             if not file_path:
-                continue
+                return
+            if index is not None:
+                found = index.exists(file_path)
+            else:
+                found = (self.project_root / file_path).exists()
+            if not found:
+                emit(Issue("V6", "WARNING", f"screen {sid}: file not found - {file_path}"))
 
-            full_path = self.project_root / file_path
-            if not full_path.exists():
-                self.result.issues.append(
-                    Issue("V6", "WARNING", f"screen {sid}: file not found - {file_path}")
-                )
+        walk.on_screen(on_screen)
 
-    def validate_v7_guard_consistency(self):
+    def _rule_v7_guard_consistency(self, walk: "Traversal", emit):
         """V7: Guard consistency (WARNING)
 
         guard.fallback_screenが実際に存在するscreen IDを参照しているか確認します。
         """
-        screens = self.data.get("screens", {})
+        fallbacks: list = []  # (screen_key, trigger_id, screen_id, guard)
+
+        def on_trigger(sid, tid, target, trigger):
+            guards = trigger.get("guards")
+            if guards:
+                for guard in guards:
+                    if guard.get("fallback_screen"):
+                        fallbacks.append((walk.unit, trigger.get("id", "?"), sid, guard))
+
+        def finish():
+            for screen_key, tid, sid, guard in fallbacks:
+                fallback = guard["fallback_screen"]
+                if fallback not in self._screen_ids and fallback not in self._external_screens:
+                    condition = guard.get("condition", "?")
+                    emit(
+                        Issue(
+                            "V7",
+                            "WARNING",
+                            f"guard on {tid} (in {sid}): fallback_screen {fallback} not found "
+                            f"(condition: {condition})",
+                        ),
+                        screen_key,
+                    )
 
-        for screen_key, screen in screens.items():
-            sid = screen.get("id", screen_key)
-            for trigger in screen.get("triggers", []):
-                tid = trigger.get("id", "?")
-                for guard in trigger.get("guards", []):
-                    fallback = guard.get("fallback_screen")
-                    if fallback and fallback not in self._screen_ids:
-                        condition = guard.get("condition", "?")
-                        self.result.issues.append(
-                            Issue(
-                                "V7",
-                                "WARNING",
-                                f"guard on {tid} (in {sid}): fallback_screen {fallback} not found "
-                                f"(condition: {condition})",
-                            )
-                        )
+        walk.on_trigger(on_trigger)
+        walk.on_finish(finish)
 
-    def validate_v8_flow_paths(self):
+    def _rule_v8_flow_paths(self, walk: "Traversal", emit):
         """V8: Flow path validity (BLOCKING)
 
         フローのすべてのstep.screenおよびstep.triggerが実際に存在するか検証します。
+        (flows は全 screen / trigger の走査後に訪れるため、索引は完成している)
         """
-        flows = self.data.get("flows", {})
-
-        for flow_key, flow_data in flows.items():
-            fid = flow_data.get("id", flow_key)
-            steps = flow_data.get("steps", [])
-
-            for i, step in enumerate(steps):
-                screen_ref = step.get("screen")
-                trigger_ref = step.get("trigger")
-
-                # step.screenが存在するか確認
-                if screen_ref and screen_ref not in self._screen_ids:
-                    self.result.issues.append(
+        external_screens, external_triggers = self._external_screens, self._external_triggers
+
+        def on_step(fid, i, step):
+            screen_ref = step.get("screen")
+            trigger_ref = step.get("trigger")
+            screen_found = screen_ref in self._screen_ids or screen_ref in external_screens
+            trigger_found = trigger_ref in self._trigger_ids or trigger_ref in external_triggers
+
+            # step.screenが存在するか確認
+            if screen_ref and not screen_found:
+                emit(Issue("V8", "BLOCKING", f"flow {fid} step[{i}]: screen {screen_ref} not found"))
+
+            # step.triggerが存在するか確認（最後のstepはnull許容）
+            if trigger_ref and not trigger_found:
+                emit(Issue("V8", "BLOCKING", f"flow {fid} step[{i}]: trigger {trigger_ref} not found"))
+
+            # step.triggerがstep.screenに属しているか確認（存在する場合）
+            if trigger_ref and trigger_found and screen_ref and screen_found:
+                owning_screen = self._trigger_map.get(trigger_ref) or external_triggers.get(trigger_ref)
+                if owning_screen and owning_screen != screen_ref:
+                    emit(
                         Issue(
                             "V8",
                             "BLOCKING",
-                            f"flow {fid} step[{i}]: screen {screen_ref} not found",
+                            f"flow {fid} step[{i}]: trigger {trigger_ref} belongs to "
+                            f"{owning_screen}, not {screen_ref}",
                         )
                     )
 
-                # step.triggerが存在するか確認（最後のstepはnull許容）
-                if trigger_ref and trigger_ref not in self._trigger_ids:
-                    self.result.issues.append(
-                        Issue(
-                            "V8",
-                            "BLOCKING",
-                            f"flow {fid} step[{i}]: trigger {trigger_ref} not found",
-                        )
-                    )
+        walk.on_step(on_step)
 
-                # step.triggerがstep.screenに属しているか確認（存在する場合）
-                if (
-                    trigger_ref
-                    and trigger_ref in self._trigger_ids
-                    and screen_ref
-                    and screen_ref in self._screen_ids
-                ):
-                    owning_screen = self._trigger_map.get(trigger_ref)
-                    if owning_screen and owning_screen != screen_ref:
-                        self.result.issues.append(
-                            Issue(
-                                "V8",
-                                "BLOCKING",
-                                f"flow {fid} step[{i}]: trigger {trigger_ref} belongs to "
-                                f"{owning_screen}, not {screen_ref}",
-                            )
-                        )
+    def _rule_v9_unreachable_screens(self, walk: "Traversal", emit):
+        """V9: Unreachable screen detection (WARNING)
+
+        エントリー画面・タブ・フローの開始画面から trigger / guard fallback を辿って
+        到達できないスクリーンを検出します。
+        例外: incoming triggerがないスクリーン（V2で報告）
+        """
+        self._register_graph(walk)
+
+        def finish():
+            graph = self.graph
+            seen = graph.reachable(graph.roots())
+            in_degrees = graph.in_degrees()
+            for node, sid in enumerate(graph.ids):
+                if not seen[node] and in_degrees[node]:
+                    emit(Issue("V9", "WARNING",
+                               f"unreachable screen: {sid} ({graph.names[node]}) - エントリー/タブから到達不能"))
+
+        walk.on_finish(finish)
+
+    def _rule_v10_closed_loops(self, walk: "Traversal", emit):
+        """V10: Closed loop detection (WARNING)
+
+        ループ外へのtriggerがない閉路（強連結成分）を検出します。一度入ると抜けられません。
+        例外: エントリー画面・タブ・フロー開始画面、またはターミナル画面を含むループ
+        """
+        self._register_graph(walk)
+
+        def finish():
+            graph = self.graph
+            for members in graph.closed_loops():
+                shown = ", ".join(graph.ids[i] for i in members[:MAX_LOOP_SCREENS_SHOWN])
+                if len(members) > MAX_LOOP_SCREENS_SHOWN:
+                    shown += ", ..."
+                emit(Issue("V10", "WARNING",
+                           f"closed loop without exit: {shown} ({len(members)} screens) - ループ外へのtriggerなし"))
+
+        walk.on_finish(finish)
 
     def validate(self) -> ValidationResult:
-        """全体検証を実行"""
+        """全体検証を実行 (全ルールを1回の走査で実行)"""
         if not self.load():
             return self.result
+        rules = self._scope_rules()
+
+        if self.cache is None:
+            found = self.run_rules(rules)
+            self.result.issues.extend(issue for rule in rules for issue in found[rule])
+            return self.result
+
+        cacheable = [rule for rule in CACHEABLE_RULES if rule in rules]
+        code_file_issues: list = []
+
+        def run_cacheable_rules() -> list:
+            # キャッシュミス時は V6 も同じ走査で実行し、結果を取り分ける
+            found = self.run_rules(rules)
+            code_file_issues.extend(found["V6"])
+            return [issue for rule in cacheable for issue in found[rule]]
+
+        # 一部のシャードのみの検証は ID 索引 (manifest) も入力。読み込み範囲ごとに別エントリ
+        scope = () if rules is RULE_ORDER else (f"rules={','.join(rules)}",)
+        issues, hit = self.cache.cached(
+            "nav-graph",
+            (*self._input_paths(), self.schema_path, f"jsonschema={HAS_JSONSCHEMA}", *scope),
+            script_version(__file__, Path(__file__).with_name("nav_graph_core.py"),
+                           Path(__file__).with_name("schema_compiler.py"),
+                           Path(__file__).with_name("nav_graph_shards.py")),
+            run_cacheable_rules,
+            encode=lambda found: [asdict(i) for i in found],
+            decode=lambda stored: [Issue(**i) for i in stored],
+        )
+        if hit:
+            # 統計 (索引) と V6 のみ走査
+            code_file_issues = self.run_rules(("V6",))["V6"]
+        # 各ルールは自身のイシューのみ返すため、ルール順の安定ソートで逐次実行と同一順序
+        rank = {rule: n for n, rule in enumerate(RULE_ORDER)}
+        self.result.issues = sorted(issues + code_file_issues, key=lambda i: rank[i.rule])
+        if hit:
+            self.result.cached_rules = cacheable
+        return self.result
 
-        self._index_data()
+    # ── インクリメンタル検証 ──
 
-        # V1-V8を順番に実行
-        self.validate_v1_schema()
-        self.validate_v2_orphan_screens()
-        self.validate_v3_dead_ends()
-        self.validate_v4_reference_integrity()
-        self.validate_v5_duplicate_ids()
-        self.validate_v6_code_files()
-        self.validate_v7_guard_consistency()
-        self.validate_v8_flow_paths()
+    def validate_incremental(self, previous: Optional[dict] = None) -> ValidationResult:
+        """前回のスナップショット (snapshot()) との差分の影響範囲のみ再評価
+
+        変更された screen / flow を内容ダイジェストで特定し、索引を差分更新したうえで
+        - UNIT_RULES: 変更された単位と、索引の変化 (ID の出現/消滅, trigger の所属変更,
+          被参照/フロー開始の有無) の影響を受ける単位のみ再評価
+        - GLOBAL_RULES: 入力 (ドキュメント / ID 列 / グラフ) が変わった場合のみルールごと再実行
+        - V6: ファイルシステムを参照するため毎回実行
+        結果 (イシュー・順序・統計) はキャッシュなしの validate() と同一。
+        previous がない・互換性がない・screen / flow の並び順が変わった場合は全体検証。
+        シャード構成では全シャードをマージしたドキュメントが対象 (features 指定とは併用不可)。
+        """
+        if self.features is not None:
+            raise ValueError("インクリメンタル検証は全シャードが対象です (features 指定不可)")
+        if not self.load():
+            return self.result
+        version = _snapshot_version(self.schema_path)
+        if not self._restore(previous, version):
+            return self._validate_full(version, "スナップショットなし/不一致")
+
+        screens = self.data.get("screens", {})
+        flows = self.data.get("flows", {})
+        old_digests, old_flow_digests = self._screen_digests, self._flow_digests
+        if not (_same_order(screens, old_digests) and _same_order(flows, old_flow_digests)):
+            return self._validate_full(version, "screen / flow の並び順が変更")
+        new_digests, changed = _diff_units(screens, old_digests)
+        new_flow_digests, changed_flows = _diff_units(flows, old_flow_digests)
+        removed = [key for key in old_digests if key not in screens]
+        removed_flows = [key for key in old_flow_digests if key not in flows]
+        rest = _rest_digest(self.data)
+
+        # ── 索引の差分更新 (変更前の事実を取り消して変更後を追加) ──
+        old_facts = {key: json_codec.loads(self._screen_facts[key]) for key in changed + removed
+                     if key in self._screen_facts}
+        new_facts = {key: _screen_facts(key, screens[key]) for key in changed}
+        old_flow_facts = {key: json_codec.loads(self._flow_facts[key]) for key in changed_flows + removed_flows
+                          if key in self._flow_facts}
+        new_flow_facts = {key: _flow_facts(key, flows[key]) for key in changed_flows}
+
+        sids, tids, targets = set(), set(), set()
+        for facts in (*old_facts.values(), *new_facts.values()):
+            sids.add(facts[0])
+            for tid, target, _fallbacks in facts[2]:
+                if tid:
+                    tids.add(tid)
+                if target:
+                    targets.add(target)
+        entries = {facts[1] for facts in (*old_flow_facts.values(), *new_flow_facts.values()) if facts[1]}
+        had_sids = {sid for sid in sids if sid in self._screen_ids}
+        had_targets = {target for target in targets if target in self._target_map}
+        had_entries = {entry for entry in entries if entry in self._flow_entries}
+        owners_before = {tid: self._trigger_map.get(tid) for tid in tids}
+
+        for facts in old_facts.values():
+            self._index_screen(facts, -1)
+        for facts in new_facts.values():
+            self._index_screen(facts, 1)
+        for facts in old_flow_facts.values():
+            self._index_flow(facts, -1)
+        for facts in new_flow_facts.values():
+            self._index_flow(facts, 1)
+        self._resolve_trigger_owners(tids, screens)
+
+        flipped_sids = {sid for sid in sids if (sid in self._screen_ids) != (sid in had_sids)}
+        flipped_tids = {tid for tid in tids if self._trigger_map.get(tid) != owners_before[tid]}
+        flipped_targets = {t for t in targets if (t in self._target_map) != (t in had_targets)}
+        flipped_entries = {e for e in entries if (e in self._flow_entries) != (e in had_entries)}
+
+        # ── 再評価する単位 (索引の変化の影響は現在のドキュメントを走査して求める) ──
+        dirty = set(changed)
+        orphan_flips = flipped_targets | flipped_entries  # V2: 被参照/フロー開始の有無
+        if orphan_flips or flipped_sids:
+            for key, screen in screens.items():
+                if key in dirty:
+                    continue
+                if screen.get("id", key) in orphan_flips:
+                    dirty.add(key)
+                elif flipped_sids and any(  # V4 / V7: 参照先の存在
+                    trigger.get("target") in flipped_sids
+                    or any(guard.get("fallback_screen") in flipped_sids for guard in trigger.get("guards") or ())
+                    for trigger in screen.get("triggers", [])
+                ):
+                    dirty.add(key)
+        dirty_flows = set(changed_flows)
+        if flipped_sids or flipped_tids:  # V8: step が参照する screen / trigger の存在・所属
+            for key, flow_data in flows.items():
+                if key not in dirty_flows and any(
+                    step.get("screen") in flipped_sids or step.get("trigger") in flipped_tids
+                    for step in flow_data.get("steps", [])
+                ):
+                    dirty_flows.add(key)
+
+        for rules, keys in ((SCREEN_RULES, dirty.union(removed)), (FLOW_RULES, dirty_flows.union(removed_flows))):
+            for rule in rules:
+                store = self._unit_issues.setdefault(rule, {})
+                for key in keys:
+                    store.pop(key, None)
+        unit_rules = (SCREEN_RULES if dirty else ()) + (FLOW_RULES if dirty_flows else ())
+        if unit_rules:
+            partial = {"screens": {key: screens[key] for key in dirty},
+                       "flows": {key: flows[key] for key in dirty_flows}}
+            self.run_rules(unit_rules, index=False, data=partial, units=self._unit_issues)
+
+        # ── ドキュメント全体のルール ──
+        document_changed = bool(changed or removed or changed_flows or removed_flows) or rest != self._rest
+        global_rules = []
+        if document_changed or version[1] != self._version[1]:
+            global_rules.append("V1")
+        if removed or removed_flows or any(
+            key not in old_facts or _id_facts(old_facts[key]) != _id_facts(new_facts[key]) for key in changed
+        ) or any(key not in old_flow_facts or old_flow_facts[key][0] != new_flow_facts[key][0]
+                 for key in changed_flows):
+            global_rules.append("V5")
+        if removed or flipped_entries or any(
+            key not in old_facts or _graph_facts(old_facts[key]) != _graph_facts(new_facts[key]) for key in changed
+        ):
+            self._graph = None
+            global_rules += ["V9", "V10"]
+        found = self.run_rules(global_rules + ["V6"], index=False)
+        for rule in global_rules:
+            self._global_issues[rule] = found[rule]
+
+        for key in removed:
+            self._screen_facts.pop(key, None)
+        for key in removed_flows:
+            self._flow_facts.pop(key, None)
+        self._screen_facts.update((key, _encode_facts(facts)) for key, facts in new_facts.items())
+        self._flow_facts.update((key, _encode_facts(facts)) for key, facts in new_flow_facts.items())
+        self._screen_digests, self._flow_digests = new_digests, new_flow_digests
+        self._version, self._rest = version, rest
+        self._update_stats()
+        self.result.issues = self._collect_issues(found["V6"])
+        self.result.incremental = {
+            "full": False,
+            "changed_screens": len(changed) + len(removed),
+            "changed_flows": len(changed_flows) + len(removed_flows),
+            "reevaluated_screens": len(dirty),
+            "reevaluated_flows": len(dirty_flows),
+            "rules": [rule for rule in RULE_ORDER if rule in unit_rules or rule in global_rules],
+        }
+        return self.result
 
+    def _validate_full(self, version: tuple, reason: str) -> ValidationResult:
+        """全ルールを実行し、インクリメンタル検証の状態 (単位ごとのイシュー・事実) を作成"""
+        for name in INDEX_NAMES:
+            setattr(self, "_" + name, {})
+        self._graph = None
+        self._unit_issues = {}
+        found = self.run_rules(RULE_ORDER, units=self._unit_issues)
+        self._global_issues = {rule: found[rule] for rule in GLOBAL_RULES}
+        screens = self.data.get("screens", {})
+        flows = self.data.get("flows", {})
+        self._screen_digests = {key: _digest(screen) for key, screen in screens.items()}
+        self._flow_digests = {key: _digest(flow_data) for key, flow_data in flows.items()}
+        self._screen_facts = {key: _encode_facts(_screen_facts(key, screen)) for key, screen in screens.items()}
+        self._flow_facts = {key: _encode_facts(_flow_facts(key, flow_data)) for key, flow_data in flows.items()}
+        self._version, self._rest = version, _rest_digest(self.data)
+        self.result.issues = [issue for rule in RULE_ORDER for issue in found[rule]]
+        self.result.incremental = {"full": True, "reason": reason, "rules": list(RULE_ORDER)}
         return self.result
 
+    def _collect_issues(self, code_file_issues: list) -> list:
+        """保存済みイシューを RULE_ORDER, 単位はドキュメント順に並べる (validate() と同一順序)"""
+        units = {"screens": self.data.get("screens", {}), "flows": self.data.get("flows", {})}
+        issues = []
+        for rule in RULE_ORDER:
+            if rule == "V6":
+                issues.extend(code_file_issues)
+            elif rule in UNIT_RULES:
+                store = self._unit_issues.get(rule, {})
+                if store:
+                    for key in units["screens" if rule in SCREEN_RULES else "flows"]:
+                        found = store.get(key)
+                        if found:
+                            issues.extend(found)
+            else:
+                issues.extend(self._global_issues.get(rule, ()))
+        return issues
+
+    def _index_screen(self, facts: list, delta: int):
+        """screen 1件分の索引を追加 (delta=1) / 取り消し (delta=-1)。_trigger_map は _resolve_trigger_owners"""
+        _count(self._screen_ids, facts[0], delta)
+        for tid, target, fallbacks in facts[2]:
+            if tid:
+                _count(self._trigger_ids, tid, delta)
+            if target:
+                _count(self._target_map, target, delta)
+            for fallback in fallbacks:
+                _count(self._fallback_map, fallback, delta)
+
+    def _index_flow(self, facts: list, delta: int):
+        _count(self._flow_ids, facts[0], delta)
+        if facts[1]:
+            _count(self._flow_entries, facts[1], delta)
+
+    def _resolve_trigger_owners(self, tids: set, screens: dict):
+        """_trigger_map (最後に出現した所属 screen) を tids について更新 (末尾から走査)"""
+        pending = set()
+        for tid in tids:
+            if tid in self._trigger_ids:
+                pending.add(tid)
+            else:
+                self._trigger_map.pop(tid, None)
+        for screen_key in reversed(screens):
+            if not pending:
+                break
+            screen = screens[screen_key]
+            for trigger in screen.get("triggers", []):
+                tid = trigger.get("id")
+                if tid in pending:
+                    self._trigger_map[tid] = screen.get("id", screen_key)
+                    pending.discard(tid)
+
+    def snapshot(self) -> Optional[dict]:
+        """インクリメンタル検証の状態 (JSON 化可能)。validate_incremental の実行後のみ"""
+        if self._screen_digests is None:
+            return None
+
+        def units(digests: dict, facts: dict) -> dict:
+            return {"keys": list(digests), "digests": list(digests.values()),
+                    "facts": [facts[key] for key in digests]}
+
+        return {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "version": self._version[0],
+            "v1_input": self._version[1],
+            "rest": self._rest,
+            "screens": units(self._screen_digests, self._screen_facts),
+            "flows": units(self._flow_digests, self._flow_facts),
+            "indexes": {name: getattr(self, "_" + name) for name in INDEX_NAMES},
+            "issues": {
+                # UNIT_RULES の重大度はルールごとに固定のためメッセージのみ
+                **{rule: {key: [issue.message for issue in issues]
+                          for key, issues in self._unit_issues.get(rule, {}).items()}
+                   for rule in UNIT_RULES},
+                **{rule: [[issue.severity, issue.message] for issue in self._global_issues.get(rule, ())]
+                   for rule in GLOBAL_RULES},
+            },
+        }
+
+    def _restore(self, previous: Optional[dict], version: tuple) -> bool:
+        """スナップショットを復元。ルール実装が変わった・破損している場合は False"""
+        if (
+            not previous
+            or previous.get("format_version") != SNAPSHOT_FORMAT_VERSION
+            or version[0] is None
+            or previous.get("version") != version[0]
+        ):
+            return False
+        try:
+            screens, flows, stored = previous["screens"], previous["flows"], previous["issues"]
+            indexes = {name: previous["indexes"][name] for name in INDEX_NAMES}
+            unit_issues = {
+                rule: {key: [Issue(rule, UNIT_SEVERITY[rule], message) for message in messages]
+                       for key, messages in stored[rule].items()}
+                for rule in UNIT_RULES
+            }
+            global_issues = {rule: [Issue(rule, severity, message) for severity, message in stored[rule]]
+                             for rule in GLOBAL_RULES}
+            for units in (screens, flows):
+                if not len(units["keys"]) == len(units["digests"]) == len(units["facts"]):
+                    return False
+            screen_digests = dict(zip(screens["keys"], screens["digests"]))
+            screen_facts = dict(zip(screens["keys"], screens["facts"]))
+            flow_digests = dict(zip(flows["keys"], flows["digests"]))
+            flow_facts = dict(zip(flows["keys"], flows["facts"]))
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return False
+        for name, index in indexes.items():
+            setattr(self, "_" + name, index)
+        self._screen_digests, self._screen_facts = screen_digests, screen_facts
+        self._flow_digests, self._flow_facts = flow_digests, flow_facts
+        self._unit_issues, self._global_issues = unit_issues, global_issues
+        self._version = (previous["version"], previous.get("v1_input"))
+        self._rest = previous.get("rest", "")
+        return True
+
+
+class Traversal:
+    """nav-graph.json を1回だけ走査し、登録されたコールバックを呼び出すパイプライン
+
+    走査順: screens (screen → その triggers) → flows (flow → その steps) → finish (登録順)。
+    flows は全 screen / trigger の後に訪れるため、flow/step コールバックからは
+    完成した索引を参照できる。コールバックがなければその部分は走査しない。
+    trigger の id / target は走査側で1回だけ取り出してコールバックに渡す。
+    unit は走査中の screen キー (screen / trigger コールバック中) または flow キー
+    (flow / step コールバック中)。finish 中は None。
+    """
+
+    def __init__(self):
+        self.screen_callbacks: list = []   # (sid, screen_key, screen)
+        self.trigger_callbacks: list = []  # (sid, trigger_id, target, trigger)
+        self.flow_callbacks: list = []     # (fid, flow_key, flow_data)
+        self.step_callbacks: list = []     # (fid, index, step)
+        self.finish_callbacks: list = []   # ()
+        self.shared: dict = {}  # 複数ルールで共有する構築物の登録済みフラグ
+        self.passes = 0  # ドキュメントの走査回数 (0 or 1)
+        self.unit = None
+        self._ids: Optional[tuple] = None
+
+    def index_ids(self, screen_ids: dict, trigger_ids: dict, trigger_map: dict, target_map: dict,
+                  fallback_map: dict, flow_ids: dict, flow_entries: dict):
+        """走査中に ID 索引 (INDEX_NAMES の順) を更新する (コールバック呼び出しなしで直接)"""
+        self._ids = (screen_ids, trigger_ids, trigger_map, target_map, fallback_map, flow_ids, flow_entries)
+
+    def on_screen(self, callback):
+        self.screen_callbacks.append(callback)
+
+    def on_trigger(self, callback):
+        self.trigger_callbacks.append(callback)
+
+    def on_flow(self, callback):
+        self.flow_callbacks.append(callback)
+
+    def on_step(self, callback):
+        self.step_callbacks.append(callback)
+
+    def on_finish(self, callback):
+        self.finish_callbacks.append(callback)
+
+    def run(self, data: dict):
+        on_screen, on_trigger = self.screen_callbacks, self.trigger_callbacks
+        on_flow, on_step = self.flow_callbacks, self.step_callbacks
+        indexing = self._ids is not None
+        if indexing or on_screen or on_trigger or on_flow or on_step:
+            self.passes += 1
+        if indexing:
+            screen_ids, trigger_ids, trigger_map, target_map, fallback_map, flow_ids, flow_entries = self._ids
+
+        if indexing or on_screen or on_trigger:
+            for screen_key, screen in data.get("screens", {}).items():
+                sid = screen.get("id", screen_key)
+                self.unit = screen_key
+                if indexing:
+                    screen_ids[sid] = screen_ids.get(sid, 0) + 1
+                for callback in on_screen:
+                    callback(sid, screen_key, screen)
+                if indexing or on_trigger:
+                    for trigger in screen.get("triggers", []):
+                        tid = trigger.get("id")
+                        target = trigger.get("target")
+                        if indexing:
+                            if tid:
+                                trigger_ids[tid] = trigger_ids.get(tid, 0) + 1
+                                trigger_map[tid] = sid
+                            if target:
+                                target_map[target] = target_map.get(target, 0) + 1
+                            guards = trigger.get("guards")
+                            if guards:
+                                for guard in guards:
+                                    fallback = guard.get("fallback_screen")
+                                    if fallback:
+                                        fallback_map[fallback] = fallback_map.get(fallback, 0) + 1
+                        for callback in on_trigger:
+                            callback(sid, tid, target, trigger)
+
+        if indexing or on_flow or on_step:
+            for flow_key, flow_data in data.get("flows", {}).items():
+                fid = flow_data.get("id", flow_key)
+                self.unit = flow_key
+                if indexing:
+                    flow_ids[fid] = flow_ids.get(fid, 0) + 1
+                    entry = _flow_entry(flow_data)
+                    if entry:
+                        flow_entries[entry] = flow_entries.get(entry, 0) + 1
+                for callback in on_flow:
+                    callback(fid, flow_key, flow_data)
+                if on_step:
+                    for i, step in enumerate(flow_data.get("steps", [])):
+                        for callback in on_step:
+                            callback(fid, i, step)
+
+        self.unit = None
+        for callback in self.finish_callbacks:
+            callback()
+
+
+def _append(mapping: dict, key, value):
+    """mapping[key] のリストに追加"""
+    owners = mapping.get(key)
+    if owners is None:
+        mapping[key] = [value]
+    else:
+        owners.append(value)
+
+
+def _count(mapping: dict, key, delta: int):
+    """索引の出現回数を増減 (0 になれば key ごと削除)"""
+    count = mapping.get(key, 0) + delta
+    if count:
+        mapping[key] = count
+    else:
+        del mapping[key]
+
+
+def _flow_entry(flow_data: dict):
+    """フローの最初の step.screen (なければ None)"""
+    steps = flow_data.get("steps", [])
+    return steps[0].get("screen") if steps else None
+
+
+def _emitter(walk: Traversal, issues: list, by_unit: Optional[dict]):
+    """ルールのイシュー出力先 emit(issue, unit=None)
+
+    by_unit を指定すると unit (省略時は走査中の screen / flow キー) ごとにも記録する。
+    """
+    if by_unit is None:
+        def emit(issue, unit=None):
+            issues.append(issue)
+    else:
+        def emit(issue, unit=None):
+            issues.append(issue)
+            _append(by_unit, walk.unit if unit is None else unit, issue)
+    return emit
+
+
+# ルール → 登録メソッド (走査コールバックと集計を登録する)
+RULE_METHODS = {
+    "V1": "_rule_v1_schema",
+    "V2": "_rule_v2_orphan_screens",
+    "V3": "_rule_v3_dead_ends",
+    "V4": "_rule_v4_reference_integrity",
+    "V5": "_rule_v5_duplicate_ids",
+    "V6": "_rule_v6_code_files",
+    "V7": "_rule_v7_guard_consistency",
+    "V8": "_rule_v8_flow_paths",
+    "V9": "_rule_v9_unreachable_screens",
+    "V10": "_rule_v10_closed_loops",
+}
+
 
 def format_text(result: ValidationResult, nav_graph_path: Path) -> str:
     """人間が読みやすいテキスト出力"""
@@ -447,6 +1185,23 @@ def format_text(result: ValidationResult, nav_graph_path: Path) -> str:
     lines.append(f"NAV-GRAPH Validation Results: {nav_graph_path.name}")
     lines.append(f"{'=' * 60}")
     lines.append(f"Stats: {stats.screen_count} screens, {stats.trigger_count} triggers, {stats.flow_count} flows")
+    if result.shards:
+        scope = result.shards
+        line = f"Shards: {len(scope['loaded'])}/{scope['total']} ({', '.join(scope['loaded'])})"
+        if scope["skipped_rules"]:
+            line += f" - 全シャードが必要なため未実行: {', '.join(scope['skipped_rules'])}"
+        lines.append(line)
+    if result.cached_rules:
+        lines.append(f"Cache: {', '.join(result.cached_rules)} (入力不変のため前回結果)")
+    delta = result.incremental
+    if delta and delta["full"]:
+        lines.append(f"Incremental: 全体検証 ({delta['reason']})")
+    elif delta:
+        lines.append(
+            f"Incremental: 変更 {delta['changed_screens']} screens / {delta['changed_flows']} flows → "
+            f"再評価 {delta['reevaluated_screens']} screens / {delta['reevaluated_flows']} flows "
+            f"({', '.join(delta['rules'])})"
+        )
 
     # BLOCKING
     blocking = result.blocking_issues
@@ -492,10 +1247,13 @@ def format_json(result: ValidationResult) -> str:
             {"rule": i.rule, "message": i.message}
             for i in result.warning_issues
         ],
+        "cached_rules": result.cached_rules,
+        **({"incremental": result.incremental} if result.incremental is not None else {}),
+        **({"shards": result.shards} if result.shards is not None else {}),
         "pass": not result.has_blocking,
         "exit_code": 1 if result.has_blocking else (2 if result.has_warning else 0),
     }
-    return json.dumps(output, ensure_ascii=False, indent=2)
+    return json_codec.dumps(output)
 
 
 def main():
@@ -508,7 +1266,8 @@ def main():
         "nav_graph",
         nargs="?",
         default=None,
-        help="nav-graph.jsonパス（デフォルト: docs/navigation/nav-graph.json）",
+        help="nav-graph.json またはシャードディレクトリ / manifest.json のパス"
+             "（デフォルト: docs/navigation/nav-graph.json, なければ docs/navigation/nav-graph/）",
     )
     parser.add_argument(
         "--project-root",
@@ -520,7 +1279,31 @@ def main():
         action="store_true",
         help="JSON形式のみで出力",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="結果キャッシュを使わず全ルールを実行",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="前回のスナップショットとの差分 (変更された screen / flow) の影響範囲のみ再評価",
+    )
+    parser.add_argument(
+        "--snapshot",
+        default=None,
+        help="スナップショットのパス（デフォルト: .quality/cache/nav-graph-snapshot.json）",
+    )
+    parser.add_argument(
+        "--feature",
+        action="append",
+        default=None,
+        help="シャード構成で検証する feature（番号またはシャード名, 複数指定可。例: 022）",
+    )
     args = parser.parse_args()
+    if args.feature and args.incremental:
+        parser.error("--feature と --incremental は併用できません")
+    features = [f.zfill(3) if f.isdigit() else f for f in args.feature] if args.feature else None
 
     # プロジェクトルートを決定
     if args.project_root:
@@ -542,8 +1325,26 @@ def main():
         nav_graph_path = project_root / "docs" / "navigation" / "nav-graph.json"
 
     # 検証を実行
-    validator = NavGraphValidator(nav_graph_path, project_root)
-    result = validator.validate()
+    if args.incremental:
+        snapshot_path = Path(args.snapshot) if args.snapshot else project_root / ".quality" / "cache" / "nav-graph-snapshot.json"
+        validator = NavGraphValidator(nav_graph_path, project_root)
+        result = validator.validate_incremental(load_snapshot(snapshot_path))
+        snapshot = validator.snapshot()
+        if snapshot is not None:
+            try:
+                save_snapshot(snapshot_path, snapshot)
+            except OSError as e:
+                print(f"WARNING: スナップショット保存失敗: {e}", file=sys.stderr)
+        cache = None
+    else:
+        cache = CheckCache() if HAS_CHECK_CACHE and not args.no_cache else None
+        validator = NavGraphValidator(nav_graph_path, project_root, cache=cache, features=features)
+        result = validator.validate()
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: 結果キャッシュ保存失敗: {e}", file=sys.stderr)
 
     # 出力
     if args.json_only:
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+nav_graph_core.py — nav-graph.json のグラフコア (到達可能性・強連結成分).
+
+screens[].triggers[] の入れ子 dict を1回だけ走査し、screen ID を整数インデックスに
+インターンして辺を CSR (offsets / targets 配列) で保持する。以降の解析は配列のみを参照する。
+
+- reachable(roots)  BFS による到達可能性 (O(V + E))
+- components()      Tarjan の強連結成分 (反復版, 再帰なし, O(V + E))
+- closed_loops()    出口のない閉路 (シンク強連結成分)
+
+辺は trigger.target と guards[].fallback_screen (リダイレクト先) の両方。
+存在しない screen への参照 (V4/V7 で報告) は辺に含めない。
+
+Usage:
+    from nav_graph_core import NavGraph, find_entry_screen
+
+    graph = NavGraph.from_data(data)
+    seen = graph.reachable(graph.roots())
+    unreachable = [graph.ids[i] for i in range(graph.size) if not seen[i]]
+"""
+
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+from typing import Iterable, Optional
+
+# ターミナル画面 (閉じて前の画面に戻る) — V3 の除外対象と同一
+TERMINAL_TYPES = frozenset({"dialog", "bottomSheet", "overlay"})
+
+
+def find_entry_screen(screens: dict) -> str | None:
+    """アプリのエントリーポイントscreenを推論する。
+
+    優先順位:
+    1. entry_conditionsに'none'のみがありscreen_typeが'page'のログイン/スプラッシュ
+    2. tab_index == 0のタブscreen
+    3. 最初のscreen（fallback）
+    """
+    # ログイン/スプラッシュscreenを探索
+    for screen in screens.values():
+        name_lower = screen.get("name", "").lower()
+        if any(kw in name_lower for kw in ("login", "splash", "onboarding")):
+            return screen["id"]
+
+    # tab_index 0
+    for screen in screens.values():
+        if screen.get("tab_index") == 0:
+            return screen["id"]
+
+    # fallback: 最初のもの
+    if screens:
+        return next(iter(screens.values()))["id"]
+
+    return None
+
+
+class NavGraph:
+    """screen ID を整数化した有向グラフ (CSR)。
+
+    ids[i]                         インデックス i の screen ID (screens の出現順, 重複IDは最初のもの)
+    index[sid]                     screen ID → インデックス
+    targets[offsets[i]:offsets[i + 1]]  i からの辺の行き先 (trigger 順, fallback は各 trigger の直後)
+    """
+
+    __slots__ = ("ids", "index", "offsets", "targets", "screen_types", "names", "entry", "flow_entries")
+
+    def __init__(self, ids: list, offsets: array, targets: array, screen_types: list,
+                 names: Optional[list] = None, entry: Optional[str] = None,
+                 flow_entries: Iterable[str] = ()):
+        self.ids = ids
+        self.index = {sid: i for i, sid in enumerate(ids)}
+        self.offsets = offsets
+        self.targets = targets
+        self.screen_types = screen_types
+        self.names = names if names is not None else ["?"] * len(ids)
+        self.entry = entry
+        self.flow_entries = tuple(flow_entries)
+
+    @classmethod
+    def from_data(cls, data: dict) -> "NavGraph":
+        """nav-graph.json の dict から構築 (screens / flows を各1回走査)。"""
+        builder = NavGraphBuilder()
+        for screen_key, screen in data.get("screens", {}).items():
+            builder.add_screen(screen.get("id", screen_key), screen)
+            for trigger in screen.get("triggers", ()):
+                builder.add_trigger(trigger.get("target"), trigger.get("guards"))
+        for flow_data in data.get("flows", {}).values():
+            steps = flow_data.get("steps", [])
+            if steps:
+                builder.add_flow_entry(steps[0].get("screen"))
+        return builder.build()
+
+    # ── 基本 ──
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.targets)
+
+    def successors(self, node: int) -> array:
+        return self.targets[self.offsets[node]:self.offsets[node + 1]]
+
+    def in_degrees(self) -> array:
+        degrees = array("l", bytes(array("l").itemsize * self.size))
+        for target in self.targets:
+            degrees[target] += 1
+        return degrees
+
+    def roots(self) -> list[int]:
+        """到達可能性の起点: エントリー画面 + タブ + フローの開始画面 (V2 の除外対象と同一)。"""
+        roots = [i for i, kind in enumerate(self.screen_types) if kind == "tab"]
+        for sid in (self.entry, *self.flow_entries):
+            node = self.index.get(sid)
+            if node is not None:
+                roots.append(node)
+        return roots
+
+    # ── 解析 ──
+
+    def reachable(self, roots: Iterable[int]) -> bytearray:
+        """roots から到達可能なノード (seen[i] == 1)。"""
+        offsets, targets = self.offsets, self.targets
+        seen = bytearray(self.size)
+        queue = []
+        for root in roots:
+            if not seen[root]:
+                seen[root] = 1
+                queue.append(root)
+        # キューは追記のみ (先頭から読み進める)
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if not seen[target]:
+                    seen[target] = 1
+                    queue.append(target)
+        return seen
+
+    def components(self) -> tuple[list[list[int]], array]:
+        """Tarjan の強連結成分 (反復版)。
+
+        (成分のリスト, ノード → 成分番号) を返す。成分は逆トポロジカル順
+        (後の成分から前の成分への辺はない)。
+        """
+        n = self.size
+        offsets, targets = self.offsets, self.targets
+        order = [-1] * n  # 訪問順 (-1 = 未訪問)
+        low = [0] * n
+        cursor = list(offsets[:n]) if n else []  # 次に調べる辺の位置
+        on_stack = bytearray(n)
+        component_of = array("l", [-1]) * n
+        stack: list = []
+        components: list = []
+        counter = 0
+
+        for root in range(n):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            call = [root]
+            while call:
+                node = call[-1]
+                pos, end = cursor[node], offsets[node + 1]
+                while pos < end:
+                    target = targets[pos]
+                    pos += 1
+                    if order[target] == -1:
+                        cursor[node] = pos
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = 1
+                        call.append(target)
+                        break
+                    if on_stack[target] and order[target] < low[node]:
+                        low[node] = order[target]
+                else:
+                    call.pop()
+                    if low[node] == order[node]:
+                        number = len(components)
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = 0
+                            component_of[member] = number
+                            members.append(member)
+                            if member == node:
+                                break
+                        components.append(members)
+                    if call:
+                        parent = call[-1]
+                        if low[node] < low[parent]:
+                            low[parent] = low[node]
+        return components, component_of
+
+    def closed_loops(self) -> list[list[int]]:
+        """出口のない閉路: 外への辺がない強連結成分のうち、閉路を含み
+        (2ノード以上 or 自己ループ)、起点 (roots) もターミナル画面も含まないもの。
+
+        各成分はインデックス昇順, 成分は最小インデックス順。
+        """
+        components, component_of = self.components()
+        offsets, targets = self.offsets, self.targets
+        has_exit = bytearray(len(components))
+        self_loop = bytearray(len(components))
+        for node in range(self.size):
+            number = component_of[node]
+            for target in targets[offsets[node]:offsets[node + 1]]:
+                if component_of[target] != number:
+                    has_exit[number] = 1
+                elif target == node:
+                    self_loop[number] = 1
+        excluded = bytearray(len(components))
+        for root in self.roots():
+            excluded[component_of[root]] = 1
+        for node, kind in enumerate(self.screen_types):
+            if kind in TERMINAL_TYPES:
+                excluded[component_of[node]] = 1
+
+        loops = [
+            sorted(members) for number, members in enumerate(components)
+            if not has_exit[number] and not excluded[number]
+            and (len(members) > 1 or self_loop[number])
+        ]
+        loops.sort(key=lambda members: members[0])
+        return loops
+
+
+_UNSET = object()
+_ENTRY_KEYWORDS = ("login", "splash", "onboarding")
+
+
+class NavGraphBuilder:
+    """走査しながら NavGraph を組み立てる (他の検査と同じ1回の走査に相乗りするため)。
+
+    add_screen() → その screen の add_trigger() … の順に呼び、最後に build()。
+    参照先は build() でまとめて解決するため、後方の screen への参照も可。
+    エントリー画面は find_entry_screen() と同一の推論を走査中に行う。
+    """
+
+    def __init__(self):
+        self.ids: list = []
+        self.index: dict = {}
+        self.screen_types: list = []
+        self.names: list = []
+        self._owners: list = []  # screen 訪問ごとのノード
+        self._starts: list = []  # screen 訪問ごとの _refs 開始位置
+        self._refs: list = []    # 参照先 screen ID (未解決)
+        self._flow_entries: list = []
+        self._login = self._tab0 = self._first = _UNSET
+
+    def add_screen(self, sid, screen: dict) -> None:
+        node = self.index.get(sid)
+        if node is None:
+            node = self.index[sid] = len(self.ids)
+            self.ids.append(sid)
+            self.screen_types.append(screen.get("screen_type", "page"))
+            self.names.append(screen.get("name", "?"))
+        self._owners.append(node)
+        self._starts.append(len(self._refs))
+
+        # find_entry_screen と同一の優先順位 (id のない screen は None = 起点なし)
+        if self._first is _UNSET:
+            self._first = screen.get("id")
+        if self._login is _UNSET:
+            name_lower = screen.get("name", "").lower()
+            if any(kw in name_lower for kw in _ENTRY_KEYWORDS):
+                self._login = screen.get("id")
+        if self._tab0 is _UNSET and screen.get("tab_index") == 0:
+            self._tab0 = screen.get("id")
+
+    def add_trigger(self, target, guards=None) -> None:
+        """直前の add_screen の screen からの辺 (trigger.target + guards[].fallback_screen)。"""
+        if target:
+            self._refs.append(target)
+        if guards:
+            for guard in guards:
+                fallback = guard.get("fallback_screen")
+                if fallback:
+                    self._refs.append(fallback)
+
+    def add_flow_entry(self, screen_id) -> None:
+        if screen_id:
+            self._flow_entries.append(screen_id)
+
+    def entry(self) -> Optional[str]:
+        for candidate in (self._login, self._tab0, self._first):
+            if candidate is not _UNSET:
+                return candidate
+        return None
+
+    def build(self) -> NavGraph:
+        n = len(self.ids)
+        resolved = list(map(self.index.get, self._refs))  # 存在しない screen → None
+        bounds = self._starts + [len(resolved)]
+        if len(self._owners) == n:
+            # 重複IDなし: 訪問順 = ノード順のため、そのまま CSR 順
+            if None not in resolved:
+                offsets, targets = bounds, resolved
+            else:
+                prefix = [0, *accumulate(t is not None for t in resolved)]
+                offsets = [prefix[b] for b in bounds]
+                targets = [t for t in resolved if t is not None]
+        else:
+            # 重複IDの screen は最初の screen の辺に合流させる
+            per_node: list = [[] for _ in range(n)]
+            for visit, owner in enumerate(self._owners):
+                per_node[owner].extend(t for t in resolved[bounds[visit]:bounds[visit + 1]] if t is not None)
+            offsets, targets = [0], []
+            for out in per_node:
+                targets.extend(out)
+                offsets.append(len(targets))
+        return NavGraph(self.ids, array("l", offsets), array("l", targets), self.screen_types,
+                        self.names, self.entry(), self._flow_entries)
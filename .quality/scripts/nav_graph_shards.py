@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+nav_graph_shards.py — feature 別に分割した nav-graph (シャード構成) の読み込み.
+
+単一の nav-graph.json は feature 1件分の screen だけが必要なコマンドでも全体を
+パースする必要がある。シャード構成では feature ごとの断片と小さな manifest に分割し、
+コマンドが必要とするシャードだけを読んでマージする (遅延マージ)。
+
+レイアウト (docs/navigation/nav-graph/):
+    manifest.json     シャード一覧 + 全体の ID 索引 (常に読む, 軽量)
+    <feature>.json    その feature の {"screens": {...}, "flows": {...}}
+
+manifest.json:
+    {
+      "format_version": 1,
+      "meta": {nav-graph.json の screens / flows 以外のトップレベル (version 等)},
+      "shards": {
+        "<feature>": {
+          "file": "<feature>.json",
+          "screens": {screen ID: name},
+          "triggers": {trigger ID: 所属 screen ID},
+          "flows": [flow ID, ...]
+        }
+      }
+    }
+
+- screen は screen.feature でシャードに振り分ける (feature のない screen は "_unassigned")
+- flow は最初の step.screen が属するシャードに置く
+- 読み込んでいないシャードへの参照 (V4/V7/V8, Mermaid の外部遷移先) は ID 索引で解決する
+- 読み込んだシャードの内容と索引が食い違う場合は ShardManifestError (reindex で再生成)
+
+Usage:
+    from nav_graph_shards import ShardedNavGraph, find_manifest
+
+    manifest = find_manifest(Path("docs/navigation/nav-graph.json"))  # シャード構成なら manifest のパス
+    shards = ShardedNavGraph(manifest)
+    data = shards.load(["022"])            # feature 022 のシャードのみ (None = 全シャード)
+    index = shards.id_index()              # 読み込んでいないシャードの ID 索引
+
+    python3 nav_graph_shards.py split docs/navigation/nav-graph.json   # → docs/navigation/nav-graph/
+    python3 nav_graph_shards.py merge docs/navigation/nav-graph --output nav-graph.json
+    python3 nav_graph_shards.py reindex docs/navigation/nav-graph      # シャード編集後に索引を再生成
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import json_codec  # noqa: E402
+from atomic_write import WriteBatch, dump_json_bytes  # noqa: E402
+
+MANIFEST_NAME = "manifest.json"
+SHARD_FORMAT_VERSION = 1
+UNASSIGNED_FEATURE = "_unassigned"
+
+
+class ShardManifestError(ValueError):
+    """manifest の形式不正・索引とシャード内容の不一致。"""
+
+
+class IdIndex(NamedTuple):
+    """シャード横断の ID 索引 (manifest のみから構築)。"""
+
+    screens: dict   # screen ID -> feature (シャードキー)
+    names: dict     # screen ID -> name
+    triggers: dict  # trigger ID -> 所属 screen ID
+
+
+def find_manifest(path: Path) -> Optional[Path]:
+    """path がシャード構成を指すなら manifest のパス (単一ファイル構成なら None)。
+
+    - ディレクトリ → その下の manifest.json
+    - manifest.json そのもの
+    - 存在しない nav-graph.json → 拡張子を除いた同名ディレクトリの manifest.json
+    """
+    path = Path(path)
+    if path.is_dir():
+        candidate = path / MANIFEST_NAME
+        return candidate if candidate.exists() else None
+    if path.name == MANIFEST_NAME:
+        return path
+    if not path.exists() and path.suffix == ".json":
+        candidate = path.with_suffix("") / MANIFEST_NAME
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def extract_feature_num(feature: str) -> str:
+    """'022-home-screen' → '022'."""
+    return feature.split("-")[0]
+
+
+def _feature_of(screen: dict) -> str:
+    return screen.get("feature") or UNASSIGNED_FEATURE
+
+
+def _shard_file_name(feature: str, taken: set) -> str:
+    base = re.sub(r"[^A-Za-z0-9_.-]", "_", feature) or UNASSIGNED_FEATURE
+    name = f"{base}.json"
+    n = 2
+    while name in taken or name == MANIFEST_NAME:
+        name = f"{base}-{n}.json"
+        n += 1
+    taken.add(name)
+    return name
+
+
+def index_entry(shard: dict) -> dict:
+    """シャード内容の ID 索引 (manifest の shards[feature] から file を除いたもの)"""
+    screens: dict = {}
+    triggers: dict = {}
+    for screen_key, screen in shard.get("screens", {}).items():
+        sid = screen.get("id", screen_key)
+        screens[sid] = screen.get("name", "?")
+        for trigger in screen.get("triggers", []):
+            tid = trigger.get("id")
+            if tid:
+                triggers[tid] = sid
+    flows = [flow_data.get("id", flow_key) for flow_key, flow_data in shard.get("flows", {}).items()]
+    return {"screens": screens, "triggers": triggers, "flows": flows}
+
+
+def split_nav_graph(data: dict) -> tuple[dict, dict]:
+    """単一の nav-graph dict → (manifest, {ファイル名: シャード})。シャードは screen の出現順。"""
+    shards: dict = {}
+    feature_of_screen: dict = {}
+    for screen_key, screen in data.get("screens", {}).items():
+        feature = _feature_of(screen)
+        shards.setdefault(feature, {"screens": {}, "flows": {}})["screens"][screen_key] = screen
+        feature_of_screen.setdefault(screen.get("id", screen_key), feature)
+    for flow_key, flow_data in data.get("flows", {}).items():
+        steps = flow_data.get("steps", [])
+        entry = steps[0].get("screen") if steps else None
+        feature = feature_of_screen.get(entry, UNASSIGNED_FEATURE)
+        shards.setdefault(feature, {"screens": {}, "flows": {}})["flows"][flow_key] = flow_data
+
+    taken: set = set()
+    entries: dict = {}
+    files: dict = {}
+    for feature, shard in shards.items():
+        name = _shard_file_name(feature, taken)
+        entries[feature] = {"file": name, **index_entry(shard)}
+        files[name] = shard
+    manifest = {
+        "format_version": SHARD_FORMAT_VERSION,
+        "meta": {key: value for key, value in data.items() if key not in ("screens", "flows")},
+        "shards": entries,
+    }
+    return manifest, files
+
+
+def write_shards(data: dict, out_dir: Path) -> list[Path]:
+    """単一の nav-graph dict をシャード構成で out_dir に書き出す (変更のあったファイルのみ)"""
+    manifest, files = split_nav_graph(data)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    with WriteBatch() as batch:
+        for name, shard in files.items():
+            batch.stage_json(out_dir / name, shard)
+        batch.stage_json(out_dir / MANIFEST_NAME, manifest)
+    return batch.written
+
+
+class ShardedNavGraph:
+    """manifest + シャードファイル群。シャードは要求されたものだけを読み、読み込み済みは再利用する。"""
+
+    def __init__(self, manifest_path: Path):
+        self.manifest_path = Path(manifest_path)
+        self.root = self.manifest_path.parent
+        manifest = json_codec.load_path(self.manifest_path)  # OSError / JSONDecodeError はそのまま
+        if not isinstance(manifest, dict) or manifest.get("format_version") != SHARD_FORMAT_VERSION:
+            raise ShardManifestError(
+                f"{self.manifest_path}: 未対応の manifest (format_version={SHARD_FORMAT_VERSION} が必要)")
+        shards = manifest.get("shards")
+        if not isinstance(shards, dict) or not all(
+            isinstance(entry, dict) and isinstance(entry.get("file"), str) for entry in shards.values()
+        ):
+            raise ShardManifestError(f"{self.manifest_path}: shards の各要素に file が必要")
+        self.meta: dict = manifest.get("meta", {})
+        self.shards: dict = shards
+        self.loaded: dict = {}  # feature -> シャード内容 (読み込み済み)
+
+    @property
+    def features(self) -> list:
+        return list(self.shards)
+
+    def select(self, features: Optional[Iterable[str]] = None) -> list:
+        """features (シャードキーまたは feature 番号) に該当するシャードキー (manifest 順, None = 全シャード)"""
+        if features is None:
+            return self.features
+        wanted = set(features)
+        return [key for key in self.shards if key in wanted or extract_feature_num(key) in wanted]
+
+    def path(self, feature: str) -> Path:
+        return self.root / self.shards[feature]["file"]
+
+    def paths(self, features: Optional[Iterable[str]] = None) -> list:
+        return [self.path(key) for key in self.select(features)]
+
+    def load(self, features: Optional[Iterable[str]] = None) -> dict:
+        """該当シャードをマージした nav-graph dict (meta → screens → flows, シャードは manifest 順)
+
+        読み込んだシャードの ID が manifest の索引と異なる、または screen / flow キーが
+        複数のシャードにある場合は ShardManifestError。
+        """
+        merged = dict(self.meta)
+        screens: dict = {}
+        flows: dict = {}
+        for key in self.select(features):
+            shard = self.loaded.get(key)
+            if shard is None:
+                shard = json_codec.load_path(self.path(key))
+                expected = {name: value for name, value in self.shards[key].items() if name != "file"}
+                if index_entry(shard) != expected:
+                    raise ShardManifestError(
+                        f"{self.path(key)}: manifest の ID 索引と内容が不一致 "
+                        f"(nav_graph_shards.py reindex {self.root} で再生成)")
+                self.loaded[key] = shard
+            for units, merged_units, kind in ((shard.get("screens", {}), screens, "screen"),
+                                              (shard.get("flows", {}), flows, "flow")):
+                for unit_key, unit in units.items():
+                    if unit_key in merged_units:
+                        raise ShardManifestError(f"{kind} キー {unit_key} が複数のシャードにあります ({key})")
+                    merged_units[unit_key] = unit
+        merged["screens"] = screens
+        merged["flows"] = flows
+        return merged
+
+    def id_index(self, exclude: Iterable[str] = ()) -> IdIndex:
+        """exclude 以外のシャードの ID 索引 (シャードファイルは読まない)"""
+        excluded = set(exclude)
+        index = IdIndex({}, {}, {})
+        for key, entry in self.shards.items():
+            if key in excluded:
+                continue
+            for sid, name in entry.get("screens", {}).items():
+                index.screens.setdefault(sid, key)
+                index.names.setdefault(sid, name)
+            index.triggers.update(entry.get("triggers", {}))
+        return index
+
+    def reindex(self) -> bool:
+        """全シャードを読み直して manifest の ID 索引を再生成 (変更があれば True)"""
+        for key in self.shards:
+            shard = self.loaded[key] = json_codec.load_path(self.path(key))
+            self.shards[key] = {"file": self.shards[key]["file"], **index_entry(shard)}
+        manifest = {"format_version": SHARD_FORMAT_VERSION, "meta": self.meta, "shards": self.shards}
+        with WriteBatch() as batch:
+            changed = batch.stage_json(self.manifest_path, manifest)
+        return changed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="nav-graph のシャード構成 (feature 別分割) の作成・結合")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_split = sub.add_parser("split", help="nav-graph.json を feature 別シャードに分割")
+    p_split.add_argument("nav_graph", type=Path, help="nav-graph.json パス")
+    p_split.add_argument("--out", type=Path, default=None,
+                         help="出力ディレクトリ（デフォルト: 拡張子を除いた同名ディレクトリ）")
+    p_merge = sub.add_parser("merge", help="シャードを結合して単一の nav-graph.json を出力")
+    p_merge.add_argument("shards", type=Path, help="シャードディレクトリまたは manifest.json")
+    p_merge.add_argument("--output", type=Path, default=None, help="出力ファイル（デフォルト: stdout）")
+    p_reindex = sub.add_parser("reindex", help="シャード編集後に manifest の ID 索引を再生成")
+    p_reindex.add_argument("shards", type=Path, help="シャードディレクトリまたは manifest.json")
+    args = parser.parse_args()
+
+    if args.command == "split":
+        out_dir = args.out or args.nav_graph.with_suffix("")
+        written = write_shards(json_codec.load_path(args.nav_graph), out_dir)
+        print(f"{out_dir}: {len(written)} files written", file=sys.stderr)
+        return 0
+
+    manifest = find_manifest(args.shards)
+    if manifest is None:
+        print(f"Error: manifest が見つかりません: {args.shards}", file=sys.stderr)
+        return 1
+    try:
+        shards = ShardedNavGraph(manifest)
+        if args.command == "reindex":
+            changed = shards.reindex()
+            print(f"{manifest}: {'updated' if changed else 'unchanged'}", file=sys.stderr)
+            return 0
+        data = shards.load()
+    except ShardManifestError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    content = dump_json_bytes(data)
+    if args.output:
+        with WriteBatch() as batch:
+            batch.stage(args.output, content)
+    else:
+        sys.stdout.write(content.decode("utf-8"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
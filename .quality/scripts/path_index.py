@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+path_index.py — パス存在確認・glob 用のファイルシステムスナップショット.
+
+d7_related_code_path_validity, NavGraphValidator V6, nav-graph-code-sync S2,
+check_scan_status (source_docs / doc_path) のように大量のパスを1件ずつ
+Path.exists() で確認すると、NFS 上のチェックアウトでは stat ごとに往復が発生する。
+PathIndex は対象ルート (src/, docs/, lib/) を os.scandir で1回だけ走査し、
+以降の存在確認・glob をメモリ上で応答する。
+
+- ルートは最初の問い合わせ時に走査 (走査しないルートのコストはゼロ)
+- ルート外・除外ディレクトリ (node_modules 等)・シンボリックリンク先は
+  親ディレクトリ単位で遅延 scandir (結果はキャッシュ)
+- 存在判定は Path.exists() と同一 (シンボリックリンクは追跡, リンク切れは False)
+- ".." を含むパスは字句的に畳まず Path で判定 (相対パスは project_root 基準)
+- glob は除外ディレクトリ・シンボリックリンク先ディレクトリの配下を返さない
+- スナップショットは自動更新しない: 常駐プロセス等は invalidate() を呼ぶこと
+
+Usage:
+    from path_index import get_index, invalidate
+
+    index = get_index(PROJECT_ROOT)
+    index.exists("src/features/battle/index.ts")     # ルート相対 or 絶対パス
+    index.glob("lib/features/*/presentation/pages/**/*.dart")
+    invalidate()                                      # 全スナップショット破棄
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+DEFAULT_ROOTS = ("src", "docs", "lib")
+# 一括走査から除外 (問い合わせがあれば遅延 scandir で応答)
+EXCLUDED_DIRS = {"node_modules", ".git", ".next", "__pycache__"}
+
+PathLike = Union[str, os.PathLike]
+
+
+class PathIndex:
+    """project_root 配下のディレクトリ一覧スナップショット。
+
+    _dirs: ルート相対ディレクトリ ("" = project_root) → {名前: ディレクトリか}
+           (None = ディレクトリが存在しない)
+    """
+
+    def __init__(self, project_root: PathLike, roots=DEFAULT_ROOTS):
+        self.project_root = Path(project_root).resolve()
+        self.roots = tuple(roots)
+        self._dirs: dict[str, Optional[dict[str, bool]]] = {}
+        self._walked: set[str] = set()  # 配下を一括走査済みのディレクトリ
+        self._lock = threading.RLock()
+        self.scandirs = 0  # 統計: 実行した scandir 回数
+
+    # ── 問い合わせ ──
+
+    def exists(self, path: PathLike) -> bool:
+        return self._lookup(path) is not None
+
+    def is_file(self, path: PathLike) -> bool:
+        return self._lookup(path) is False
+
+    def is_dir(self, path: PathLike) -> bool:
+        return self._lookup(path) is True
+
+    def glob(self, pattern: str) -> list[str]:
+        """ルート相対の glob (glob.glob(recursive=True) と同一の規則)。ソート済みの相対パスを返す。
+
+        ただし EXCLUDED_DIRS とシンボリックリンク先のディレクトリ配下には降りない。
+        """
+        pattern = pattern.strip("/")
+        parts = pattern.split("/")
+        # ワイルドカードを含まない先頭部分を走査起点にする
+        literal = []
+        for part in parts:
+            if any(c in part for c in "*?["):
+                break
+            literal.append(part)
+        base = "/".join(literal)
+        if len(literal) == len(parts):
+            return [base] if self.exists(base) else []
+        regex = _compile_glob(parts)
+        with self._lock:
+            self._ensure_walked(base)
+            candidates = [d + "/" + name if d else name
+                          for d, listing in self._dirs.items()
+                          if listing and _within(d, base)
+                          for name in listing]
+        if base and self.is_dir(base):
+            candidates.append(base)
+        return sorted(c for c in candidates if regex.match(c))
+
+    # ── 無効化 ──
+
+    def invalidate(self, path: Optional[PathLike] = None) -> None:
+        """スナップショット破棄。path 指定時はそのパス (配下含む) と親ディレクトリの一覧のみ。"""
+        with self._lock:
+            if path is None:
+                self._dirs.clear()
+                self._walked.clear()
+                return
+            rel = self._relative(path)
+            if rel is None:
+                return
+            parent = rel.rpartition("/")[0]
+            for d in [d for d in self._dirs if d == parent or _within(d, rel)]:
+                del self._dirs[d]
+            # 一覧を捨てたディレクトリを含む走査済み範囲は再走査対象
+            self._walked = {w for w in self._walked if not (_within(parent, w) or _within(w, rel))}
+
+    # ── 内部 ──
+
+    def _relative(self, path: PathLike) -> Optional[str]:
+        """ルート相対の正規化済み POSIX パス (project_root 外なら None)。"""
+        p = os.fspath(path)
+        if os.path.isabs(p):
+            try:
+                p = os.path.relpath(p, self.project_root)
+            except ValueError:
+                return None
+        p = os.path.normpath(p).replace(os.sep, "/")
+        if p == ".":
+            return ""
+        if p == ".." or p.startswith("../"):
+            return None
+        return p
+
+    def _lookup(self, path: PathLike) -> Optional[bool]:
+        """True = ディレクトリ, False = ファイル等, None = 存在しない。"""
+        # "a/b/../c" は b の実在とシンボリックリンク先に依存するため normpath では解決できない
+        rel = None if ".." in Path(path).parts else self._relative(path)
+        if rel is None:
+            p = self.project_root / path
+            return p.is_dir() if p.exists() else None
+        if rel == "":
+            return True
+        parent, _, name = rel.rpartition("/")
+        with self._lock:
+            top = rel.split("/", 1)[0]
+            if top in self.roots:
+                self._ensure_walked(top)
+            listing = self._listing(parent)
+        return None if listing is None else listing.get(name)
+
+    def _listing(self, rel_dir: str) -> Optional[dict[str, bool]]:
+        if rel_dir in self._dirs:
+            return self._dirs[rel_dir]
+        if rel_dir:
+            # 既知の祖先の一覧から存在しないと分かれば scandir 不要
+            parent, _, name = rel_dir.rpartition("/")
+            ancestor = parent
+            while ancestor and ancestor not in self._dirs:
+                ancestor = ancestor.rpartition("/")[0]
+            if ancestor in self._dirs:
+                parent_listing = self._listing(parent)
+                if parent_listing is None or parent_listing.get(name) is not True:
+                    self._dirs[rel_dir] = None
+                    return None
+        self._scan(rel_dir)
+        return self._dirs[rel_dir]
+
+    def _scan(self, rel_dir: str) -> list[str]:
+        """rel_dir を1回 scandir して一覧を記録。Returns 一括走査で降りるべきサブディレクトリ。"""
+        listing: dict[str, bool] = {}
+        descend = []
+        self.scandirs += 1
+        try:
+            with os.scandir(self.project_root / rel_dir) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                        if not is_dir and not entry.is_file() and entry.is_symlink():
+                            if not os.path.exists(entry.path):
+                                continue  # リンク切れ (Path.exists() は False)
+                    except OSError:
+                        continue
+                    listing[entry.name] = is_dir
+                    if is_dir and entry.name not in EXCLUDED_DIRS and not entry.is_symlink():
+                        descend.append(entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            self._dirs[rel_dir] = None
+            return []
+        self._dirs[rel_dir] = listing
+        return [f"{rel_dir}/{name}" if rel_dir else name for name in descend]
+
+    def _ensure_walked(self, rel_dir: str) -> None:
+        """rel_dir 配下を1回の走査でスナップショット (走査済みなら何もしない)。"""
+        if any(_within(rel_dir, w) for w in self._walked):
+            return
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            if current in self._dirs and any(_within(current, w) for w in self._walked):
+                continue
+            stack.extend(self._scan(current))
+        self._walked.add(rel_dir)
+
+
+def _within(path: str, base: str) -> bool:
+    """path が base 自身またはその配下か (ルート相対)。"""
+    return base == "" or path == base or path.startswith(base + "/")
+
+
+def _compile_glob(parts: list[str]) -> re.Pattern:
+    """glob.glob(recursive=True) 互換: * は / を越えず、隠しファイルには一致しない。"""
+    out = ""
+    for i, part in enumerate(parts):
+        last = i == len(parts) - 1
+        if part == "**":
+            if last:
+                # 末尾の ** はディレクトリ自身にも一致 (glob.glob の "dir/**" → "dir/")
+                out = out[:-1] + r"(?:/[^/.][^/]*)*" if out else r"(?:[^/.][^/]*(?:/[^/.][^/]*)*)?"
+            else:
+                out += r"(?:[^/.][^/]*/)*"
+            continue
+        segment = "" if part.startswith(".") else r"(?![.])"
+        j = 0
+        while j < len(part):
+            c = part[j]
+            if c == "*":
+                segment += "[^/]*"
+            elif c == "?":
+                segment += "[^/]"
+            elif c == "[":
+                end = part.find("]", j + 2)
+                if end == -1:
+                    segment += re.escape(c)
+                else:
+                    body = part[j + 1:end]
+                    if body.startswith("!"):
+                        body = "^" + body[1:]
+                    segment += f"[{body}]"
+                    j = end
+            else:
+                segment += re.escape(c)
+            j += 1
+        out += segment + ("" if last else "/")
+    return re.compile(out.rstrip("/") + r"\Z")
+
+
+# ── 共有インスタンス ─────────────────────────────────────────────────────
+
+_INDEXES: dict[Path, PathIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(project_root: PathLike) -> PathIndex:
+    """project_root ごとのプロセス共有 PathIndex。"""
+    root = Path(project_root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(root)
+        if index is None:
+            index = _INDEXES[root] = PathIndex(root)
+        return index
+
+
+def invalidate(path: Optional[PathLike] = None) -> None:
+    """全共有インスタンスのスナップショットを破棄 (path 指定時はそのパス周辺のみ)。"""
+    with _INDEXES_LOCK:
+        indexes = list(_INDEXES.values())
+    for index in indexes:
+        if path is None or index._relative(path) is not None:
+            index.invalidate(path)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Priority Index — RICE順位インデックス (Top-K / Tier / Phase クエリ)
+
+rice_calculator.py の実行ごとに、各Featureの adjusted_score / tier / phase /
+last_updated を1ファイルのランク済みインデックスとして保持する。
+クエリはこのファイルのみを読み、Featureディレクトリには一切触れない。
+
+インデックスは常に CONTEXT.json 上の状態 (ディスク上のスコア) を表す:
+- --apply で再計算された Feature は新スコア
+- dry-run / unchanged の Feature は既存スコア
+- 非アクティブ (Archived/Failed) 等で skipped の Feature は除外
+- 全体実行時は存在しなくなった Feature を削除、--feature 実行時は差分のみ更新
+
+Usage:
+    python3 priority_index.py                  # Top 10
+    python3 priority_index.py --top 20         # Top 20
+    python3 priority_index.py --tier T1        # T1 のみ
+    python3 priority_index.py --phase mvp      # Phase 別
+    python3 priority_index.py --json           # JSON形式出力
+    python3 priority_index.py --rebuild        # CONTEXT.json から再構築 (再計算なし)
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+from atomic_write import write_bytes_atomic  # noqa: E402
+from context_corpus import load_feature  # noqa: E402
+from rice_calculator import (  # noqa: E402
+    FEATURES_DIR,
+    PROJECT_ROOT,
+    TIER_THRESHOLDS,
+    discover_feature_dirs,
+    score_tier,
+)
+
+# ── Constants ─────────────────────────────────────────────────────────────
+
+PRIORITY_INDEX_PATH = PROJECT_ROOT / ".quality" / "cache" / "priority-index.json"
+INDEX_FORMAT_VERSION = 1
+
+TIERS = tuple(t for t, _ in TIER_THRESHOLDS) + ("T4",)
+
+# skipped 判定されたFeatureはインデックスから除外 (CONTEXT.jsonなし / 非アクティブ)
+_REMOVE_STATUSES = {"skipped"}
+
+
+# ── Index ─────────────────────────────────────────────────────────────────
+
+def _rank_key(entry: dict) -> tuple:
+    return (-entry["adjusted_score"], entry["id"])
+
+
+def _entry(feature_id: str, score: float, phase: Optional[str],
+           last_updated: Optional[str]) -> dict:
+    return {
+        "id": feature_id,
+        "adjusted_score": score,
+        "tier": score_tier(score),
+        "phase": phase,
+        "last_updated": last_updated,
+    }
+
+
+class PriorityIndex:
+    """スコア降順 (同点はID昇順) に整列済みのエントリ列。"""
+
+    def __init__(self, entries: Optional[list[dict]] = None,
+                 updated_at: Optional[str] = None):
+        self.entries = sorted(entries or [], key=_rank_key)
+        self.updated_at = updated_at
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: Optional[Path] = None) -> "PriorityIndex":
+        """インデックス読み込み。存在しない/形式不一致なら空。"""
+        path = path or PRIORITY_INDEX_PATH
+        try:
+            payload = json_codec.loads(path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            return cls()
+        if not isinstance(payload, dict) or payload.get("format_version") != INDEX_FORMAT_VERSION:
+            return cls()
+        # 保存時に整列済みのため再ソート不要
+        index = cls(updated_at=payload.get("updated_at"))
+        index.entries = payload.get("entries", [])
+        return index
+
+    def save(self, path: Optional[Path] = None) -> bool:
+        """アトミック保存 (内容不変なら書き込まない)。書き込んだら True。"""
+        path = path or PRIORITY_INDEX_PATH
+        payload = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "updated_at": self.updated_at,
+            "entries": self.entries,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        content = json_codec.dump_bytes(payload, pretty=False)
+        return write_bytes_atomic(path, content, durable=False)
+
+    def apply_results(self, results: list[dict], applied: bool, full: bool) -> None:
+        """rice_calculator の結果をマージ。
+
+        Args:
+            results: process_feature() 結果リスト
+            applied: --apply 実行か (False なら CONTEXT.json 上の旧スコアを採用)
+            full: 全Feature実行か (True なら結果に含まれないエントリを削除)
+        """
+        previous = {e["id"]: e for e in self.entries}
+        by_id = {} if full else dict(previous)
+        for r in results:
+            status = r.get("status")
+            if status in _REMOVE_STATUSES:
+                by_id.pop(r["id"], None)
+                continue
+            if status == "error":
+                # 読み込み失敗: 直前の既知の状態を維持
+                if r["id"] in previous:
+                    by_id[r["id"]] = previous[r["id"]]
+                continue
+            score = r["new_score"] if status == "updated" and applied else r["old_score"]
+            by_id[r["id"]] = _entry(r["id"], score, r.get("phase"), r.get("last_updated"))
+        entries = sorted(by_id.values(), key=_rank_key)
+        # エントリ不変なら updated_at も据え置き (save() の書き込みをスキップ)
+        if entries != self.entries or self.updated_at is None:
+            self.entries = entries
+            self.updated_at = datetime.now(timezone.utc).isoformat()
+
+    # ── Queries ──
+
+    def top(self, k: int) -> list[dict]:
+        """上位K件。"""
+        return self.entries[:max(k, 0)]
+
+    def query(self, tier: Optional[str] = None, phase: Optional[str] = None,
+              limit: Optional[int] = None) -> list[dict]:
+        """Tier/Phase で絞り込み (順位順)。"""
+        out = []
+        for e in self.entries:
+            if tier is not None and e["tier"] != tier:
+                continue
+            if phase is not None and e["phase"] != phase:
+                continue
+            out.append(e)
+            if limit is not None and len(out) >= limit:
+                break
+        return out
+
+
+def update_priority_index(results: list[dict], applied: bool, full: bool,
+                          path: Optional[Path] = None) -> PriorityIndex:
+    """rice_calculator 実行結果でインデックスを増分更新して保存。"""
+    index = PriorityIndex.load(path)
+    index.apply_results(results, applied, full)
+    index.save(path)
+    return index
+
+
+def rebuild_priority_index(path: Optional[Path] = None) -> PriorityIndex:
+    """全 CONTEXT.json の priority セクションから再構築 (スコア再計算なし)。"""
+    from feature_lifecycle import is_active
+
+    entries = []
+    for feature_dir in discover_feature_dirs():
+        record = load_feature(feature_dir)
+        data = record.context
+        if data is None or not is_active(data):
+            continue
+        priority = data.get("priority", {})
+        calculated = priority.get("calculated", {})
+        score = calculated.get("adjusted_score", calculated.get("rice_score", 0))
+        entries.append(_entry(record.id, score, priority.get("phase", "mvp"),
+                              priority.get("last_updated")))
+    index = PriorityIndex(entries, datetime.now(timezone.utc).isoformat())
+    index.save(path)
+    return index
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description="RICE順位インデックスのクエリ")
+    parser.add_argument("--top", type=int, default=10, help="表示件数 (デフォルト: 10)")
+    parser.add_argument("--tier", choices=TIERS, help="Tierで絞り込み")
+    parser.add_argument("--phase", choices=["exploration", "mvp", "growth", "stability"],
+                        help="Phaseで絞り込み")
+    parser.add_argument("--json", action="store_true", help="JSON形式出力")
+    parser.add_argument("--rebuild", action="store_true",
+                        help="CONTEXT.jsonからインデックスを再構築")
+    args = parser.parse_args()
+
+    if args.rebuild:
+        if not FEATURES_DIR.exists():
+            print(f"ERROR: {FEATURES_DIR} パスが見つかりません", file=sys.stderr)
+            sys.exit(1)
+        index = rebuild_priority_index()
+    else:
+        index = PriorityIndex.load()
+        if not index.entries and not PRIORITY_INDEX_PATH.exists():
+            print("ERROR: インデックスなし (rice_calculator.py 実行 or --rebuild)", file=sys.stderr)
+            sys.exit(1)
+
+    entries = index.query(args.tier, args.phase, limit=args.top)
+
+    if args.json:
+        print(json_codec.dumps({"updated_at": index.updated_at, "total": len(index),
+                                "entries": entries}))
+        return
+
+    filters = [f for f in (args.tier, args.phase) if f]
+    print(f"── Priority Index {'(' + ', '.join(filters) + ') ' if filters else ''}"
+          f"— {len(entries)}/{len(index)} (updated: {index.updated_at or '-'}) ──")
+    for i, e in enumerate(entries, 1):
+        print(f"  #{i:2d} [{e['tier']}] {e['id']:45s} {e['adjusted_score']:6.2f}  {e['phase'] or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+Quality Runner — ドキュメント系品質チェックの単一プロセス統合ランナー
+
+Makefile の各ターゲットが個別に python3 を起動して jsonschema の import と
+docs の読み込みを繰り返す代わりに、1プロセスで以下を実行する:
+
+  ui-flow                validate_ui_flow.py V1–V12
+  docs-consistency       validate_docs_consistency.py D1–D9
+  nav-graph              nav-graph-validator.py V1–V10
+  feature-doctor         feature_doctor.py (診断のみ, --fix なし)
+  cross-feature-imports  check_cross_feature_imports.py
+
+- 各チェックは独立しているためスレッドプールで並行実行
+- CONTEXT.json / 分析JSON は context_corpus の共有キャッシュで1回だけパース
+- 終了コードは個別スクリプトと同一の意味: MVS/BLOCKING/エラー=1, Tier/警告=2, 正常=0
+  (複数チェックの合成は 1 > 2 > 0 の優先順)
+- チェック自体の例外は exit 1 として報告 (fail-closed)
+- 入力ファイルの純関数であるチェック (ui-flow V1–V12, nav-graph, D5) は check_cache で
+  入力不変なら前回の結果を返す (レポートに "cache" と明示, --no-cache で無効化)
+
+Usage:
+    python3 .quality/scripts/quality_runner.py                      # 全チェック
+    python3 .quality/scripts/quality_runner.py --checks ui-flow,docs-consistency
+    python3 .quality/scripts/quality_runner.py --json               # 統合JSONレポート
+    python3 .quality/scripts/quality_runner.py --jobs 1             # 逐次実行
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+QUALITY_SCRIPTS_DIR = Path(__file__).resolve().parent
+UI_FLOW_PATH = PROJECT_ROOT / "docs" / "ui-flow" / "ui-flow.json"
+NAV_GRAPH_PATH = PROJECT_ROOT / "docs" / "navigation" / "nav-graph.json"
+
+sys.path.insert(0, str(QUALITY_SCRIPTS_DIR))
+sys.path.insert(0, str(SCRIPTS_DIR))
+from check_cache import CheckCache  # noqa: E402
+from context_corpus import load_json  # noqa: E402
+import json_codec  # noqa: E402
+
+# NavGraphValidator の BLOCKING/WARNING を他チェックの深刻度体系に対応付け
+_NAV_SEVERITY = {"BLOCKING": "MVS", "WARNING": "Tier"}
+
+
+@dataclass
+class CheckOutcome:
+    """チェック1件の結果 (items は失敗/警告項目のみ)"""
+    name: str
+    exit_code: int
+    summary: str
+    items: list = field(default_factory=list)
+    duration_ms: float = 0.0
+    error: Optional[str] = None
+    cached: list = field(default_factory=list)  # 結果キャッシュから返した項目ID
+
+
+def _item(item_id: str, name: str, severity: str, details: list) -> dict:
+    return {"id": item_id, "name": name, "severity": severity, "details": details}
+
+
+def merged_exit_code(codes) -> int:
+    """1 (コミット不可) > 2 (警告) > 0 の優先順で合成。"""
+    codes = set(codes)
+    if 1 in codes:
+        return 1
+    if 2 in codes:
+        return 2
+    return 0
+
+
+# ── Checks ────────────────────────────────────────────────────────────────
+
+def _report_outcome(name: str, report) -> CheckOutcome:
+    """validate_ui_flow / validate_docs_consistency の ValidationReport を変換。"""
+    items = [_item(r.id, r.name, r.severity, list(r.details))
+             for r in report.results if not r.passed]
+    passed = sum(1 for r in report.results if r.passed)
+    return CheckOutcome(name, report.exit_code,
+                        f"{passed}/{len(report.results)} passed "
+                        f"(MVS {report.mvs_failures}, Tier {report.tier_failures}, "
+                        f"Warning {report.warnings})", items,
+                        cached=[r.id for r in report.results if r.cached])
+
+
+def check_ui_flow(ui_flow_path: Path = UI_FLOW_PATH, cache: Optional[CheckCache] = None) -> CheckOutcome:
+    try:
+        import validate_ui_flow
+    except SystemExit:
+        # jsonschema 未インストール時はモジュールが exit(1) する
+        return CheckOutcome("ui-flow", 1, "jsonschema パッケージが必要です: pip install jsonschema")
+    data = _try_load(ui_flow_path)
+    if data is None:
+        return CheckOutcome("ui-flow", 1, f"ファイルの読み込みに失敗しました: {ui_flow_path}")
+    schema = _try_load(validate_ui_flow.SCHEMA_PATH)
+    if schema is None:
+        return CheckOutcome("ui-flow", 1, f"スキーマの読み込みに失敗しました: {validate_ui_flow.SCHEMA_PATH}")
+    return _report_outcome("ui-flow", validate_ui_flow.run_all_checks(data, schema, cache, ui_flow_path))
+
+
+def check_docs_consistency(cache: Optional[CheckCache] = None) -> CheckOutcome:
+    import validate_docs_consistency
+
+    registry = validate_docs_consistency.load_json(validate_docs_consistency.REGISTRY_PATH)
+    if registry is None:
+        return CheckOutcome("docs-consistency", 1,
+                            f"feature-registry.json の読み込みに失敗しました: "
+                            f"{validate_docs_consistency.REGISTRY_PATH}")
+    return _report_outcome("docs-consistency",
+                           validate_docs_consistency.run_all_checks(registry, cache=cache))
+
+
+def _load_nav_graph_validator():
+    # ファイル名がハイフン区切りのため importlib で読み込む
+    module = sys.modules.get("nav_graph_validator")
+    if module is None:
+        spec = importlib.util.spec_from_file_location(
+            "nav_graph_validator", QUALITY_SCRIPTS_DIR / "nav-graph-validator.py")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["nav_graph_validator"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+def check_nav_graph(nav_graph_path: Path = NAV_GRAPH_PATH, cache: Optional[CheckCache] = None) -> CheckOutcome:
+    module = _load_nav_graph_validator()
+    result = module.NavGraphValidator(nav_graph_path, PROJECT_ROOT, cache=cache).validate()
+    by_rule: dict[tuple[str, str], list[str]] = {}
+    for issue in result.issues:
+        by_rule.setdefault((issue.rule, issue.severity), []).append(issue.message)
+    items = [_item(rule, "NAV-GRAPH", _NAV_SEVERITY.get(sev, "Warning"), messages)
+             for (rule, sev), messages in sorted(by_rule.items())]
+    code = 1 if result.has_blocking else (2 if result.has_warning else 0)
+    stats = result.stats
+    return CheckOutcome("nav-graph", code,
+                        f"{stats.screen_count} screens, {stats.trigger_count} triggers, "
+                        f"{stats.flow_count} flows (BLOCKING {len(result.blocking_issues)}, "
+                        f"WARNING {len(result.warning_issues)})", items, cached=list(result.cached_rules))
+
+
+def check_feature_doctor(sync: bool = False) -> CheckOutcome:
+    import feature_doctor
+
+    try:
+        summary, sync_note = feature_doctor.run_doctor(fix=False, feature_filter=None, sync=sync)
+    except FileNotFoundError as e:
+        return CheckOutcome("feature-doctor", 1, str(e))
+    items = []
+    for entry in summary["items"]:
+        if entry["errors"]:
+            items.append(_item(entry["feature"], entry["status"], "MVS", entry["errors"]))
+        if entry["warnings"]:
+            items.append(_item(entry["feature"], entry["status"], "Tier", entry["warnings"]))
+    if sync_note:
+        items.append(_item("verify_feature_status", "sync", "Warning", [sync_note]))
+    return CheckOutcome("feature-doctor", feature_doctor.doctor_exit_code(summary),
+                        f"検査 {summary['checked']} | 警告 {summary['warnings']} | "
+                        f"エラー {summary['errors']}", items)
+
+
+def check_cross_feature_imports() -> CheckOutcome:
+    import check_cross_feature_imports
+
+    violations = check_cross_feature_imports.collect_violations()
+    if violations is None:
+        return CheckOutcome("cross-feature-imports", 1, "src/features/ ディレクトリが見つかりません")
+    items = [_item("IMPORT", "Cross-Feature 内部 import", "MVS", [v.strip() for v in violations])] \
+        if violations else []
+    return CheckOutcome("cross-feature-imports", 1 if violations else 0,
+                        f"違反 {len(violations)}件", items)
+
+
+def _try_load(path: Path):
+    try:
+        return load_json(path)
+    except (OSError, ValueError):
+        return None
+
+
+CHECKS: dict[str, Callable[[], CheckOutcome]] = {
+    "ui-flow": check_ui_flow,
+    "docs-consistency": check_docs_consistency,
+    "nav-graph": check_nav_graph,
+    "feature-doctor": check_feature_doctor,
+    "cross-feature-imports": check_cross_feature_imports,
+}
+
+
+# 変更パス → 影響するチェック (エディタ保存フック等でのチェック絞り込み用)
+_PATH_CHECKS = (
+    ("docs/ui-flow/", ("ui-flow",)),
+    ("docs/navigation/", ("nav-graph",)),
+    ("docs/features/", ("docs-consistency", "feature-doctor")),
+    ("docs/_templates/", ("feature-doctor",)),
+    ("src/features/", ("cross-feature-imports", "docs-consistency", "ui-flow")),
+    ("src/", ("nav-graph",)),
+    ("src/app/page.tsx", ("ui-flow",)),
+)
+
+
+def checks_for_paths(paths) -> list[str]:
+    """変更パス (プロジェクトルート相対 or 絶対) に影響するチェック名 (CHECKS の順序)。"""
+    selected: set[str] = set()
+    for path in paths:
+        path = Path(path)
+        if path.is_absolute():
+            try:
+                path = path.relative_to(PROJECT_ROOT)
+            except ValueError:
+                continue
+        rel = path.as_posix()
+        for prefix, names in _PATH_CHECKS:
+            if rel == prefix.rstrip("/") or rel.startswith(prefix):
+                selected.update(names)
+    return [n for n in CHECKS if n in selected]
+
+
+def build_checks(names, ui_flow_path: Path = UI_FLOW_PATH, nav_graph_path: Path = NAV_GRAPH_PATH,
+                 doctor_sync: bool = False,
+                 cache: Optional[CheckCache] = None) -> dict[str, Callable[[], CheckOutcome]]:
+    """チェック名 → 実行関数 (パス/オプション/結果キャッシュ適用済み)。不明な名前は ValueError。"""
+    unknown = [n for n in names if n not in CHECKS]
+    if unknown:
+        raise ValueError(f"不明なチェック: {', '.join(unknown)} (有効: {', '.join(CHECKS)})")
+    overrides = {
+        "ui-flow": lambda: check_ui_flow(ui_flow_path, cache),
+        "docs-consistency": lambda: check_docs_consistency(cache),
+        "nav-graph": lambda: check_nav_graph(nav_graph_path, cache),
+        "feature-doctor": lambda: check_feature_doctor(sync=doctor_sync),
+    }
+    return {n: overrides.get(n, CHECKS[n]) for n in names}
+
+
+# ── Runner ────────────────────────────────────────────────────────────────
+
+def _run_one(name: str, fn: Callable[[], CheckOutcome]) -> CheckOutcome:
+    start = time.perf_counter()
+    try:
+        outcome = fn()
+    except Exception as e:  # noqa: BLE001 — チェック内の想定外エラーは失敗として報告
+        outcome = CheckOutcome(name, 1, "チェック実行中に例外", error=f"{type(e).__name__}: {e}")
+    outcome.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+    return outcome
+
+
+def run_checks(checks: dict[str, Callable[[], CheckOutcome]],
+               jobs: int = 0) -> list[CheckOutcome]:
+    """チェックを並行実行 (jobs <= 0 はチェック数)。結果は checks の順序。
+
+    feature-doctor は相対パスを使うため、カレントディレクトリはプロジェクトルートであること。
+    """
+    workers = len(checks) if jobs <= 0 else min(jobs, len(checks))
+    if workers <= 1:
+        return [_run_one(name, fn) for name, fn in checks.items()]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_run_one, name, fn) for name, fn in checks.items()]
+        return [f.result() for f in futures]
+
+
+# ── Report ────────────────────────────────────────────────────────────────
+
+_STATUS = {0: "✅ PASS", 1: "❌ FAIL", 2: "⚠️  WARN"}
+
+
+def format_text(outcomes: list[CheckOutcome], wall_ms: float) -> str:
+    lines = ["", "=" * 60, "Quality Runner — 統合レポート", "=" * 60]
+    for o in outcomes:
+        cache_note = f" [cache: {', '.join(o.cached)}]" if o.cached else ""
+        lines.append(f"  {o.name:<24s} {_STATUS[o.exit_code]}  {o.summary}  ({o.duration_ms:.0f}ms){cache_note}")
+    details = [o for o in outcomes if o.items or o.error]
+    if details:
+        lines.append("")
+        lines.append("  Details:")
+        for o in details:
+            if o.error:
+                lines.append(f"    ❌ [{o.name}] {o.error}")
+            for item in o.items:
+                icon = "❌" if item["severity"] in ("MVS", "Tier") else "⚠️"
+                for detail in item["details"]:
+                    lines.append(f"    {icon} [{o.name}/{item['id']}] {detail}")
+    code = merged_exit_code(o.exit_code for o in outcomes)
+    lines.append("")
+    lines.append(f"  Total: {len(outcomes)} checks, {wall_ms:.0f}ms (wall)")
+    if code == 0:
+        lines.append("\n  ✅ Quality Runner PASSED")
+    elif code == 1:
+        lines.append("\n  ❌ MVS/BLOCKING 項目の修正が必要です（コミット不可）")
+    else:
+        lines.append("\n  ⚠️  Tier/WARNING 項目の修正を推奨します")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def report_dict(outcomes: list[CheckOutcome], wall_ms: float) -> dict:
+    return {
+        "exit_code": merged_exit_code(o.exit_code for o in outcomes),
+        "wall_ms": round(wall_ms, 1),
+        "checks": [asdict(o) for o in outcomes],
+    }
+
+
+def format_json(outcomes: list[CheckOutcome], wall_ms: float) -> str:
+    return json_codec.dumps(report_dict(outcomes, wall_ms))
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="ドキュメント系品質チェックを1プロセスで並行実行します",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="チェック: " + ", ".join(CHECKS),
+    )
+    parser.add_argument("--checks", default=",".join(CHECKS),
+                        help="実行するチェック (カンマ区切り, デフォルト: 全て)")
+    parser.add_argument("--jobs", type=int, default=0,
+                        help="並行数 (0 = チェック数, 1 = 逐次)")
+    parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+    parser.add_argument("--ui-flow", type=Path, default=UI_FLOW_PATH, help="ui-flow.json パス")
+    parser.add_argument("--nav-graph", type=Path, default=NAV_GRAPH_PATH, help="nav-graph.json パス")
+    parser.add_argument("--doctor-sync", action="store_true",
+                        help="feature-doctor で verify_feature_status も実行")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="結果キャッシュを使わず全チェックを実行")
+    args = parser.parse_args()
+
+    names = [n.strip() for n in args.checks.split(",") if n.strip()]
+    # validate_ui_flow.py と同様、相対パスはプロジェクトルート基準
+    ui_flow_path = args.ui_flow if args.ui_flow.is_absolute() else PROJECT_ROOT / args.ui_flow
+    cache = None if args.no_cache else CheckCache()
+    try:
+        selected = build_checks(names, ui_flow_path, args.nav_graph.resolve(), args.doctor_sync, cache)
+    except ValueError as e:
+        parser.error(str(e))
+
+    # feature_doctor は docs/ 相対パスで動作する
+    os.chdir(PROJECT_ROOT)
+    start = time.perf_counter()
+    outcomes = run_checks(selected, args.jobs)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: 結果キャッシュ保存失敗: {e}", file=sys.stderr)
+
+    print(format_json(outcomes, wall_ms) if args.json else format_text(outcomes, wall_ms))
+    sys.exit(merged_exit_code(o.exit_code for o in outcomes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,745 @@
+#!/usr/bin/env python3
+"""
+RICE Batch Engine — ポートフォリオ一括スコアリング & ウェイト感度分析
+
+rice_calculator.py のスカラー計算 (calc_reach / calc_impact / calc_confidence /
+calc_effort / calc_rice_score / calc_competitive_adjustment / compose_final_score)
+と同一の式を、Feature横断の列指向 NumPy 行列に対して1回のベクトル演算で評価する。
+BRIEF/SPEC/CONTEXT/registry/gaps からのシグナル抽出はFeatureごとに1回のみ。
+
+ウェイトベクトル (REACH_WEIGHTS 3要素 + CONFIDENCE_WEIGHTS 4要素) を数千パターン
+一括評価し、順位がどれだけ変動するかを集計する (what-if 分析)。
+
+Monte Carlo モードでは R/I/C/E の点推定をシグナル別の分布からサンプリングし、
+adjusted_score の p10/p50/p90 と順位安定性を Feature ごとに集計する
+(ヒューリスティック由来のスコアノイズでロードマップを組み替えないため)。
+
+Usage:
+    python3 rice_batch.py                              # 現行ウェイトで一括スコアリング
+    python3 rice_batch.py --sweep 5000                 # ランダムウェイト5000パターンで順位変動分析
+    python3 rice_batch.py --sweep 5000 --concentration 30 --seed 1
+    python3 rice_batch.py --weights weights.json       # 指定ウェイトベクトル群で分析
+    python3 rice_batch.py --sweep 5000 --json          # JSON形式出力
+    python3 rice_batch.py --monte-carlo 10000          # スコア信頼区間 (p10/p50/p90) + 順位安定性
+    python3 rice_batch.py --monte-carlo 10000 --mc-spread 1.5 --seed 1
+
+weights.json 形式: [{"reach_user_scope": 0.5, "confidence_spec_quality": 0.3, ...}, ...]
+(未指定キーは現行ウェイト)
+
+要件: numpy
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+# numpyはオプション依存 (rice_calculator.py 本体は不要)
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+sys.path.insert(0, str(Path(__file__).parent))
+from context_corpus import load_json  # noqa: E402
+import json_codec  # noqa: E402
+from rice_calculator import (  # noqa: E402
+    COMPETITIVE_ADJUSTMENT_BOUNDS,
+    CONFIDENCE_WEIGHTS,
+    FEATURES_DIR,
+    IMPACT_LEVELS,
+    PARSE_CACHE_PATH,
+    REACH_WEIGHTS,
+    BriefData,
+    ContextData,
+    GapData,
+    ParseCache,
+    RegistryData,
+    SpecData,
+    _normalize_manual_override,
+    core_goal_impact_level,
+    core_goal_user_scope,
+    discover_feature_dirs,
+    find_spec_path,
+)
+
+# ── Constants ─────────────────────────────────────────────────────────────
+
+# シグナル行列の列 (Featureごとに1回だけ抽出)
+SIGNAL_COLUMNS = (
+    "user_scope",          # Core goal ターゲット範囲 (9/7/3/5)
+    "has_ltv",             # LTVキーワード (0/1)
+    "has_retention",       # リテンションキーワード (0/1)
+    "has_biz_metrics",     # ビジネスメトリクス有無 (0/1)
+    "progress",            # CONTEXT.json progress_pct
+    "impact_goal",         # Core goal Impact基本レベル (2.0/1.0)
+    "gap_severity",        # 0=N/A, 1=LOW, 2=MEDIUM, 3=HIGH
+    "brief_exists",        # BRIEF.md 有無 (0/1)
+    "section_count",       # BRIEF.md 実質セクション数
+    "spec_exists",         # SPEC.md 有無 (0/1)
+    "spec_fr_count",       # SPEC.md FR数
+    "target_files",        # SPEC.md 対象ファイル数
+    "research_count",      # research_ids 数
+    "context_fr_total",    # CONTEXT.json fr_total
+    "constraint_count",    # BRIEF.md §6 制約数 (hard + soft)
+    "assessments",         # 競合assessment総数
+    "is_standard",         # 業界標準 (0/1)
+    "opportunity",         # opportunity_score (NaN = マッピングなし)
+    "manual_override",     # 正規化済み manual_override (0.8-1.2)
+)
+_COL = {name: i for i, name in enumerate(SIGNAL_COLUMNS)}
+
+GAP_SEVERITY_CODES = {"LOW": 1, "MEDIUM": 2, "HIGH": 3}
+
+# ウェイトベクトルの列 (REACH_WEIGHTS → CONFIDENCE_WEIGHTS の順)
+WEIGHT_COLUMNS = tuple(f"reach_{k}" for k in REACH_WEIGHTS) + \
+    tuple(f"confidence_{k}" for k in CONFIDENCE_WEIGHTS)
+_REACH_SLICE = slice(0, len(REACH_WEIGHTS))
+_CONFIDENCE_SLICE = slice(len(REACH_WEIGHTS), len(WEIGHT_COLUMNS))
+
+# スイープ/Monte Carlo 時の1チャンクあたり最大要素数 (ウェイト数 or サンプル数 × Feature数)
+SWEEP_CHUNK_ELEMENTS = 2_000_000
+
+# Monte Carlo 入力分布 (各点推定まわりのばらつき)
+MC_UNCERTAINTY = {
+    "reach_spread": 0.20,              # Reach: 三角分布 [R×(1-s), R, R×(1+s)]
+    "impact_step_prob": 0.20,          # Impact: 隣接レベルへ上下それぞれこの確率で移動
+    "confidence_concentration": 20.0,  # Confidence: Beta(平均 C, 集中度 κ)
+    "effort_sigma": 0.35,              # Effort: 対数正規 (中央値 E)
+}
+MC_PERCENTILES = (10, 50, 90)
+
+
+# ── Data Models ───────────────────────────────────────────────────────────
+
+@dataclass
+class SignalMatrix:
+    """Feature × シグナルの列指向行列。"""
+    ids: list[str]
+    values: "np.ndarray"  # shape (N, len(SIGNAL_COLUMNS))
+    skipped: list[tuple[str, str]] = field(default_factory=list)
+
+    def column(self, name: str) -> "np.ndarray":
+        return self.values[:, _COL[name]]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass
+class SweepResult:
+    """ウェイトスイープの順位変動集計。順位は1始まり (1 = 最高スコア)。"""
+    ids: list[str]
+    base_scores: "np.ndarray"       # (N,) 現行ウェイトでの adjusted_score
+    base_ranks: "np.ndarray"        # (N,)
+    mean_rank: "np.ndarray"         # (N,)
+    rank_std: "np.ndarray"          # (N,)
+    best_rank: "np.ndarray"         # (N,)
+    worst_rank: "np.ndarray"        # (N,)
+    top_k_share: "np.ndarray"       # (N,) Top-K 入りしたウェイトの割合
+    displacement: "np.ndarray"      # (K,) ウェイトごとの平均 |順位変動|
+    top_k: int
+    vector_count: int
+
+    def to_dict(self) -> dict:
+        order = np.argsort(self.base_ranks, kind="stable")
+        return {
+            "vector_count": self.vector_count,
+            "top_k": self.top_k,
+            "displacement": {
+                "mean": round(float(self.displacement.mean()), 3) if self.vector_count else 0.0,
+                "max": round(float(self.displacement.max()), 3) if self.vector_count else 0.0,
+            },
+            "features": [
+                {
+                    "id": self.ids[i],
+                    "base_score": round(float(self.base_scores[i]), 2),
+                    "base_rank": int(self.base_ranks[i]),
+                    "mean_rank": round(float(self.mean_rank[i]), 2),
+                    "rank_std": round(float(self.rank_std[i]), 2),
+                    "best_rank": int(self.best_rank[i]),
+                    "worst_rank": int(self.worst_rank[i]),
+                    "top_k_share": round(float(self.top_k_share[i]), 3),
+                }
+                for i in order
+            ],
+        }
+
+
+@dataclass
+class MonteCarloResult:
+    """Monte Carlo のスコア分布と順位安定性。順位は1始まり。"""
+    ids: list[str]
+    base_scores: "np.ndarray"        # (N,) 点推定の adjusted_score
+    base_ranks: "np.ndarray"         # (N,)
+    score_percentiles: "np.ndarray"  # (len(MC_PERCENTILES), N)
+    rank_percentiles: "np.ndarray"   # (len(MC_PERCENTILES), N)
+    top_k_share: "np.ndarray"        # (N,) Top-K 入りしたサンプルの割合
+    rank_hold_share: "np.ndarray"    # (N,) 点推定と同順位だったサンプルの割合
+    top_k: int
+    samples: int
+    uncertainty: dict
+
+    def to_dict(self) -> dict:
+        order = np.argsort(self.base_ranks, kind="stable")
+        return {
+            "samples": self.samples,
+            "top_k": self.top_k,
+            "uncertainty": {k: round(v, 4) for k, v in self.uncertainty.items()},
+            "features": [
+                {
+                    "id": self.ids[i],
+                    "base_score": round(float(self.base_scores[i]), 2),
+                    "base_rank": int(self.base_ranks[i]),
+                    **{f"score_p{q}": round(float(self.score_percentiles[j, i]), 2)
+                       for j, q in enumerate(MC_PERCENTILES)},
+                    **{f"rank_p{q}": round(float(self.rank_percentiles[j, i]), 1)
+                       for j, q in enumerate(MC_PERCENTILES)},
+                    "top_k_share": round(float(self.top_k_share[i]), 3),
+                    "rank_hold_share": round(float(self.rank_hold_share[i]), 3),
+                }
+                for i in order
+            ],
+        }
+
+
+def _require_numpy():
+    if not HAS_NUMPY:
+        raise RuntimeError("numpy未インストール - rice_batch は numpy が必要です (pip install numpy)")
+
+
+# ── Signal Extraction ─────────────────────────────────────────────────────
+
+def extract_feature_signals(feature_dir: Path, registry: RegistryData, gaps: GapData,
+                            parse_cache: Optional[ParseCache] = None) -> tuple[Optional[list], str]:
+    """単一Featureのシグナル行を抽出。対象外なら (None, 理由)。
+
+    process_feature() と同一の除外条件 (CONTEXT.jsonなし / JSON破損 / 非アクティブ)。
+    """
+    context_path = feature_dir / "CONTEXT.json"
+    if not context_path.exists():
+        return None, "CONTEXT.jsonなし"
+    try:
+        data = load_json(context_path)
+    except (ValueError, OSError) as e:
+        return None, f"JSON読み込み失敗: {e}"
+
+    from feature_lifecycle import is_active
+    if not is_active(data):
+        lifecycle_state = data.get("quick_resume", {}).get("current_state", "unknown")
+        return None, f"非アクティブFeature ({lifecycle_state})"
+
+    brief = BriefData(feature_dir / "BRIEF.md", cache=parse_cache)
+    spec = SpecData(find_spec_path(feature_dir), cache=parse_cache)
+    context = ContextData(data)
+    feature_id = context.feature_id
+
+    core_goal = brief.core_goal if brief.exists else ""
+    user_scope = core_goal_user_scope(core_goal) if core_goal else 5
+
+    total_assessments = 0
+    for feat in registry.get_all_matching_features(feature_id):
+        assessments = feat.get("assessments", {})
+        total_assessments += len([a for a in assessments.values() if isinstance(a, dict)])
+
+    opp = gaps.get_opportunity_score(feature_id)
+    override = _normalize_manual_override(
+        data.get("priority", {}).get("manual_override", 1.0))
+
+    row = [
+        user_scope,
+        float(brief.has_ltv_keywords),
+        float(brief.has_retention_keywords),
+        float(brief.has_business_metrics),
+        context.progress_pct,
+        core_goal_impact_level(core_goal),
+        GAP_SEVERITY_CODES.get(gaps.get_gap_severity(feature_id), 0),
+        float(brief.exists),
+        brief.section_count if brief.exists else 0,
+        float(spec.exists),
+        spec.fr_count if spec.exists else 0,
+        spec.target_file_count if spec.exists else 0,
+        len(context.research_ids),
+        context.fr_total,
+        brief.hard_constraint_count + brief.soft_constraint_count,
+        total_assessments,
+        float(gaps.get_is_industry_standard(feature_id)),
+        float("nan") if opp is None else opp,
+        override["value"],
+    ]
+    return row, ""
+
+
+def extract_signals(feature_dirs: list[Path], registry: RegistryData, gaps: GapData,
+                    parse_cache: Optional[ParseCache] = None) -> SignalMatrix:
+    """全Featureのシグナルを1回だけ抽出して行列化。"""
+    _require_numpy()
+    ids, rows, skipped = [], [], []
+    for feature_dir in feature_dirs:
+        row, reason = extract_feature_signals(feature_dir, registry, gaps, parse_cache)
+        if row is None:
+            skipped.append((feature_dir.name, reason))
+            continue
+        ids.append(feature_dir.name)
+        rows.append(row)
+    values = np.array(rows, dtype=np.float64).reshape(len(rows), len(SIGNAL_COLUMNS))
+    return SignalMatrix(ids=ids, values=values, skipped=skipped)
+
+
+# ── Vectorized RICE ───────────────────────────────────────────────────────
+
+def py_round(values: "np.ndarray", ndigits: int) -> "np.ndarray":
+    """組み込み round() と同一結果の丸め。
+
+    np.round は x × 10^n を rint するため、7.55 (実体 7.5499…) のような
+    境界値で round() と結果が分かれる。境界付近の要素のみ round() で再計算する。
+    """
+    values = np.asarray(values, dtype=np.float64)
+    rounded = np.round(values, ndigits)
+    scaled = values * 10.0 ** ndigits
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        rounded[near_tie] = [round(v, ndigits) for v in values[near_tie].tolist()]
+    return rounded
+
+
+def base_weight_vector() -> "np.ndarray":
+    """現行ウェイト (REACH_WEIGHTS + CONFIDENCE_WEIGHTS) を1行ベクトルで返却。"""
+    _require_numpy()
+    return np.array(list(REACH_WEIGHTS.values()) + list(CONFIDENCE_WEIGHTS.values()))
+
+
+def _reach_parts(s: SignalMatrix) -> tuple:
+    """calc_reach の (user_scope, biz_score, progress_factor)。"""
+    ltv = s.column("has_ltv") > 0
+    ret = s.column("has_retention") > 0
+    p = s.column("progress")
+    biz = np.select([ltv & ret, ltv | ret, s.column("has_biz_metrics") > 0], [9.0, 7.0, 5.0], 3.0)
+    pf = np.select([p >= 100, p >= 80, p >= 50, p > 0], [2.0, 3.0, 4.0, 5.0], 6.0)
+    return s.column("user_scope"), biz, pf
+
+
+def _confidence_factors(s: SignalMatrix) -> tuple:
+    """calc_confidence の4ファクタースコア (CONFIDENCE_WEIGHTS の順、丸め済み)。"""
+    p = s.column("progress")
+    brief = np.where(s.column("brief_exists") > 0,
+                     np.minimum(1.0, s.column("section_count") / 6), 0.0)
+    fr = s.column("spec_fr_count")
+    spec = np.where(s.column("spec_exists") > 0,
+                    np.where(fr == 0, 0.3, np.minimum(1.0, fr * 0.15)), 0.0)
+    research = np.minimum(1.0, s.column("research_count") * 0.2)
+    impl = np.select([p >= 80, p >= 50, p >= 20, p > 0], [1.0, 0.7, 0.4, 0.2], 0.0)
+    return tuple(py_round(f, 2) for f in (brief, spec, research, impl))
+
+
+def vector_impact(s: SignalMatrix) -> "np.ndarray":
+    """calc_impact のベクトル版 (ウェイト非依存)。"""
+    raw = s.column("impact_goal").copy()
+    ltv = s.column("has_ltv") > 0
+    ret = s.column("has_retention") > 0
+    raw = np.where(ltv, np.maximum(raw, 2.0), np.where(ret, np.maximum(raw, 1.0), raw))
+    gap = s.column("gap_severity")
+    raw = np.where(gap == 3, np.maximum(raw, 2.0), np.where(gap == 2, np.maximum(raw, 1.0), raw))
+    levels = np.array(sorted(IMPACT_LEVELS.keys()), dtype=np.float64)
+    # 最近傍レベルへsnap (同距離なら小さいレベル = min() と同一)
+    snapped = levels[np.argmin(np.abs(raw[:, None] - levels[None, :]), axis=1)]
+    return np.where(s.column("progress") >= 100, 0.25, snapped)
+
+
+def vector_effort(s: SignalMatrix) -> "np.ndarray":
+    """calc_effort のベクトル版 (ウェイト非依存)。"""
+    spec_exists = s.column("spec_exists") > 0
+    fr = np.where(spec_exists, s.column("spec_fr_count"), s.column("context_fr_total"))
+    effort = np.where(fr > 0, fr * 0.8, 2.0)
+    tf = np.where(spec_exists, s.column("target_files"), 0.0)
+    effort = np.where(tf > 0, effort * np.minimum(1 + tf / 50, 2.0), effort)
+    cc = s.column("constraint_count")
+    effort = effort * np.select([cc > 5, cc > 2], [1.3, 1.1], 1.0)
+    remaining = np.maximum(0.0, 100 - s.column("progress"))
+    effort = effort * (remaining / 100)
+    return py_round(np.clip(effort, 0.5, 20), 1)
+
+
+def vector_competitive_adjustment(s: SignalMatrix,
+                                  bounds: tuple[float, float] = COMPETITIVE_ADJUSTMENT_BOUNDS
+                                  ) -> "np.ndarray":
+    """calc_competitive_adjustment のベクトル版 (bounds で範囲制限を差し替え可能)。"""
+    a = s.column("assessments")
+    std = s.column("is_standard") > 0
+    opp = s.column("opportunity")
+    has_opp = ~np.isnan(opp)
+    gap = s.column("gap_severity")
+
+    adj = 1.0 + np.select([a >= 7, a >= 4, a > 0], [0.10, 0.06, 0.03], 0.0)
+    adj = adj + np.where(std, 0.05, 0.0)
+    opp_filled = np.where(has_opp, opp, 0.0)
+    adj = adj + np.where(has_opp, np.select([opp_filled >= 7, opp_filled >= 5, opp_filled >= 3],
+                                            [0.10, 0.05, 0.0], -0.05), 0.0)
+    adj = adj + np.select([gap == 3, gap == 2, gap == 1], [0.10, 0.05, -0.02], 0.0)
+
+    has_data = (a > 0) | std | has_opp | (gap > 0)
+    adj = np.where(has_data, adj, 1.0)
+    return py_round(np.clip(adj, bounds[0], bounds[1]), 3)
+
+
+def _weighted_scores(s: SignalMatrix, weights: "np.ndarray", impact, effort, comp) -> tuple:
+    """ウェイト行列 (K, 7) に対する reach/confidence/rice/adjusted (各 (K, N))。"""
+    weights = np.atleast_2d(weights)
+    rw = weights[:, _REACH_SLICE]
+    cw = weights[:, _CONFIDENCE_SLICE]
+
+    user_scope, biz, pf = _reach_parts(s)
+    progress = s.column("progress")
+    reach = (user_scope[None, :] * rw[:, 0:1] + biz[None, :] * rw[:, 1:2]
+             + pf[None, :] * rw[:, 2:3])
+    reach = np.where(progress[None, :] >= 100, 1.0, reach)
+    reach = py_round(np.clip(reach, 1, 10), 1)
+
+    confidence = np.zeros_like(reach)
+    for j, factor in enumerate(_confidence_factors(s)):
+        confidence = confidence + factor[None, :] * cw[:, j:j + 1]
+    confidence = py_round(np.maximum(0.05, confidence), 2)
+
+    numerator = reach * impact[None, :] * confidence
+    denominator = np.where(effort > 0, effort, 0.5)[None, :]
+    rice = py_round(numerator / denominator, 2)
+    adjusted = py_round(rice * comp[None, :] * s.column("manual_override")[None, :], 2)
+    return reach, confidence, rice, adjusted
+
+
+def score_portfolio(s: SignalMatrix, weights: Optional["np.ndarray"] = None,
+                    bounds: tuple[float, float] = COMPETITIVE_ADJUSTMENT_BOUNDS) -> dict:
+    """ポートフォリオ全体を1回のベクトル演算でスコアリング。
+
+    Returns:
+        {"reach", "impact", "confidence", "effort", "rice_score",
+         "competitive_adjustment", "adjusted_score"} 各 shape (N,)
+    """
+    _require_numpy()
+    if weights is None:
+        weights = base_weight_vector()
+    impact = vector_impact(s)
+    effort = vector_effort(s)
+    comp = vector_competitive_adjustment(s, bounds)
+    reach, confidence, rice, adjusted = _weighted_scores(s, weights, impact, effort, comp)
+    return {
+        "reach": reach[0],
+        "impact": impact,
+        "confidence": confidence[0],
+        "effort": effort,
+        "rice_score": rice[0],
+        "competitive_adjustment": comp,
+        "adjusted_score": adjusted[0],
+    }
+
+
+def rank_scores(scores: "np.ndarray") -> "np.ndarray":
+    """スコア (…, N) → 順位 (1 = 最高)。同点はFeature順 (安定ソート)。"""
+    order = np.argsort(-scores, axis=-1, kind="stable")
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, scores.shape[-1] + 1), axis=-1)
+    return ranks
+
+
+# ── Weight Sweep ──────────────────────────────────────────────────────────
+
+def sample_weight_vectors(count: int, concentration: float = 50.0,
+                          seed: Optional[int] = None) -> "np.ndarray":
+    """現行ウェイト周辺のランダムウェイトベクトル (count, 7) を生成。
+
+    Reach/Confidence それぞれ Dirichlet(base × concentration) で合計1を維持。
+    concentration が大きいほど現行ウェイトに近い。
+    """
+    _require_numpy()
+    rng = np.random.default_rng(seed)
+    base = base_weight_vector()
+    reach = rng.dirichlet(base[_REACH_SLICE] * concentration, size=count)
+    conf = rng.dirichlet(base[_CONFIDENCE_SLICE] * concentration, size=count)
+    return np.hstack([reach, conf])
+
+
+def load_weight_vectors(path: Path) -> "np.ndarray":
+    """JSON (ウェイトdictのリスト) → (K, 7) 行列。未指定キーは現行ウェイト。"""
+    _require_numpy()
+    entries = json_codec.load_path(path)
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: ウェイトdictのリストが必要です")
+    base = base_weight_vector()
+    vectors = np.tile(base, (len(entries), 1))
+    for i, entry in enumerate(entries):
+        unknown = set(entry) - set(WEIGHT_COLUMNS)
+        if unknown:
+            raise ValueError(f"{path}[{i}]: 不明なウェイトキー {sorted(unknown)}")
+        for j, name in enumerate(WEIGHT_COLUMNS):
+            if name in entry:
+                vectors[i, j] = float(entry[name])
+    return vectors
+
+
+def sweep_weights(s: SignalMatrix, weight_vectors: "np.ndarray", top_k: int = 10,
+                  bounds: tuple[float, float] = COMPETITIVE_ADJUSTMENT_BOUNDS) -> SweepResult:
+    """ウェイトベクトル群 (K, 7) で再スコアリングし、順位変動を集計。
+
+    ウェイト非依存の Impact/Effort/CompAdj は1回だけ計算し、
+    K × N のスコア行列はチャンク単位で評価してメモリ使用量を抑える。
+    """
+    _require_numpy()
+    n = len(s)
+    weight_vectors = np.atleast_2d(np.asarray(weight_vectors, dtype=np.float64))
+    k = weight_vectors.shape[0]
+    impact = vector_impact(s)
+    effort = vector_effort(s)
+    comp = vector_competitive_adjustment(s, bounds)
+
+    base_scores = _weighted_scores(s, base_weight_vector(), impact, effort, comp)[3][0]
+    base_ranks = rank_scores(base_scores)
+
+    rank_sum = np.zeros(n)
+    rank_sq_sum = np.zeros(n)
+    best = np.full(n, n + 1, dtype=np.int64) if n else np.zeros(0, dtype=np.int64)
+    worst = np.zeros(n, dtype=np.int64)
+    top_hits = np.zeros(n)
+    displacement = np.zeros(k)
+
+    chunk = max(1, SWEEP_CHUNK_ELEMENTS // max(n, 1))
+    for start in range(0, k, chunk):
+        stop = min(k, start + chunk)
+        adjusted = _weighted_scores(s, weight_vectors[start:stop], impact, effort, comp)[3]
+        ranks = rank_scores(adjusted)
+        rank_sum += ranks.sum(axis=0)
+        rank_sq_sum += (ranks.astype(np.float64) ** 2).sum(axis=0)
+        best = np.minimum(best, ranks.min(axis=0, initial=n + 1))
+        worst = np.maximum(worst, ranks.max(axis=0, initial=0))
+        top_hits += (ranks <= top_k).sum(axis=0)
+        displacement[start:stop] = np.abs(ranks - base_ranks[None, :]).mean(axis=1) if n else 0.0
+
+    if k:
+        mean_rank = rank_sum / k
+        rank_std = np.sqrt(np.maximum(0.0, rank_sq_sum / k - mean_rank ** 2))
+        top_share = top_hits / k
+    else:
+        mean_rank = base_ranks.astype(np.float64)
+        rank_std = np.zeros(n)
+        best = worst = base_ranks
+        top_share = (base_ranks <= top_k).astype(np.float64)
+
+    return SweepResult(
+        ids=list(s.ids), base_scores=base_scores, base_ranks=base_ranks,
+        mean_rank=mean_rank, rank_std=rank_std, best_rank=best, worst_rank=worst,
+        top_k_share=top_share, displacement=displacement, top_k=top_k, vector_count=k,
+    )
+
+
+# ── Monte Carlo ───────────────────────────────────────────────────────────
+
+def _mc_uncertainty(spread: float = 1.0) -> dict:
+    """MC_UNCERTAINTY を spread 倍に拡大/縮小 (Confidence集中度は逆数倍)。"""
+    if spread <= 0:
+        raise ValueError("spread は正の値が必要です")
+    u = MC_UNCERTAINTY
+    return {
+        "reach_spread": u["reach_spread"] * spread,
+        "impact_step_prob": min(0.5, u["impact_step_prob"] * spread),
+        "confidence_concentration": u["confidence_concentration"] / spread,
+        "effort_sigma": u["effort_sigma"] * spread,
+    }
+
+
+def sample_rice_inputs(rng, reach, impact, confidence, effort, size: int,
+                       uncertainty: dict) -> tuple:
+    """点推定 (N,) の周辺から R/I/C/E サンプル (size, N) を生成。"""
+    n = reach.shape[0]
+    shape = (size, n)
+
+    s = uncertainty["reach_spread"]
+    r = np.broadcast_to(reach, shape)
+    if s > 0:
+        r = rng.triangular(reach * (1 - s), reach, reach * (1 + s), size=shape)
+    r = np.clip(r, 1, 10)
+
+    levels = np.array(sorted(IMPACT_LEVELS.keys()), dtype=np.float64)
+    idx = np.argmin(np.abs(impact[:, None] - levels[None, :]), axis=1)
+    p = uncertainty["impact_step_prob"]
+    step = rng.choice(np.array([-1, 0, 1]), size=shape, p=[p, 1 - 2 * p, p])
+    i = levels[np.clip(idx[None, :] + step, 0, len(levels) - 1)]
+
+    k = uncertainty["confidence_concentration"]
+    m = np.clip(confidence, 0.01, 0.99)
+    c = np.maximum(0.05, rng.beta(m * k, (1 - m) * k, size=shape))
+
+    e = np.clip(effort * np.exp(rng.normal(0.0, uncertainty["effort_sigma"], size=shape)), 0.5, 20)
+    return r, i, c, e
+
+
+def monte_carlo_scores(s: SignalMatrix, samples: int = 10000, top_k: int = 10,
+                       spread: float = 1.0, seed: Optional[int] = None,
+                       bounds: tuple[float, float] = COMPETITIVE_ADJUSTMENT_BOUNDS
+                       ) -> MonteCarloResult:
+    """R/I/C/E をサンプリングして adjusted_score の分布と順位安定性を集計。
+
+    CompAdj / manual_override は確定値として扱う。サンプル × Feature の
+    行列はチャンク単位で生成し、スコア/順位は float32/int32 で保持する。
+    """
+    _require_numpy()
+    uncertainty = _mc_uncertainty(spread)
+    rng = np.random.default_rng(seed)
+    point = score_portfolio(s, bounds=bounds)
+    multiplier = point["competitive_adjustment"] * s.column("manual_override")
+    base_scores = point["adjusted_score"]
+    base_ranks = rank_scores(base_scores)
+
+    n = len(s)
+    scores = np.empty((samples, n), dtype=np.float32)
+    ranks = np.empty((samples, n), dtype=np.int32)
+    chunk = max(1, SWEEP_CHUNK_ELEMENTS // max(n, 1))
+    for start in range(0, samples, chunk):
+        stop = min(samples, start + chunk)
+        r, i, c, e = sample_rice_inputs(rng, point["reach"], point["impact"],
+                                        point["confidence"], point["effort"],
+                                        stop - start, uncertainty)
+        adjusted = r * i * c / e * multiplier[None, :]
+        scores[start:stop] = adjusted
+        ranks[start:stop] = rank_scores(adjusted)
+
+    if samples and n:
+        score_pct = np.percentile(scores, MC_PERCENTILES, axis=0)
+        rank_pct = np.percentile(ranks, MC_PERCENTILES, axis=0)
+        top_share = (ranks <= top_k).mean(axis=0)
+        hold_share = (ranks == base_ranks[None, :]).mean(axis=0)
+    else:
+        score_pct = np.tile(base_scores, (len(MC_PERCENTILES), 1))
+        rank_pct = np.tile(base_ranks, (len(MC_PERCENTILES), 1)).astype(np.float64)
+        top_share = (base_ranks <= top_k).astype(np.float64)
+        hold_share = np.ones(n)
+
+    return MonteCarloResult(
+        ids=list(s.ids), base_scores=base_scores, base_ranks=base_ranks,
+        score_percentiles=score_pct, rank_percentiles=rank_pct,
+        top_k_share=top_share, rank_hold_share=hold_share,
+        top_k=top_k, samples=samples, uncertainty=uncertainty,
+    )
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def _print_scores(s: SignalMatrix, scores: dict, top: int):
+    order = np.argsort(-scores["adjusted_score"], kind="stable")
+    print(f"\n── Portfolio ({len(s)} Features, 現行ウェイト) ──")
+    print(f"  {'#':>3} {'Feature':45s} {'R':>5} {'I':>5} {'C':>5} {'E':>5} {'Comp':>6} {'Score':>7}")
+    for rank, i in enumerate(order[:top], 1):
+        print(f"  {rank:3d} {s.ids[i]:45s} {scores['reach'][i]:5.1f} {scores['impact'][i]:5.2f} "
+              f"{scores['confidence'][i]:5.2f} {scores['effort'][i]:5.1f} "
+              f"{scores['competitive_adjustment'][i]:6.3f} {scores['adjusted_score'][i]:7.2f}")
+
+
+def _print_sweep(result: SweepResult, top: int):
+    data = result.to_dict()
+    print(f"\n── Weight Sweep ({result.vector_count} ウェイトベクトル, Top-{result.top_k}) ──")
+    print(f"  平均順位変動: {data['displacement']['mean']:.2f} (最大 {data['displacement']['max']:.2f})")
+    print(f"  {'Base':>4} {'Feature':45s} {'Score':>7} {'Mean':>6} {'Std':>5} {'Best-Worst':>10} {'Top-K%':>7}")
+    for f in data["features"][:top]:
+        span = f"{f['best_rank']}-{f['worst_rank']}"
+        print(f"  {f['base_rank']:4d} {f['id']:45s} {f['base_score']:7.2f} {f['mean_rank']:6.2f} "
+              f"{f['rank_std']:5.2f} {span:>10} {f['top_k_share'] * 100:6.1f}%")
+
+
+def _print_monte_carlo(result: MonteCarloResult, top: int):
+    data = result.to_dict()
+    print(f"\n── Monte Carlo ({result.samples} サンプル, Top-{result.top_k}) ──")
+    print(f"  {'Base':>4} {'Feature':45s} {'Score':>7} {'p10':>7} {'p50':>7} {'p90':>7} "
+          f"{'Rank p10-p90':>12} {'Top-K%':>7} {'Hold%':>6}")
+    for f in data["features"][:top]:
+        span = f"{f['rank_p10']:.0f}-{f['rank_p90']:.0f}"
+        print(f"  {f['base_rank']:4d} {f['id']:45s} {f['base_score']:7.2f} {f['score_p10']:7.2f} "
+              f"{f['score_p50']:7.2f} {f['score_p90']:7.2f} {span:>12} "
+              f"{f['top_k_share'] * 100:6.1f}% {f['rank_hold_share'] * 100:5.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RICE一括スコアリング & ウェイト感度分析 (NumPy)")
+    parser.add_argument("--feature", type=str, help="特定Feature ID (部分一致)")
+    parser.add_argument("--sweep", type=int, default=0, help="ランダムウェイトベクトル数")
+    parser.add_argument("--weights", type=Path, help="ウェイトベクトルJSONファイル")
+    parser.add_argument("--concentration", type=float, default=50.0,
+                        help="ランダムウェイトの集中度 (大きいほど現行ウェイトに近い, デフォルト: 50)")
+    parser.add_argument("--seed", type=int, default=None, help="乱数シード")
+    parser.add_argument("--top-k", type=int, default=10, help="Top-K 入り判定の K (デフォルト: 10)")
+    parser.add_argument("--top", type=int, default=20, help="表示件数 (デフォルト: 20)")
+    parser.add_argument("--monte-carlo", type=int, default=0, metavar="N",
+                        help="R/I/C/E をN回サンプリングしてスコア信頼区間と順位安定性を算出")
+    parser.add_argument("--mc-spread", type=float, default=1.0,
+                        help="Monte Carlo 入力分布の幅の倍率 (デフォルト: 1.0)")
+    parser.add_argument("--json", action="store_true", help="JSON形式出力")
+    parser.add_argument("--no-parse-cache", action="store_true",
+                        help="BRIEF/SPECパースキャッシュを使用しない")
+    args = parser.parse_args()
+
+    if not HAS_NUMPY:
+        print("ERROR: numpy未インストール (pip install numpy)", file=sys.stderr)
+        sys.exit(1)
+    if not FEATURES_DIR.exists():
+        print(f"ERROR: {FEATURES_DIR} パスが見つかりません", file=sys.stderr)
+        sys.exit(1)
+
+    feature_dirs = discover_feature_dirs(args.feature)
+    parse_cache = None if args.no_parse_cache else ParseCache(PARSE_CACHE_PATH)
+    signals = extract_signals(feature_dirs, RegistryData(), GapData(), parse_cache)
+    if parse_cache is not None:
+        try:
+            parse_cache.save()
+        except OSError as e:
+            print(f"WARNING: パースキャッシュ保存失敗: {e}", file=sys.stderr)
+
+    scores = score_portfolio(signals)
+    vectors = None
+    if args.weights:
+        try:
+            vectors = load_weight_vectors(args.weights)
+        except (OSError, ValueError, json.JSONDecodeError) as e:
+            print(f"ERROR: ウェイトファイル読み込み失敗: {e}", file=sys.stderr)
+            sys.exit(1)
+    if args.sweep > 0:
+        sampled = sample_weight_vectors(args.sweep, args.concentration, args.seed)
+        vectors = sampled if vectors is None else np.vstack([vectors, sampled])
+    sweep = sweep_weights(signals, vectors, top_k=args.top_k) if vectors is not None else None
+    mc = None
+    if args.monte_carlo > 0:
+        try:
+            mc = monte_carlo_scores(signals, args.monte_carlo, top_k=args.top_k,
+                                    spread=args.mc_spread, seed=args.seed)
+        except ValueError as e:
+            print(f"ERROR: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    if args.json:
+        output = {
+            "features": [
+                {"id": fid, **{k: round(float(v[i]), 3) for k, v in scores.items()}}
+                for i, fid in enumerate(signals.ids)
+            ],
+            "skipped": [{"id": fid, "reason": reason} for fid, reason in signals.skipped],
+        }
+        if sweep is not None:
+            output["sweep"] = sweep.to_dict()
+        if mc is not None:
+            output["monte_carlo"] = mc.to_dict()
+        print(json_codec.dumps(output))
+        return
+
+    print(f"\n{'=' * 60}")
+    print("RICE Batch Engine")
+    print(f"{'=' * 60}")
+    print(f"対象: {len(signals)} Features ({len(signals.skipped)} skipped)")
+    _print_scores(signals, scores, args.top)
+    if sweep is not None:
+        _print_sweep(sweep, args.top)
+    if mc is not None:
+        _print_monte_carlo(mc, args.top)
+
+
+if __name__ == "__main__":
+    main()
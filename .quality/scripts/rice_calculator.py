@@ -14,28 +14,56 @@ Usage:
     python3 rice_calculator.py --verbose              # 詳細出力
     python3 rice_calculator.py --json-output          # JSON出力
     python3 rice_calculator.py --set-phase growth     # Phase変更
+    python3 rice_calculator.py --jobs 8               # プロセスプール並列スコアリング
+    python3 rice_calculator.py --no-parse-cache       # パースキャッシュ無効化
+    python3 rice_calculator.py --apply --history-limit 20  # 履歴を直近20件に圧縮 (古い分はアーカイブ)
+    python3 rice_calculator.py --profile              # ステージ別タイミング (wall/CPU, p50/p90/p99)
+    python3 rice_calculator.py --profile --profile-output prof.json --cprofile rice.pstats
+    python3 rice_calculator.py --watch --apply       # 変更されたFeatureのみ自動再スコアリング
+    python3 rice_calculator.py --staged              # ステージ済み変更のFeatureのみ (pre-commit)
+    python3 rice_calculator.py --changed-since main  # main からの変更Featureのみ
+
+実行ごとに .quality/cache/priority-index.json (順位インデックス) を更新する。
+Top-K / Tier / Phase の参照は priority_index.py を使用。
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+from atomic_write import WriteBatch, dump_json_bytes, write_bytes_atomic
+from changed_scope import add_scope_arguments, scope_from_args
+from context_corpus import load_bytes, load_json
+import json_codec
+from stage_profiler import NULL_PROFILER, StageProfiler, format_report
+
 # ── Project Root ──────────────────────────────────────────────────────────
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 FEATURES_DIR = PROJECT_ROOT / "docs" / "features"
 REGISTRY_PATH = PROJECT_ROOT / "docs" / "analysis" / "competitor-registry.json"
 GAP_CANDIDATES_PATH = PROJECT_ROOT / "docs" / "analysis" / "gap-candidates.json"
+PARSE_CACHE_PATH = PROJECT_ROOT / ".quality" / "cache" / "rice_parse_cache.json"
 
 # ── Constants ─────────────────────────────────────────────────────────────
 
 # Impact 許容値 (Intercom 5段階)
 IMPACT_LEVELS = {0.25: "Minimal", 0.5: "Low", 1: "Medium", 2: "High", 3: "Massive"}
 
+# Reach 要素別ウェイト (独立加重和)
+REACH_WEIGHTS = {
+    "user_scope": 0.40,
+    "business_metrics": 0.35,
+    "progress": 0.25,
+}
+
 # Confidence 要素別ウェイト (v2: competitor_data 除去、4ファクター再配分)
 CONFIDENCE_WEIGHTS = {
     "brief_completeness": 0.30,
@@ -44,6 +72,12 @@ CONFIDENCE_WEIGHTS = {
     "implementation_status": 0.20,
 }
 
+# Competitive Adjustment 範囲 (post-multiplier)
+COMPETITIVE_ADJUSTMENT_BOUNDS = (0.8, 1.3)
+
+# 優先度Tier 閾値 (adjusted_score 以上 → Tier、降順に評価)
+TIER_THRESHOLDS = (("T1", 5.0), ("T2", 2.0), ("T3", 1.0))
+
 # BRIEF.md 期待セクション (§0~§7)
 BRIEF_SECTIONS = [
     "0. Original Request",
@@ -56,11 +90,265 @@ BRIEF_SECTIONS = [
     "7. Business Metrics",
 ]
 
+# パーサーバージョン (パースロジック変更時にインクリメント → キャッシュ自動無効化)
+BRIEF_PARSER_VERSION = 2
+SPEC_PARSER_VERSION = 1
+
+# パースキャッシュ最大エントリ数 (超過分は古い順に破棄)
+PARSE_CACHE_MAX_ENTRIES = 5000
+
+# priority.history のアーカイブ先 (Featureディレクトリ内、追記専用JSONL)
+PRIORITY_HISTORY_ARCHIVE = "priority-history.jsonl"
+
+# ── Parse Cache ───────────────────────────────────────────────────────────
+
+class ParseCache:
+    """BRIEF.md/SPEC.md パース結果の永続キャッシュ。
+
+    キー: "{kind}:v{parser_version}:{sha256(content)}"。
+    内容が変わらない限りregexパースを完全にスキップする。
+    """
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self.entries: dict[str, dict] = {}
+        self._new_entries: dict[str, dict] = {}
+        self._touched: set[str] = set()
+        self.stats = {"brief_hit": 0, "brief_miss": 0, "spec_hit": 0, "spec_miss": 0}
+        if path is not None:
+            self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            data = json_codec.loads(self.path.read_bytes())
+        except (json.JSONDecodeError, OSError):
+            return  # 破損キャッシュは無視 (次回保存で再生成)
+        if data.get("format_version") == self.FORMAT_VERSION:
+            self.entries = data.get("entries", {})
+
+    @staticmethod
+    def make_key(kind: str, version: int, raw: bytes) -> str:
+        return f"{kind}:v{version}:{hashlib.sha256(raw).hexdigest()}"
+
+    def get(self, kind: str, key: str) -> Optional[dict]:
+        fields = self.entries.get(key)
+        self.stats[f"{kind}_{'hit' if fields is not None else 'miss'}"] += 1
+        if fields is not None:
+            self._touched.add(key)
+        return fields
+
+    def put(self, key: str, fields: dict):
+        self.entries[key] = fields
+        self._new_entries[key] = fields
+        self._touched.add(key)
+
+    def drain(self) -> dict:
+        """ワーカー側の新規エントリ/統計を取り出してリセット (親プロセスへ返却用)。"""
+        delta = {"entries": self._new_entries, "touched": sorted(self._touched),
+                 "stats": self.stats}
+        self._new_entries = {}
+        self._touched = set()
+        self.stats = {k: 0 for k in self.stats}
+        return delta
+
+    def absorb(self, delta: dict):
+        """ワーカーから返却された差分を統合。"""
+        self.entries.update(delta["entries"])
+        self._touched.update(delta["touched"])
+        for k, v in delta["stats"].items():
+            self.stats[k] += v
+
+    def summary(self) -> str:
+        s = self.stats
+        return (f"Parse cache: BRIEF {s['brief_hit']} hit / {s['brief_miss']} miss, "
+                f"SPEC {s['spec_hit']} hit / {s['spec_miss']} miss")
+
+    def save(self):
+        """今回使用したエントリを優先して保存 (上限超過分は未使用の古いものから破棄)。"""
+        if self.path is None:
+            return
+        untouched = [k for k in self.entries if k not in self._touched]
+        touched = [k for k in self.entries if k in self._touched]
+        keep = (untouched + touched)[-PARSE_CACHE_MAX_ENTRIES:]
+        payload = {
+            "format_version": self.FORMAT_VERSION,
+            "entries": {k: self.entries[k] for k in keep},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # キャッシュは再生成可能なため fsync 不要 (内容不変なら書き込み自体をスキップ)
+        write_bytes_atomic(self.path, json_codec.dump_bytes(payload, pretty=False), durable=False)
+
+
+def _decode_text(raw: bytes) -> str:
+    """Path.read_text() と同一のテキストに復元 (universal newlines)。"""
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+# ── BRIEF Tokenizer ───────────────────────────────────────────────────────
+
+_SECTION_HEADER_RE = re.compile(r'## (\d+)\. ')
+
+# LTV/リテンションキーワード (text.lower() に対して検索)。
+# sre は選択肢 (A|B|C) の先頭文字最適化が効かないため、語句ごとのリテラル接頭辞
+# パターンに分割して最初のヒットで打ち切る
+_LTV_TERM_RES = tuple(re.compile(p) for p in (
+    r'ltv', r'生涯\s*価値', r'lifetime\s*value', r'arpu', r'mrr'))
+_RETENTION_TERM_RES = tuple(re.compile(p) for p in (
+    r'retention', r'リテンション', r'離脱率', r'churn', r'更新率'))
+
+# §5/§6 カウント対象: (属性名, セクション番号, 語句の選択肢)
+# 語句同士は重複一致し得ないため、語句別件数の合計 == 旧 (?i)(A|B|C) の findall 件数
+_SECTION_TERMS = tuple(
+    (attr, num, re.compile(f"(?i)({alt})"), tuple(re.compile(t) for t in alt.split("|")))
+    for attr, num, alt in (
+        ("hard_constraint_count", "6", r'hard\s*constraint|違反\s*禁止|\[x\]'),
+        ("soft_constraint_count", "6", r'soft\s*constraint|推奨|\[ \]'),
+        ("in_scope_count", "5", r'in.scope|含む'),
+        ("out_scope_count", "5", r'out.scope|除外|非対象'),
+    )
+)
+# (?i) 照合と lower() 後の照合が一致しない文字 (İ→"i̇" の2文字化, ı/ſ の特殊畳み込み)
+_CASEFOLD_SPECIAL_CHARS = ("\u0130", "\u0131", "\u017f")
+
+_TABLE_SEPARATOR_RE = re.compile(r'^[\|\-\s:]+$')
+
+
+class BriefTokens:
+    """BRIEF.md の単一パス・トークン化結果。
+
+    全行を1回だけ走査し、以下を生成する:
+    - sections: セクション番号 → (内容開始行, 終了行)  ※ヘッダー行の次行から次ヘッダー直前まで
+    - subheads: セクション番号 → [(行, "###" 直後のテキスト)]  ("###" 出現ごと)
+    - head_lines: セクション番号 → "###" で始まる行 (サブセクション終端)
+    - bolds: セクション番号 → [(行, ラベル, ":" 直後の列)]  ("**label**:" 出現ごと)
+    - has_ltv / has_retention: キーワードヒットフラグ
+
+    旧regex実装 (BriefData._parse_reference) と原則同一の結果を返す。
+    既知の差異: "###" / "**label**" 直後の空白は行内のみを対象とする
+    (旧regexの \\s* は改行をまたぐため "###\\nCore Goal" や "**Core Goal**\\n:" にも一致する)。
+    """
+    def __init__(self, text: str):
+        self.lines = text.split("\n")
+        self.sections: dict[str, tuple[int, int]] = {}
+        self.subheads: dict[str, list[tuple[int, str]]] = {}
+        self.head_lines: dict[str, list[int]] = {}
+        self.bolds: dict[str, list[tuple[int, str, int]]] = {}
+        self._walk()
+        lowered = text.lower()
+        self.has_ltv = any(p.search(lowered) for p in _LTV_TERM_RES)
+        self.has_retention = any(p.search(lowered) for p in _RETENTION_TERM_RES)
+
+    def _walk(self):
+        current = None
+        start = 0
+        subheads: list = []
+        head_lines: list = []
+        bolds: list = []
+        for i, line in enumerate(self.lines):
+            if "#" in line:
+                # セクションヘッダー: 先頭行以外の "## N. " (旧 re.split(r'\n## (\d+)\. ') と同一)
+                if i and line.startswith("## "):
+                    m = _SECTION_HEADER_RE.match(line)
+                    if m:
+                        if current is not None:
+                            self.sections[current] = (start, i)
+                        current = m.group(1)
+                        start = i + 1
+                        subheads, head_lines, bolds = [], [], []
+                        self.subheads[current] = subheads
+                        self.head_lines[current] = head_lines
+                        self.bolds[current] = bolds
+                        continue
+                if current is not None and "###" in line:
+                    if line.startswith("###"):
+                        head_lines.append(i)
+                    p = line.find("###")
+                    while p != -1:
+                        subheads.append((i, line[p + 3:].lstrip()))
+                        p = line.find("###", p + 1)
+            if current is not None and "**" in line:
+                p = line.find("**")
+                while p != -1:
+                    q = line.find("**", p + 2)
+                    if q == -1:
+                        break
+                    after = line[q + 2:].lstrip()
+                    if after.startswith(":"):
+                        bolds.append((i, line[p + 2:q], len(line) - len(after) + 1))
+                    p = line.find("**", p + 1)
+        if current is not None:
+            self.sections[current] = (start, len(self.lines))
+
+    def section_lines(self, num: str) -> list[str]:
+        start, end = self.sections.get(num, (0, 0))
+        return self.lines[start:end]
+
+    def section_text(self, num: str) -> str:
+        return "\n".join(self.section_lines(num))
+
+    def subsection_lines(self, num: str, heading: str) -> Optional[list[str]]:
+        """2種類のBRIEF形式からサブセクション本文の行を抽出 (見つからなければNone)。
+
+        Format A (### heading): 見出し次行から次の "###" 行の直前まで
+        Format B (インラインボールド): "**heading**:" 以降 (行末が空なら次の非空行)
+        """
+        if num not in self.sections:
+            return None
+        start, end = self.sections[num]
+        heading_re = _heading_re(heading)
+
+        # Format A: 見出し行の後に少なくとも1行必要。終端は本文2行目以降の "###" 行
+        for line_no, rest in self.subheads[num]:
+            if line_no + 1 < end and heading_re.match(rest):
+                stop = end
+                for head_line in self.head_lines[num]:
+                    if head_line >= line_no + 2:
+                        stop = head_line
+                        break
+                return self.lines[line_no + 1:stop]
+
+        # Format B: - **heading**: インラインテキスト
+        for line_no, label, col in self.bolds[num]:
+            if not heading_re.fullmatch(label):
+                continue
+            rest = self.lines[line_no][col:]
+            if rest.strip():
+                return [rest]
+            following = self.lines[line_no + 1:end]
+            for line in following:
+                if line.strip():
+                    return [line]
+            if rest or any(following):
+                return [""]  # 空白のみ (旧regexのバックトラック一致と同等)
+        return None
+
+
+_HEADING_RE_CACHE: dict[str, re.Pattern] = {}
+
+
+def _heading_re(heading: str) -> re.Pattern:
+    pattern = _HEADING_RE_CACHE.get(heading)
+    if pattern is None:
+        pattern = _HEADING_RE_CACHE[heading] = re.compile(re.escape(heading), re.IGNORECASE)
+    return pattern
+
+
 # ── Data Models ───────────────────────────────────────────────────────────
 
 class BriefData:
     """BRIEF.md パース結果。calc_reach/calc_impact/calc_confidenceの単一データソース。"""
-    def __init__(self, path: Path):
+    # ParseCache に保存するパース結果フィールド
+    CACHED_FIELDS = (
+        "sections", "section_count", "has_core_goal", "has_user_value",
+        "has_business_metrics", "has_ltv_keywords", "has_retention_keywords",
+        "hard_constraint_count", "soft_constraint_count", "in_scope_count",
+        "out_scope_count", "core_goal", "user_value", "business_metrics", "user_story",
+    )
+
+    def __init__(self, path: Path, cache: Optional[ParseCache] = None):
         self.path = path
         self.exists = path.exists()
         self.sections: dict[str, str] = {}
@@ -81,10 +369,90 @@ class BriefData:
         self.business_metrics: list[str] = []
         self.user_story = ""
         if self.exists:
-            self._parse()
+            _load_with_cache(self, "brief", BRIEF_PARSER_VERSION, cache)
+
+    def _parse(self, text: Optional[str] = None):
+        """BriefTokens (単一パス・トークン化) から全フィールドを算出。"""
+        if text is None:
+            text = self.path.read_text(encoding="utf-8")
+        tokens = BriefTokens(text)
+        for num in tokens.sections:
+            self.sections[num] = tokens.section_text(num)
+
+        # 実質的な内容があるセクション数 (auto-migrated/未定義を除外)
+        for num, content in self.sections.items():
+            stripped = content.strip()
+            if stripped and "[auto-migrated]" not in stripped[:100]:
+                first_line = stripped.split('\n', 1)[0]
+                if len(first_line) > 20:  # 実質的な内容の判定
+                    self.section_count += 1
+
+        # §1 テキスト抽出 — サブヘッダー(### Core Goal, ### User Value 等)ベース
+        self.core_goal = self._join_lines(tokens.subsection_lines("1", "Core Goal"))
+        self.user_value = self._join_lines(tokens.subsection_lines("1", "User Value"))
+        self.has_core_goal = bool(self.core_goal)
+        self.has_user_value = bool(self.user_value)
+
+        # §7 Business Metrics (または §1 内の Business Metric)
+        biz_lines = tokens.subsection_lines("1", "Business Metric")
+        if not self._join_lines(biz_lines):
+            biz_lines = tokens.section_lines("7")
+        self.business_metrics = self._metric_lines(biz_lines)
+        self.has_business_metrics = bool(self.business_metrics)
+
+        # §2 User Stories
+        self.user_story = self._first_paragraph(tokens.section_lines("2"))
+
+        # LTV/リテンションキーワード (トークン化時に全テキスト1回の走査で判定済み)
+        self.has_ltv_keywords = tokens.has_ltv
+        self.has_retention_keywords = tokens.has_retention
+
+        # §5 Scope / §6 Constraints
+        lowered_sections: dict[str, Optional[str]] = {}
+        for attr, num, pattern, term_patterns in _SECTION_TERMS:
+            section = self.sections.get(num, "")
+            if num not in lowered_sections:
+                special = any(c in section for c in _CASEFOLD_SPECIAL_CHARS)
+                lowered_sections[num] = None if special else section.lower()
+            lowered = lowered_sections[num]
+            if lowered is None:
+                setattr(self, attr, len(pattern.findall(section)))
+            else:
+                setattr(self, attr, sum(len(p.findall(lowered)) for p in term_patterns))
+
+    @staticmethod
+    def _join_lines(lines: Optional[list[str]]) -> str:
+        return "\n".join(lines).strip() if lines else ""
+
+    @staticmethod
+    def _metric_lines(lines: list[str]) -> list[str]:
+        """ビジネスメトリクスの行から意味のある行を抽出 (最大10行)。"""
+        result = []
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith('#') or line == '---':
+                continue
+            # マークダウンテーブル区切り線を除外
+            if _TABLE_SEPARATOR_RE.match(line):
+                continue
+            result.append(line)
+            if len(result) == 10:
+                break
+        return result
+
+    @staticmethod
+    def _first_paragraph(lines: list[str]) -> str:
+        """セクションの最初の意味のある行を抽出。"""
+        for line in lines:
+            line = line.strip()
+            if line and not line.startswith('#') and line != '---' and '[auto-migrated]' not in line:
+                return line
+        return ""
 
-    def _parse(self):
-        text = self.path.read_text(encoding="utf-8")
+    def _parse_reference(self, text: Optional[str] = None):
+        """旧regex実装 (参照用)。_parse との結果一致をテストで検証する。"""
+        if text is None:
+            text = self.path.read_text(encoding="utf-8")
         # セクション分割: ## N. パターン
         parts = re.split(r'\n## (\d+)\. ', text)
         # parts[0] = ヘッダー, parts[1]=N, parts[2]=content, ...
@@ -186,17 +554,20 @@ class BriefData:
 
 class SpecData:
     """SPEC.md パース結果。"""
-    def __init__(self, path: Optional[Path]):
+    CACHED_FIELDS = ("fr_count", "ac_count", "target_file_count")
+
+    def __init__(self, path: Optional[Path], cache: Optional[ParseCache] = None):
         self.path = path
         self.exists = path is not None and path.exists()
         self.fr_count = 0
         self.ac_count = 0
         self.target_file_count = 0
         if self.exists:
-            self._parse()
+            _load_with_cache(self, "spec", SPEC_PARSER_VERSION, cache)
 
-    def _parse(self):
-        text = self.path.read_text(encoding="utf-8")
+    def _parse(self, text: Optional[str] = None):
+        if text is None:
+            text = self.path.read_text(encoding="utf-8")
         # FR 個数: FR-NNN パターン
         self.fr_count = len(set(re.findall(r'FR-\d{3,4}', text)))
         # AC 個数: AC-NNN または AC N パターン
@@ -208,6 +579,22 @@ class SpecData:
         self.target_file_count = len(re.findall(r'(?:lib/|test/)\S+\.dart', text))
 
 
+def _load_with_cache(doc, kind: str, version: int, cache: Optional[ParseCache]):
+    """BriefData/SpecData 共通: キャッシュヒットならパースをスキップしてフィールド復元。"""
+    raw = load_bytes(doc.path)
+    if cache is None:
+        doc._parse(_decode_text(raw))
+        return
+    key = ParseCache.make_key(kind, version, raw)
+    fields = cache.get(kind, key)
+    if fields is not None:
+        for name in doc.CACHED_FIELDS:
+            setattr(doc, name, fields[name])
+        return
+    doc._parse(_decode_text(raw))
+    cache.put(key, {name: getattr(doc, name) for name in doc.CACHED_FIELDS})
+
+
 class ContextData:
     """CONTEXT.json データ。"""
     def __init__(self, data: dict):
@@ -235,15 +622,49 @@ class RegistryData:
     def __init__(self):
         self.features: list[dict] = []
         self.apps: list[dict] = []
+        self._coverage_index: dict[str, list[dict]] = {}
         self._load()
+        self._build_coverage_index()
 
     def _load(self):
         if not REGISTRY_PATH.exists():
             return
-        data = json.loads(REGISTRY_PATH.read_text(encoding="utf-8"))
+        data = load_json(REGISTRY_PATH)
         self.features = data.get("features", [])
         self.apps = data.get("apps", [])
 
+    def _build_coverage_index(self):
+        """Feature番号(先頭ゼロ除去) → registry項目リストの逆引きインデックスを構築。
+
+        hackathon_project_coverage の正規化 ("001,034" / "027-partial") はここで1回だけ行う。
+        各リストはself.featuresの出現順を保持し、同一項目は1回のみ登録する。
+        """
+        index: dict[str, list[dict]] = {}
+        for feat in self.features:
+            for num in self._coverage_nums(feat):
+                index.setdefault(num, []).append(feat)
+        self._coverage_index = index
+
+    @staticmethod
+    def _coverage_nums(feat: dict) -> list[str]:
+        """hackathon_project_coverage から正規化済みFeature番号を重複なしで抽出。"""
+        coverage = feat.get("hackathon_project_coverage")
+        if not coverage or not isinstance(coverage, str):
+            return []
+        nums: list[str] = []
+        # カンマ区切り複数値処理
+        for part in coverage.split(","):
+            part = part.strip()
+            if not part:
+                continue
+            # 数字プレフィックス抽出 (例: "027-partial" → "027")
+            match = re.match(r'(\d+)', part)
+            if match:
+                num = match.group(1).lstrip("0")
+                if num and num not in nums:
+                    nums.append(num)
+        return nums
+
     @staticmethod
     def _extract_feature_num(feature_id: str) -> Optional[str]:
         """Feature IDから数字部分を抽出。'008-monetization-system' → '8'。"""
@@ -259,30 +680,13 @@ class RegistryData:
         - 接尾辞: "027-partial" → Feature 027 マッチ
         - null/非数値("cloud-tts") → スキップ
         """
-        num = self._extract_feature_num(feature_id)
-        if not num:
-            return None
-        for feat in self.features:
-            if self._coverage_matches(feat, num):
-                return feat
-        return None
+        matches = self.get_all_matching_features(feature_id)
+        return matches[0] if matches else None
 
-    @staticmethod
-    def _coverage_matches(feat: dict, target_num: str) -> bool:
+    @classmethod
+    def _coverage_matches(cls, feat: dict, target_num: str) -> bool:
         """hackathon_project_coverage フィールドがtarget_numとマッチするか確認。"""
-        coverage = feat.get("hackathon_project_coverage")
-        if not coverage or not isinstance(coverage, str):
-            return False
-        # カンマ区切り複数値処理
-        for part in coverage.split(","):
-            part = part.strip()
-            if not part:
-                continue
-            # 数字プレフィックス抽出 (例: "027-partial" → "027")
-            match = re.match(r'(\d+)', part)
-            if match and match.group(1).lstrip("0") == target_num:
-                return True
-        return False
+        return target_num in cls._coverage_nums(feat)
 
     def get_all_matching_features(self, feature_id: str) -> list[dict]:
         """Feature IDにマッチするすべてのregistry項目を返却。
@@ -293,7 +697,7 @@ class RegistryData:
         num = self._extract_feature_num(feature_id)
         if not num:
             return []
-        return [f for f in self.features if self._coverage_matches(f, num)]
+        return list(self._coverage_index.get(num, ()))
 
 
     def get_opportunity_score(self, feature_id: str) -> Optional[float]:
@@ -317,24 +721,37 @@ class GapData:
     """gap-candidates.json データ。"""
     def __init__(self):
         self.candidates: list[dict] = []
+        self._candidate_index: dict[str, dict] = {}
         self._load()
 
     def _load(self):
         if not GAP_CANDIDATES_PATH.exists():
             return
-        data = json.loads(GAP_CANDIDATES_PATH.read_text(encoding="utf-8"))
+        data = load_json(GAP_CANDIDATES_PATH)
         self.candidates = data.get("candidates", [])
+        self._build_candidate_index()
+
+    def _build_candidate_index(self):
+        """Feature番号(先頭ゼロ除去) → gap candidate インデックスを構築。
+
+        同一番号に複数candidateがある場合は先頭(ファイル出現順)を採用。
+        """
+        index: dict[str, dict] = {}
+        for c in self.candidates:
+            existing_id = c.get("existing_feature_id", "")
+            if not existing_id or not isinstance(existing_id, str):
+                continue
+            num = existing_id.lstrip("0")
+            if num:
+                index.setdefault(num, c)
+        self._candidate_index = index
 
     def _find_candidate(self, feature_id: str) -> Optional[dict]:
         """Feature IDにマッチするgap candidateを返却。"""
         num = feature_id.split("-")[0].lstrip("0")
         if not num:
             return None
-        for c in self.candidates:
-            existing_id = c.get("existing_feature_id", "")
-            if existing_id and existing_id.lstrip("0") == num:
-                return c
-        return None
+        return self._candidate_index.get(num)
 
     def get_gap_severity(self, feature_id: str) -> Optional[str]:
         """Featureに関連するgap severityを返却。"""
@@ -380,6 +797,24 @@ def _normalize_manual_override(raw: Any) -> dict:
 
 # ── RICE Component Calculators ────────────────────────────────────────────
 
+def core_goal_user_scope(core_goal: str) -> int:
+    """Core goalのターゲットユーザー範囲 (calc_reach user_scope: 9/7/3/5)。"""
+    if re.search(r'(すべての\s*ユーザー|全体|all\s*user|every)', core_goal, re.I):
+        return 9
+    if re.search(r'(大半|most|多くの)', core_goal, re.I):
+        return 7
+    if re.search(r'(特定|specific|niche)', core_goal, re.I):
+        return 3
+    return 5
+
+
+def core_goal_impact_level(core_goal: str) -> float:
+    """Core goalキーワードによるImpact基本レベル (calc_impact: 2.0/1.0)。"""
+    if re.search(r'(核心|critical|必須|ゲーム\s*チェンジャー|game.changer|収益|monetiz)', core_goal, re.I):
+        return 2.0
+    return 1.0
+
+
 def calc_reach(brief: BriefData, context: ContextData) -> dict:
     """Reachスコア算出 (1-10) — 純粋RICE、独立加重合計。
 
@@ -391,14 +826,7 @@ def calc_reach(brief: BriefData, context: ContextData) -> dict:
     # 1. Target user scope (ウェイト 0.40) — BRIEF.md §1
     if brief.exists and brief.core_goal:
         core_goal = brief.core_goal
-        if re.search(r'(すべての\s*ユーザー|全体|all\s*user|every)', core_goal, re.I):
-            user_scope = 9
-        elif re.search(r'(大半|most|多くの)', core_goal, re.I):
-            user_scope = 7
-        elif re.search(r'(特定|specific|niche)', core_goal, re.I):
-            user_scope = 3
-        else:
-            user_scope = 5
+        user_scope = core_goal_user_scope(core_goal)
         evidence["target_user_scope"] = {"value": core_goal[:100], "source": "BRIEF.md §1"}
     else:
         user_scope = 5
@@ -433,7 +861,9 @@ def calc_reach(brief: BriefData, context: ContextData) -> dict:
     evidence["progress_adjustment"] = {"value": progress, "source": "CONTEXT.json progress"}
 
     # 独立加重合計
-    score = user_scope * 0.40 + biz_score * 0.35 + progress_factor * 0.25
+    score = (user_scope * REACH_WEIGHTS["user_scope"]
+             + biz_score * REACH_WEIGHTS["business_metrics"]
+             + progress_factor * REACH_WEIGHTS["progress"])
 
     # 完了機能の強制override
     if progress >= 100:
@@ -479,12 +909,7 @@ def calc_impact(brief: BriefData, context: ContextData,
 
     # 2. Core goalキーワード → 基本レベル設定
     core_goal = brief.core_goal if brief.exists else ""
-    if re.search(r'(核心|critical|必須|ゲーム\s*チェンジャー|game.changer|収益|monetiz)', core_goal, re.I):
-        raw_score = 2.0
-    elif re.search(r'(重要|important|改善|improv)', core_goal, re.I):
-        raw_score = 1.0
-    else:
-        raw_score = 1.0
+    raw_score = core_goal_impact_level(core_goal)
     evidence["core_goal"] = {"value": core_goal[:100] if core_goal else "N/A", "source": "BRIEF.md §1"}
 
     # 3. LTVキーワード → 最低保証 (floor役割のみ、既存の高い値を維持)
@@ -756,7 +1181,8 @@ def calc_competitive_adjustment(registry: RegistryData, gaps: GapData,
         adjustment = 1.0
 
     # 範囲制限 0.8-1.3
-    adjustment = round(max(0.8, min(1.3, adjustment)), 3)
+    lower, upper = COMPETITIVE_ADJUSTMENT_BOUNDS
+    adjustment = round(max(lower, min(upper, adjustment)), 3)
 
     return {
         "adjustment": adjustment,
@@ -819,8 +1245,116 @@ def compose_final_score(rice: dict, competitive_adj: dict,
     }
 
 
+def score_tier(score: float) -> str:
+    """adjusted_score → 優先度Tier (T1~T4)。"""
+    for tier, threshold in TIER_THRESHOLDS:
+        if score >= threshold:
+            return tier
+    return "T4"
+
+
+# ── Priority History ──────────────────────────────────────────────────────
+
+def _history_line(entry: Any) -> bytes:
+    """アーカイブ1行分の正規化JSON (重複判定にも使用)。"""
+    return json.dumps(entry, ensure_ascii=False, sort_keys=True).encode("utf-8")
+
+
+def _tail_lines(path: Path, count: int) -> list[bytes]:
+    """ファイル末尾から最大count行を読み込む (アーカイブ全体は読まない)。"""
+    if count <= 0 or not path.exists():
+        return []
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= count:
+            step = min(8192, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = buf.split(b"\n")
+    if pos > 0:
+        lines = lines[1:]  # 先頭は途中から読んだ行
+    return [line.strip() for line in lines if line.strip()][-count:]
+
+
+def _archive_overlap(tail: list[bytes], lines: list[bytes]) -> int:
+    """アーカイブ末尾とlines先頭の最長一致数 (中断時の二重アーカイブ検出)。"""
+    for k in range(min(len(tail), len(lines)), 0, -1):
+        if tail[-k:] == lines[:k]:
+            return k
+    return 0
+
+
+def compact_priority_history(priority: dict, limit: int) -> list:
+    """インライン履歴を直近limit件に切り詰め、溢れた古いエントリを返す。"""
+    history = priority.get("history")
+    if not isinstance(history, list) or limit < 0 or len(history) <= limit:
+        return []
+    cut = len(history) - limit
+    priority["history"] = history[cut:]
+    return history[:cut]
+
+
+def stage_history_archive(feature_dir: Path, entries: list, writer: WriteBatch) -> int:
+    """溢れた履歴をアーカイブへの追記として予約。予約件数を返す。
+
+    前回実行がアーカイブ追記後・CONTEXT.json置換前に中断された場合、
+    同じエントリがアーカイブ末尾に既に存在するため再追記しない。
+    """
+    if not entries:
+        return 0
+    path = feature_dir / PRIORITY_HISTORY_ARCHIVE
+    lines = [_history_line(e) for e in entries]
+    fresh = lines[_archive_overlap(_tail_lines(path, len(lines)), lines):]
+    if fresh:
+        writer.stage_append(path, b"".join(line + b"\n" for line in fresh))
+    return len(fresh)
+
+
+def iter_priority_history(feature_dir: Path, data: Optional[dict] = None):
+    """アーカイブ + インラインの全履歴を古い順にストリーミング。
+
+    data省略時はCONTEXT.jsonを読み込む。アーカイブの破損行はスキップする。
+    """
+    if data is None:
+        context_path = feature_dir / "CONTEXT.json"
+        data = load_json(context_path) if context_path.exists() else {}
+    inline = data.get("priority", {}).get("history") or []
+
+    # アーカイブ末尾 == インライン先頭 (中断による重複) を除外するため末尾を保持
+    recent: deque = deque(maxlen=len(inline))
+    path = feature_dir / PRIORITY_HISTORY_ARCHIVE
+    if path.exists():
+        with open(path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json_codec.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                recent.append(_history_line(entry))
+                yield entry
+
+    overlap = _archive_overlap(list(recent), [_history_line(e) for e in inline])
+    yield from inline[overlap:]
+
+
 # ── File Processing ───────────────────────────────────────────────────────
 
+def discover_feature_dirs(feature_filter: Optional[str] = None) -> list[Path]:
+    """CONTEXT.jsonを持つFeatureディレクトリ一覧 (feature_filter: ID部分一致)。"""
+    feature_dirs = sorted([d for d in FEATURES_DIR.iterdir()
+                           if d.is_dir() and (d / "CONTEXT.json").exists()])
+    if feature_filter:
+        keyword = feature_filter.lstrip("0")
+        feature_dirs = [d for d in feature_dirs if keyword in d.name]
+    return feature_dirs
+
+
 def find_spec_path(feature_dir: Path) -> Optional[Path]:
     """FeatureディレクトリからSPECファイルを検索。"""
     specs = list(feature_dir.glob("SPEC*.md"))
@@ -828,8 +1362,30 @@ def find_spec_path(feature_dir: Path) -> Optional[Path]:
 
 
 def process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
-                    new_phase: Optional[str], apply: bool, verbose: bool) -> dict:
-    """単一Feature処理 (v2: competitive_adjustment + compose_final_score)。"""
+                    new_phase: Optional[str], apply: bool, verbose: bool,
+                    parse_cache: Optional[ParseCache] = None,
+                    writer: Optional[WriteBatch] = None,
+                    history_limit: Optional[int] = None,
+                    profiler: Optional[StageProfiler] = None) -> dict:
+    """単一Feature処理 (v2: competitive_adjustment + compose_final_score)。
+
+    apply時の書き戻しは writer に予約される (None なら即時アトミック書き込み)。
+    history_limit指定時は priority.history を直近N件に圧縮し、
+    溢れた古いエントリを priority-history.jsonl へ移す (スコア不変でも実施)。
+    profiler指定時はステージ別 (読み込み/パース/calc_*/直列化/書き込み) の時間を記録。
+    """
+    if profiler is None:
+        return _process_feature(feature_dir, registry, gaps, new_phase, apply, verbose,
+                                parse_cache, writer, history_limit, NULL_PROFILER)
+    with profiler.feature(feature_dir.name):
+        return _process_feature(feature_dir, registry, gaps, new_phase, apply, verbose,
+                                parse_cache, writer, history_limit, profiler)
+
+
+def _process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
+                     new_phase: Optional[str], apply: bool, verbose: bool,
+                     parse_cache: Optional[ParseCache], writer: Optional[WriteBatch],
+                     history_limit: Optional[int], prof) -> dict:
     feature_id = feature_dir.name
     context_path = feature_dir / "CONTEXT.json"
     result = {
@@ -844,23 +1400,29 @@ def process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
         return result
 
     try:
-        data = json.loads(context_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError) as e:
+        # コーパスキャッシュ経由 (同一プロセス内で未変更なら再パースなし)。書き換えるため複製
+        with prof.stage("read_context"):
+            data = load_json(context_path, mutable=True)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
         result["status"] = "error"
         result["diffs"].append(f"JSON読み込み失敗: {e}")
         return result
 
     # Lifecycleフィルター: Archived/Failed FeatureはRICE計算対象から除外
-    from feature_lifecycle import is_active
-    if not is_active(data):
+    with prof.stage("lifecycle_filter"):
+        from feature_lifecycle import is_active
+        active = is_active(data)
+    if not active:
         lifecycle_state = data.get("quick_resume", {}).get("current_state", "unknown")
         result["status"] = "skipped"
         result["diffs"].append(f"非アクティブFeature ({lifecycle_state})")
         return result
 
-    # データソース読み込み
-    brief = BriefData(feature_dir / "BRIEF.md")
-    spec = SpecData(find_spec_path(feature_dir))
+    # データソース読み込み (パースキャッシュヒット時は読み込み+ハッシュのみ)
+    with prof.stage("parse_brief"):
+        brief = BriefData(feature_dir / "BRIEF.md", cache=parse_cache)
+    with prof.stage("parse_spec"):
+        spec = SpecData(find_spec_path(feature_dir), cache=parse_cache)
     context = ContextData(data)
 
     # 既存スコアの保存
@@ -871,25 +1433,32 @@ def process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
 
     # Phase 決定
     phase = new_phase or old_priority.get("phase", "mvp")
+    result["phase"] = old_priority.get("phase", "mvp")
+    result["last_updated"] = old_priority.get("last_updated")
 
     # RICEコンポーネント計算 (v2: registry/gapsをcalc_reach/calc_impactから除去)
-    reach = calc_reach(brief, context)
-    impact = calc_impact(brief, context, gaps)
-    confidence = calc_confidence(brief, spec, context)
-    effort = calc_effort(brief, spec, context)
+    with prof.stage("calc_reach"):
+        reach = calc_reach(brief, context)
+    with prof.stage("calc_impact"):
+        impact = calc_impact(brief, context, gaps)
+    with prof.stage("calc_confidence"):
+        confidence = calc_confidence(brief, spec, context)
+    with prof.stage("calc_effort"):
+        effort = calc_effort(brief, spec, context)
 
     # 純粋RICE Score
-    rice = calc_rice_score(reach, impact, confidence, effort)
+    with prof.stage("calc_rice_score"):
+        rice = calc_rice_score(reach, impact, confidence, effort)
 
     # Competitive Adjustment (別途post-multiplier)
-    comp_adj = calc_competitive_adjustment(registry, gaps, context)
-
-    # Manual override 正規化
-    raw_override = old_priority.get("manual_override", 1.0)
-    manual_override = _normalize_manual_override(raw_override)
-
-    # 最終スコア合成
-    calculated = compose_final_score(rice, comp_adj, manual_override)
+    with prof.stage("calc_competitive_adjustment"):
+        comp_adj = calc_competitive_adjustment(registry, gaps, context)
+
+    # Manual override 正規化 + 最終スコア合成
+    with prof.stage("compose_final_score"):
+        raw_override = old_priority.get("manual_override", 1.0)
+        manual_override = _normalize_manual_override(raw_override)
+        calculated = compose_final_score(rice, comp_adj, manual_override)
     result["new_score"] = calculated["adjusted_score"]
 
     # data_sources_read 生成
@@ -900,10 +1469,11 @@ def process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
     if spec.exists:
         data_sources.append(f"SPEC.md (date: {now_str})")
     data_sources.append(f"CONTEXT.json (date: {now_str})")
-    if REGISTRY_PATH.exists():
-        data_sources.append(f"competitor-registry.json (date: {now_str})")
-    if GAP_CANDIDATES_PATH.exists():
-        data_sources.append(f"gap-candidates.json (date: {now_str})")
+    with prof.stage("stat_sources"):
+        if REGISTRY_PATH.exists():
+            data_sources.append(f"competitor-registry.json (date: {now_str})")
+        if GAP_CANDIDATES_PATH.exists():
+            data_sources.append(f"gap-candidates.json (date: {now_str})")
 
     # AI rationale 生成
     rationale_parts = [
@@ -951,6 +1521,12 @@ def process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
 
     if not diffs:
         result["status"] = "unchanged"
+        if history_limit is not None and isinstance(old_priority, dict):
+            overflow = compact_priority_history(old_priority, history_limit)
+            if overflow:
+                result["archived"] = len(overflow)
+                if apply:
+                    _write_context(feature_dir, data, overflow, writer, prof)
         return result
 
     # history 追加
@@ -970,18 +1546,240 @@ def process_feature(feature_dir: Path, registry: RegistryData, gaps: GapData,
         "notes": "; ".join(diffs),
     })
 
+    overflow = []
+    if history_limit is not None:
+        overflow = compact_priority_history(new_priority, history_limit)
+        if overflow:
+            result["archived"] = len(overflow)
+
     data["priority"] = new_priority
     result["status"] = "updated"
 
     if apply:
-        context_path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2) + "\n",
-            encoding="utf-8"
-        )
+        _write_context(feature_dir, data, overflow, writer, prof)
+        # 結果はディスク上の状態を表す (dry-run では旧値のまま)
+        result["phase"] = phase
+        result["last_updated"] = now_iso
 
     return result
 
 
+def _write_context(feature_dir: Path, data: dict, overflow: list,
+                   writer: Optional[WriteBatch], prof=NULL_PROFILER) -> None:
+    """CONTEXT.jsonの書き戻し予約 (溢れた履歴はアーカイブ追記を先に予約)。"""
+    if writer is None:
+        batch = WriteBatch()
+        _write_context(feature_dir, data, overflow, batch, prof)
+        with prof.stage("write_commit"):
+            batch.commit()
+        return
+    with prof.stage("serialize"):
+        content = dump_json_bytes(data)
+    with prof.stage("write_stage"):
+        stage_history_archive(feature_dir, overflow, writer)
+        writer.stage(feature_dir / "CONTEXT.json", content)
+
+
+# ── Parallel Processing ───────────────────────────────────────────────────
+
+# ワーカープロセス側の共有データソース (initializerで1回だけ設定)
+_WORKER_REGISTRY: Optional[RegistryData] = None
+_WORKER_GAPS: Optional[GapData] = None
+_WORKER_CACHE: Optional[ParseCache] = None
+_WORKER_PROFILER: Optional[StageProfiler] = None
+
+
+def _init_worker(registry: RegistryData, gaps: GapData,
+                 parse_cache: Optional[ParseCache], profile: bool = False) -> None:
+    """ワーカー初期化。RegistryData/GapData/ParseCacheをプロセスごとに1回だけ受け取る。"""
+    global _WORKER_REGISTRY, _WORKER_GAPS, _WORKER_CACHE, _WORKER_PROFILER
+    _WORKER_REGISTRY = registry
+    _WORKER_GAPS = gaps
+    _WORKER_CACHE = parse_cache
+    _WORKER_PROFILER = StageProfiler() if profile else None
+
+
+def _process_feature_worker(args: tuple) -> tuple[dict, Optional[dict], dict, list]:
+    """ワーカー側エントリーポイント。結果・パースキャッシュ差分・書き込み予約・計測レコードを返却。
+
+    書き込みは親プロセスの WriteBatch でまとめて行う (fsync を1回に集約)。
+    """
+    feature_dir, new_phase, apply, verbose, history_limit = args
+    writer = WriteBatch()
+    result = process_feature(feature_dir, _WORKER_REGISTRY, _WORKER_GAPS,
+                             new_phase, apply, verbose, parse_cache=_WORKER_CACHE,
+                             writer=writer, history_limit=history_limit,
+                             profiler=_WORKER_PROFILER)
+    cache_delta = _WORKER_CACHE.drain() if _WORKER_CACHE is not None else None
+    records = _WORKER_PROFILER.drain() if _WORKER_PROFILER is not None else []
+    return result, cache_delta, writer.drain(), records
+
+
+def run_features(feature_dirs: list[Path], registry: RegistryData, gaps: GapData,
+                 new_phase: Optional[str], apply: bool, verbose: bool,
+                 jobs: int = 1, parse_cache: Optional[ParseCache] = None,
+                 history_limit: Optional[int] = None,
+                 profiler: Optional[StageProfiler] = None,
+                 writer: Optional[WriteBatch] = None) -> list[dict]:
+    """全Featureをスコアリング。jobs > 1 ならプロセスプールで並列実行。
+
+    結果は常にfeature_dirsの順序で返却されるため、シリアル実行と同一の出力になる。
+    apply時の書き戻しは全Feature処理後に1バッチでコミットする (中断時は何も書かない)。
+    profiler指定時はワーカー分も含め全Featureの計測レコードを集約する。
+    writer指定時はそのバッチでコミットする (呼び出し側で writer.written を参照可能)。
+    """
+    writer = writer if writer is not None else WriteBatch()
+    try:
+        results = _run_features(feature_dirs, registry, gaps, new_phase, apply, verbose,
+                                jobs, parse_cache, writer, history_limit, profiler)
+    except BaseException:
+        writer.abort()
+        raise
+    with (profiler or NULL_PROFILER).stage("write_commit"):
+        writer.commit()
+    return results
+
+
+def _run_features(feature_dirs: list[Path], registry: RegistryData, gaps: GapData,
+                  new_phase: Optional[str], apply: bool, verbose: bool,
+                  jobs: int, parse_cache: Optional[ParseCache],
+                  writer: WriteBatch, history_limit: Optional[int],
+                  profiler: Optional[StageProfiler]) -> list[dict]:
+    if jobs <= 1 or len(feature_dirs) <= 1:
+        return [process_feature(fd, registry, gaps, new_phase, apply, verbose,
+                                parse_cache=parse_cache, writer=writer,
+                                history_limit=history_limit, profiler=profiler)
+                for fd in feature_dirs]
+
+    workers = min(jobs, len(feature_dirs))
+    tasks = [(fd, new_phase, apply, verbose, history_limit) for fd in feature_dirs]
+    # チャンク単位で配布しIPCオーバーヘッドを抑制
+    chunksize = max(1, len(tasks) // (workers * 4))
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(registry, gaps, parse_cache,
+                                       profiler is not None)) as executor:
+        for result, cache_delta, pending, records in executor.map(
+                _process_feature_worker, tasks, chunksize=chunksize):
+            if cache_delta is not None:
+                parse_cache.absorb(cache_delta)
+            writer.absorb(pending)
+            if profiler is not None:
+                profiler.absorb(records)
+            results.append(result)
+    return results
+
+
+# ── Watch Mode ────────────────────────────────────────────────────────────
+
+# Feature ディレクトリ内で再スコアリングの契機となるファイル
+WATCH_FEATURE_FILES = ("BRIEF.md", "CONTEXT.json")
+WATCH_FEATURE_GLOB = "SPEC*.md"
+
+
+def is_watch_relevant(path: Path) -> bool:
+    """監視対象か: docs/features/*/{BRIEF.md,SPEC*.md,CONTEXT.json}, 分析JSON, Featureディレクトリ自体。"""
+    if path in (REGISTRY_PATH, GAP_CANDIDATES_PATH):
+        return True
+    if path.parent == FEATURES_DIR:
+        # Featureディレクトリの削除/リネーム (inotify はディレクトリ単位で通知)
+        return not path.suffix
+    if path.parent.parent != FEATURES_DIR:
+        return False
+    return path.name in WATCH_FEATURE_FILES or path.match(WATCH_FEATURE_GLOB)
+
+
+def classify_changes(paths: set[Path]) -> tuple[bool, list[Path]]:
+    """変更パス → (データソース再読み込み要否, 再スコアリング対象Featureディレクトリ)。"""
+    from file_watcher import OVERFLOW
+
+    reload_sources = any(p in (REGISTRY_PATH, GAP_CANDIDATES_PATH) for p in paths)
+    if OVERFLOW in paths:
+        return True, []
+    feature_dirs = {p if p.parent == FEATURES_DIR else p.parent
+                    for p in paths if p.parent == FEATURES_DIR or p.parent.parent == FEATURES_DIR}
+    return reload_sources, sorted(feature_dirs)
+
+
+def watch_features(args, registry: RegistryData, gaps: GapData, jobs: int,
+                   parse_cache: Optional[ParseCache], max_cycles: Optional[int] = None, watcher=None) -> None:
+    """--watch: 変更されたFeatureのみ再スコアリングし続ける。
+
+    RegistryData/GapData はメモリ上に保持し、分析JSONの変更時のみ再読み込み + 全Feature再計算。
+    --apply による CONTEXT.json の書き戻しは watcher に記録し、自己イベントとして無視する。
+    max_cycles / watcher はテスト用 (None なら Ctrl-C まで継続)。
+    """
+    from file_watcher import create_watcher
+
+    if watcher is None:
+        watcher = create_watcher([(FEATURES_DIR, 1), (REGISTRY_PATH.parent, 0)],
+                                 accept=is_watch_relevant, debounce=args.watch_debounce,
+                                 polling=args.watch_poll)
+
+    def rescore(feature_dirs: list[Path], full: bool) -> list[dict]:
+        writer = WriteBatch()
+        results = run_features(feature_dirs, registry, gaps, args.set_phase, args.apply,
+                               args.verbose, jobs=jobs if full else 1, parse_cache=parse_cache,
+                               history_limit=args.history_limit, writer=writer)
+        watcher.expect_writes(writer.written)
+        if parse_cache is not None:
+            try:
+                parse_cache.save()
+            except OSError as e:
+                print(f"WARNING: パースキャッシュ保存失敗: {e}", file=sys.stderr)
+        if not args.no_index:
+            from priority_index import update_priority_index
+            try:
+                update_priority_index(results, applied=args.apply, full=full and not args.feature)
+            except OSError as e:
+                print(f"WARNING: 順位インデックス保存失敗: {e}", file=sys.stderr)
+        _print_watch_results(results, args.apply)
+        return results
+
+    stamp = datetime.now().strftime("%H:%M:%S")
+    print(f"[{stamp}] watch ({watcher.backend}, {'APPLY' if args.apply else 'DRY RUN'}) — "
+          f"初回全体スコアリング", flush=True)
+    rescore(discover_feature_dirs(args.feature), full=True)
+
+    cycles = 0
+    try:
+        while max_cycles is None or cycles < max_cycles:
+            changed = watcher.wait()
+            cycles += 1
+            reload_sources, feature_dirs = classify_changes(changed)
+            stamp = datetime.now().strftime("%H:%M:%S")
+            if reload_sources:
+                registry, gaps = RegistryData(), GapData()
+                print(f"[{stamp}] データソース変更 — 全Feature再スコアリング", flush=True)
+                rescore(discover_feature_dirs(args.feature), full=True)
+                continue
+            if args.feature:
+                keyword = args.feature.lstrip("0")
+                feature_dirs = [d for d in feature_dirs if keyword in d.name]
+            if not feature_dirs:
+                continue
+            print(f"[{stamp}] 変更: {', '.join(d.name for d in feature_dirs)}", flush=True)
+            rescore(feature_dirs, full=False)
+    except KeyboardInterrupt:
+        print("\nwatch 終了")
+    finally:
+        watcher.close()
+
+
+def _print_watch_results(results: list[dict], applied: bool) -> None:
+    for r in results:
+        if r["status"] == "updated":
+            mark = "" if applied else " (dry-run)"
+            print(f"  {r['id']:45s} {r['old_score']:6.2f} → {r['new_score']:6.2f}{mark}")
+        elif r["status"] == "error":
+            print(f"  {r['id']}: ERROR {'; '.join(r['diffs'])}")
+        elif r["status"] == "skipped":
+            print(f"  {r['id']}: skipped ({'; '.join(r['diffs'])})")
+    counts = {s: sum(1 for r in results if r["status"] == s)
+              for s in ("updated", "unchanged", "skipped", "error")}
+    print("  " + ", ".join(f"{n} {s}" for s, n in counts.items()), flush=True)
+
+
 # ── Main ──────────────────────────────────────────────────────────────────
 
 def main():
@@ -993,34 +1791,103 @@ def main():
                         help="Phase変更")
     parser.add_argument("--verbose", action="store_true", help="詳細出力")
     parser.add_argument("--json-output", action="store_true", help="JSON形式出力")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="並列ワーカー数 (0 = CPU数, デフォルト: 1 = シリアル)")
+    parser.add_argument("--no-parse-cache", action="store_true",
+                        help="BRIEF/SPECパースキャッシュを使用しない")
+    parser.add_argument("--no-index", action="store_true",
+                        help="順位インデックス (priority_index.py) を更新しない")
+    parser.add_argument("--history-limit", type=int, default=None, metavar="N",
+                        help=f"priority.historyを直近N件に圧縮 (古い分は{PRIORITY_HISTORY_ARCHIVE}へ)")
+    parser.add_argument("--profile", action="store_true",
+                        help="ステージ別 wall/CPU 時間を計測 (--json-output 時は profile キーに出力)")
+    parser.add_argument("--profile-output", type=Path, metavar="PATH",
+                        help="計測結果 (Feature別レコード含む) をJSONファイルに保存 (--profile を含意)")
+    parser.add_argument("--cprofile", type=Path, metavar="PATH",
+                        help="cProfile統計をダンプ (pstats形式, --jobs > 1 では親プロセスのみ)")
+    parser.add_argument("--watch", action="store_true",
+                        help="BRIEF/SPEC/CONTEXT・分析JSONを監視し、変更Featureのみ再スコアリング")
+    parser.add_argument("--watch-debounce", type=float, default=0.3, metavar="SEC",
+                        help="--watch のイベント集約時間 (デフォルト: 0.3秒)")
+    parser.add_argument("--watch-poll", action="store_true",
+                        help="--watch で inotify を使わずポーリング監視")
+    add_scope_arguments(parser)
     args = parser.parse_args()
+    scope = scope_from_args(args, parser)
+
+    if args.history_limit is not None and args.history_limit < 0:
+        parser.error("--history-limit は0以上を指定してください")
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
 
     if not FEATURES_DIR.exists():
         print(f"ERROR: {FEATURES_DIR} パスが見つかりません", file=sys.stderr)
         sys.exit(1)
 
+    profiler = StageProfiler() if (args.profile or args.profile_output) else None
+    prof = profiler or NULL_PROFILER
+    cprof = None
+    if args.cprofile:
+        import cProfile
+        cprof = cProfile.Profile()
+        cprof.enable()
+
     # 共有データソースのロード
-    registry = RegistryData()
-    gaps = GapData()
+    with prof.stage("load_sources"):
+        registry = RegistryData()
+        gaps = GapData()
 
     # Feature一覧
-    feature_dirs = sorted([d for d in FEATURES_DIR.iterdir()
-                           if d.is_dir() and (d / "CONTEXT.json").exists()])
-    if args.feature:
-        keyword = args.feature.lstrip("0")
-        feature_dirs = [d for d in feature_dirs if keyword in d.name]
-        if not feature_dirs:
-            print(f"ERROR: '{args.feature}'にマッチするFeatureなし", file=sys.stderr)
-            sys.exit(1)
-
-    results = []
-    for fd in feature_dirs:
-        r = process_feature(fd, registry, gaps, args.set_phase, args.apply, args.verbose)
-        results.append(r)
+    with prof.stage("discover"):
+        feature_dirs = discover_feature_dirs(args.feature)
+        # 分析JSON (全Featureのスコア入力) の変更時は絞り込まない
+        partial = scope is not None and not (scope.full or scope.touches(REGISTRY_PATH, GAP_CANDIDATES_PATH))
+        if partial:
+            feature_dirs = scope.filter_dirs(feature_dirs)
+    if args.feature and not feature_dirs:
+        print(f"ERROR: '{args.feature}'にマッチするFeatureなし", file=sys.stderr)
+        sys.exit(1)
 
-    # JSON出力
+    with prof.stage("load_parse_cache"):
+        parse_cache = None if args.no_parse_cache else ParseCache(PARSE_CACHE_PATH)
+    if args.watch:
+        watch_features(args, registry, gaps, jobs, parse_cache)
+        return
+    with prof.stage("run_features"):
+        results = run_features(feature_dirs, registry, gaps, args.set_phase,
+                               args.apply, args.verbose, jobs=jobs, parse_cache=parse_cache,
+                               history_limit=args.history_limit, profiler=profiler)
+    if parse_cache is not None:
+        try:
+            with prof.stage("save_parse_cache"):
+                parse_cache.save()
+        except OSError as e:
+            print(f"WARNING: パースキャッシュ保存失敗: {e}", file=sys.stderr)
+
+    # 順位インデックス更新 (--feature 指定時は差分マージ)
+    if not args.no_index:
+        from priority_index import update_priority_index
+        try:
+            with prof.stage("update_index"):
+                update_priority_index(results, applied=args.apply, full=not (args.feature or partial))
+        except OSError as e:
+            print(f"WARNING: 順位インデックス保存失敗: {e}", file=sys.stderr)
+
+    if cprof is not None:
+        cprof.disable()
+        cprof.dump_stats(str(args.cprofile))
+
+    profile_summary = None
+    if profiler is not None:
+        profile_summary = profiler.summary()
+        if args.profile_output:
+            args.profile_output.write_bytes(json_codec.dump_bytes(
+                {**profile_summary, "records": profiler.feature_records()}, newline=True))
+
+    # JSON出力 (--profile 時は {"results", "profile"})
     if args.json_output:
-        print(json.dumps(results, ensure_ascii=False, indent=2))
+        output = results if profile_summary is None else {"results": results, "profile": profile_summary}
+        print(json_codec.dumps(output))
         return
 
     # テキスト出力
@@ -1035,6 +1902,12 @@ def main():
     print(f"対象: {len(results)} Features | Phase: {args.set_phase or '(維持)'}")
     print(f"結果: {len(updated)} updated, {len(unchanged)} unchanged, "
           f"{len(skipped)} skipped, {len(errors)} errors")
+    archived = sum(r.get("archived", 0) for r in results)
+    if archived:
+        print(f"履歴アーカイブ: {archived} entries → {PRIORITY_HISTORY_ARCHIVE}"
+              f"{'' if args.apply else ' (dry-run)'}")
+    if args.verbose and parse_cache is not None:
+        print(parse_cache.summary())
     print()
 
     if updated:
@@ -1064,12 +1937,15 @@ def main():
     if ranked and len(ranked) > 5:
         print(f"\n── Top 10 RICE ──")
         for i, r in enumerate(ranked[:10], 1):
-            tier = ("T1" if r["new_score"] >= 5.0
-                    else "T2" if r["new_score"] >= 2.0
-                    else "T3" if r["new_score"] >= 1.0
-                    else "T4")
+            tier = score_tier(r["new_score"])
             print(f"  #{i:2d} [{tier}] {r['id']:45s} {r['new_score']:6.2f}")
 
+    if profile_summary is not None:
+        print()
+        print(format_report(profile_summary))
+    if args.cprofile:
+        print(f"\ncProfile: {args.cprofile} (python3 -m pstats {args.cprofile})")
+
     sys.exit(1 if errors else 0)
 
 
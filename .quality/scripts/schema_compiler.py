@@ -0,0 +1,716 @@
+#!/usr/bin/env python3
+"""
+schema_compiler.py — JSON Schema → 専用 Python 検証コードのコンパイラ (fastjsonschema 方式).
+
+jsonschema の Validator はキーワードごとに汎用ディスパッチを行うため、
+CONTEXT.json を全 Feature 分検証するような用途では遅い。本モジュールは
+スキーマ (Draft 2020-12) から検証関数の Python ソースを生成し、
+.quality/cache/schemas/ にスキーマハッシュをキーとして保存する
+(2回目以降はソース生成を省略し、バイトコードも __pycache__ で再利用)。
+
+- エラーは jsonschema.iter_errors と同一のパス・メッセージ・キーワード
+  (additionalProperties にスキーマを指定した場合の順序のみ: jsonschema は set 順, 本実装はインスタンス順)
+- best_match() は jsonschema.exceptions.best_match と同じ関連度で選択
+- format はアノテーション扱い (jsonschema の既定: format_checker なしと同一)
+- 未対応キーワード (anyOf, oneOf, if, prefixItems 等) や外部 $ref を含むスキーマは
+  SchemaCompileError → get_validator() は jsonschema にフォールバック
+
+Usage:
+    from schema_compiler import get_validator, load_validator
+
+    validator = load_validator(SCHEMA_PATH)          # ファイル (stat 不変ならメモ化)
+    validator = get_validator(schema_dict)           # dict
+    for error in validator.iter_errors(data):
+        error.absolute_path, error.message, error.validator
+    error = validator.best_match(data)               # 最も有用な1件 (なければ None)
+
+    python3 schema_compiler.py SCHEMA [INSTANCE ...]  # 検証
+    python3 schema_compiler.py SCHEMA --source        # 生成コードを表示
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import numbers
+import os
+import re
+import sys
+import threading
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional, Union
+from urllib.parse import unquote
+
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+from atomic_write import write_bytes_atomic  # noqa: E402
+
+try:
+    import jsonschema
+
+    HAS_JSONSCHEMA = True
+except ImportError:
+    HAS_JSONSCHEMA = False
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+SCHEMA_CACHE_DIR = PROJECT_ROOT / ".quality" / "cache" / "schemas"
+
+# 生成コードの形式が変わったら上げる (キャッシュ済みソースが自動的に再生成される)
+COMPILER_VERSION = 1
+
+SUPPORTED_DRAFTS = {
+    None,
+    "https://json-schema.org/draft/2020-12/schema",
+    "https://json-schema.org/draft/2020-12/schema#",
+}
+
+# Draft 2020-12 の検証キーワードのうち未対応のもの (含まれていればフォールバック)
+UNSUPPORTED_KEYWORDS = {
+    "anyOf", "oneOf", "if", "contains", "prefixItems", "propertyNames", "multipleOf",
+    "dependentRequired", "dependentSchemas", "unevaluatedItems", "unevaluatedProperties",
+    "$dynamicRef", "$recursiveRef",
+}
+
+# jsonschema.exceptions.WEAK_MATCHES / STRONG_MATCHES と同一
+WEAK_MATCHES = frozenset({"anyOf", "oneOf"})
+STRONG_MATCHES: frozenset = frozenset()
+
+
+class SchemaCompileError(ValueError):
+    """コンパイル不可 (未対応キーワード・不正なスキーマ)。"""
+
+
+class SchemaViolation(NamedTuple):
+    """検証エラー (jsonschema.ValidationError の path/message/validator に対応)。"""
+
+    path: tuple
+    message: str
+    validator: Optional[str]
+    matches_type: bool = False
+
+    @property
+    def absolute_path(self) -> tuple:
+        return self.path
+
+
+def relevance(error: SchemaViolation) -> tuple:
+    """jsonschema.exceptions.relevance と同一の関連度キー。"""
+    return (-len(error.path), error.path, error.validator not in WEAK_MATCHES,
+            error.validator in STRONG_MATCHES, not error.matches_type)
+
+
+def best_match(errors) -> Optional[SchemaViolation]:
+    return max(errors, key=relevance, default=None)
+
+
+# ── Runtime helpers (生成コードから参照) ─────────────────────────────────
+
+_TRUE = object()
+_FALSE = object()
+
+
+def _unbool(element):
+    if element is True:
+        return _TRUE
+    if element is False:
+        return _FALSE
+    return element
+
+
+def _equal(one, two) -> bool:
+    """jsonschema._utils.equal と同一 (bool と数値を区別)。"""
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, Sequence) and isinstance(two, Sequence):
+        return len(one) == len(two) and all(_equal(i, j) for i, j in zip(one, two))
+    if isinstance(one, Mapping) and isinstance(two, Mapping):
+        return len(one) == len(two) and all(k in two and _equal(v, two[k]) for k, v in one.items())
+    return _unbool(one) == _unbool(two)
+
+
+def _uniq(container) -> bool:
+    """jsonschema._utils.uniq と同一。"""
+    try:
+        ordered = sorted(_unbool(i) for i in container)
+        return not any(_equal(i, j) for i, j in zip(ordered, ordered[1:]))
+    except (NotImplementedError, TypeError):
+        seen = []
+        for e in container:
+            e = _unbool(e)
+            if any(_equal(i, e) for i in seen):
+                return False
+            seen.append(e)
+    return True
+
+
+def _extras_msg(extras: list) -> str:
+    verb = "was" if len(extras) == 1 else "were"
+    return f"{', '.join(repr(e) for e in extras)} {verb}"
+
+
+_RUNTIME = {
+    "_V": SchemaViolation,
+    "_equal": _equal,
+    "_uniq": _uniq,
+    "_extras_msg": _extras_msg,
+    "_Number": numbers.Number,
+    "re": re,
+}
+
+
+# ── Code generation ───────────────────────────────────────────────────────
+
+_TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "null": "{v} is None",
+    "boolean": "isinstance({v}, bool)",
+    "number": "(isinstance({v}, _Number) and not isinstance({v}, bool))",
+    # Draft 6 以降: 1.0 も integer
+    "integer": "((isinstance({v}, int) and not isinstance({v}, bool))"
+               " or (isinstance({v}, float) and {v}.is_integer()))",
+}
+_IS_NUMBER = _TYPE_CHECKS["number"]
+
+# 子スキーマを持つキーワード (これを含むノードは独立関数にする)
+_APPLICATORS = {"properties", "additionalProperties", "patternProperties", "items",
+                "allOf", "not", "$ref"}
+
+
+def _frozenset_literal(items) -> str:
+    # repr(frozenset) はハッシュ順 (実行ごとに変わる) のため, 生成コードが決定的になるよう展開する
+    return f"frozenset(({''.join(f'{item!r}, ' for item in items)}))"
+
+
+def _decode_pointer(ref: str) -> list[str]:
+    if not ref.startswith("#"):
+        raise SchemaCompileError(f"外部 $ref は未対応: {ref}")
+    fragment = unquote(ref[1:])
+    if fragment == "":
+        return []
+    if not fragment.startswith("/"):
+        raise SchemaCompileError(f"アンカー $ref は未対応: {ref}")
+    return [p.replace("~1", "/").replace("~0", "~") for p in fragment[1:].split("/")]
+
+
+class _Generator:
+    def __init__(self, root: Any):
+        self.root = root
+        self.functions: list[list[str]] = []
+        self.by_pointer: dict[str, str] = {}
+        self.by_id: dict[int, str] = {}
+        self.constants: list[str] = []
+        self.counter = 0
+
+    # ── 名前 ──
+
+    def _name(self, prefix: str) -> str:
+        self.counter += 1
+        return f"{prefix}{self.counter}"
+
+    def const(self, expr: str) -> str:
+        name = self._name("_C")
+        self.constants.append(f"{name} = {expr}")
+        return name
+
+    # ── 関数 ──
+
+    def function_for(self, node: Any) -> str:
+        key = id(node)
+        if key not in self.by_id:
+            name = self._name("_f")
+            self.by_id[key] = name
+            body: list[str] = []
+            self.functions.append([f"def {name}(value, path, errors):"])
+            index = len(self.functions) - 1
+            self.emit(node, "value", "path", body, 1)
+            self.functions[index].extend(body or ["    pass"])
+        return self.by_id[key]
+
+    def ref_function(self, ref: str) -> str:
+        if ref not in self.by_pointer:
+            target = self.root
+            for part in _decode_pointer(ref):
+                try:
+                    target = target[int(part)] if isinstance(target, list) else target[part]
+                except (KeyError, IndexError, ValueError, TypeError):
+                    raise SchemaCompileError(f"$ref を解決できません: {ref}") from None
+            self.by_pointer[ref] = self.function_for(target)
+        return self.by_pointer[ref]
+
+    def descend(self, node: Any, value: str, path: str, out: list[str], depth: int) -> None:
+        """子スキーマの検証コード (適用子を含むなら関数呼び出し, それ以外はインライン)。"""
+        if node is True:
+            return
+        if isinstance(node, dict) and not any(k in _APPLICATORS for k in node):
+            self.emit(node, value, path, out, depth)
+            return
+        out.append("    " * depth + f"{self.function_for(node)}({value}, {path}, errors)")
+
+    # ── ノード ──
+
+    def emit(self, node: Any, v: str, path: str, out: list[str], depth: int) -> None:
+        ind = "    " * depth
+        if node is True:
+            return
+        if node is False:
+            out.append(f"{ind}errors.append(_V({path}, f\"False schema does not allow {{{v}!r}}\", None))")
+            return
+        if not isinstance(node, dict):
+            raise SchemaCompileError(f"スキーマは object/boolean である必要があります: {node!r}")
+
+        unsupported = UNSUPPORTED_KEYWORDS & node.keys()
+        if unsupported:
+            raise SchemaCompileError(f"未対応キーワード: {', '.join(sorted(unsupported))}")
+
+        types = node.get("type")
+        if "type" in node:
+            types = [types] if isinstance(types, str) else types
+            if not isinstance(types, list) or not types or any(t not in _TYPE_CHECKS for t in types):
+                raise SchemaCompileError(f"不正な type: {node['type']!r}")
+            type_expr = " or ".join(_TYPE_CHECKS[t].format(v=v) for t in types)
+        else:
+            type_expr = None
+        # jsonschema の ValidationError._matches_type (best_match の関連度に使用)
+        mt = f"({type_expr})" if type_expr else "False"
+
+        def error(message_expr: str, keyword: str, indent: str) -> str:
+            return f"{indent}errors.append(_V({path}, {message_expr}, {keyword!r}, {mt}))"
+
+        for keyword, arg in node.items():
+            handler = _KEYWORDS.get(keyword)
+            if handler is not None:
+                handler(self, node, arg, v, path, out, depth, error, type_expr)
+
+
+# ── Keyword handlers ──
+# handler(gen, node, arg, v, path, out, depth, error, type_expr)
+
+def _kw_type(gen, node, arg, v, path, out, depth, error, type_expr):
+    ind = "    " * depth
+    types = [arg] if isinstance(arg, str) else arg
+    reprs = ", ".join(repr(t) for t in types)
+    out.append(f"{ind}if not ({type_expr}):")
+    out.append(error(f"f\"{{{v}!r}} is not of type \" {reprs!r}", "type", ind + "    "))
+
+
+def _kw_enum(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not isinstance(arg, list):
+        raise SchemaCompileError(f"enum は配列である必要があります: {arg!r}")
+    ind = "    " * depth
+    message = f"f\"{{{v}!r}} is not one of \" {repr(arg)!r}"
+    if arg and all(isinstance(e, str) for e in arg):
+        values = gen.const(_frozenset_literal(arg))
+        out.append(f"{ind}if not (isinstance({v}, str) and {v} in {values}):")
+    else:
+        values = gen.const(repr(arg))
+        out.append(f"{ind}if not any(_equal(_e, {v}) for _e in {values}):")
+    out.append(error(message, "enum", ind + "    "))
+
+
+def _kw_const(gen, node, arg, v, path, out, depth, error, type_expr):
+    ind = "    " * depth
+    value = gen.const(repr(arg))
+    out.append(f"{ind}if not _equal({v}, {value}):")
+    out.append(error(repr(f"{arg!r} was expected"), "const", ind + "    "))
+
+
+def _kw_pattern(gen, node, arg, v, path, out, depth, error, type_expr):
+    ind = "    " * depth
+    try:
+        re.compile(arg)
+    except (re.error, TypeError) as e:
+        raise SchemaCompileError(f"不正な pattern {arg!r}: {e}") from None
+    regex = gen.const(f"re.compile({arg!r})")
+    out.append(f"{ind}if isinstance({v}, str) and not {regex}.search({v}):")
+    out.append(error(f"f\"{{{v}!r}} does not match \" {repr(arg)!r}", "pattern", ind + "    "))
+
+
+def _length(kind: str, op: str, keyword: str, short: str, long_: str):
+    guard = _TYPE_CHECKS[kind]
+
+    def handler(gen, node, arg, v, path, out, depth, error, type_expr):
+        if not isinstance(arg, int) or isinstance(arg, bool):
+            raise SchemaCompileError(f"{keyword} は整数である必要があります: {arg!r}")
+        ind = "    " * depth
+        boundary = 1 if op == "<" else 0
+        message = short if arg == boundary else long_
+        out.append(f"{ind}if {guard.format(v=v)} and len({v}) {op} {arg}:")
+        out.append(error(f"f\"{{{v}!r}} {message}\"", keyword, ind + "    "))
+    return handler
+
+
+def _bound(op: str, keyword: str, phrase: str):
+    def handler(gen, node, arg, v, path, out, depth, error, type_expr):
+        if not isinstance(arg, (int, float)) or isinstance(arg, bool):
+            raise SchemaCompileError(f"{keyword} は数値である必要があります: {arg!r}")
+        ind = "    " * depth
+        out.append(f"{ind}if {_IS_NUMBER.format(v=v)} and {v} {op} {arg!r}:")
+        out.append(error(f"f\"{{{v}!r}} {phrase} \" {repr(arg)!r}", keyword, ind + "    "))
+    return handler
+
+
+def _kw_required(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not isinstance(arg, list) or not all(isinstance(p, str) for p in arg):
+        raise SchemaCompileError(f"required は文字列配列である必要があります: {arg!r}")
+    if not arg:
+        return
+    ind = "    " * depth
+    out.append(f"{ind}if isinstance({v}, dict):")
+    for prop in arg:
+        out.append(f"{ind}    if {prop!r} not in {v}:")
+        out.append(error(repr(f"{prop!r} is a required property"), "required", ind + "        "))
+
+
+def _kw_properties(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not isinstance(arg, dict):
+        raise SchemaCompileError("properties は object である必要があります")
+    body: list[str] = []
+    ind = "    " * (depth + 1)
+    for prop, sub in arg.items():
+        child = gen._name("_v")
+        inner: list[str] = []
+        gen.descend(sub, child, f"{path} + ({prop!r},)", inner, depth + 2)
+        if inner:
+            body.append(f"{ind}if {prop!r} in {v}:")
+            body.append(f"{ind}    {child} = {v}[{prop!r}]")
+            body.extend(inner)
+    if body:
+        out.append("    " * depth + f"if isinstance({v}, dict):")
+        out.extend(body)
+
+
+def _kw_pattern_properties(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not isinstance(arg, dict):
+        raise SchemaCompileError("patternProperties は object である必要があります")
+    ind = "    " * depth
+    for pattern, sub in arg.items():
+        regex = gen.const(f"re.compile({pattern!r})")
+        key, child = gen._name("_k"), gen._name("_v")
+        inner: list[str] = []
+        gen.descend(sub, child, f"{path} + ({key},)", inner, depth + 3)
+        if inner:
+            out.append(f"{ind}if isinstance({v}, dict):")
+            out.append(f"{ind}    for {key}, {child} in {v}.items():")
+            out.append(f"{ind}        if {regex}.search({key}):")
+            out.extend(inner)
+
+
+def _kw_additional_properties(gen, node, arg, v, path, out, depth, error, type_expr):
+    if arg is True or arg == {}:
+        return
+    ind = "    " * depth
+    known = gen.const(_frozenset_literal(node.get("properties", {})))
+    patterns = "|".join(node.get("patternProperties", {}))
+    extras = gen._name("_x")
+    cond = f"_k not in {known}"
+    if patterns:
+        cond += f" and not {gen.const(f're.compile({patterns!r})')}.search(_k)"
+    out.append(f"{ind}if isinstance({v}, dict):")
+    out.append(f"{ind}    {extras} = [_k for _k in {v} if {cond}]")
+    if arg is False:
+        out.append(f"{ind}    if {extras}:")
+        if "patternProperties" in node:
+            listed = ", ".join(repr(p) for p in sorted(node["patternProperties"]))
+            out.append(f"{ind}        _verb = 'does' if len({extras}) == 1 else 'do'")
+            message = (f"f\"{{', '.join(repr(_e) for _e in sorted({extras}))}} {{_verb}} "
+                       f"not match any of the regexes: \" {listed!r}")
+        else:
+            message = f"f\"Additional properties are not allowed ({{_extras_msg(sorted({extras}, key=str))}} unexpected)\""
+        out.append(error(message, "additionalProperties", ind + "        "))
+        return
+    key = gen._name("_k")
+    inner: list[str] = []
+    gen.descend(arg, f"{v}[{key}]", f"{path} + ({key},)", inner, depth + 2)
+    if inner:
+        out.append(f"{ind}    for {key} in {extras}:")
+        out.extend(inner)
+
+
+def _kw_items(gen, node, arg, v, path, out, depth, error, type_expr):
+    ind = "    " * depth
+    if arg is False:
+        out.append(f"{ind}if isinstance({v}, list) and {v}:")
+        message = (f"f\"Expected at most 0 items but found {{len({v})}} extra: "
+                   f"{{({v} if len({v}) != 1 else {v}[0])!r}}\"")
+        out.append(error(message, "items", ind + "    "))
+        return
+    index, child = gen._name("_i"), gen._name("_v")
+    inner: list[str] = []
+    gen.descend(arg, child, f"{path} + ({index},)", inner, depth + 2)
+    if inner:
+        out.append(f"{ind}if isinstance({v}, list):")
+        out.append(f"{ind}    for {index}, {child} in enumerate({v}):")
+        out.extend(inner)
+
+
+def _kw_unique_items(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not arg:
+        return
+    ind = "    " * depth
+    out.append(f"{ind}if isinstance({v}, list) and not _uniq({v}):")
+    out.append(error(f"f\"{{{v}!r}} has non-unique elements\"", "uniqueItems", ind + "    "))
+
+
+def _kw_all_of(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not isinstance(arg, list) or not arg:
+        raise SchemaCompileError("allOf は空でない配列である必要があります")
+    for sub in arg:
+        gen.descend(sub, v, path, out, depth)
+
+
+def _kw_not(gen, node, arg, v, path, out, depth, error, type_expr):
+    ind = "    " * depth
+    probe = gen._name("_n")
+    inner: list[str] = []
+    gen.descend(arg, v, path, inner, depth)
+    out.append(f"{ind}{probe} = errors")
+    out.append(f"{ind}errors = []")
+    out.extend(inner)
+    out.append(f"{ind}{probe}, errors = errors, {probe}")
+    out.append(f"{ind}if not {probe}:")
+    out.append(error(f"f\"{{{v}!r}} should not be valid under \" {repr(arg)!r}", "not", ind + "    "))
+
+
+def _kw_ref(gen, node, arg, v, path, out, depth, error, type_expr):
+    if not isinstance(arg, str):
+        raise SchemaCompileError(f"$ref は文字列である必要があります: {arg!r}")
+    out.append("    " * depth + f"{gen.ref_function(arg)}({v}, {path}, errors)")
+
+
+_KEYWORDS: dict[str, Callable] = {
+    "$ref": _kw_ref,
+    "type": _kw_type,
+    "enum": _kw_enum,
+    "const": _kw_const,
+    "pattern": _kw_pattern,
+    "minLength": _length("string", "<", "minLength", "should be non-empty", "is too short"),
+    "maxLength": _length("string", ">", "maxLength", "is expected to be empty", "is too long"),
+    "minItems": _length("array", "<", "minItems", "should be non-empty", "is too short"),
+    "maxItems": _length("array", ">", "maxItems", "is expected to be empty", "is too long"),
+    "minProperties": _length("object", "<", "minProperties", "should be non-empty",
+                             "does not have enough properties"),
+    "maxProperties": _length("object", ">", "maxProperties", "is expected to be empty",
+                             "has too many properties"),
+    "minimum": _bound("<", "minimum", "is less than the minimum of"),
+    "maximum": _bound(">", "maximum", "is greater than the maximum of"),
+    "exclusiveMinimum": _bound("<=", "exclusiveMinimum", "is less than or equal to the minimum of"),
+    "exclusiveMaximum": _bound(">=", "exclusiveMaximum", "is greater than or equal to the maximum of"),
+    "required": _kw_required,
+    "properties": _kw_properties,
+    "patternProperties": _kw_pattern_properties,
+    "additionalProperties": _kw_additional_properties,
+    "items": _kw_items,
+    "uniqueItems": _kw_unique_items,
+    "allOf": _kw_all_of,
+    "not": _kw_not,
+}
+
+
+def generate_source(schema: Any) -> str:
+    """スキーマ → 検証モジュールのソース (validate(data) -> list[SchemaViolation])。"""
+    if isinstance(schema, dict) and schema.get("$schema") not in SUPPORTED_DRAFTS:
+        raise SchemaCompileError(f"未対応の $schema: {schema.get('$schema')}")
+    gen = _Generator(schema)
+    entry = gen.function_for(schema)
+    lines = [
+        f"# schema_compiler.py v{COMPILER_VERSION} が生成 (編集不可)",
+        "",
+        *gen.constants,
+        "",
+    ]
+    for function in gen.functions:
+        lines.extend(function)
+        lines.append("")
+    lines.extend([
+        "def validate(data):",
+        "    errors = []",
+        f"    {entry}(data, (), errors)",
+        "    return errors",
+        "",
+    ])
+    return "\n".join(lines)
+
+
+# ── Validators ────────────────────────────────────────────────────────────
+
+class CompiledValidator:
+    """生成コードによる検証器。"""
+
+    compiled = True
+
+    def __init__(self, validate: Callable[[Any], list], digest: str, source_path: Optional[Path]):
+        self._validate = validate
+        self.digest = digest
+        self.source_path = source_path
+
+    def iter_errors(self, data: Any) -> list[SchemaViolation]:
+        return self._validate(data)
+
+    def is_valid(self, data: Any) -> bool:
+        return not self._validate(data)
+
+    def best_match(self, data: Any) -> Optional[SchemaViolation]:
+        return best_match(self._validate(data))
+
+
+class JsonSchemaValidator:
+    """コンパイル不可なスキーマ用: jsonschema への委譲 (同じインターフェース)。"""
+
+    compiled = False
+
+    def __init__(self, schema: Any):
+        cls = jsonschema.validators.validator_for(schema)
+        self._validator = cls(schema)
+
+    @staticmethod
+    def _convert(e) -> SchemaViolation:
+        return SchemaViolation(tuple(e.absolute_path), e.message, e.validator, e._matches_type())
+
+    def iter_errors(self, data: Any) -> list[SchemaViolation]:
+        return [self._convert(e) for e in self._validator.iter_errors(data)]
+
+    def is_valid(self, data: Any) -> bool:
+        return self._validator.is_valid(data)
+
+    def best_match(self, data: Any) -> Optional[SchemaViolation]:
+        error = jsonschema.exceptions.best_match(self._validator.iter_errors(data))
+        return None if error is None else self._convert(error)
+
+
+def schema_digest(schema: Any) -> str:
+    # キー順はエラー順序に影響するためソートしない
+    canonical = json.dumps(schema, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{COMPILER_VERSION}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+def _load_module(name: str, source: str, path: Optional[Path]) -> Callable[[Any], list]:
+    namespace = dict(_RUNTIME)
+    if path is not None:
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is not None and spec.loader is not None:
+            module = importlib.util.module_from_spec(spec)
+            module.__dict__.update(namespace)
+            spec.loader.exec_module(module)  # バイトコードは __pycache__ に保存される
+            return module.validate
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    return namespace["validate"]
+
+
+_COMPILED: dict[str, CompiledValidator] = {}
+_LOCK = threading.Lock()
+
+
+def compile_schema(schema: Any, cache_dir: Optional[Path] = SCHEMA_CACHE_DIR) -> CompiledValidator:
+    """スキーマをコンパイル (プロセス内 + cache_dir にスキーマハッシュで保存)。
+
+    未対応キーワード・不正なスキーマは SchemaCompileError。
+    """
+    digest = schema_digest(schema)
+    with _LOCK:
+        cached = _COMPILED.get(digest)
+    if cached is not None:
+        return cached
+
+    name = f"schema_{digest[:24]}"
+    path = cache_dir / f"{name}.py" if cache_dir is not None else None
+    source = None
+    if path is not None and path.exists():
+        source = path.read_text(encoding="utf-8")
+    if source is None:
+        source = generate_source(schema)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # 再生成可能なため fsync 不要
+                write_bytes_atomic(path, source.encode("utf-8"), durable=False)
+            except OSError:
+                path = None  # 書き込めなければメモリ上でのみ使用
+    validator = CompiledValidator(_load_module(name, source, path), digest, path)
+    with _LOCK:
+        _COMPILED[digest] = validator
+    return validator
+
+
+def get_validator(schema: Any, cache_dir: Optional[Path] = SCHEMA_CACHE_DIR):
+    """コンパイル済み検証器 (コンパイル不可なら jsonschema に委譲)。
+
+    どちらも使えない場合は SchemaCompileError。
+    """
+    try:
+        return compile_schema(schema, cache_dir)
+    except SchemaCompileError:
+        if not HAS_JSONSCHEMA:
+            raise
+        return JsonSchemaValidator(schema)
+
+
+_FILE_VALIDATORS: dict[str, tuple[tuple, Any]] = {}
+
+
+def load_validator(schema_path: Union[str, os.PathLike],
+                   cache_dir: Optional[Path] = SCHEMA_CACHE_DIR):
+    """スキーマファイルの検証器 (stat 不変ならファイル読み込み・ハッシュも省略)。
+
+    OSError / ValueError (JSON 不正) / SchemaCompileError をそのまま送出。
+    """
+    key = os.fspath(schema_path)
+    st = os.stat(key)
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _LOCK:
+        cached = _FILE_VALIDATORS.get(key)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    validator = get_validator(json_codec.load_path(key), cache_dir)
+    with _LOCK:
+        _FILE_VALIDATORS[key] = (sig, validator)
+    return validator
+
+
+# ── CLI ───────────────────────────────────────────────────────────────────
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="JSON Schema → Python 検証コードのコンパイル・検証")
+    parser.add_argument("schema", type=Path, help="スキーマファイル")
+    parser.add_argument("instances", type=Path, nargs="*", help="検証する JSON ファイル")
+    parser.add_argument("--source", action="store_true", help="生成コードを表示して終了")
+    args = parser.parse_args()
+
+    try:
+        schema = json_codec.load_path(args.schema)
+        if args.source:
+            print(generate_source(schema))
+            return 0
+        validator = load_validator(args.schema)
+    except (OSError, ValueError) as e:
+        print(f"❌ {args.schema}: {e}", file=sys.stderr)
+        return 1
+
+    kind = "compiled" if validator.compiled else "jsonschema"
+    exit_code = 0
+    for instance in args.instances:
+        try:
+            errors = validator.iter_errors(json_codec.load_path(instance))
+        except (OSError, ValueError) as e:
+            print(f"❌ {instance}: {e}")
+            exit_code = 1
+            continue
+        if not errors:
+            print(f"✅ {instance} ({kind})")
+            continue
+        exit_code = 1
+        print(f"❌ {instance}: {len(errors)} 件 ({kind})")
+        for error in errors:
+            location = " > ".join(str(p) for p in error.path) or "(root)"
+            print(f"    [{location}] {error.message}")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+stage_profiler.py — 品質スクリプト用のステージ別タイミング計測.
+
+Feature 単位の処理を「ステージ」(ファイル読み込み, BRIEF パース, calc_* 等) に分け、
+各ステージの wall time / CPU time を記録し、実行全体でパーセンタイル集計する。
+1つの異常な BRIEF.md が遅いのか、全体的なオーバーヘッドが遅いのかを切り分ける用途。
+
+Usage:
+    profiler = StageProfiler()
+    with profiler.feature("001-kaiju-voice"):
+        with profiler.stage("parse_brief"):
+            ...
+    with profiler.stage("commit"):         # Feature 外はランレベルのステージ
+        ...
+    summary = profiler.summary()
+    print(format_report(summary))
+
+無効時は NULL_PROFILER (計測なし・オーバーヘッド最小) を渡す。
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+# 集計するパーセンタイル
+PERCENTILES = (50, 90, 99)
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """線形補間パーセンタイル (sorted_values は昇順)。"""
+    if not sorted_values:
+        return 0.0
+    if len(sorted_values) == 1:
+        return sorted_values[0]
+    pos = (len(sorted_values) - 1) * q / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class _Timer:
+    """ステージ1回分の計測。終了時に timings[name] へ (wall, cpu) を加算。"""
+
+    __slots__ = ("timings", "name", "wall", "cpu")
+
+    def __init__(self, timings: dict, name: str):
+        self.timings = timings
+        self.name = name
+
+    def __enter__(self):
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        prev = self.timings.get(self.name)
+        self.timings[self.name] = (wall, cpu) if prev is None else (prev[0] + wall, prev[1] + cpu)
+        return False
+
+
+class _FeatureScope:
+    """Feature 1件分のスコープ。内部のステージは Feature レコードに記録される。"""
+
+    __slots__ = ("profiler", "record", "timer")
+
+    def __init__(self, profiler: "StageProfiler", feature_id: str):
+        self.profiler = profiler
+        self.record = {"feature": feature_id, "stages": {}}
+
+    def __enter__(self):
+        self.profiler._current = self.record["stages"]
+        self.timer = _Timer(self.record, "total")
+        self.timer.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.timer.__exit__(exc_type, exc, tb)
+        self.profiler._current = None
+        self.profiler.records.append(self.record)
+        return False
+
+
+class StageProfiler:
+    """Feature × ステージ単位の wall/CPU 計測器。
+
+    records は pickle 可能な dict のリストで、drain()/absorb() により
+    ProcessPoolExecutor のワーカーから親プロセスへ集約できる。
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.records: list[dict] = []
+        self.run_stages: dict[str, tuple[float, float]] = {}
+        self._current: Optional[dict] = None
+
+    def feature(self, feature_id: str) -> _FeatureScope:
+        return _FeatureScope(self, feature_id)
+
+    def stage(self, name: str) -> _Timer:
+        target = self._current if self._current is not None else self.run_stages
+        return _Timer(target, name)
+
+    def drain(self) -> list[dict]:
+        records, self.records = self.records, []
+        return records
+
+    def absorb(self, records: list[dict]) -> None:
+        self.records.extend(records)
+
+    def summary(self, slowest: int = 10) -> dict:
+        """ステージ別パーセンタイル集計 (単位: ms)。"""
+        per_stage: dict[str, list[tuple[float, float, str]]] = {}
+        for rec in self.records:
+            for name, (wall, cpu) in rec["stages"].items():
+                per_stage.setdefault(name, []).append((wall, cpu, rec["feature"]))
+
+        stages = {}
+        for name, samples in per_stage.items():
+            walls = sorted(s[0] for s in samples)
+            cpus = sorted(s[1] for s in samples)
+            worst = max(samples, key=lambda s: s[0])
+            entry = {"count": len(samples)}
+            for label, values in (("wall", walls), ("cpu", cpus)):
+                entry[f"{label}_total_ms"] = _ms(sum(values))
+                for q in PERCENTILES:
+                    entry[f"{label}_p{q}_ms"] = _ms(percentile(values, q))
+                entry[f"{label}_max_ms"] = _ms(values[-1])
+            entry["slowest_feature"] = worst[2]
+            stages[name] = entry
+
+        totals = sorted(self.records, key=lambda r: r["total"][0], reverse=True)
+        return {
+            "features": len(self.records),
+            "stages": dict(sorted(stages.items(), key=lambda kv: -kv[1]["wall_total_ms"])),
+            "run_stages": {name: {"wall_ms": _ms(w), "cpu_ms": _ms(c)}
+                           for name, (w, c) in self.run_stages.items()},
+            "slowest_features": [
+                {"feature": r["feature"], "wall_ms": _ms(r["total"][0]), "cpu_ms": _ms(r["total"][1]),
+                 "top_stage": max(r["stages"], key=lambda n: r["stages"][n][0]) if r["stages"] else None}
+                for r in totals[:slowest]
+            ],
+        }
+
+    def feature_records(self) -> list[dict]:
+        """Feature 別の生レコード (ms 換算)。"""
+        return [
+            {"feature": r["feature"],
+             "total": {"wall_ms": _ms(r["total"][0]), "cpu_ms": _ms(r["total"][1])},
+             "stages": {n: {"wall_ms": _ms(w), "cpu_ms": _ms(c)} for n, (w, c) in r["stages"].items()}}
+            for r in self.records
+        ]
+
+
+class _NullContext:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+class NullProfiler:
+    """計測無効時の代替。全操作が no-op。"""
+
+    enabled = False
+    _CTX = _NullContext()
+
+    def feature(self, feature_id: str) -> _NullContext:
+        return self._CTX
+
+    def stage(self, name: str) -> _NullContext:
+        return self._CTX
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def format_report(summary: dict) -> str:
+    """summary() のテキストレポート。"""
+    lines = [f"── Stage Profile ({summary['features']} features, ms) ──",
+             f"  {'stage':30s} {'count':>6s} {'total':>10s} {'p50':>9s} {'p90':>9s} "
+             f"{'p99':>9s} {'max':>9s} {'cpu%':>5s}  slowest"]
+    for name, s in summary["stages"].items():
+        cpu_ratio = (s["cpu_total_ms"] / s["wall_total_ms"] * 100) if s["wall_total_ms"] else 0.0
+        lines.append(
+            f"  {name:30s} {s['count']:6d} {s['wall_total_ms']:10.2f} {s['wall_p50_ms']:9.3f} "
+            f"{s['wall_p90_ms']:9.3f} {s['wall_p99_ms']:9.3f} {s['wall_max_ms']:9.3f} "
+            f"{cpu_ratio:5.0f}  {s['slowest_feature']}")
+    if summary["run_stages"]:
+        lines.append("  ── run ──")
+        for name, s in summary["run_stages"].items():
+            lines.append(f"  {name:30s} {'':6s} {s['wall_ms']:10.2f}  (cpu {s['cpu_ms']:.2f})")
+    if summary["slowest_features"]:
+        lines.append("  ── slowest features ──")
+        for r in summary["slowest_features"]:
+            lines.append(f"  {r['feature']:45s} {r['wall_ms']:9.3f}  ({r['top_stage']})")
+    return "\n".join(lines)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+atomic_write.py テストスイート.
+
+カバレッジ:
+- dump_json_bytes (リポジトリ標準書式) — 1個
+- WriteBatch (差分スキップ, 一括コミット, ディスクリプタ上限超のファイル数, abort, drain/absorb,
+  パーミッション維持, 追記) — 7個
+- write_json_atomic, 新規ファイルのモード (import 時に umask を変更しない) — 2個
+"""
+
+import json
+import os
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import atomic_write  # noqa: E402
+from atomic_write import WriteBatch, dump_json_bytes, write_json_atomic  # noqa: E402
+
+
+def _temps(directory: Path) -> list[Path]:
+    return [p for p in directory.iterdir() if p.name.startswith(atomic_write.TEMP_PREFIX)]
+
+
+# ── Serialization Tests (1個) ──────────────────────────────────────────
+
+
+def test_dump_json_bytes_format():
+    data = {"title": "怪獣ボイス", "nested": {"a": [1, 2]}}
+    expected = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+    assert dump_json_bytes(data) == expected.encode("utf-8")
+
+
+# ── WriteBatch Tests (7個) ─────────────────────────────────────────────
+
+
+class TestWriteBatch:
+
+    def test_unchanged_content_is_skipped(self, tmp_path):
+        path = tmp_path / "CONTEXT.json"
+        path.write_bytes(dump_json_bytes({"a": 1}))
+        mtime = path.stat().st_mtime_ns
+        batch = WriteBatch()
+        assert batch.stage_json(path, {"a": 1}) is False
+        assert batch.commit() == []
+        assert batch.skipped == [path]
+        assert path.stat().st_mtime_ns == mtime
+
+    def test_commit_writes_all_pending(self, tmp_path):
+        paths = [tmp_path / f"{i}.json" for i in range(3)]
+        paths[0].write_bytes(dump_json_bytes({"v": 0}))
+        with WriteBatch() as batch:
+            for i, p in enumerate(paths):
+                batch.stage_json(p, {"v": i + 10})
+            assert not paths[1].exists()  # コミット前は未書き込み
+        assert sorted(batch.written) == sorted(paths)
+        assert [json.loads(p.read_text())["v"] for p in paths] == [10, 11, 12]
+        assert _temps(tmp_path) == []
+
+    def test_commit_more_files_than_descriptor_limit(self, tmp_path):
+        resource = pytest.importorskip("resource")
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        limit = len(os.listdir("/proc/self/fd")) + 32 if Path("/proc/self/fd").exists() else 256
+        paths = [tmp_path / f"{i}.json" for i in range(limit * 2)]
+        batch = WriteBatch()
+        for i, p in enumerate(paths):
+            batch.stage_json(p, {"v": i})
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(limit, soft), hard))
+        try:
+            written = batch.commit()
+        finally:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (soft, hard))
+        assert len(written) == len(paths)
+        assert json.loads(paths[-1].read_text()) == {"v": len(paths) - 1}
+        assert _temps(tmp_path) == []
+
+    def test_exception_aborts_without_writing(self, tmp_path):
+        path = tmp_path / "CONTEXT.json"
+        path.write_bytes(dump_json_bytes({"v": 1}))
+        with pytest.raises(KeyboardInterrupt):
+            with WriteBatch() as batch:
+                batch.stage_json(path, {"v": 2})
+                raise KeyboardInterrupt
+        assert json.loads(path.read_text()) == {"v": 1}
+        assert _temps(tmp_path) == []
+
+    def test_failed_replace_leaves_original_and_no_temps(self, tmp_path, monkeypatch):
+        path = tmp_path / "CONTEXT.json"
+        path.write_bytes(dump_json_bytes({"v": 1}))
+        batch = WriteBatch()
+        batch.stage_json(path, {"v": 2})
+
+        def boom(src, dst):
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(atomic_write.os, "replace", boom)
+        with pytest.raises(OSError):
+            batch.commit()
+        assert json.loads(path.read_text()) == {"v": 1}
+        assert _temps(tmp_path) == []
+
+    def test_drain_absorb_roundtrip_and_mode(self, tmp_path):
+        path = tmp_path / "CONTEXT.json"
+        path.write_bytes(b"{}\n")
+        os.chmod(path, 0o640)
+        worker = WriteBatch()
+        worker.stage_json(path, {"v": 3})
+        pending = pickle.loads(pickle.dumps(worker.drain()))
+        assert len(worker) == 0
+
+        parent = WriteBatch()
+        parent.absorb(pending)
+        assert parent.commit() == [path]
+        assert json.loads(path.read_text()) == {"v": 3}
+        assert path.stat().st_mode & 0o777 == 0o640
+
+    def test_append_committed_before_replace(self, tmp_path, monkeypatch):
+        """追記は置換より先に行われ、置換失敗時もアーカイブは確定済み."""
+        archive = tmp_path / "history.jsonl"
+        archive.write_bytes(b'{"n": 1}')  # 中断で改行なしの末尾行
+        target = tmp_path / "CONTEXT.json"
+        worker = WriteBatch()
+        worker.stage_append(archive, b'{"n": 2}\n')
+        worker.stage_json(target, {"v": 1})
+        batch = WriteBatch()
+        batch.absorb(pickle.loads(pickle.dumps(worker.drain())))
+        assert len(batch) == 2
+
+        def boom(src, dst):
+            raise OSError("replace failed")
+
+        monkeypatch.setattr(atomic_write.os, "replace", boom)
+        with pytest.raises(OSError):
+            batch.commit()
+        assert archive.read_bytes() == b'{"n": 1}\n{"n": 2}\n'
+        assert not target.exists()
+        assert batch.appended == [archive]
+
+
+# ── Convenience Tests (2個) ────────────────────────────────────────────
+
+
+def test_write_json_atomic(tmp_path):
+    path = tmp_path / "new.json"
+    assert write_json_atomic(path, {"k": "値"}) is True
+    assert write_json_atomic(path, {"k": "値"}) is False
+    assert path.read_bytes() == dump_json_bytes({"k": "値"})
+
+
+def test_new_file_mode_follows_umask_without_import_side_effect(tmp_path):
+    # 別プロセス: import 後に設定した umask が初回書き込みで反映される (import 時に読まない)
+    script = (
+        "import os, sys\n"
+        f"sys.path.insert(0, {str(Path(__file__).parent)!r})\n"
+        "os.umask(0o027)\n"
+        "import atomic_write\n"
+        "assert os.umask(0o077) == 0o027\n"
+        f"atomic_write.write_json_atomic(__import__('pathlib').Path({str(tmp_path / 'new.json')!r}), {{}})\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+    assert (tmp_path / "new.json").stat().st_mode & 0o777 == 0o600
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+bench_rice_calculator.py テストスイート.
+
+カバレッジ:
+- generate_corpus (Format A/B 混在, 全Feature処理可能, パス差し替えの復元) — 1個
+- run_benchmark (全シナリオの結果) / compare_results (回帰検出) — 2個
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import rice_calculator  # noqa: E402
+from bench_rice_calculator import (  # noqa: E402
+    SCENARIOS,
+    compare_results,
+    corpus_paths,
+    generate_corpus,
+    run_benchmark,
+)
+from rice_calculator import GapData, RegistryData, discover_feature_dirs, process_feature  # noqa: E402
+
+
+def test_generated_corpus_is_processable(tmp_path):
+    root = generate_corpus(tmp_path, 40, seed=1)
+    briefs = [p.read_text(encoding="utf-8") for p in (root / "docs" / "features").glob("*/BRIEF.md")]
+    assert any("### Core Goal" in b for b in briefs)
+    assert any("**Core Goal**" in b for b in briefs)
+
+    original = rice_calculator.FEATURES_DIR
+    with corpus_paths(root):
+        registry, gaps = RegistryData(), GapData()
+        assert registry.features and gaps.candidates
+        results = [process_feature(fd, registry, gaps, None, False, False)
+                   for fd in discover_feature_dirs()]
+    assert rice_calculator.FEATURES_DIR == original
+    assert len(results) == 40
+    assert {r["status"] for r in results} <= {"updated", "unchanged", "skipped"}
+    assert any(r["status"] == "updated" for r in results)
+
+
+def test_run_benchmark_reports_all_scenarios(tmp_path):
+    doc = run_benchmark([5], repeat=1, workdir=tmp_path)
+    scenarios = {r["scenario"] for r in doc["results"]}
+    assert set(SCENARIOS) <= scenarios
+    assert all(r["seconds_median"] >= 0 for r in doc["results"])
+    assert doc["config"]["sizes"] == [5]
+
+
+def test_compare_results_flags_regression():
+    base = {"results": [{"size": 100, "scenario": "main_warm", "seconds_median": 1.0}]}
+    slower = {"results": [{"size": 100, "scenario": "main_warm", "seconds_median": 1.5}]}
+    faster = {"results": [{"size": 100, "scenario": "main_warm", "seconds_median": 0.9}]}
+    assert compare_results(base, slower, 0.2)[1] is False
+    lines, ok = compare_results(base, faster, 0.2)
+    assert ok and len(lines) == 1
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+changed_scope.py テストスイート.
+
+カバレッジ:
+- features_for_paths (docs/src パス → Feature ID, 全体入力 → full) — 1個
+- git_changed_paths (--staged / --changed-since, リネーム, 未追跡ファイル, 不正 ref) — 1個
+- validate_docs_consistency スコープ (Feature 単位チェックのみ絞り込み, D1/D8 は全件) — 1個
+- feature_doctor スコープ — 1個
+- validate_spec: spec_file と --staged / --changed-since の併用はエラー — 1個
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "scripts"))
+
+from changed_scope import ChangeScope, features_for_paths, git_changed_paths  # noqa: E402
+
+MAPPINGS = {"battle": "001-battle", "voice": "002-voice"}
+
+
+def test_features_for_paths():
+    scope = features_for_paths([
+        "docs/features/001-battle/SPEC-001-battle.md",
+        "src/features/voice/hooks/useVoice.ts",
+        "src/features/unregistered/index.ts",
+        "docs/features/index.md",
+        "README.md",
+    ], MAPPINGS)
+    assert scope.feature_ids == {"001-battle", "002-voice"}
+    assert not scope.full
+    assert scope.includes("002-voice") and not scope.includes("003-other")
+    assert scope.touches(Path("README.md"))
+
+    assert features_for_paths(["docs/features/feature-registry.json"], MAPPINGS).full
+    assert features_for_paths(["docs/_templates/context_schema.json"], MAPPINGS).full
+
+
+def test_git_changed_paths(tmp_path):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("config", "user.email", "t@example.com")
+    git("config", "user.name", "t")
+    (tmp_path / "a.md").write_text("a")
+    (tmp_path / "b.md").write_text("b")
+    (tmp_path / ".gitignore").write_text("ignored.md\n")
+    git("add", ".")
+    git("commit", "-q", "-m", "init")
+
+    git("mv", "a.md", "renamed.md")
+    (tmp_path / "b.md").write_text("b2")  # 未ステージ
+    (tmp_path / "new.md").write_text("n")  # 未追跡
+    (tmp_path / "ignored.md").write_text("i")  # .gitignore 対象
+    assert git_changed_paths(staged=True, root=tmp_path) == ["a.md", "renamed.md"]
+    assert git_changed_paths(since="HEAD", root=tmp_path) == ["a.md", "b.md", "new.md", "renamed.md"]
+    with pytest.raises(ValueError, match="git diff"):
+        git_changed_paths(since="no-such-ref", root=tmp_path)
+
+
+def test_docs_consistency_scopes_per_feature_checks(tmp_path, monkeypatch):
+    import validate_docs_consistency as vdc
+
+    docs = tmp_path / "docs" / "features"
+    src = tmp_path / "src" / "features"
+    for name in ("battle", "voice", "unregistered"):
+        (src / name).mkdir(parents=True)
+    (docs / "999-orphan").mkdir(parents=True)
+    monkeypatch.setattr(vdc, "FEATURES_DOCS_DIR", docs)
+    monkeypatch.setattr(vdc, "FEATURES_SRC_DIR", src)
+    monkeypatch.setattr(vdc, "INDEX_MD_PATH", docs / "index.md")
+    registry = {"mappings": MAPPINGS}
+
+    full = {r.id: r for r in vdc.run_all_checks(registry).results}
+    scoped_report = vdc.run_all_checks(registry, ChangeScope(paths=[], feature_ids={"002-voice"}))
+    scoped = {r.id: r for r in scoped_report.results}
+
+    assert full["D2"].total == 2 and scoped["D2"].total == 1
+    assert all("002-voice" in d for d in scoped["D4"].details)
+    # 全体チェックはスコープに関係なく同一
+    for check_id in ("D1", "D5", "D8"):
+        assert scoped[check_id].details == full[check_id].details
+    assert scoped_report.scope is not None
+
+
+def test_feature_doctor_scope(tmp_path, monkeypatch):
+    import feature_doctor
+
+    for name in ("001-battle", "002-voice", "_templates"):
+        (tmp_path / name).mkdir()
+    monkeypatch.setattr(feature_doctor, "FEATURES_DIR", tmp_path)
+    scope = ChangeScope(paths=[], feature_ids={"002-voice"})
+    assert [d.name for d in feature_doctor._feature_dirs(None, scope)] == ["002-voice"]
+    scope.full = True
+    assert [d.name for d in feature_doctor._feature_dirs(None, scope)] == ["001-battle", "002-voice"]
+
+
+def test_validate_spec_rejects_spec_file_with_scope(monkeypatch, capsys):
+    import validate_spec
+
+    spec = "docs/features/001-battle/SPEC-001-battle.md"
+    for flags in (["--staged"], ["--changed-since", "HEAD"]):
+        monkeypatch.setattr(sys, "argv", ["validate_spec.py", spec, *flags])
+        with pytest.raises(SystemExit) as exc:
+            validate_spec.main()
+        assert exc.value.code == 2
+        assert "同時に指定できません" in capsys.readouterr().err
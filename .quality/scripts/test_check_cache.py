@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+check_cache.py テストスイート.
+
+カバレッジ:
+- cached (ヒット, 入力ファイル/ディレクトリ一覧/値/バージョン変更で再実行) — 1個
+- 永続化 + サイズ上限による LRU 破棄 — 1個
+- validate_ui_flow.run_all_checks (キャッシュ有無で同一結果, cached フラグ, 入力変更) — 1個
+- NavGraphValidator (キャッシュ有無で同一イシュー, V6 は毎回実行) — 1個
+"""
+
+import json
+import shutil
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import path_index  # noqa: E402
+from check_cache import CheckCache, Listing  # noqa: E402
+from quality_runner import UI_FLOW_PATH, _load_nav_graph_validator  # noqa: E402
+
+
+def test_cached_invalidates_on_any_input_change(tmp_path):
+    cache = CheckCache(path=None)
+    src = tmp_path / "input.json"
+    src.write_text("{}")
+    listed = tmp_path / "features"
+    listed.mkdir()
+    calls = []
+
+    def run(inputs, version="v1"):
+        return cache.cached("demo", inputs, version, lambda: calls.append(1) or len(calls))
+
+    inputs = (src, Listing(listed), "mappings-a")
+    assert run(inputs) == (1, False)
+    assert run(inputs) == (1, True)
+    src.write_text('{"changed": true}')
+    assert run(inputs) == (2, False)
+    (listed / "battle").mkdir()
+    assert run(inputs) == (3, False)
+    assert run((src, Listing(listed), "mappings-b")) == (4, False)
+    assert run(inputs, version="v2") == (5, False)
+    assert cache.hits == 1 and cache.misses == 5
+
+
+def test_persist_and_evict_least_recently_used(tmp_path):
+    path = tmp_path / "check_results.json"
+    cache = CheckCache(path=path, max_bytes=250)
+    for i in range(3):
+        cache.put(f"k{i}", {"details": ["x" * 80]})
+    cache.get("k0")  # k0 を最近使用に → k1 から破棄
+    cache.save()
+    reloaded = CheckCache(path=path, max_bytes=250)
+    assert sorted(reloaded.entries) == ["k0", "k2"]
+    assert cache.evictions == 1
+
+    path.write_text("{broken")
+    assert CheckCache(path=path).entries == {}
+
+
+def test_ui_flow_cached_results_match(tmp_path):
+    import validate_ui_flow
+
+    target = tmp_path / "ui-flow.json"
+    shutil.copy(UI_FLOW_PATH, target)
+    data = json.loads(target.read_text(encoding="utf-8"))
+    schema = json.loads(validate_ui_flow.SCHEMA_PATH.read_text(encoding="utf-8"))
+    cache = CheckCache(path=None)
+
+    fresh = validate_ui_flow.run_all_checks(data, schema)
+    first = validate_ui_flow.run_all_checks(data, schema, cache, target)
+    second = validate_ui_flow.run_all_checks(data, schema, cache, target)
+    assert not any(r.cached for r in first.results)
+    assert all(r.cached for r in second.results)
+    assert [replace(r, cached=False) for r in second.results] == fresh.results
+    assert second.exit_code == fresh.exit_code
+
+    target.write_text(target.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    third = validate_ui_flow.run_all_checks(data, schema, cache, target)
+    assert not any(r.cached for r in third.results)
+
+
+def test_nav_graph_cached_issues_match(tmp_path):
+    module = _load_nav_graph_validator()
+    nav_path = tmp_path / "nav-graph.json"
+    nav_path.write_text(json.dumps({"screens": {
+        "home": {"id": "home", "file": "src/home.tsx",
+                 "triggers": [{"id": "t1", "target": "missing"}]},
+        "lonely": {"id": "lonely", "triggers": []},
+    }}))
+    schema_path = tmp_path / "nav-graph.schema.json"
+    cache = CheckCache(path=None)
+
+    def validate(use_cache):
+        return module.NavGraphValidator(nav_path, tmp_path, schema_path,
+                                        cache=cache if use_cache else None).validate()
+
+    fresh = validate(False)
+    assert any(i.rule == "V6" for i in fresh.issues)
+    assert validate(True).issues == fresh.issues
+    served = validate(True)
+    assert served.cached_rules and served.issues == fresh.issues
+
+    # V6 (ファイル存在) はキャッシュ対象外: ファイル作成が即座に反映される
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "home.tsx").write_text("")
+    path_index.invalidate()
+    after = validate(True)
+    assert after.cached_rules
+    assert [i for i in fresh.issues if i.rule != "V6"] == after.issues
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+context_corpus.py テストスイート.
+
+カバレッジ:
+- load_json (キャッシュヒット, 更新時の再パース, mutable 複製の独立性, 失敗はキャッシュしない) — 3個
+- FileCache LRU 上限 — 1個
+- load_corpus / load_context (BRIEF/SPEC 解決, 破損 CONTEXT.json) — 1個
+- スクリプト間共有 (feature_lifecycle → rice_calculator で再パースなし, 書き戻し後の再読込) — 1個
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import context_corpus  # noqa: E402
+from context_corpus import FileCache, load_context, load_corpus, load_json  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    context_corpus.clear_cache()
+    yield
+    context_corpus.clear_cache()
+
+
+# ── load_json Tests (3個) ──────────────────────────────────────────────
+
+
+class TestLoadJson:
+
+    def test_hit_then_reparse_on_change(self, tmp_path):
+        path = tmp_path / "CONTEXT.json"
+        path.write_text(json.dumps({"v": 1}))
+        first = load_json(path)
+        assert load_json(path) is first
+        assert context_corpus.get_cache().hits == 1
+
+        path.write_text(json.dumps({"v": 22}))
+        assert load_json(path) == {"v": 22}
+        assert context_corpus.get_cache().misses == 2
+
+    def test_mutable_copy_is_independent(self, tmp_path):
+        path = tmp_path / "CONTEXT.json"
+        path.write_text(json.dumps({"priority": {"history": [1, 2]}}))
+        copy = load_json(path, mutable=True)
+        copy["priority"]["history"].append(3)
+        assert load_json(path) == {"priority": {"history": [1, 2]}}
+        assert load_json(path, mutable=True) is not load_json(path, mutable=True)
+
+    def test_errors_are_not_cached(self, tmp_path):
+        path = tmp_path / "CONTEXT.json"
+        path.write_text("{broken")
+        with pytest.raises(json.JSONDecodeError):
+            load_json(path)
+        with pytest.raises(FileNotFoundError):
+            load_json(tmp_path / "missing.json")
+        assert len(context_corpus.get_cache()) == 0
+        path.write_text("{}")
+        assert load_json(path) == {}
+
+
+# ── FileCache LRU Tests (1個) ──────────────────────────────────────────
+
+
+def test_lru_evicts_least_recently_used(tmp_path):
+    cache = FileCache(max_entries=2)
+    paths = [tmp_path / f"{i}.json" for i in range(3)]
+    for p in paths:
+        p.write_text("0")
+    cache.get("json", paths[0], json.loads)
+    cache.get("json", paths[1], json.loads)
+    cache.get("json", paths[0], json.loads)  # 0 を最近使用に
+    cache.get("json", paths[2], json.loads)  # 1 が破棄される
+    assert cache.evictions == 1
+    misses = cache.misses
+    cache.get("json", paths[0], json.loads)
+    assert cache.misses == misses
+    cache.get("json", paths[1], json.loads)
+    assert cache.misses == misses + 1
+
+
+# ── Corpus Tests (1個) ─────────────────────────────────────────────────
+
+
+def test_load_corpus_records(tmp_path):
+    ok = tmp_path / "001-ok"
+    ok.mkdir()
+    (ok / "CONTEXT.json").write_text(json.dumps({"feature_id": "001-ok"}))
+    (ok / "BRIEF.md").write_text("# Brief\r\n本文")
+    (ok / "SPEC-001.md").write_text("# Spec")
+    broken = tmp_path / "002-broken"
+    broken.mkdir()
+    (broken / "CONTEXT.json").write_text("{")
+    (tmp_path / "003-no-context").mkdir()
+
+    records = load_corpus(tmp_path)
+    assert [r.id for r in records] == ["001-ok", "002-broken"]
+    assert records[0].context == {"feature_id": "001-ok"}
+    assert records[0].brief_text() == "# Brief\n本文"
+    assert records[0].spec_path == ok / "SPEC-001.md"
+    assert records[1].context is None and "JSON" in records[1].error
+    assert records[1].brief_path is None
+    assert load_context(broken) is None
+    assert load_context(tmp_path / "003-no-context") is None
+
+
+# ── Cross-script Tests (1個) ───────────────────────────────────────────
+
+
+def test_shared_between_scripts_and_refreshed_after_write(tmp_path):
+    from feature_lifecycle import load_context as lifecycle_load_context
+    from rice_calculator import GapData, RegistryData, process_feature
+
+    fd = tmp_path / "960-corpus"
+    fd.mkdir()
+    (fd / "CONTEXT.json").write_text(json.dumps({
+        "feature_id": fd.name,
+        "progress": {"percentage": 20, "fr_total": 2},
+        "quick_resume": {"current_state": "Implementing"},
+        "priority": {"schema": "rice-v2", "phase": "mvp", "calculated": {"adjusted_score": 9.0}},
+    }))
+    registry = RegistryData.__new__(RegistryData)
+    registry.features, registry.apps = [], []
+    registry._build_coverage_index()
+    gaps = GapData.__new__(GapData)
+    gaps.candidates = []
+    gaps._build_candidate_index()
+
+    before = lifecycle_load_context(fd)
+    cache = context_corpus.get_cache()
+    misses = cache.misses
+    result = process_feature(fd, registry, gaps, None, True, False)
+    assert result["status"] == "updated"
+    # process_feature は同じパース結果を再利用 (複製して書き換え)
+    assert cache.misses == misses
+    assert before["priority"]["calculated"]["adjusted_score"] == 9.0
+    after = lifecycle_load_context(fd)
+    assert after["priority"]["calculated"]["adjusted_score"] == result["new_score"]
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+file_watcher.py / rice_calculator --watch テストスイート.
+
+カバレッジ:
+- PollingWatcher (作成/更新/削除検知, accept フィルター, デバウンス集約) — 2個
+- 自己書き込み除外 (expect_writes) — 1個
+- InotifyWatcher (新規サブディレクトリ, アトミック置換, 未作成ルートの後追い) — 2個
+- rice_calculator watch (変更分類, 変更Featureのみ再スコアリング + 自己書き込み登録) — 2個
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import rice_calculator  # noqa: E402
+from file_watcher import HAS_INOTIFY, OVERFLOW, InotifyWatcher, PollingWatcher  # noqa: E402
+
+
+def _md_only(path: Path) -> bool:
+    return path.suffix == ".md"
+
+
+def _later(delay: float, fn) -> threading.Thread:
+    t = threading.Timer(delay, fn)
+    t.start()
+    return t
+
+
+# ── PollingWatcher Tests (2個) ─────────────────────────────────────────
+
+
+class TestPollingWatcher:
+
+    def test_detects_create_modify_delete(self, tmp_path):
+        (tmp_path / "001").mkdir()
+        keep = tmp_path / "001" / "BRIEF.md"
+        gone = tmp_path / "001" / "SPEC.md"
+        keep.write_text("a")
+        gone.write_text("b")
+        watcher = PollingWatcher([(tmp_path, 1)], _md_only, debounce=0.05, interval=0.02)
+
+        keep.write_text("changed")
+        gone.unlink()
+        (tmp_path / "001" / "CONTEXT.txt").write_text("ignored")
+        (tmp_path / "002").mkdir()
+        (tmp_path / "002" / "BRIEF.md").write_text("new")
+        assert watcher.wait(timeout=2) == {keep, gone, tmp_path / "002" / "BRIEF.md"}
+        assert watcher.wait(timeout=0.1) == set()
+
+    def test_debounce_coalesces_bursts(self, tmp_path):
+        paths = [tmp_path / f"{i}.md" for i in range(3)]
+        watcher = PollingWatcher([(tmp_path, 0)], _md_only, debounce=0.3, interval=0.02)
+
+        def burst():
+            for p in paths:
+                p.write_text("x")
+                time.sleep(0.05)
+
+        t = _later(0.0, burst)
+        assert watcher.wait(timeout=2) == set(paths)
+        t.join()
+
+
+# ── Self-write Tests (1個) ─────────────────────────────────────────────
+
+
+def test_expect_writes_suppresses_own_writes(tmp_path):
+    path = tmp_path / "BRIEF.md"
+    path.write_text("v1")
+    watcher = PollingWatcher([(tmp_path, 0)], _md_only, debounce=0.05, interval=0.02)
+    path.write_text("v2 (self)")
+    watcher.expect_writes([path])
+    assert watcher.wait(timeout=0.2) == set()
+    # 外部からの更新は再び通知される
+    time.sleep(0.01)
+    path.write_text("v3 (external)")
+    assert watcher.wait(timeout=2) == {path}
+
+
+# ── InotifyWatcher Tests (2個) ─────────────────────────────────────────
+
+
+@pytest.mark.skipif(not HAS_INOTIFY, reason="inotify 非対応環境")
+class TestInotifyWatcher:
+
+    def test_new_subdir_and_atomic_replace(self, tmp_path):
+        existing = tmp_path / "001"
+        existing.mkdir()
+        target = existing / "BRIEF.md"
+        target.write_text("v1")
+        with InotifyWatcher([(tmp_path, 1)], _md_only, debounce=0.05) as watcher:
+            tmp = existing / ".tmp-abc"
+            tmp.write_text("v2")
+            os.replace(tmp, target)
+            assert watcher.wait(timeout=2) == {target}
+
+            new_dir = tmp_path / "002"
+            new_dir.mkdir()
+            (new_dir / "BRIEF.md").write_text("new")
+            assert watcher.wait(timeout=2) == {new_dir / "BRIEF.md"}
+
+    def test_missing_root_attached_when_created(self, tmp_path):
+        root = tmp_path / "analysis"
+        with InotifyWatcher([(root, 0)], _md_only, debounce=0.05, interval=0.05) as watcher:
+            assert watcher.wait(timeout=0.1) == set()
+            root.mkdir()
+            (root / "gap.md").write_text("x")
+            assert watcher.wait(timeout=2) == {root / "gap.md"}
+            (root / "gap.md").write_text("y")
+            assert watcher.wait(timeout=2) == {root / "gap.md"}
+
+
+# ── rice_calculator watch Tests (2個) ──────────────────────────────────
+
+
+def _write_feature(root: Path, name: str) -> Path:
+    fd = root / name
+    fd.mkdir()
+    (fd / "CONTEXT.json").write_text(json.dumps({
+        "feature_id": name,
+        "progress": {"percentage": 20, "fr_total": 2},
+        "quick_resume": {"current_state": "Implementing"},
+        "priority": {"schema": "rice-v2", "phase": "mvp", "calculated": {"adjusted_score": 9.0}},
+    }))
+    return fd
+
+
+class _ScriptedWatcher:
+    """wait() が事前定義の変更集合を順に返すテスト用 watcher。"""
+
+    backend = "scripted"
+
+    def __init__(self, batches):
+        self.batches = list(batches)
+        self.expected: list[Path] = []
+        self.closed = False
+
+    def wait(self):
+        return self.batches.pop(0)
+
+    def expect_writes(self, paths):
+        self.expected.extend(paths)
+
+    def close(self):
+        self.closed = True
+
+
+class TestWatchMode:
+
+    def test_classify_changes(self, tmp_path):
+        features = tmp_path / "features"
+        registry = tmp_path / "analysis" / "competitor-registry.json"
+        with patch.object(rice_calculator, "FEATURES_DIR", features), \
+                patch.object(rice_calculator, "REGISTRY_PATH", registry):
+            changed = {features / "001-a" / "BRIEF.md", features / "001-a" / "SPEC-v2.md",
+                       features / "002-b"}
+            assert all(rice_calculator.is_watch_relevant(p) for p in changed)
+            assert not rice_calculator.is_watch_relevant(features / "001-a" / "NOTES.md")
+            assert not rice_calculator.is_watch_relevant(features / "001-a" / ".tmp-x")
+            assert rice_calculator.classify_changes(changed) == \
+                (False, [features / "001-a", features / "002-b"])
+            assert rice_calculator.classify_changes({registry})[0] is True
+            assert rice_calculator.classify_changes({OVERFLOW}) == (True, [])
+
+    def test_rescores_only_changed_feature(self, tmp_path, capsys):
+        features = tmp_path / "features"
+        features.mkdir()
+        a = _write_feature(features, "901-a")
+        b = _write_feature(features, "902-b")
+        watcher = _ScriptedWatcher([{a / "BRIEF.md"}])
+        args = Namespace(set_phase=None, apply=True, verbose=False, history_limit=None,
+                         no_index=True, feature=None, watch_debounce=0.05, watch_poll=True)
+        registry = rice_calculator.RegistryData.__new__(rice_calculator.RegistryData)
+        registry.features, registry.apps = [], []
+        registry._build_coverage_index()
+        gaps = rice_calculator.GapData.__new__(rice_calculator.GapData)
+        gaps.candidates = []
+        gaps._build_candidate_index()
+
+        with patch.object(rice_calculator, "FEATURES_DIR", features):
+            rice_calculator.watch_features(args, registry, gaps, 1, None,
+                                           max_cycles=1, watcher=watcher)
+        out = capsys.readouterr().out
+        assert "変更: 901-a" in out
+        assert "902-b" not in out.split("変更:")[1]
+        # 初回全体スコアリングの書き戻しは自己書き込みとして登録
+        assert set(watcher.expected) == {a / "CONTEXT.json", b / "CONTEXT.json"}
+        assert watcher.closed
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+json_codec.py テストスイート.
+
+カバレッジ:
+- dump_bytes が標準 json とバイト同一 (pretty / compact / sort_keys, 書式差のある float・int・キー) — 1個
+- トップレベルのスカラー (None, "null", float, NaN) が全バックエンドでバイト同一 — 1個
+- loads が json.loads と同一の結果・例外 (NaN リテラル, 64bit 超 int, BOM, 不正 JSON) — 1個
+- QUALITY_JSON_BACKEND による切り替え — 1個
+- bench_json_codec (全バックエンドで計測, バイト同一検証) — 1個
+"""
+
+import json
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import json_codec  # noqa: E402
+from bench_json_codec import run_benchmark, speedups  # noqa: E402
+from json_codec import HAS_ORJSON, JsonCodec  # noqa: E402
+
+BACKENDS = ["json", "orjson"] if HAS_ORJSON else ["json"]
+
+
+def _stdlib(obj, pretty=True, sort_keys=False):
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, sort_keys=sort_keys).encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dump_bytes_identical_to_stdlib(backend):
+    codec = JsonCodec(backend)
+    rng = random.Random(0)
+    floats = [0.1, 1e-4, 1e-5, 5e-324, 1e15, 1e16, -1.5e300, 1e22, -0.0, 123456789.123,
+              float("nan"), float("inf")] + [rng.uniform(-1e6, 1e6) for _ in range(200)] \
+        + [10 ** rng.uniform(-12, 25) for _ in range(200)]
+    samples = [
+        {"title": "怪獣ボイス \x7f\x1f\"\\/", "nested": {"a": [], "b": {}, "c": [[{}]]}},
+        {"floats": floats[:-2]},
+        {"note": None, "score": float("nan")},
+        [2 ** 70, -(2 ** 63), 2 ** 64 - 1, True, False, None],
+        {1: "int key", "z": 1, "a": 2},
+        {"text": "hash 3e45 and v1e5, 0.00001 in a string"},
+        (1, "tuple"),
+        "",
+        1e-7,
+    ] + [[f] for f in floats]
+    for obj in samples:
+        for pretty in (True, False):
+            for sort_keys in (False, True):
+                try:
+                    expected = _stdlib(obj, pretty, sort_keys)
+                except TypeError:  # 混在キーのソート等: 同じ例外になること
+                    with pytest.raises(TypeError):
+                        codec.dump_bytes(obj, pretty=pretty, sort_keys=sort_keys)
+                    continue
+                assert codec.dump_bytes(obj, pretty=pretty, sort_keys=sort_keys) == expected, obj
+    assert codec.dump_bytes({"a": 1}, newline=True) == b'{\n  "a": 1\n}\n'
+    assert codec.dumps(["ü"]) == '[\n  "ü"\n]'
+    with pytest.raises(TypeError):
+        codec.dump_bytes({"s": {1, 2}})
+
+
+def test_top_level_scalars_identical_across_backends():
+    codecs = [JsonCodec(backend) for backend in BACKENDS]
+    for obj in (None, "null", 1.0, float("nan"), float("-inf"), 0, True, "", "NaN"):
+        for pretty in (True, False):
+            outputs = [codec.dump_bytes(obj, pretty=pretty) for codec in codecs]
+            assert outputs == [_stdlib(obj, pretty)] * len(codecs), obj
+    assert json_codec.dumps(None) == "null"
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_loads_matches_stdlib(backend):
+    codec = JsonCodec(backend)
+    inputs = [b'{"a": [1, 2.5, "x", null, true]}', b"123456789012345678901234567890",
+              b'[1e400, -0, 1E5]', b'"\\ud800"', b'{"a": 1, "a": 2}', "[\"文字列\"]",
+              b"\xef\xbb\xbf{}", b"NaN", b"[Infinity]"]
+    for raw in inputs:
+        value = codec.loads(raw)
+        expected = json.loads(raw)
+        assert repr(value) == repr(expected) and type(value) is type(expected), raw
+    for broken in [b"{", b"", b"[1,]", b"\xff"]:
+        with pytest.raises(ValueError):
+            codec.loads(broken)
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b'{"a": }')
+
+
+def test_backend_selection_by_env(tmp_path):
+    script = "import json_codec; print(json_codec.BACKEND)"
+    env = {**os.environ, "QUALITY_JSON_BACKEND": "json"}
+    out = subprocess.run([sys.executable, "-c", script], cwd=Path(__file__).parent,
+                         env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "json"
+    assert json_codec.BACKEND == ("orjson" if HAS_ORJSON and
+                                  os.environ.get("QUALITY_JSON_BACKEND", "auto") != "json" else "json")
+    with pytest.raises(ValueError, match="不明な JSON バックエンド"):
+        JsonCodec("simdjson")
+
+
+def test_benchmark_reports_all_backends():
+    doc = run_benchmark([20], repeat=1)
+    combos = {(r["file"], r["backend"], r["operation"]) for r in doc["results"]}
+    assert len(combos) == 2 * len(BACKENDS) * 2
+    assert all(r["seconds_median"] >= 0 and r["bytes"] > 0 for r in doc["results"])
+    assert len(speedups(doc)) == (4 if HAS_ORJSON else 0)
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+nav_graph_core.py テストスイート.
+
+カバレッジ:
+- reachable / components がランダムグラフで素朴な実装 (全点対到達可能性) と一致 — 1個
+- closed_loops の除外 (出口あり, 起点・ターミナル画面を含む, 自己ループのみ) と重複IDの合流 — 1個
+- NavGraphValidator V9 (到達不能) / V10 (出口のない閉路) — 1個
+- NavGraphBuilder のエントリー推論が find_entry_screen と一致 — 1個
+- 1回走査 (validate) とルール別走査のイシュー一致・走査回数, bench_nav_graph — 1個
+- インクリメンタル検証 (スナップショット保存/読み込みを挟んだ連続編集) と全体検証の一致 — 1個
+"""
+
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_nav_graph import run_benchmark, speedups, synthetic_nav_graph  # noqa: E402
+from nav_graph_core import NavGraph, find_entry_screen  # noqa: E402
+from quality_runner import _load_nav_graph_validator  # noqa: E402
+
+
+def _screen(sid, *targets, screen_type="page", guards=()):
+    triggers = [{"id": f"{sid}-t{n}", "target": t} for n, t in enumerate(targets)]
+    if guards:
+        triggers.append({"id": f"{sid}-g", "target": targets[0] if targets else None,
+                         "guards": [{"condition": "auth", "fallback_screen": g} for g in guards]})
+    return {"id": sid, "name": sid.upper(), "screen_type": screen_type, "triggers": triggers}
+
+
+def _graph(*screens, flows=None):
+    return NavGraph.from_data({"screens": {s["id"]: s for s in screens}, "flows": flows or {}})
+
+
+def _closure(graph, start):
+    seen, stack = {start}, [start]
+    while stack:
+        for t in graph.successors(stack.pop()):
+            if t not in seen:
+                seen.add(t)
+                stack.append(t)
+    return seen
+
+
+def test_reachability_and_components_match_naive():
+    rng = random.Random(0)
+    for _ in range(200):
+        n = rng.randint(1, 25)
+        ids = [f"s{i}" for i in range(n)]
+        screens = [_screen(sid, *(rng.choice(ids + ["missing"]) for _ in range(rng.randint(0, 3))))
+                   for sid in ids]
+        graph = _graph(*screens)
+        closure = [_closure(graph, i) for i in range(n)]
+
+        roots = rng.sample(range(n), rng.randint(0, min(2, n)))
+        seen = graph.reachable(roots)
+        expected = set().union(*(closure[r] for r in roots)) if roots else set()
+        assert {i for i in range(n) if seen[i]} == expected
+
+        components, component_of = graph.components()
+        assert sorted(i for c in components for i in c) == list(range(n))
+        for i in range(n):
+            same = {j for j in range(n) if j in closure[i] and i in closure[j]}
+            assert {j for j in range(n) if component_of[j] == component_of[i]} == same
+        # 逆トポロジカル順: 辺は後の成分から前の成分へ向かわない
+        for i in range(n):
+            assert all(component_of[t] <= component_of[i] for t in graph.successors(i))
+
+
+def test_closed_loops_exclusions():
+    graph = _graph(
+        _screen("home", "a", screen_type="tab"),
+        _screen("a", "b"), _screen("b", "a"),                  # 出口なし → 検出
+        _screen("c", "d"), _screen("d", "c", "home"),          # 出口あり
+        _screen("e", "f"), _screen("f", "e", screen_type="dialog"),  # ターミナル画面を含む
+        _screen("g", "g"),                                     # 自己ループのみ → 検出
+        _screen("h"),                                          # 単独の dead-end (V3 の対象)
+        _screen("i", "j"), _screen("j", "i"),                  # フロー開始画面を含む
+        flows={"f1": {"id": "f1", "steps": [{"screen": "i"}]}},
+    )
+    assert [[graph.ids[n] for n in loop] for loop in graph.closed_loops()] == [["a", "b"], ["g"]]
+
+    # 重複IDは最初の screen に合流, guard fallback も辺, 存在しない target は無視
+    merged = NavGraph.from_data({"screens": {
+        "x1": _screen("x", "y"), "y": _screen("y", "nowhere", guards=["z"]),
+        "x2": _screen("x", "z"), "z": _screen("z"),
+    }})
+    assert merged.ids == ["x", "y", "z"]
+    assert list(merged.successors(0)) == [1, 2] and list(merged.successors(1)) == [2]
+    assert list(merged.in_degrees()) == [0, 1, 2]
+
+
+def test_validator_reports_unreachable_and_closed_loops(tmp_path):
+    module = _load_nav_graph_validator()
+    nav_path = tmp_path / "nav-graph.json"
+    nav_path.write_text(json.dumps({"screens": {s["id"]: s for s in [
+        _screen("home", "detail", screen_type="tab"),
+        _screen("detail", "home"),
+        _screen("orphan", "island"),               # V2 orphan (V9 の対象外)
+        _screen("island", "trap"),                 # V9
+        _screen("trap", "trap2"), _screen("trap2", "trap"),  # V9 + V10
+    ]}}))
+    result = module.NavGraphValidator(nav_path, tmp_path, tmp_path / "missing.schema.json").validate()
+    by_rule = {}
+    for issue in result.issues:
+        by_rule.setdefault(issue.rule, []).append(issue.message)
+
+    assert by_rule["V2"] == ["orphan screen: orphan (ORPHAN) - incoming triggerなし"]
+    assert by_rule["V9"] == [f"unreachable screen: {sid} ({sid.upper()}) - エントリー/タブから到達不能"
+                             for sid in ("island", "trap", "trap2")]
+    assert by_rule["V10"] == ["closed loop without exit: trap, trap2 (2 screens) - ループ外へのtriggerなし"]
+    assert all(i.severity == "WARNING" for i in result.issues if i.rule in ("V9", "V10"))
+
+
+def test_builder_entry_matches_find_entry_screen():
+    cases = [
+        [_screen("a"), _screen("b", screen_type="tab") | {"tab_index": 0}, {**_screen("c"), "name": "Splash"}],
+        [_screen("a"), _screen("b", screen_type="tab") | {"tab_index": 0}],
+        [_screen("a"), _screen("b")],
+        [],
+    ]
+    for screens in cases:
+        data = {s["id"]: s for s in screens}
+        assert NavGraph.from_data({"screens": data}).entry == find_entry_screen(data)
+
+
+def test_single_traversal_matches_per_rule(tmp_path):
+    module = _load_nav_graph_validator()
+    nav_path = tmp_path / "nav-graph.json"
+    nav_path.write_text(json.dumps(synthetic_nav_graph(400, seed=3)))
+
+    single = module.NavGraphValidator(nav_path, tmp_path, tmp_path / "missing.schema.json")
+    issues = single.validate().issues
+    assert single.passes == 1
+    assert {i.rule for i in issues} >= {"V2", "V3", "V4", "V5", "V6", "V7", "V9", "V10"}
+
+    per_rule = module.NavGraphValidator(nav_path, tmp_path, tmp_path / "missing.schema.json")
+    per_rule.load()
+    per_rule.run_rules(())
+    separate = [i for rule in module.RULE_ORDER for i in per_rule.run_rules((rule,), index=False)[rule]]
+    assert separate == issues
+    assert per_rule.passes > single.passes
+
+    doc = run_benchmark([200], repeat=1)
+    assert {r["mode"] for r in doc["results"]} == {"per-rule", "single", "incremental"}
+    assert [s["size"] for s in speedups(doc)] == [200]
+
+
+def _edits(rng):
+    """各ルールの依存 (被参照・ID の出現/消滅・trigger の所属・フロー開始・グラフ・重複ID) を変える編集"""
+
+    def pick(doc):
+        return rng.choice(list(doc["screens"].values()))
+
+    def retarget(doc, target=None):
+        screen = pick(doc)
+        if screen["triggers"]:
+            screen["triggers"][0]["target"] = target or pick(doc)["id"]
+
+    def remove_screen(doc):
+        del doc["screens"][rng.choice(list(doc["screens"]))]
+
+    def add_screen(doc, sid=None):
+        key = f"NEW-{rng.randrange(10 ** 6)}"
+        doc["screens"][key] = _screen(sid or key, pick(doc)["id"], guards=("SCR-GONE",))
+
+    def move_trigger(doc):
+        source, dest = pick(doc), pick(doc)
+        if source["triggers"]:
+            dest["triggers"].append(source["triggers"].pop())
+
+    def remove_flow(doc):
+        if doc["flows"]:
+            del doc["flows"][rng.choice(list(doc["flows"]))]
+
+    def add_flow(doc):
+        screen = pick(doc)
+        trigger = screen["triggers"][0]["id"] if screen["triggers"] else None
+        doc["flows"][f"FLOW-NEW-{rng.randrange(10 ** 6)}"] = {
+            "id": rng.choice(["FLOW-00000", "FLOW-NEW"]), "steps": [{"screen": screen["id"], "trigger": trigger}]}
+
+    return [
+        lambda doc: pick(doc).update(name=rng.choice(["Login", "Edited"])),
+        lambda doc: retarget(doc),
+        lambda doc: retarget(doc, "SCR-MISSING"),
+        lambda doc: pick(doc).update(triggers=[]),
+        lambda doc: pick(doc).update(id=rng.choice(["SCR-MISSING", "SCR-GONE", pick(doc)["id"]])),
+        lambda doc: pick(doc).update(screen_type=rng.choice(["tab", "dialog", "page"]), tab_index=0),
+        lambda doc: pick(doc).update(file="lib/missing.dart"),
+        lambda doc: doc.update(version=str(rng.random())),
+        remove_screen, add_screen, lambda doc: add_screen(doc, "SCR-GONE"), move_trigger, remove_flow, add_flow,
+    ]
+
+
+def test_incremental_matches_full_validation(tmp_path):
+    module = _load_nav_graph_validator()
+    nav_path = tmp_path / "nav-graph.json"
+    snapshot_path = tmp_path / "snapshot.json"
+    schema_path = tmp_path / "missing.schema.json"
+
+    def full_issues():
+        result = module.NavGraphValidator(nav_path, tmp_path, schema_path).validate()
+        return [(i.rule, i.severity, i.message) for i in result.issues], result.stats
+
+    for seed in range(3):
+        rng = random.Random(seed)
+        doc = synthetic_nav_graph(120, seed=seed)
+        edits = _edits(rng)
+        snapshot_path.unlink(missing_ok=True)
+        incremental_runs = 0
+        for step in range(30):
+            for _ in range(rng.randint(1, 3)):
+                rng.choice(edits)(doc)
+            nav_path.write_text(json.dumps(doc))
+
+            validator = module.NavGraphValidator(nav_path, tmp_path, schema_path)
+            result = validator.validate_incremental(module.load_snapshot(snapshot_path))
+            module.save_snapshot(snapshot_path, validator.snapshot())
+            issues, stats = full_issues()
+            assert [(i.rule, i.severity, i.message) for i in result.issues] == issues, (seed, step)
+            assert (result.stats.screen_count, result.stats.trigger_count, result.stats.flow_count) == (
+                stats.screen_count, stats.trigger_count, stats.flow_count)
+            incremental_runs += not result.incremental["full"]
+        assert incremental_runs == 29  # 初回のみ全体検証
+
+    # 並び順の変更は全体検証にフォールバック
+    first = next(iter(doc["screens"]))
+    doc["screens"][first] = doc["screens"].pop(first)
+    nav_path.write_text(json.dumps(doc))
+    validator = module.NavGraphValidator(nav_path, tmp_path, schema_path)
+    result = validator.validate_incremental(module.load_snapshot(snapshot_path))
+    assert result.incremental["full"]
+    assert [(i.rule, i.severity, i.message) for i in result.issues] == full_issues()[0]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+nav_graph_shards.py テストスイート.
+
+カバレッジ:
+- split → 全シャードのマージが元のドキュメントと同じ screens / flows, 全体検証のイシュー一致 — 1個
+- feature 単位の検証 (該当シャードのみ読み込み, シャード横断参照は ID 索引) が全体検証と一致 — 1個
+- 索引とシャード内容の不一致 (V1), 読み込み範囲ごとの結果キャッシュ — 1個
+- nav-graph-to-mermaid --feature がシャード1つ + ID 索引で単一ファイルと同一の出力 — 1個
+"""
+
+import importlib.util
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bench_nav_graph import synthetic_nav_graph  # noqa: E402
+from check_cache import CheckCache  # noqa: E402
+from nav_graph_shards import (  # noqa: E402
+    MANIFEST_NAME,
+    UNASSIGNED_FEATURE,
+    ShardedNavGraph,
+    find_manifest,
+    write_shards,
+)
+from quality_runner import _load_nav_graph_validator  # noqa: E402
+
+
+def _sharded(tmp_path, screens=200, seed=0):
+    doc = synthetic_nav_graph(screens, seed=seed)
+    # シャードをまたぐフロー (正常 / 別 screen の trigger / 存在しない screen)
+    home, other = doc["screens"]["SCR-000-001"], doc["screens"]["SCR-001-002"]
+    doc["flows"]["FLOW-CROSS"] = {"id": "FLOW-CROSS", "steps": [
+        {"screen": home["id"], "trigger": home["triggers"][0]["id"]},
+        {"screen": other["id"], "trigger": other["triggers"][0]["id"]},
+        {"screen": "SCR-000-003", "trigger": other["triggers"][0]["id"]},
+        {"screen": "SCR-NOPE", "trigger": None},
+    ]}
+    write_shards(doc, tmp_path / "nav-graph")
+    return doc, tmp_path / "nav-graph" / MANIFEST_NAME
+
+
+def _issues(result):
+    return [(i.rule, i.severity, i.message) for i in result.issues]
+
+
+def test_split_round_trip_and_full_validation(tmp_path):
+    module = _load_nav_graph_validator()
+    doc, manifest = _sharded(tmp_path)
+    # 存在しない nav-graph.json → 同名ディレクトリの manifest
+    assert find_manifest(tmp_path / "nav-graph.json") == manifest
+    assert find_manifest(tmp_path / "nav-graph") == manifest
+
+    sharded = ShardedNavGraph(manifest)
+    assert sharded.features[-1] == UNASSIGNED_FEATURE  # feature のない閉路 screen
+    merged = sharded.load()
+    assert merged["version"] == doc["version"]
+    assert merged["screens"] == doc["screens"]
+    assert list(merged["screens"]) == list(doc["screens"])
+    assert merged["flows"] == doc["flows"]
+
+    schema_path = tmp_path / "missing.schema.json"
+    monolith = tmp_path / "merged.json"
+    monolith.write_text(json.dumps(merged))
+    from_shards = module.NavGraphValidator(tmp_path / "nav-graph.json", tmp_path, schema_path).validate()
+    assert _issues(from_shards) == _issues(module.NavGraphValidator(monolith, tmp_path, schema_path).validate())
+    assert from_shards.shards == {"loaded": sharded.features, "total": len(sharded.features), "skipped_rules": []}
+
+
+def test_feature_validation_uses_id_index(tmp_path):
+    module = _load_nav_graph_validator()
+    _, manifest = _sharded(tmp_path, screens=240, seed=1)
+    schema_path = tmp_path / "missing.schema.json"
+    full = module.NavGraphValidator(manifest, tmp_path, schema_path).validate()
+    scoped_rules = set(module.SHARD_SCOPE_RULES) - {"V1"}
+    expected = Counter(issue for issue in _issues(full) if issue[0] in scoped_rules)
+    assert {rule for rule, _, _ in expected} >= {"V3", "V4", "V6", "V7", "V8"}
+
+    # 各 feature を個別に検証した結果の和 = 全体検証 (シャード外への参照は誤検出しない)
+    combined = Counter()
+    features = ShardedNavGraph(manifest).features
+    for feature in features:
+        validator = module.NavGraphValidator(manifest, tmp_path, schema_path, features=[feature])
+        result = validator.validate()
+        assert result.shards["loaded"] == [feature]
+        assert result.shards["skipped_rules"] == ["V2", "V5", "V9", "V10"]
+        assert list(validator._sharded.loaded) == [feature]
+        assert {rule for rule, _, _ in _issues(result)} <= set(module.SHARD_SCOPE_RULES)
+        combined.update(issue for issue in _issues(result) if issue[0] in scoped_rules)
+    assert combined == expected
+
+    # feature 番号でも指定可 (シャードキー "000-feature")
+    by_number = module.NavGraphValidator(manifest, tmp_path, schema_path, features=["000"]).validate()
+    assert by_number.shards["loaded"] == ["000-feature"]
+    unknown = module.NavGraphValidator(manifest, tmp_path, schema_path, features=["999"]).validate()
+    assert [i.rule for i in unknown.issues] == ["V1"]
+
+
+def test_stale_index_and_scoped_cache(tmp_path):
+    module = _load_nav_graph_validator()
+    _, manifest = _sharded(tmp_path)
+    schema_path = tmp_path / "missing.schema.json"
+    sharded = ShardedNavGraph(manifest)
+    shard_path = sharded.path("001-feature")
+
+    cache = CheckCache(tmp_path / "cache.json")
+    first = module.NavGraphValidator(manifest, tmp_path, schema_path, cache=cache, features=["001"]).validate()
+    second = module.NavGraphValidator(manifest, tmp_path, schema_path, cache=cache, features=["001"]).validate()
+    assert not first.cached_rules
+    assert second.cached_rules == ["V1", "V3", "V4", "V7", "V8"]
+    assert _issues(second) == _issues(first)
+    # 全体検証は別エントリ
+    assert not module.NavGraphValidator(manifest, tmp_path, schema_path, cache=cache).validate().cached_rules
+
+    # シャードに screen を追加して索引を再生成しない → V1
+    shard = json.loads(shard_path.read_text())
+    shard["screens"]["SCR-NEW"] = {"id": "SCR-NEW", "name": "New", "screen_type": "page", "triggers": []}
+    shard_path.write_text(json.dumps(shard))
+    stale = module.NavGraphValidator(manifest, tmp_path, schema_path, cache=cache, features=["001"]).validate()
+    assert [(i.rule, i.severity) for i in stale.issues] == [("V1", "BLOCKING")]
+    assert "reindex" in stale.issues[0].message
+    # 他シャードのみの検証は影響を受けない
+    assert module.NavGraphValidator(manifest, tmp_path, schema_path, features=["002"]).validate().shards
+
+    assert ShardedNavGraph(manifest).reindex()
+    fresh = module.NavGraphValidator(manifest, tmp_path, schema_path, cache=cache, features=["001"]).validate()
+    assert not fresh.cached_rules
+    assert ("V3", "WARNING", "dead-end screen: SCR-NEW (New) - triggersが空") in _issues(fresh)
+
+
+def test_mermaid_feature_flow_from_single_shard(tmp_path):
+    spec = importlib.util.spec_from_file_location(
+        "nav_graph_to_mermaid", Path(__file__).with_name("nav-graph-to-mermaid.py"))
+    mermaid = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mermaid)
+    doc, manifest = _sharded(tmp_path)
+    monolith = tmp_path / "nav-graph-full.json"
+    monolith.write_text(json.dumps(doc))
+
+    for feature_num in ("000", "003"):
+        data = mermaid.load_nav_graph(tmp_path / "nav-graph", feature_num)
+        external = {sid for sid, s in data["screens"].items() if not s.get("feature", "").startswith(feature_num)}
+        assert external  # 他 feature への遷移先 (ID 索引のスタブ)
+        assert all(set(data["screens"][sid]) <= {"id", "name", "feature"} for sid in external)
+        expected = mermaid.generate_feature_flow(mermaid.load_nav_graph(monolith)["screens"], feature_num)
+        assert mermaid.generate_feature_flow(data["screens"], feature_num) == expected
+
+    assert mermaid.load_nav_graph(tmp_path / "nav-graph")["screens"] == doc["screens"]
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+path_index.py テストスイート.
+
+カバレッジ:
+- exists / is_file / is_dir が Path と一致 (シンボリックリンク, リンク切れ, 除外ディレクトリ, ルート外) — 1個
+- ".." を含むパスが Path と一致 (存在しない/ファイル/リンク経由の親, ルート外経由) — 1個
+- glob が glob.glob(recursive=True) と一致 (除外ディレクトリ・リンク先は対象外) — 1個
+- 一括走査は1回のみ + invalidate で変更を反映 — 1個
+"""
+
+import glob
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from path_index import PathIndex  # noqa: E402
+
+
+@pytest.fixture
+def tree(tmp_path):
+    files = [
+        "src/features/battle/index.ts",
+        "src/features/battle/hooks/useBattle.ts",
+        "src/features/voice/.hidden.ts",
+        "src/node_modules/pkg/index.js",
+        "docs/features/001-kaiju-voice/SPEC.md",
+        "lib/features/home/presentation/pages/home_page.dart",
+        "lib/features/home/presentation/pages/tabs/feed_frag.dart",
+        "lib/features/home/presentation/pages/.draft.dart",
+        "README.md",
+    ]
+    for rel in files:
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    (tmp_path / "src" / "linked").symlink_to(tmp_path / "docs" / "features")
+    (tmp_path / "src" / "broken.ts").symlink_to(tmp_path / "nowhere.ts")
+    return tmp_path
+
+
+def test_exists_matches_path(tree):
+    index = PathIndex(tree)
+    queries = [
+        "src", "src/features/battle/index.ts", "src/features/battle/missing.ts",
+        "src/features/battle/index.ts/child", "src/node_modules/pkg/index.js",
+        "src/linked/001-kaiju-voice/SPEC.md", "src/broken.ts", "README.md",
+        "docs/features/../features/001-kaiju-voice", "nope/deeper/file", "",
+    ]
+    for rel in queries:
+        path = tree / rel
+        assert index.exists(rel) == path.exists(), rel
+        assert index.is_dir(rel) == path.is_dir(), rel
+        assert index.is_file(rel) == path.is_file(), rel
+        assert index.exists(path) == path.exists(), rel
+    assert index.exists(tree.parent) and not index.exists(tree.parent / "no-such-dir")
+
+
+def test_parent_components_match_path(tree):
+    """".." は字句的に畳まず、ファイルシステムと同じく直前の要素を辿って解決する。"""
+    index = PathIndex(tree)
+    queries = [
+        "src/nope/../features", "src/features/battle/index.ts/../hooks",
+        "src/linked/../features/001-kaiju-voice/SPEC.md", f"../{tree.name}/src",
+        f"../{tree.name}/src/nope",
+    ]
+    for rel in queries:
+        path = tree / rel
+        assert index.exists(rel) == path.exists(), rel
+        assert index.is_dir(rel) == path.is_dir(), rel
+        assert index.is_file(rel) == path.is_file(), rel
+        assert index.exists(str(path)) == path.exists(), rel
+
+
+def test_glob_matches_stdlib(tree):
+    index = PathIndex(tree)
+    patterns = [
+        "lib/features/*/presentation/pages/**/*.dart",
+        "src/features/**",
+        "src/features/*/*.ts",
+        "src/features/voice/.*",
+        "docs/features/[0-9]*",
+        "docs/**/*.md",
+        "README.md",
+        "missing/**/*.md",
+    ]
+    for pattern in patterns:
+        expected = sorted(os.path.relpath(p, tree)
+                          for p in glob.glob(str(tree / pattern), recursive=True))
+        assert index.glob(pattern) == expected, pattern
+    assert index.glob("src/**/index.*") == ["src/features/battle/index.ts"]
+
+
+def test_single_walk_and_invalidate(tree):
+    index = PathIndex(tree)
+    index.exists("src/features/battle/index.ts")
+    walked = index.scandirs
+    for rel in ["src/features/voice/a.ts", "src/features/x/y/z.ts", "src/features/battle/hooks"]:
+        index.exists(rel)
+    assert index.scandirs == walked  # 以降の問い合わせは scandir なし
+
+    new_file = tree / "src" / "features" / "voice" / "new.ts"
+    new_file.write_text("")
+    assert not index.exists("src/features/voice/new.ts")  # スナップショットは自動更新しない
+    index.invalidate(new_file)
+    assert index.exists("src/features/voice/new.ts")
+    assert index.exists("src/features/battle/index.ts")
+
+    (tree / "src" / "features" / "battle" / "index.ts").unlink()
+    index.invalidate()
+    assert not index.exists("src/features/battle/index.ts")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+priority_index.py テストスイート.
+
+カバレッジ:
+- score_tier 閾値 — 1個
+- apply_results (全体実行の剪定, 差分マージ, dry-run は旧スコア, skipped/error) — 4個
+- クエリ (Top-K, Tier/Phase) / 保存・読み込み — 2個
+- rice_calculator 連携 (run_features 結果 → インデックス) — 1個
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from priority_index import PriorityIndex, update_priority_index  # noqa: E402
+from rice_calculator import GapData, RegistryData, run_features, score_tier  # noqa: E402
+
+
+def _result(fid, status="unchanged", old=1.0, new=1.0, phase="mvp", ts="2025-01-01"):
+    return {"id": fid, "status": status, "old_score": old, "new_score": new,
+            "phase": phase, "last_updated": ts, "diffs": []}
+
+
+def _ids(index: PriorityIndex) -> list[str]:
+    return [e["id"] for e in index.entries]
+
+
+def test_score_tier():
+    assert [score_tier(s) for s in (7.0, 5.0, 4.99, 2.0, 1.0, 0.99, 0.0)] == \
+        ["T1", "T1", "T2", "T2", "T3", "T4", "T4"]
+
+
+# ── apply_results Tests (4個) ──────────────────────────────────────────
+
+
+class TestApplyResults:
+
+    def test_full_run_prunes_missing(self):
+        index = PriorityIndex([{"id": "old", "adjusted_score": 9.0, "tier": "T1",
+                                "phase": "mvp", "last_updated": None}])
+        index.apply_results([_result("a", old=2.0), _result("b", old=3.0)], applied=True, full=True)
+        assert _ids(index) == ["b", "a"]
+
+    def test_partial_run_merges(self):
+        index = PriorityIndex()
+        index.apply_results([_result("a", old=2.0), _result("b", old=3.0)], applied=True, full=True)
+        index.apply_results([_result("a", status="updated", old=2.0, new=6.0)],
+                            applied=True, full=False)
+        assert _ids(index) == ["a", "b"]
+        assert index.entries[0]["tier"] == "T1"
+
+    def test_dry_run_keeps_disk_score(self):
+        index = PriorityIndex()
+        index.apply_results([_result("a", status="updated", old=2.0, new=6.0)],
+                            applied=False, full=True)
+        assert index.entries[0]["adjusted_score"] == 2.0
+
+    def test_skipped_removed_and_error_kept(self):
+        index = PriorityIndex()
+        index.apply_results([_result("a", old=2.0), _result("b", old=3.0)], applied=True, full=True)
+        index.apply_results([{"id": "a", "status": "skipped", "old_score": 0.0, "new_score": 0.0},
+                             {"id": "b", "status": "error", "old_score": 0.0, "new_score": 0.0}],
+                            applied=True, full=True)
+        assert _ids(index) == ["b"]
+        assert index.entries[0]["adjusted_score"] == 3.0
+
+
+# ── Query / Persistence Tests (2個) ────────────────────────────────────
+
+
+class TestQuery:
+
+    def test_top_and_filters(self):
+        index = PriorityIndex()
+        index.apply_results([
+            _result("a", old=6.0, phase="mvp"),
+            _result("b", old=3.0, phase="growth"),
+            _result("c", old=3.0, phase="mvp"),
+            _result("d", old=0.5, phase="mvp"),
+        ], applied=True, full=True)
+        assert _ids(PriorityIndex(index.top(3))) == ["a", "b", "c"]
+        assert [e["id"] for e in index.query(tier="T2")] == ["b", "c"]
+        assert [e["id"] for e in index.query(phase="mvp", limit=2)] == ["a", "c"]
+
+    def test_save_load_and_skip_unchanged(self, tmp_path):
+        path = tmp_path / "priority-index.json"
+        index = update_priority_index([_result("a", old=2.0)], applied=True, full=True, path=path)
+        mtime = path.stat().st_mtime_ns
+        loaded = PriorityIndex.load(path)
+        assert loaded.entries == index.entries
+        assert loaded.updated_at == index.updated_at
+        # 同一結果での再実行はファイルを書き換えない
+        update_priority_index([_result("a", old=2.0)], applied=True, full=True, path=path)
+        assert path.stat().st_mtime_ns == mtime
+
+
+# ── Integration Tests (1個) ────────────────────────────────────────────
+
+
+def test_run_features_results_feed_index(tmp_path):
+    """--apply 後のインデックスは CONTEXT.json 上のスコア/phase/last_updated と一致."""
+    fd = tmp_path / "950-index"
+    fd.mkdir()
+    (fd / "CONTEXT.json").write_text(json.dumps({
+        "feature_id": fd.name,
+        "progress": {"percentage": 20, "fr_total": 2},
+        "quick_resume": {"current_state": "Implementing"},
+        "priority": {"schema": "rice-v2", "phase": "mvp", "calculated": {"adjusted_score": 9.0}},
+    }))
+    registry = RegistryData.__new__(RegistryData)
+    registry.features, registry.apps = [], []
+    registry._build_coverage_index()
+    gaps = GapData.__new__(GapData)
+    gaps.candidates = []
+    gaps._build_candidate_index()
+
+    results = run_features([fd], registry, gaps, "growth", True, False)
+    index = update_priority_index(results, applied=True, full=True, path=tmp_path / "idx.json")
+    priority = json.loads((fd / "CONTEXT.json").read_text())["priority"]
+    entry = index.entries[0]
+    assert entry["adjusted_score"] == priority["calculated"]["adjusted_score"]
+    assert entry["phase"] == priority["phase"] == "growth"
+    assert entry["last_updated"] == priority["last_updated"]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+quality_runner.py テストスイート.
+
+カバレッジ:
+- merged_exit_code (1 > 2 > 0 優先) — 1個
+- run_checks (並行実行の順序保持, 例外 → exit 1) — 1個
+- 個別スクリプトとの終了コード一致 (5チェック) — 5個
+- CLI 統合JSONレポート — 1個
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import quality_runner  # noqa: E402
+from quality_runner import CheckOutcome, merged_exit_code, run_checks  # noqa: E402
+
+PROJECT_ROOT = quality_runner.PROJECT_ROOT
+
+# チェック名 → 個別実行コマンド (Makefile ターゲット相当)
+STANDALONE = {
+    "ui-flow": ["scripts/validate_ui_flow.py", "docs/ui-flow/ui-flow.json"],
+    "docs-consistency": ["scripts/validate_docs_consistency.py"],
+    "nav-graph": [".quality/scripts/nav-graph-validator.py"],
+    "feature-doctor": [".quality/scripts/feature_doctor.py", "--no-sync"],
+    "cross-feature-imports": ["scripts/check_cross_feature_imports.py"],
+}
+
+
+def test_merged_exit_code_precedence():
+    assert merged_exit_code([]) == 0
+    assert merged_exit_code([0, 2, 0]) == 2
+    assert merged_exit_code([2, 1, 0]) == 1
+
+
+def test_run_checks_keeps_order_and_fails_closed():
+    def slow_pass():
+        import time
+        time.sleep(0.05)
+        return CheckOutcome("a", 0, "ok")
+
+    def boom():
+        raise RuntimeError("broken check")
+
+    outcomes = run_checks({"a": slow_pass, "b": boom,
+                           "c": lambda: CheckOutcome("c", 2, "warn")}, jobs=3)
+    assert [o.name for o in outcomes] == ["a", "b", "c"]
+    assert [o.exit_code for o in outcomes] == [0, 1, 2]
+    assert "RuntimeError" in outcomes[1].error
+
+
+# ── Parity Tests (5個) ─────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("name", list(STANDALONE))
+def test_exit_code_matches_standalone_script(name, monkeypatch):
+    monkeypatch.chdir(PROJECT_ROOT)
+    standalone = subprocess.run([sys.executable, *STANDALONE[name]], cwd=PROJECT_ROOT,
+                                capture_output=True, text=True)
+    outcome = run_checks({name: quality_runner.CHECKS[name]}, jobs=1)[0]
+    assert outcome.error is None
+    assert outcome.exit_code == standalone.returncode
+
+
+def test_cli_json_report():
+    proc = subprocess.run([sys.executable, str(Path(quality_runner.__file__)), "--json",
+                           "--checks", "docs-consistency,cross-feature-imports"],
+                          capture_output=True, text=True)
+    report = json.loads(proc.stdout)
+    assert [c["name"] for c in report["checks"]] == ["docs-consistency", "cross-feature-imports"]
+    assert report["exit_code"] == proc.returncode == \
+        merged_exit_code(c["exit_code"] for c in report["checks"])
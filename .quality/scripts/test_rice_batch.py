@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+rice_batch.py テストスイート.
+
+カバレッジ:
+- score_portfolio とスカラー計算 (calc_* / process_feature) の一致 — 2個
+- rank_scores (安定順位) — 1個
+- sweep_weights (現行ウェイトのみ → 変動なし, 個別再計算との一致, チャンク分割) — 3個
+- load_weight_vectors / competitive bounds — 2個
+- monte_carlo_scores (分位点の順序/再現性, 分布幅→0で点推定に収束, チャンク分割) — 3個
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import rice_batch  # noqa: E402
+from rice_batch import (  # noqa: E402
+    WEIGHT_COLUMNS,
+    base_weight_vector,
+    extract_signals,
+    load_weight_vectors,
+    monte_carlo_scores,
+    rank_scores,
+    sample_weight_vectors,
+    score_portfolio,
+    sweep_weights,
+    vector_competitive_adjustment,
+)
+from rice_calculator import (  # noqa: E402
+    BriefData,
+    ContextData,
+    GapData,
+    RegistryData,
+    SpecData,
+    calc_competitive_adjustment,
+    calc_confidence,
+    calc_effort,
+    calc_impact,
+    calc_reach,
+    calc_rice_score,
+    find_spec_path,
+    process_feature,
+)
+
+# ── Fixtures ─────────────────────────────────────────────────────────────
+
+_CORE_GOALS = [
+    "すべてのユーザーに収益機能を提供する",
+    "大半の学習者の継続を改善する",
+    "特定の上級者向けの critical な機能",
+    "音声入力を提供する",
+]
+
+
+def _registry(features: list[dict]) -> RegistryData:
+    r = RegistryData.__new__(RegistryData)
+    r.features = features
+    r.apps = []
+    r._build_coverage_index()
+    return r
+
+
+def _gaps(candidates: list[dict]) -> GapData:
+    g = GapData.__new__(GapData)
+    g.candidates = candidates
+    g._build_candidate_index()
+    return g
+
+
+def _write_corpus(root: Path, count: int) -> list[Path]:
+    """シグナルの組み合わせが異なる Feature ディレクトリを生成."""
+    dirs = []
+    for n in range(count):
+        fd = root / f"{n + 700:03d}-batch-{n}"
+        fd.mkdir()
+        if n % 5 != 4:
+            metrics = ["| MRR | ¥500K |", "| 継続率 | retention 40% |", "- DAU 増加", ""][n % 4]
+            constraints = "\n".join(["- [x] hard constraint"] * (n % 4) + ["- [ ] 推奨"] * (n % 3))
+            (fd / "BRIEF.md").write_text(
+                f"# Brief\n\n## 0. Original Request\n\n> req {n}\n\n"
+                f"## 1. Problem & Why\n\n### Core Goal\n\n{_CORE_GOALS[n % 4]}\n\n"
+                f"### User Value\n\n価値 {n}\n\n### Business Metric\n\n{metrics}\n\n"
+                f"## 2. User Stories\n\n- 学習者は機能 {n} を使いたい (十分に長いユーザーストーリー)\n\n"
+                f"## 6. Constraints\n\n{constraints}\n",
+                encoding="utf-8",
+            )
+        if n % 3 != 2:
+            frs = "\n".join(f"FR-{i:03d}" for i in range(n % 7))
+            files = "\n".join(f"lib/f{i}.dart" for i in range(n * 3 % 11))
+            (fd / f"SPEC-{n + 700}.md").write_text(f"# SPEC\n{frs}\n{files}\n", encoding="utf-8")
+        context = {
+            "feature_id": fd.name,
+            "progress": {"percentage": [0, 10, 35, 55, 85, 100][n % 6], "fr_total": n % 4},
+            "quick_resume": {"current_state": "Implementing"},
+            "references": {"research_links": {"research_ids": [f"R{i}" for i in range(n % 6)]}},
+            "priority": {"schema": "rice-v2", "manual_override": [1.0, 1.2, 0.8, {"value": 1.1}][n % 4]},
+        }
+        (fd / "CONTEXT.json").write_text(json.dumps(context), encoding="utf-8")
+        dirs.append(fd)
+    return dirs
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    dirs = _write_corpus(tmp_path, 24)
+    registry = _registry([
+        {"id": "c1", "hackathon_project_coverage": "701,705", "assessments": {"a": {}, "b": {}}},
+        {"id": "c2", "hackathon_project_coverage": "705", "assessments": {str(i): {} for i in range(6)}},
+        {"id": "c3", "hackathon_project_coverage": "710-partial", "assessments": {str(i): {} for i in range(9)}},
+    ])
+    gaps = _gaps([
+        {"existing_feature_id": "702", "gap_severity": "HIGH", "opportunity_score": 8.0},
+        {"existing_feature_id": "703", "gap_severity": "MEDIUM", "opportunity_score": 5.5,
+         "is_industry_standard": True},
+        {"existing_feature_id": "704", "gap_severity": "LOW", "opportunity_score": 1.0},
+        {"existing_feature_id": "706", "opportunity_score": 3.5},
+    ])
+    return dirs, registry, gaps
+
+
+# ── Portfolio Scoring Tests (2個) ──────────────────────────────────────
+
+
+class TestScorePortfolio:
+    """ベクトル版とスカラー版の一致."""
+
+    def test_components_match_scalar(self, corpus):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        scores = score_portfolio(signals)
+        for i, fd in enumerate(dirs):
+            data = json.loads((fd / "CONTEXT.json").read_text())
+            brief = BriefData(fd / "BRIEF.md")
+            spec = SpecData(find_spec_path(fd))
+            ctx = ContextData(data)
+            reach = calc_reach(brief, ctx)
+            impact = calc_impact(brief, ctx, gaps)
+            conf = calc_confidence(brief, spec, ctx)
+            effort = calc_effort(brief, spec, ctx)
+            rice = calc_rice_score(reach, impact, conf, effort)
+            comp = calc_competitive_adjustment(registry, gaps, ctx)
+            assert scores["reach"][i] == reach["score"], fd.name
+            assert scores["impact"][i] == impact["score"], fd.name
+            assert scores["confidence"][i] == conf["score"], fd.name
+            assert scores["effort"][i] == effort["score"], fd.name
+            assert scores["rice_score"][i] == pytest.approx(rice["rice_score"], abs=1e-9), fd.name
+            assert scores["competitive_adjustment"][i] == comp["adjustment"], fd.name
+
+    def test_adjusted_matches_process_feature(self, corpus):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        scores = score_portfolio(signals)
+        expected = [process_feature(fd, registry, gaps, None, False, False)["new_score"] for fd in dirs]
+        assert signals.ids == [fd.name for fd in dirs]
+        np.testing.assert_allclose(scores["adjusted_score"], expected, atol=1e-9)
+
+
+# ── Ranking / Sweep Tests (4個) ────────────────────────────────────────
+
+
+class TestSweep:
+    """ウェイトスイープと順位集計."""
+
+    def test_rank_scores_stable(self):
+        ranks = rank_scores(np.array([[1.0, 3.0, 3.0, 0.5]]))
+        assert ranks.tolist() == [[3, 1, 2, 4]]
+
+    def test_base_weights_have_no_displacement(self, corpus):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        result = sweep_weights(signals, np.tile(base_weight_vector(), (3, 1)), top_k=5)
+        assert result.vector_count == 3
+        assert np.all(result.displacement == 0)
+        np.testing.assert_array_equal(result.best_rank, result.base_ranks)
+        np.testing.assert_array_equal(result.worst_rank, result.base_ranks)
+
+    def test_sweep_matches_individual_scoring(self, corpus, monkeypatch):
+        """チャンク分割しても各ウェイトで個別にスコアリングした順位と一致."""
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        vectors = sample_weight_vectors(40, concentration=5.0, seed=3)
+        monkeypatch.setattr(rice_batch, "SWEEP_CHUNK_ELEMENTS", len(dirs) * 7)
+        result = sweep_weights(signals, vectors, top_k=5)
+
+        ranks = np.array([rank_scores(score_portfolio(signals, v)["adjusted_score"]) for v in vectors])
+        np.testing.assert_allclose(result.mean_rank, ranks.mean(axis=0))
+        np.testing.assert_array_equal(result.best_rank, ranks.min(axis=0))
+        np.testing.assert_array_equal(result.worst_rank, ranks.max(axis=0))
+        np.testing.assert_allclose(result.top_k_share, (ranks <= 5).mean(axis=0))
+        assert result.displacement.max() > 0
+
+    def test_sampled_vectors_sum_to_one(self):
+        vectors = sample_weight_vectors(100, seed=0)
+        assert vectors.shape == (100, len(WEIGHT_COLUMNS))
+        np.testing.assert_allclose(vectors[:, :3].sum(axis=1), 1.0)
+        np.testing.assert_allclose(vectors[:, 3:].sum(axis=1), 1.0)
+
+
+# ── Weights File / Bounds Tests (2個) ──────────────────────────────────
+
+
+class TestWeightsAndBounds:
+
+    def test_load_weight_vectors(self, tmp_path):
+        path = tmp_path / "weights.json"
+        path.write_text(json.dumps([{"reach_user_scope": 0.6}, {}]))
+        vectors = load_weight_vectors(path)
+        assert vectors[0, 0] == 0.6
+        np.testing.assert_array_equal(vectors[1], base_weight_vector())
+        path.write_text(json.dumps([{"reach_unknown": 1.0}]))
+        with pytest.raises(ValueError):
+            load_weight_vectors(path)
+
+    def test_custom_competitive_bounds(self, corpus):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        comp = vector_competitive_adjustment(signals, bounds=(0.95, 1.05))
+        assert comp.min() >= 0.95 and comp.max() <= 1.05
+        assert comp.max() == 1.05  # 702 (HIGH + opp 8.0) は上限でクリップ
+
+
+# ── Monte Carlo Tests (3個) ────────────────────────────────────────────
+
+
+class TestMonteCarlo:
+
+    def test_percentiles_ordered_and_reproducible(self, corpus):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        a = monte_carlo_scores(signals, samples=500, top_k=5, seed=7)
+        b = monte_carlo_scores(signals, samples=500, top_k=5, seed=7)
+        np.testing.assert_array_equal(a.score_percentiles, b.score_percentiles)
+        p10, p50, p90 = a.score_percentiles
+        assert np.all(p10 <= p50) and np.all(p50 <= p90)
+        assert np.all((a.top_k_share >= 0) & (a.top_k_share <= 1))
+        with pytest.raises(ValueError):
+            monte_carlo_scores(signals, samples=10, spread=0)
+
+    def test_narrow_spread_converges_to_point_estimate(self, corpus):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        result = monte_carlo_scores(signals, samples=200, spread=1e-6, seed=0)
+        # 丸め誤差 (rice/adjusted の2段階 round) 分のみ乖離
+        for row in result.score_percentiles:
+            np.testing.assert_allclose(row, result.base_scores, atol=0.02)
+
+    def test_chunked_sampling(self, corpus, monkeypatch):
+        dirs, registry, gaps = corpus
+        signals = extract_signals(dirs, registry, gaps)
+        monkeypatch.setattr(rice_batch, "SWEEP_CHUNK_ELEMENTS", len(dirs) * 7)
+        result = monte_carlo_scores(signals, samples=50, top_k=5, seed=1)
+        assert result.score_percentiles.shape == (3, len(dirs))
+        assert result.rank_percentiles.min() >= 1
+        assert result.rank_percentiles.max() <= len(dirs)
+        data = result.to_dict()
+        assert [f["base_rank"] for f in data["features"]] == list(range(1, len(dirs) + 1))
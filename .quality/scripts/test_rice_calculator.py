@@ -4,9 +4,10 @@ rice_calculator.py v2 テストスイート.
 
 カバレッジ (~93個):
 - BriefData パース (Format A/B, エッジケース) — 12個
+- BriefTokens 単一パス・トークナイザー (旧regex実装との一致, 改行をまたぐ空白の差異) — 6個
 - ContextData research_ids 解釈 — 4個
-- RegistryData Feature ID マッチング (hackathon_project_coverage, 複数値, partial) — 10個
-- GapData (get_opportunity_score, get_is_industry_standard) — 4個
+- RegistryData Feature ID マッチング (hackathon_project_coverage, 複数値, partial) — 11個
+- GapData (get_opportunity_score, get_is_industry_standard, 先頭優先) — 5個
 - calc_reach 純粋加重和 — 8個
 - calc_impact 純粋シグナル — 8個
 - calc_confidence 4ファクター — 7個
@@ -19,6 +20,9 @@ rice_calculator.py v2 テストスイート.
 - Golden file (代表 5 Feature) — 5個
 - process_feature オーケストレーション — 4個
 - Recalculation (冪等性, 履歴) — 2個
+- History compaction (アーカイブ移動, 不変Featureの圧縮, 中断後の重複防止) — 3個
+- Parallel (--jobs シリアル一致) — 2個
+- ParseCache (ヒット復元, 内容変更時の無効化, 永続化) — 4個
 - Integration — 3個
 """
 
@@ -33,8 +37,10 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent))
 from rice_calculator import (
     BriefData,
+    BriefTokens,
     ContextData,
     GapData,
+    ParseCache,
     RegistryData,
     SpecData,
     _normalize_manual_override,
@@ -45,7 +51,9 @@ from rice_calculator import (
     calc_reach,
     calc_rice_score,
     compose_final_score,
+    iter_priority_history,
     process_feature,
+    run_features,
 )
 
 
@@ -247,6 +255,7 @@ def _empty_registry():
     r = RegistryData.__new__(RegistryData)
     r.features = []
     r.apps = []
+    r._build_coverage_index()
     return r
 
 
@@ -255,6 +264,7 @@ def _make_registry(features: list[dict]) -> RegistryData:
     r = RegistryData.__new__(RegistryData)
     r.features = features
     r.apps = []
+    r._build_coverage_index()
     return r
 
 
@@ -262,6 +272,7 @@ def _empty_gaps():
     """空の GapData."""
     g = GapData.__new__(GapData)
     g.candidates = []
+    g._build_candidate_index()
     return g
 
 
@@ -269,6 +280,7 @@ def _make_gaps(candidates: list[dict]) -> GapData:
     """カスタム candidates を持つ GapData."""
     g = GapData.__new__(GapData)
     g.candidates = candidates
+    g._build_candidate_index()
     return g
 
 
@@ -348,6 +360,83 @@ class TestBriefData:
         assert "学習者" in b.user_story
 
 
+# ── BRIEF Tokenizer Tests (6個) ────────────────────────────────────────
+
+
+# 旧regex実装と挙動が分かれやすいエッジケース
+_TOKENIZER_EDGE_CASES = {
+    "adjacent_headings": "# T\n## 1. P\n### Core Goal\n### User Value\nfoo\n### Other\nbar",
+    "value_on_next_line": "# T\n## 1. P\n- **Core Goal**:\n\n   次行の目標テキスト\n- **User Value**:   ",
+    "nested_bold": "# T\n## 1. P\n***Core Goal**: a\n**x** **User Value** : b\n**Core Goal***: c",
+    "duplicate_sections": "## 1. First\n# T\n## 1. P\n### Core Goal\nx\n## 2. S\n- s\n## 1. Again\n### Core Goal\ny",
+    "keywords_and_counts": (
+        "# T\n## 5. Scope\nIn Scope: 含む\nOUT-OF-SCOPE 除外 非対象\nİn scope\n"
+        "## 6. C\nHARD\n constraint [X] [x] [ ] 推奨 違反 禁止\n## 7. M\nLifetime\nValue\nmrretention"
+    ),
+}
+
+
+class TestBriefTokenizer:
+    """BriefTokens ベースの _parse と旧regex実装 _parse_reference の一致検証."""
+
+    @staticmethod
+    def _assert_same(text: str):
+        fast = BriefData(Path("/nonexistent/BRIEF.md"))
+        fast._parse(text)
+        ref = BriefData(Path("/nonexistent/BRIEF.md"))
+        ref._parse_reference(text)
+        for name in BriefData.CACHED_FIELDS:
+            assert getattr(fast, name) == getattr(ref, name), name
+
+    def test_format_a_matches_reference(self, tmp_dir):
+        self._assert_same(_write_brief_format_a(tmp_dir).read_text(encoding="utf-8"))
+
+    def test_format_b_matches_reference(self, tmp_dir):
+        self._assert_same(_write_brief_format_b(tmp_dir).read_text(encoding="utf-8"))
+
+    @pytest.mark.parametrize("name", sorted(_TOKENIZER_EDGE_CASES))
+    def test_edge_cases_match_reference(self, name):
+        self._assert_same(_TOKENIZER_EDGE_CASES[name])
+
+    def test_randomized_documents_match_reference(self):
+        """断片のランダム結合でも全フィールドが一致."""
+        import random
+
+        fragments = [
+            "## 1. P", "## 2. S", "## 5. Scope", "## 6. C", "## 7. M", "### Core Goal",
+            "#### core goal", "###Business Metric", "text ### User Value", "- **Core Goal**: g",
+            "**User Value**:", "**Business Metric** : ", "", "  ", "---", "|---|---|", "| a | b |",
+            "LTV", "Churn", "[x]", "[ ]", "In Scope", "out scope", "[auto-migrated]",
+            "a sufficiently long line of section content",
+        ]
+        rng = random.Random(7)
+        for _ in range(500):
+            text = "\n".join(rng.choice(fragments) for _ in range(rng.randint(0, 20)))
+            self._assert_same(text)
+
+    def test_subsection_lines(self):
+        """Format A は次の ### 行の直前まで、Format B は値1行."""
+        tokens = BriefTokens("# T\n## 1. P\n### Core Goal\na\nb\n### Next\n- **User Value**: v")
+        assert tokens.subsection_lines("1", "core goal") == ["a", "b"]
+        assert tokens.subsection_lines("1", "User Value") == [" v"]
+        assert tokens.subsection_lines("1", "Business Metric") is None
+        assert tokens.subsection_lines("9", "Core Goal") is None
+
+    @pytest.mark.parametrize("text", [
+        "# T\n## 1. P\n###\nCore Goal\n目標テキスト\n",
+        "# T\n## 1. P\n- **Core Goal**\n: 目標テキスト\n",
+    ])
+    def test_whitespace_across_newline_deviates_from_reference(self, text):
+        """既知の差異: ### / **label** 直後の空白は行内のみ (旧regexの \\s* は改行をまたぐ)."""
+        fast = BriefData(Path("/nonexistent/BRIEF.md"))
+        fast._parse(text)
+        ref = BriefData(Path("/nonexistent/BRIEF.md"))
+        ref._parse_reference(text)
+        assert ref.core_goal == "目標テキスト"
+        assert fast.core_goal == ""
+        assert BriefTokens(text).subsection_lines("1", "Core Goal") is None
+
+
 # ── ContextData Tests (6個) ────────────────────────────────────────────
 
 
@@ -371,7 +460,7 @@ class TestContextData:
         assert ctx.research_ids == ["R-200"]
 
 
-# ── RegistryData Tests (10個) ──────────────────────────────────────────
+# ── RegistryData Tests (11個) ──────────────────────────────────────────
 
 
 class TestRegistryData:
@@ -446,6 +535,17 @@ class TestRegistryData:
         names = {m["name"] for m in matches}
         assert names == {"A", "B"}
 
+    def test_coverage_index_dedup_and_order(self):
+        """同一項目内の重複 ('005,005-partial') は1件、順序は registry 出現順."""
+        r = _make_registry([
+            {"hackathon_project_coverage": "005,005-partial", "name": "A"},
+            {"hackathon_project_coverage": "cloud-tts", "name": "X"},
+            {"hackathon_project_coverage": " 05 ", "name": "B"},
+        ])
+        assert [m["name"] for m in r.get_all_matching_features("005-core")] == ["A", "B"]
+        assert r._find_registry_feature("005-core")["name"] == "A"
+        assert r.get_all_matching_features("000-none") == []
+
     def test_get_assessment_count(self):
         """assessment_count は hackathon_project_coverage でマッチング."""
         r = _make_registry([
@@ -460,7 +560,7 @@ class TestRegistryData:
         assert r.get_assessment_count("008-monetization-system") == 2
 
 
-# ── GapData Tests (4個) ────────────────────────────────────────────────
+# ── GapData Tests (5個) ────────────────────────────────────────────────
 
 
 class TestGapData:
@@ -490,6 +590,15 @@ class TestGapData:
         ])
         assert g.get_is_industry_standard("005-core") is False
 
+    def test_first_candidate_wins(self):
+        """同一 Feature 番号の candidate が複数ある場合は先頭を採用."""
+        g = _make_gaps([
+            {"existing_feature_id": None, "gap_severity": "LOW"},
+            {"existing_feature_id": "07", "gap_severity": "HIGH"},
+            {"existing_feature_id": "007", "gap_severity": "MEDIUM"},
+        ])
+        assert g.get_gap_severity("007-voice") == "HIGH"
+
 
 # ── calc_reach Tests (8個) ─────────────────────────────────────────────
 
@@ -1175,6 +1284,175 @@ class TestRecalculation:
         assert "adjusted_score" in latest
 
 
+# ── History Compaction Tests (3個) ─────────────────────────────────────
+
+
+def _history_entries(count: int) -> list[dict]:
+    return [{"timestamp": f"2025-01-{i + 1:02d}T00:00:00+00:00", "actor": "ai",
+             "adjusted_score": float(i)} for i in range(count)]
+
+
+class TestHistoryCompaction:
+    """--history-limit による priority.history の圧縮とアーカイブ."""
+
+    def _write_context(self, tmp_dir, history, rice_score=1.0):
+        _write_brief_format_a(tmp_dir)
+        (tmp_dir / "CONTEXT.json").write_text(json.dumps({
+            "feature_id": "999-test",
+            "progress": {"percentage": 0, "fr_total": 3, "fr_completed": 0},
+            "priority": {"schema": "rice-v2", "phase": "mvp",
+                         "calculated": {"rice_score": rice_score}, "history": history},
+        }))
+
+    def test_overflow_moves_to_archive(self, tmp_dir):
+        """直近N件のみインライン保持し、全履歴は順序通りストリーミング可能."""
+        old = _history_entries(5)
+        self._write_context(tmp_dir, old)
+        result = process_feature(tmp_dir, _empty_registry(), _empty_gaps(), None, True, False,
+                                 history_limit=2)
+        assert result["status"] == "updated"
+        assert result["archived"] == 4
+        data = json.loads((tmp_dir / "CONTEXT.json").read_text())
+        inline = data["priority"]["history"]
+        assert inline[0] == old[-1] and len(inline) == 2
+        archive = (tmp_dir / "priority-history.jsonl").read_text().splitlines()
+        assert [json.loads(line) for line in archive] == old[:4]
+        assert list(iter_priority_history(tmp_dir)) == old + [inline[-1]]
+
+    def test_unchanged_feature_is_compacted(self, tmp_dir):
+        """スコア不変でも圧縮される。dry-run では書き込まない."""
+        self._write_context(tmp_dir, [])
+        process_feature(tmp_dir, _empty_registry(), _empty_gaps(), None, True, False)
+        data = json.loads((tmp_dir / "CONTEXT.json").read_text())
+        data["priority"]["history"] = _history_entries(3) + data["priority"]["history"]
+        (tmp_dir / "CONTEXT.json").write_text(json.dumps(data))
+
+        dry = process_feature(tmp_dir, _empty_registry(), _empty_gaps(), None, False, False,
+                              history_limit=1)
+        assert dry["status"] == "unchanged" and dry["archived"] == 3
+        assert not (tmp_dir / "priority-history.jsonl").exists()
+
+        process_feature(tmp_dir, _empty_registry(), _empty_gaps(), None, True, False,
+                        history_limit=1)
+        after = json.loads((tmp_dir / "CONTEXT.json").read_text())
+        assert len(after["priority"]["history"]) == 1
+        assert list(iter_priority_history(tmp_dir)) == data["priority"]["history"]
+
+    def test_interrupted_archive_not_duplicated(self, tmp_dir):
+        """アーカイブ追記後に CONTEXT.json 置換前で中断しても重複しない."""
+        old = _history_entries(4)
+        self._write_context(tmp_dir, old)
+        # 前回実行の中断を再現: 先頭2件だけアーカイブ済み、CONTEXT.json は未更新
+        (tmp_dir / "priority-history.jsonl").write_text(
+            "".join(json.dumps(e, sort_keys=True) + "\n" for e in old[:2]))
+        assert list(iter_priority_history(tmp_dir)) == old
+
+        process_feature(tmp_dir, _empty_registry(), _empty_gaps(), None, True, False,
+                        history_limit=1)
+        archive = (tmp_dir / "priority-history.jsonl").read_text().splitlines()
+        assert [json.loads(line) for line in archive] == old
+        full = list(iter_priority_history(tmp_dir))
+        assert full[:4] == old and len(full) == 5
+
+
+# ── Parallel Tests (2個) ───────────────────────────────────────────────
+
+
+def _write_feature_corpus(root: Path, count: int) -> list[Path]:
+    """進捗率の異なる Feature ディレクトリを count 個生成."""
+    dirs = []
+    for n in range(count):
+        fd = root / f"{n + 900:03d}-parallel-{n}"
+        fd.mkdir()
+        if n % 2 == 0:
+            _write_brief_format_a(fd)
+        else:
+            _write_brief_format_b(fd)
+        (fd / "CONTEXT.json").write_text(json.dumps({
+            "feature_id": fd.name,
+            "progress": {"percentage": (n * 17) % 100, "fr_total": n + 1, "fr_completed": 0},
+            "quick_resume": {"current_state": "Implementing"},
+            "priority": {"schema": "rice-v2", "phase": "mvp", "calculated": {"rice_score": 1.0}},
+        }))
+        dirs.append(fd)
+    return dirs
+
+
+class TestParallel:
+    """run_features の --jobs 並列モード."""
+
+    def test_parallel_matches_serial(self, tmp_dir):
+        """jobs > 1 でもシリアル実行と同一の結果・順序."""
+        dirs = _write_feature_corpus(tmp_dir, 6)
+        r = _make_registry([{"id": "comp-001", "hackathon_project_coverage": "901,903",
+                             "assessments": {"a": {}, "b": {}}}])
+        g = _make_gaps([{"existing_feature_id": "902", "gap_severity": "HIGH",
+                         "opportunity_score": 8.0}])
+        serial = run_features(dirs, r, g, None, False, False, jobs=1)
+        parallel = run_features(dirs, r, g, None, False, False, jobs=3)
+        assert parallel == serial
+        assert [x["id"] for x in parallel] == [d.name for d in dirs]
+
+    def test_parallel_apply_writes(self, tmp_dir):
+        """jobs > 1 の --apply でも各 CONTEXT.json が更新される."""
+        dirs = _write_feature_corpus(tmp_dir, 4)
+        results = run_features(dirs, _empty_registry(), _empty_gaps(), None, True, False, jobs=2)
+        for fd, res in zip(dirs, results):
+            data = json.loads((fd / "CONTEXT.json").read_text())
+            assert data["priority"]["calculated"]["adjusted_score"] == res["new_score"]
+
+
+class TestParseCache:
+    """BRIEF/SPEC パースキャッシュ."""
+
+    def test_brief_cache_hit_restores_fields(self, tmp_dir):
+        """2回目はキャッシュヒットし、全パースフィールドが一致."""
+        _write_brief_format_a(tmp_dir)
+        cache = ParseCache()
+        first = BriefData(tmp_dir / "BRIEF.md", cache=cache)
+        second = BriefData(tmp_dir / "BRIEF.md", cache=cache)
+        plain = BriefData(tmp_dir / "BRIEF.md")
+        assert cache.stats["brief_miss"] == 1
+        assert cache.stats["brief_hit"] == 1
+        for name in BriefData.CACHED_FIELDS:
+            assert getattr(second, name) == getattr(first, name) == getattr(plain, name)
+
+    def test_content_change_invalidates(self, tmp_dir):
+        """内容が変わればキャッシュミスして再パース."""
+        spec = tmp_dir / "SPEC-901-x.md"
+        spec.write_text("FR-001\nFR-002\nAC-001\n")
+        cache = ParseCache()
+        assert SpecData(spec, cache=cache).fr_count == 2
+        spec.write_text("FR-001\nFR-002\nFR-003\nAC-001\n")
+        assert SpecData(spec, cache=cache).fr_count == 3
+        assert cache.stats["spec_miss"] == 2
+        assert cache.stats["spec_hit"] == 0
+
+    def test_save_and_reload(self, tmp_dir):
+        """保存したキャッシュを別インスタンスで再利用可能."""
+        _write_brief_format_b(tmp_dir)
+        cache_path = tmp_dir / "cache" / "parse.json"
+        cache = ParseCache(cache_path)
+        BriefData(tmp_dir / "BRIEF.md", cache=cache)
+        cache.save()
+        reloaded = ParseCache(cache_path)
+        BriefData(tmp_dir / "BRIEF.md", cache=reloaded)
+        assert reloaded.stats["brief_hit"] == 1
+
+    def test_parallel_merges_worker_entries(self, tmp_dir):
+        """並列実行時もワーカーのキャッシュ差分が親に統合される."""
+        dirs = _write_feature_corpus(tmp_dir, 4)
+        cache = ParseCache()
+        run_features(dirs, _empty_registry(), _empty_gaps(), None, False, False,
+                     jobs=2, parse_cache=cache)
+        assert cache.stats["brief_hit"] + cache.stats["brief_miss"] == 4
+        assert len(cache.entries) == 2  # Format A / B の2種類
+        hits_before = cache.stats["brief_hit"]
+        run_features(dirs, _empty_registry(), _empty_gaps(), None, False, False,
+                     jobs=1, parse_cache=cache)
+        assert cache.stats["brief_hit"] - hits_before == 4
+
+
 # ── Integration Tests (3個) ────────────────────────────────────────────
 
 
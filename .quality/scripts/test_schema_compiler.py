@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+schema_compiler.py テストスイート.
+
+カバレッジ:
+- 実スキーマ (ui-flow / CONTEXT) + 変異インスタンスで jsonschema とエラー・best_match が一致 — 1個
+- 全対応キーワード ($ref 再帰, allOf/not, patternProperties, 境界値, bool/int 区別) で一致 — 1個
+- ディスクキャッシュ (スキーマハッシュ単位で生成コードを再利用, 変更で再生成) — 1個
+- 未対応キーワード・外部 $ref は jsonschema にフォールバック — 1個
+"""
+
+import copy
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import schema_compiler  # noqa: E402
+from schema_compiler import SchemaCompileError, compile_schema, get_validator  # noqa: E402
+
+jsonschema = pytest.importorskip("jsonschema")
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+REAL_PAIRS = [
+    ("docs/ui-flow/ui-flow.schema.json", "docs/ui-flow/ui-flow.json"),
+    ("docs/_templates/context_schema.json", "docs/features/001-kaiju-voice/CONTEXT.json"),
+    ("docs/_templates/context_schema.json", "docs/_templates/context_template.json"),
+]
+JUNK = [None, True, False, 0, 1, 1.0, 2.5, -3, 10, "", "x", "zz", "done", [], [1], [1, 1],
+        [True, 1], ["a", "a"], {}, {"k": [1, 2]}, {"k": [True, 2]}, {"p_1": "s"}, {"q": 1, "p_2": 2}]
+
+
+def _key(error):
+    return (tuple(str(p) for p in error.absolute_path), error.message, error.validator)
+
+
+def _mutate(doc, rng: random.Random):
+    """ランダムに値の置換・キー削除・未知キー追加・配列要素追加を行う。"""
+    nodes = []
+    stack = [doc]
+    while stack:
+        parent = stack.pop()
+        keys = list(parent) if isinstance(parent, dict) else range(len(parent))
+        for k in keys:
+            nodes.append((parent, k))
+            if isinstance(parent[k], (dict, list)):
+                stack.append(parent[k])
+    for _ in range(rng.randint(1, 4)):
+        if not nodes:
+            break
+        parent, k = rng.choice(nodes)
+        r = rng.random()
+        if isinstance(parent, dict) and k not in parent:
+            continue
+        if r < 0.5:
+            parent[k] = copy.deepcopy(rng.choice(JUNK))
+        elif isinstance(parent, dict):
+            if r < 0.75:
+                del parent[k]
+            else:
+                parent[f"extra_{rng.randint(0, 2)}"] = rng.choice(JUNK)
+        else:
+            parent.append(copy.deepcopy(rng.choice(parent)) if parent else 1)
+    return doc
+
+
+def _assert_parity(schema, instances):
+    compiled = compile_schema(schema, cache_dir=None)
+    reference = jsonschema.Draft202012Validator(schema)
+    for doc in instances:
+        expected = list(reference.iter_errors(doc))
+        assert sorted(_key(e) for e in compiled.iter_errors(doc)) == sorted(_key(e) for e in expected)
+        best = compiled.best_match(doc)
+        expected_best = jsonschema.exceptions.best_match(expected)
+        assert (best is None) == (expected_best is None)
+        if best is not None:
+            assert _key(best) == _key(expected_best)
+
+
+def test_real_schemas_match_jsonschema():
+    rng = random.Random(0)
+    for schema_rel, instance_rel in REAL_PAIRS:
+        schema = json.loads((PROJECT_ROOT / schema_rel).read_text(encoding="utf-8"))
+        base = json.loads((PROJECT_ROOT / instance_rel).read_text(encoding="utf-8"))
+        _assert_parity(schema, [base] + [_mutate(copy.deepcopy(base), rng) for _ in range(300)])
+
+
+def test_all_supported_keywords_match_jsonschema():
+    schema = {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "required": ["id", "tags", "node"],
+        "properties": {
+            "id": {"type": "string", "pattern": "^s-\\d+$", "minLength": 3, "maxLength": 6},
+            "n": {"type": ["integer", "null"], "minimum": 0, "exclusiveMaximum": 10},
+            "x": {"type": "number", "exclusiveMinimum": 0, "maximum": 1},
+            "tags": {"type": "array", "items": {"enum": ["a", "b", 1, True]},
+                     "uniqueItems": True, "minItems": 1, "maxItems": 3},
+            "c": {"const": {"k": [1, 2]}},
+            "none": {"type": "array", "items": False},
+            "f": False,
+            "node": {"$ref": "#/$defs/node"},
+            "m": {"type": "object", "minProperties": 1, "maxProperties": 2,
+                  "patternProperties": {"^p_": {"type": "integer"}, "^q": {"type": "string"}},
+                  "additionalProperties": False},
+            "al": {"allOf": [{"type": "string"}, {"minLength": 2}], "not": {"const": "zz"}},
+        },
+        "additionalProperties": {"type": "boolean"},
+        "$defs": {"node": {"type": "object", "additionalProperties": False, "properties": {
+            "children": {"type": "array", "items": {"$ref": "#/$defs/node"}},
+            "v": {"type": "integer"},
+        }}},
+    }
+    base = {"id": "s-12", "n": 3, "x": 0.5, "tags": ["a", 1], "c": {"k": [1, 2]}, "none": [],
+            "node": {"children": [{"v": 1, "children": []}], "v": 2.0}, "m": {"p_1": 1},
+            "al": "ok", "flag": True}
+    rng = random.Random(1)
+    _assert_parity(schema, [base] + [_mutate(copy.deepcopy(base), rng) for _ in range(1500)])
+    assert compile_schema(schema, cache_dir=None).is_valid(base)
+
+
+def test_disk_cache_reuses_generated_code(tmp_path, monkeypatch):
+    schema = {"type": "object", "properties": {"a": {"type": "integer"}}}
+    first = compile_schema(schema, cache_dir=tmp_path)
+    assert first.source_path is not None and first.source_path.parent == tmp_path
+    assert [e.message for e in first.iter_errors({"a": "x"})] == ["'x' is not of type 'integer'"]
+
+    # プロセス内メモを消しても生成は行わず, 保存済みソースを読み込む
+    monkeypatch.setattr(schema_compiler, "_COMPILED", {})
+    monkeypatch.setattr(schema_compiler, "generate_source",
+                        lambda s: pytest.fail("キャッシュ済みスキーマを再生成した"))
+    second = compile_schema(schema, cache_dir=tmp_path)
+    assert second is not first and second.source_path == first.source_path
+    assert second.is_valid({"a": 1})
+
+    monkeypatch.undo()
+    changed = compile_schema({**schema, "required": ["a"]}, cache_dir=tmp_path)
+    assert changed.digest != first.digest
+    assert len(list(tmp_path.glob("schema_*.py"))) == 2
+
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps(schema))
+    assert schema_compiler.load_validator(schema_file, cache_dir=tmp_path) is \
+        schema_compiler.load_validator(schema_file, cache_dir=tmp_path)
+
+
+def test_unsupported_schema_falls_back_to_jsonschema():
+    for schema in [{"anyOf": [{"type": "string"}, {"type": "integer"}]},
+                   {"properties": {"a": {"$ref": "other.json#/a"}}},
+                   {"$schema": "http://json-schema.org/draft-07/schema#", "type": "string"}]:
+        with pytest.raises(SchemaCompileError):
+            compile_schema(schema, cache_dir=None)
+        validator = get_validator(schema, cache_dir=None)
+        assert not validator.compiled
+    validator = get_validator({"anyOf": [{"type": "string"}, {"type": "integer"}]}, cache_dir=None)
+    assert validator.is_valid("x") and not validator.is_valid(1.5)
+    assert validator.best_match(1.5).validator == "anyOf"
+    with pytest.raises(SchemaCompileError):
+        compile_schema({"type": "strng"}, cache_dir=None)
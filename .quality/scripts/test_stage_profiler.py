@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+stage_profiler.py テストスイート.
+
+カバレッジ:
+- percentile (線形補間) — 1個
+- StageProfiler (Feature/ランレベルのステージ, 集計, drain/absorb) — 2個
+- rice_calculator 連携 (シリアル/並列で全ステージ記録) — 1個
+"""
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rice_calculator import GapData, RegistryData, run_features  # noqa: E402
+from stage_profiler import NULL_PROFILER, StageProfiler, format_report, percentile  # noqa: E402
+
+
+def test_percentile():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 90) == pytest.approx(4.6)
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+class TestStageProfiler:
+
+    def test_feature_and_run_stages(self):
+        profiler = StageProfiler()
+        for fid in ("a", "b"):
+            with profiler.feature(fid):
+                with profiler.stage("parse"):
+                    pass
+                with profiler.stage("parse"):  # 同名ステージは加算
+                    pass
+        with profiler.stage("commit"):
+            pass
+        summary = profiler.summary()
+        assert summary["features"] == 2
+        assert summary["stages"]["parse"]["count"] == 2
+        assert set(summary["run_stages"]) == {"commit"}
+        assert [r["feature"] for r in summary["slowest_features"]] in (["a", "b"], ["b", "a"])
+        assert "parse" in format_report(summary)
+        with NULL_PROFILER.feature("x"), NULL_PROFILER.stage("y"):
+            pass
+
+    def test_drain_absorb(self):
+        worker = StageProfiler()
+        with worker.feature("a"), worker.stage("parse"):
+            pass
+        parent = StageProfiler()
+        parent.absorb(pickle.loads(pickle.dumps(worker.drain())))
+        assert worker.records == []
+        assert parent.summary()["stages"]["parse"]["count"] == 1
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_run_features_records_all_stages(tmp_path, jobs):
+    dirs = []
+    for n in range(3):
+        fd = tmp_path / f"96{n}-prof"
+        fd.mkdir()
+        (fd / "BRIEF.md").write_text("# Brief\n\n## 0. Original Request\n\n> req\n", encoding="utf-8")
+        (fd / "CONTEXT.json").write_text(json.dumps({
+            "feature_id": fd.name,
+            "progress": {"percentage": 10 * n},
+            "quick_resume": {"current_state": "Implementing"},
+        }))
+        dirs.append(fd)
+    registry = RegistryData.__new__(RegistryData)
+    registry.features, registry.apps = [], []
+    registry._build_coverage_index()
+    gaps = GapData.__new__(GapData)
+    gaps.candidates = []
+    gaps._build_candidate_index()
+
+    profiler = StageProfiler()
+    run_features(dirs, registry, gaps, None, True, False, jobs=jobs, profiler=profiler)
+    summary = profiler.summary()
+    assert summary["features"] == 3
+    for stage in ("read_context", "parse_brief", "parse_spec", "calc_reach", "calc_impact",
+                  "calc_confidence", "calc_effort", "calc_competitive_adjustment",
+                  "serialize", "write_stage"):
+        assert summary["stages"][stage]["count"] == 3, stage
+    assert "write_commit" in summary["run_stages"]
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+validation_daemon.py テストスイート.
+
+カバレッジ:
+- checks_for_paths (変更パス → 影響チェック) — 1個
+- デーモン未起動時の同一プロセスフォールバック — 1個
+- デーモン経由の結果が同一プロセス実行と一致 — 1個
+- 検証スクリプト更新 (stale) でデーモン終了 + フォールバック — 1個
+- 相対ソケットパスの絶対化 + bind 時点で所有者のみのパーミッション — 1個
+- sun_path 上限超過のパスは同一プロセス実行へフォールバック (警告) / サーバーは ValueError — 1個
+"""
+
+import os
+import shutil
+import socketserver
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import quality_runner  # noqa: E402
+from validation_daemon import MAX_SOCKET_PATH_BYTES, ValidationServer, _request, run  # noqa: E402
+
+FAST_CHECKS = ["docs-consistency", "cross-feature-imports"]
+
+
+def _strip_timings(report: dict) -> dict:
+    checks = [{k: v for k, v in c.items() if k not in ("duration_ms", "cached")}
+              for c in report["checks"]]
+    return {"exit_code": report["exit_code"], "checks": checks}
+
+
+@pytest.fixture
+def socket_path():
+    # AF_UNIX のパス長制限 (108 bytes) を避けるため tmp_path ではなく短いディレクトリを使用
+    d = Path(tempfile.mkdtemp(prefix="vd"))
+    yield d / "v.sock"
+    shutil.rmtree(d, ignore_errors=True)
+
+
+@pytest.fixture
+def daemon(socket_path, monkeypatch):
+    monkeypatch.chdir(quality_runner.PROJECT_ROOT)
+    server = ValidationServer(socket_path, idle_timeout=0)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05},
+                              daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    thread.join(timeout=5)
+
+
+def test_checks_for_paths():
+    assert quality_runner.checks_for_paths(["docs/ui-flow/ui-flow.json"]) == ["ui-flow"]
+    assert quality_runner.checks_for_paths(["src/features/battle/index.ts"]) == [
+        "ui-flow", "docs-consistency", "nav-graph", "cross-feature-imports"]
+    assert "feature-doctor" in quality_runner.checks_for_paths(
+        ["docs/features/001-kaiju-voice/CONTEXT.json"])
+    assert quality_runner.checks_for_paths(["README.md"]) == []
+
+
+def test_falls_back_in_process_without_daemon(socket_path, monkeypatch):
+    monkeypatch.chdir(quality_runner.PROJECT_ROOT)
+    assert _request({"op": "ping"}, socket_path) is None
+    report = run(FAST_CHECKS, socket_path=socket_path)
+    assert report["served_by"] == "in-process"
+    assert [c["name"] for c in report["checks"]] == FAST_CHECKS
+
+
+def test_daemon_report_matches_in_process(daemon, socket_path):
+    assert _request({"op": "ping"}, socket_path)["ok"] is True
+    served = run(FAST_CHECKS, socket_path=socket_path)
+    assert served["served_by"] == "daemon"
+    local = run(FAST_CHECKS, socket_path=socket_path, use_daemon=False)
+    assert _strip_timings(served) == _strip_timings(local)
+    with pytest.raises(ValueError, match="不明なチェック"):
+        run(["no-such-check"], socket_path=socket_path)
+
+
+def test_stale_code_shuts_down_daemon(daemon, socket_path):
+    daemon.code_signature = [("changed", 0, 0)]
+    report = run(FAST_CHECKS, socket_path=socket_path)
+    assert report["served_by"] == "in-process"
+    for _ in range(100):
+        if not socket_path.exists():
+            break
+        threading.Event().wait(0.05)
+    assert _request({"op": "ping"}, socket_path) is None
+
+
+def test_relative_socket_bound_owner_only(socket_path, monkeypatch):
+    bound_modes = []
+    server_bind = socketserver.UnixStreamServer.server_bind
+
+    def _server_bind(self):
+        server_bind(self)
+        bound_modes.append(stat.S_IMODE(os.stat(self.server_address).st_mode))
+
+    monkeypatch.setattr(socketserver.UnixStreamServer, "server_bind", _server_bind)
+    monkeypatch.chdir(socket_path.parent)
+    umask = os.umask(0o022)
+    try:
+        server = ValidationServer(Path(socket_path.name), idle_timeout=0)
+    finally:
+        restored = os.umask(umask)
+    try:
+        assert server.socket_path == socket_path
+        assert server.server_address == str(socket_path)
+        # bind 直後から group/other の権限がない
+        assert bound_modes and bound_modes[0] & 0o077 == 0
+        assert restored == 0o022  # bind 後にプロセスの umask は元に戻っている
+    finally:
+        server.server_close()
+    assert not socket_path.exists()
+
+
+def test_too_long_socket_path_falls_back(socket_path, monkeypatch, capsys):
+    monkeypatch.chdir(quality_runner.PROJECT_ROOT)
+    long_path = socket_path.parent / ("d" * MAX_SOCKET_PATH_BYTES) / "v.sock"
+    report = run(FAST_CHECKS, socket_path=long_path)
+    assert report["served_by"] == "in-process"
+    assert "ソケットパスが長すぎます" in capsys.readouterr().err
+    with pytest.raises(ValueError, match="ソケットパスが長すぎます"):
+        ValidationServer(long_path, idle_timeout=0)
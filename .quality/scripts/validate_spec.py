@@ -7,6 +7,8 @@ SPEC 文書の完全性と Tier/MVS 準拠状況を検証します。
 Usage:
     python validate_spec.py <spec_file>
     python validate_spec.py docs/features/001-bridge-grammar-engine/SPEC-001-bridge-grammar-engine.md
+    python validate_spec.py --staged                # ステージ済み変更の Feature の SPEC を全て検証
+    python validate_spec.py --changed-since main      # 未追跡ファイルも対象 (spec_file との併用不可)
 
 Exit codes:
     0: 検証通過
@@ -14,6 +16,7 @@ Exit codes:
     2: Tier 必須要素未達（警告）
 """
 
+import argparse
 import re
 import sys
 import json
@@ -21,6 +24,12 @@ from pathlib import Path
 from dataclasses import dataclass, field
 from typing import Optional
 
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+from changed_scope import PROJECT_ROOT, add_scope_arguments, scope_from_args  # noqa: E402
+
+FEATURES_DIR = PROJECT_ROOT / "docs" / "features"
+
 
 @dataclass
 class ValidationResult:
@@ -155,8 +164,7 @@ class SpecValidator:
             return [f"ARB ファイルなし: {arb_path}"]
 
         try:
-            arb_content = arb_path.read_text(encoding='utf-8')
-            arb_data = json.loads(arb_content)
+            arb_data = json_codec.load_path(arb_path)
         except (json.JSONDecodeError, Exception) as e:
             return [f"ARB ファイルパースエラー: {e}"]
 
@@ -300,29 +308,52 @@ def print_result(result: ValidationResult, spec_path: Path):
     print(f"{'='*60}\n")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_spec.py <spec_file>")
-        print("Example: python validate_spec.py docs/features/001-bridge-grammar-engine/SPEC-001-bridge-grammar-engine.md")
-        sys.exit(1)
+def exit_code_for(result: ValidationResult) -> int:
+    if not result.mvs_passed:
+        return 1  # MVS 未達
+    if not result.tier_passed:
+        return 2  # Tier 未達（警告）
+    return 0  # 通過
 
-    spec_path = Path(sys.argv[1])
-    if not spec_path.exists():
-        print(f"Error: ファイルが見つかりません: {spec_path}")
-        sys.exit(1)
 
-    validator = SpecValidator(spec_path)
-    result = validator.validate()
+def scoped_spec_paths(scope) -> list[Path]:
+    """スコープ内 Feature の SPEC ファイル (Feature ディレクトリ名順)。"""
+    if not FEATURES_DIR.is_dir():
+        return []
+    return [spec for d in sorted(FEATURES_DIR.iterdir()) if d.is_dir() and scope.includes(d.name)
+            for spec in sorted(d.glob("SPEC*.md"))]
 
-    print_result(result, spec_path)
 
-    # Exit code
-    if not result.mvs_passed:
-        sys.exit(1)  # MVS 未達
-    elif not result.tier_passed:
-        sys.exit(2)  # Tier 未達（警告）
+def main():
+    parser = argparse.ArgumentParser(description="SPEC 文書の MVS/Tier 準拠を検証")
+    parser.add_argument("spec_file", nargs="?", type=Path, help="検証する SPEC ファイル")
+    add_scope_arguments(parser)
+    args = parser.parse_args()
+    if args.spec_file is not None and (args.changed_since or args.staged):
+        # どちらを優先しても指定の一方が黙って無視されるため併用不可
+        parser.error("spec_file と --changed-since / --staged は同時に指定できません")
+    scope = scope_from_args(args, parser)
+
+    if scope is None:
+        if args.spec_file is None:
+            print("Usage: python validate_spec.py <spec_file>")
+            print("Example: python validate_spec.py docs/features/001-bridge-grammar-engine/SPEC-001-bridge-grammar-engine.md")
+            sys.exit(1)
+        spec_paths = [args.spec_file]
+        if not args.spec_file.exists():
+            print(f"Error: ファイルが見つかりません: {args.spec_file}")
+            sys.exit(1)
     else:
-        sys.exit(0)  # 通過
+        spec_paths = scoped_spec_paths(scope)
+        print(f"{scope.describe()} → SPEC {len(spec_paths)} 件")
+
+    # Exit code (複数 SPEC は最悪値: MVS 未達 > Tier 未達 > 通過)
+    codes = []
+    for spec_path in spec_paths:
+        result = SpecValidator(spec_path).validate()
+        print_result(result, spec_path)
+        codes.append(exit_code_for(result))
+    sys.exit(1 if 1 in codes else max(codes, default=0))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Validation Daemon — quality_runner チェックの常駐サーバー + Unix ソケットクライアント
+
+インタープリター起動・jsonschema の import・スキーマ読み込み/コンパイル・docs コーパスの
+パースを常駐プロセスに保持し、エディタの保存フック等から数十ミリ秒で結果を返す。
+
+- プロトコル: Unix ソケット上の改行区切り JSON (1リクエスト = 1行, 1レスポンス = 1行)
+    → {"op": "run", "checks": [...], "paths": [...], "options": {...}}
+    ← quality_runner.report_dict() + {"served_by": "daemon"}
+- デーモン未起動/応答なし/旧コードの場合、クライアントは同一プロセス実行へ透過的にフォールバック
+- ソケットは絶対パスに正規化し、umask 077 の下で bind (作成時点から所有者のみ接続可)。
+  sun_path の上限を超えるパスではデーモンを使わず同一プロセスで実行 (警告を表示)
+- デーモンは起動時の検証スクリプト群の stat を記録し、変更を検知したら応答せず終了する
+  (古いコードで検証結果を返さない)
+- 一定時間リクエストがなければ自動終了 (--idle-timeout)
+
+Usage:
+    python3 .quality/scripts/validation_daemon.py start              # バックグラウンド起動
+    python3 .quality/scripts/validation_daemon.py serve              # フォアグラウンド起動
+    python3 .quality/scripts/validation_daemon.py status | stop
+    python3 .quality/scripts/validation_daemon.py check              # 全チェック (デーモン or 同一プロセス)
+    python3 .quality/scripts/validation_daemon.py check docs/ui-flow/ui-flow.json   # 変更パスで絞り込み
+    python3 .quality/scripts/validation_daemon.py check --checks nav-graph --json
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+import json_codec  # noqa: E402
+import path_index  # noqa: E402
+import quality_runner  # noqa: E402
+from check_cache import CheckCache  # noqa: E402
+from quality_runner import PROJECT_ROOT, CheckOutcome  # noqa: E402
+
+SOCKET_PATH = PROJECT_ROOT / ".quality" / "cache" / "validation.sock"
+PROTOCOL_VERSION = 1
+DEFAULT_IDLE_TIMEOUT = 30 * 60  # 秒
+CONNECT_TIMEOUT = 0.5
+REQUEST_TIMEOUT = 120.0
+MAX_REQUEST_BYTES = 1 << 20
+START_WAIT = 5.0
+# sun_path の上限 (終端 NUL を除く): Linux 108 bytes, macOS/BSD 104 bytes
+MAX_SOCKET_PATH_BYTES = 107 if sys.platform.startswith("linux") else 103
+
+# 変更されたらデーモンを終了させる (古いコードで検証しない) 対象
+_CODE_FILES = (
+    Path(__file__).resolve(),
+    quality_runner.QUALITY_SCRIPTS_DIR / "quality_runner.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "check_cache.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "context_corpus.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "json_codec.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "feature_doctor.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "nav-graph-validator.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "nav_graph_core.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "nav_graph_shards.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "atomic_write.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "path_index.py",
+    quality_runner.QUALITY_SCRIPTS_DIR / "schema_compiler.py",
+    quality_runner.SCRIPTS_DIR / "validate_ui_flow.py",
+    quality_runner.SCRIPTS_DIR / "validate_docs_consistency.py",
+    quality_runner.SCRIPTS_DIR / "check_cross_feature_imports.py",
+)
+
+
+class DaemonError(Exception):
+    """デーモンとの通信失敗 (呼び出し側は同一プロセス実行へフォールバック)。"""
+
+
+def socket_path_error(socket_path: Path) -> Optional[str]:
+    """AF_UNIX で bind/connect できないパスならその理由 (問題なければ None)。"""
+    size = len(os.fsencode(socket_path))
+    if size > MAX_SOCKET_PATH_BYTES:
+        return f"ソケットパスが長すぎます ({size} bytes > {MAX_SOCKET_PATH_BYTES}): {socket_path}"
+    return None
+
+
+def _absolute(socket_path: Path) -> Path:
+    # serve() は PROJECT_ROOT へ chdir し、start() は cwd=PROJECT_ROOT で子プロセスを起動する
+    return Path(os.path.abspath(socket_path))
+
+
+def code_signature() -> list:
+    sig = []
+    for path in _CODE_FILES:
+        try:
+            st = path.stat()
+            sig.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append((str(path), None, None))
+    return sig
+
+
+# ── Execution (daemon / in-process 共通) ─────────────────────────────────
+
+def execute(checks: Optional[list[str]] = None, paths: Optional[list[str]] = None,
+            options: Optional[dict] = None, cache: Optional[CheckCache] = None) -> dict:
+    """チェック実行 → quality_runner.report_dict()。
+
+    checks 未指定時は paths から影響チェックを選択 (paths も未指定なら全チェック)。
+    cache 未指定時は結果キャッシュをディスクから読み込む (options["no_cache"] で無効化)。
+    """
+    options = options or {}
+    if options.get("no_cache"):
+        cache = None
+    elif cache is None:
+        cache = CheckCache()
+    # 常駐プロセスではリクエスト間にファイルが変わるため毎回スナップショットを取り直す
+    path_index.invalidate()
+    if not checks:
+        checks = quality_runner.checks_for_paths(paths) if paths else list(quality_runner.CHECKS)
+    kwargs = {}
+    if options.get("ui_flow"):
+        kwargs["ui_flow_path"] = Path(options["ui_flow"])
+    if options.get("nav_graph"):
+        kwargs["nav_graph_path"] = Path(options["nav_graph"])
+    selected = quality_runner.build_checks(checks, doctor_sync=bool(options.get("doctor_sync")),
+                                           cache=cache, **kwargs)
+    start = time.perf_counter()
+    outcomes = quality_runner.run_checks(selected, int(options.get("jobs", 0)))
+    wall_ms = (time.perf_counter() - start) * 1000
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError:
+            pass  # キャッシュは再生成可能 (保存失敗で結果は変わらない)
+    return quality_runner.report_dict(outcomes, wall_ms)
+
+
+# ── Server ────────────────────────────────────────────────────────────────
+
+class _Handler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        server: ValidationServer = self.server  # type: ignore[assignment]
+        server.touch()
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        try:
+            request = json_codec.loads(line)
+            response = server.dispatch(request)
+        except (ValueError, TypeError) as e:
+            response = {"error": f"bad request: {e}"}
+        if response is None:
+            return
+        self.wfile.write(json_codec.dump_bytes(response, pretty=False, newline=True))
+
+
+class ValidationServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """検証スクリプトと docs コーパスを常駐させる Unix ソケットサーバー。"""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        socket_path = _absolute(socket_path)
+        error = socket_path_error(socket_path)
+        if error:
+            raise ValueError(error)
+        self.socket_path = socket_path
+        self.idle_timeout = idle_timeout
+        self.code_signature = code_signature()
+        self.check_cache = CheckCache()  # 常駐中はメモリ上で保持 (各実行後に保存)
+        self.started = time.time()
+        self.requests = 0
+        self._last = time.monotonic()
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # bind 後の chmod では作成〜chmod の間に他ユーザーが接続できるため、作成時点で制限する
+        umask = os.umask(0o077)
+        try:
+            super().__init__(str(socket_path), _Handler)
+        finally:
+            os.umask(umask)
+
+    def touch(self) -> None:
+        self._last = time.monotonic()
+
+    def idle_seconds(self) -> float:
+        return time.monotonic() - self._last
+
+    def dispatch(self, request: dict) -> Optional[dict]:
+        op = request.get("op", "run")
+        if request.get("protocol") != PROTOCOL_VERSION:
+            return {"error": "protocol mismatch"}
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "uptime_s": round(time.time() - self.started, 1),
+                    "requests": self.requests}
+        if op == "shutdown":
+            self.stop()
+            return {"ok": True}
+        if op != "run":
+            return {"error": f"unknown op: {op}"}
+        if code_signature() != self.code_signature:
+            # 検証スクリプトが更新された: 結果を返さず終了 → クライアントは同一プロセスで実行
+            self.stop()
+            return {"error": "stale"}
+        self.requests += 1
+        try:
+            report = execute(request.get("checks"), request.get("paths"), request.get("options"),
+                             self.check_cache)
+        except ValueError as e:
+            return {"error": str(e)}
+        report["served_by"] = "daemon"
+        return report
+
+    def stop(self) -> None:
+        """ハンドラスレッドから呼べる停止 (serve_forever 終了後にソケットも削除)。"""
+        def _stop():
+            self.shutdown()
+            self.server_close()
+        threading.Thread(target=_stop, daemon=True).start()
+
+    def server_close(self):
+        super().server_close()
+        try:
+            self.socket_path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _idle_watchdog(server: ValidationServer) -> None:
+    while True:
+        time.sleep(min(5.0, server.idle_timeout))
+        if server.idle_seconds() >= server.idle_timeout:
+            server.stop()
+            return
+
+
+def serve(socket_path: Path = SOCKET_PATH, idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+          warm: bool = True) -> None:
+    """フォアグラウンドで常駐 (idle_timeout 秒リクエストがなければ終了)。"""
+    socket_path = _absolute(socket_path)
+    error = socket_path_error(socket_path)
+    if error:
+        print(f"ERROR: {error} (check は同一プロセスで実行されます)", file=sys.stderr)
+        sys.exit(1)
+    if _request({"op": "ping"}, socket_path) is not None:
+        print(f"ERROR: デーモンは既に起動しています: {socket_path}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        socket_path.unlink()  # 異常終了で残ったソケットファイル
+    except FileNotFoundError:
+        pass
+
+    # feature_doctor は docs/ 相対パスで動作する
+    os.chdir(PROJECT_ROOT)
+    if warm:
+        # 初回リクエストを待たずに import・スキーマ・コーパスをロード
+        execute()
+    server = ValidationServer(socket_path, idle_timeout)
+    if idle_timeout > 0:
+        threading.Thread(target=_idle_watchdog, args=(server,), daemon=True).start()
+    try:
+        server.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# ── Client ────────────────────────────────────────────────────────────────
+
+def _request(payload: dict, socket_path: Path = SOCKET_PATH,
+             timeout: float = REQUEST_TIMEOUT) -> Optional[dict]:
+    """デーモンへ1リクエスト。未起動 (接続不可) なら None、通信失敗は DaemonError。"""
+    if not socket_path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return None
+        sock.settimeout(timeout)
+        sock.sendall(json_codec.dump_bytes({**payload, "protocol": PROTOCOL_VERSION},
+                                           pretty=False, newline=True))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+    except OSError as e:
+        raise DaemonError(str(e)) from e
+    finally:
+        sock.close()
+    if not chunks:
+        raise DaemonError("empty response")
+    try:
+        return json_codec.loads(b"".join(chunks))
+    except ValueError as e:
+        raise DaemonError(f"invalid response: {e}") from e
+
+
+def run(checks: Optional[list[str]] = None, paths: Optional[list[str]] = None,
+        options: Optional[dict] = None, socket_path: Path = SOCKET_PATH,
+        use_daemon: bool = True) -> dict:
+    """デーモンがあれば委譲、なければ (または失敗時) 同一プロセスで実行。"""
+    socket_path = _absolute(socket_path)
+    error = socket_path_error(socket_path) if use_daemon else None
+    if error:
+        print(f"WARNING: {error} — デーモンを使わず同一プロセスで実行します", file=sys.stderr)
+        use_daemon = False
+    if use_daemon:
+        try:
+            response = _request({"op": "run", "checks": checks, "paths": paths,
+                                 "options": options or {}}, socket_path)
+        except DaemonError:
+            response = None
+        if response is not None and "error" not in response:
+            return response
+        if response is not None and response["error"].startswith("不明なチェック"):
+            raise ValueError(response["error"])
+    os.chdir(PROJECT_ROOT)
+    report = execute(checks, paths, options)
+    report["served_by"] = "in-process"
+    return report
+
+
+def start(socket_path: Path = SOCKET_PATH, idle_timeout: float = DEFAULT_IDLE_TIMEOUT) -> Optional[dict]:
+    """バックグラウンドでデーモンを起動し、応答可能になるまで待機。Returns ping 応答。
+
+    socket_path が sun_path の上限を超える場合は ValueError。
+    """
+    socket_path = _absolute(socket_path)
+    error = socket_path_error(socket_path)
+    if error:
+        raise ValueError(error)
+    ping = _request({"op": "ping"}, socket_path)
+    if ping is not None:
+        return ping
+    subprocess.Popen([sys.executable, str(Path(__file__).resolve()), "serve",
+                      "--socket", str(socket_path), "--idle-timeout", str(idle_timeout)],
+                     stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                     stderr=subprocess.DEVNULL, start_new_session=True, cwd=PROJECT_ROOT)
+    deadline = time.monotonic() + START_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        try:
+            ping = _request({"op": "ping"}, socket_path, timeout=1.0)
+        except DaemonError:
+            continue
+        if ping is not None:
+            return ping
+    return None
+
+
+# ── Main ──────────────────────────────────────────────────────────────────
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="品質チェック常駐デーモン / クライアント")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="フォアグラウンドで常駐")
+    p_start = sub.add_parser("start", help="バックグラウンドで起動")
+    for p in (p_serve, p_start):
+        p.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+                       help=f"無通信で終了するまでの秒数 (0 = 無期限, デフォルト: {DEFAULT_IDLE_TIMEOUT})")
+    p_serve.add_argument("--no-warm", action="store_true", help="起動時の事前ロードを行わない")
+    p_stop = sub.add_parser("stop", help="デーモンを停止")
+    p_status = sub.add_parser("status", help="デーモンの状態")
+
+    p_check = sub.add_parser("check", help="チェック実行 (デーモン未起動なら同一プロセス)")
+    p_check.add_argument("paths", nargs="*", help="変更パス (影響するチェックのみ実行)")
+    p_check.add_argument("--checks", help="実行するチェック (カンマ区切り, paths より優先)")
+    p_check.add_argument("--json", action="store_true", help="JSON形式で出力")
+    p_check.add_argument("--no-daemon", action="store_true", help="常に同一プロセスで実行")
+    p_check.add_argument("--no-cache", action="store_true", help="結果キャッシュを使わず全チェックを実行")
+    p_check.add_argument("--doctor-sync", action="store_true",
+                         help="feature-doctor で verify_feature_status も実行")
+    for p in (p_serve, p_start, p_stop, p_status, p_check):
+        p.add_argument("--socket", type=Path, default=SOCKET_PATH, help="Unix ソケットパス")
+    args = parser.parse_args()
+    socket_path = _absolute(args.socket)
+
+    if args.command == "serve":
+        serve(socket_path, args.idle_timeout, warm=not args.no_warm)
+        return
+    if args.command == "start":
+        try:
+            ping = start(socket_path, args.idle_timeout)
+        except ValueError as e:
+            print(f"ERROR: {e} (check は同一プロセスで実行されます)", file=sys.stderr)
+            sys.exit(1)
+        if ping is None:
+            print("ERROR: デーモンの起動を確認できませんでした", file=sys.stderr)
+            sys.exit(1)
+        print(f"validation daemon: pid {ping['pid']} ({socket_path})")
+        return
+    if args.command in ("stop", "status"):
+        try:
+            response = _request({"op": "shutdown" if args.command == "stop" else "ping"}, socket_path)
+        except DaemonError as e:
+            response = None
+            print(f"WARNING: {e}", file=sys.stderr)
+        if response is None:
+            print("validation daemon: 停止中")
+            sys.exit(0 if args.command == "stop" else 1)
+        if args.command == "status":
+            print(f"validation daemon: pid {response['pid']}, uptime {response['uptime_s']}s, "
+                  f"{response['requests']} requests ({socket_path})")
+        else:
+            print("validation daemon: 停止しました")
+        return
+
+    checks = [n.strip() for n in args.checks.split(",") if n.strip()] if args.checks else None
+    options = {"doctor_sync": args.doctor_sync, "no_cache": args.no_cache}
+    try:
+        report = run(checks, args.paths or None, options, socket_path,
+                     use_daemon=not args.no_daemon)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.json:
+        print(json_codec.dumps(report))
+    else:
+        outcomes = [CheckOutcome(**c) for c in report["checks"]]
+        print(quality_runner.format_text(outcomes, report["wall_ms"]))
+        print(f"  (served by {report['served_by']})")
+    sys.exit(report["exit_code"])
+
+
+if __name__ == "__main__":
+    main()
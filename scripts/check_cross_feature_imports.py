@@ -71,19 +71,26 @@ def check_file(filepath: str) -> list[str]:
     return violations
 
 
-def main() -> int:
-    violations: list[str] = []
-
+def collect_violations() -> list[str] | None:
+    """src/features/ 配下の全違反 (ディレクトリなしなら None)"""
     if not os.path.isdir(SRC_FEATURES):
-        print("src/features/ ディレクトリが見つかりません")
-        return 1
+        return None
 
+    violations: list[str] = []
     for root, _dirs, files in os.walk(SRC_FEATURES):
         for fname in files:
             if not fname.endswith((".ts", ".tsx")):
                 continue
             filepath = os.path.join(root, fname)
             violations.extend(check_file(filepath))
+    return violations
+
+
+def main() -> int:
+    violations = collect_violations()
+    if violations is None:
+        print("src/features/ ディレクトリが見つかりません")
+        return 1
 
     if violations:
         print(f"Cross-Feature 内部 import 違反: {len(violations)}件")
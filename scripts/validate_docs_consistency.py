@@ -3,9 +3,9 @@
 ドキュメント-実装整合性検証スクリプト
 
 feature-registry.json を SSOT として、src/features/ と docs/features/ の
-完全対応・SPEC構造・CONTEXT.json必須フィールドを検証する。
+完全対応・SPEC構造・CONTEXT.json必須フィールド・スキーマ準拠を検証する。
 
-8項目検証、3段階深刻度:
+9項目検証、3段階深刻度:
   MVS (exit 1)  — コミット不可
   Tier (exit 2) — 警告（推奨修正）
   Warning (exit 0) — 情報提供のみ
@@ -13,6 +13,9 @@ feature-registry.json を SSOT として、src/features/ と docs/features/ の
 使用法:
     python3 scripts/validate_docs_consistency.py
     python3 scripts/validate_docs_consistency.py --json
+    python3 scripts/validate_docs_consistency.py --staged              # 変更Featureのみ (D1/D5/D8 は全件)
+    python3 scripts/validate_docs_consistency.py --changed-since main
+    python3 scripts/validate_docs_consistency.py --no-cache            # 結果キャッシュを使わない
 """
 
 import argparse
@@ -20,7 +23,7 @@ import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
@@ -30,10 +33,50 @@ FEATURES_SRC_DIR = PROJECT_ROOT / "src" / "features"
 FEATURES_DOCS_DIR = PROJECT_ROOT / "docs" / "features"
 REGISTRY_PATH = FEATURES_DOCS_DIR / "feature-registry.json"
 INDEX_MD_PATH = FEATURES_DOCS_DIR / "index.md"
+CONTEXT_SCHEMA_PATH = PROJECT_ROOT / "docs" / "_templates" / "context_schema.json"
+
+# D9: 1ファイルあたりの詳細表示上限 (超過分は件数のみ)
+D9_MAX_DETAILS_PER_FILE = 10
 
 # 除外ディレクトリ
 EXCLUDED_DIRS = {".DS_Store", "_example", "__pycache__"}
 
+# 品質スクリプト共有のコーパスキャッシュ (同一プロセス内の CONTEXT.json 再パース回避)
+sys.path.insert(0, str(PROJECT_ROOT / ".quality" / "scripts"))
+try:
+    import context_corpus
+    HAS_CONTEXT_CORPUS = True
+except ImportError:
+    HAS_CONTEXT_CORPUS = False
+
+# git diff による検証対象の絞り込み (--changed-since / --staged)
+try:
+    import changed_scope
+    HAS_CHANGED_SCOPE = True
+except ImportError:
+    HAS_CHANGED_SCOPE = False
+
+# 入力ハッシュによる結果キャッシュ (D5: index.md + registry mappings が不変なら実行しない)
+try:
+    from check_cache import CheckCache, script_version
+    HAS_CHECK_CACHE = True
+except ImportError:
+    HAS_CHECK_CACHE = False
+
+# 大量のパス存在確認を1回のディレクトリ走査で応答 (D7)
+try:
+    import path_index
+    HAS_PATH_INDEX = True
+except ImportError:
+    HAS_PATH_INDEX = False
+
+# CONTEXT.json 全件のスキーマ検証をコンパイル済み検証コードで実行 (D9)
+try:
+    import schema_compiler
+    HAS_SCHEMA_COMPILER = True
+except ImportError:
+    HAS_SCHEMA_COMPILER = False
+
 
 @dataclass
 class CheckResult:
@@ -45,6 +88,7 @@ class CheckResult:
     total: int = 0
     ok_count: int = 0
     details: list = field(default_factory=list)
+    cached: bool = False  # 結果キャッシュから返した (チェック未実行)
 
 
 @dataclass
@@ -54,6 +98,7 @@ class ValidationReport:
     mvs_failures: int = 0
     tier_failures: int = 0
     warnings: int = 0
+    scope: Optional[str] = None  # 絞り込み時の説明 (None = 全Feature)
 
     @property
     def exit_code(self) -> int:
@@ -65,14 +110,23 @@ class ValidationReport:
 
 
 def load_json(path: Path) -> Optional[dict]:
-    """JSONファイルの読み込み"""
+    """JSONファイルの読み込み (読み取り専用: context_corpus の共有オブジェクト)"""
     try:
+        if HAS_CONTEXT_CORPUS:
+            return context_corpus.load_json(path)
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except (json.JSONDecodeError, FileNotFoundError) as e:
         return None
 
 
+def _path_exists(rel_path: str) -> bool:
+    """PROJECT_ROOT 相対パスの存在確認 (path_index があればスナップショットから応答)"""
+    if HAS_PATH_INDEX:
+        return path_index.get_index(PROJECT_ROOT).exists(rel_path)
+    return (PROJECT_ROOT / rel_path).exists()
+
+
 def get_src_feature_dirs() -> set:
     """src/features/ 配下のディレクトリ名一覧を取得"""
     if not FEATURES_SRC_DIR.exists():
@@ -323,8 +377,7 @@ def d7_related_code_path_validity(registry: dict) -> CheckResult:
             if not isinstance(p, str):
                 continue
             total_paths += 1
-            full_path = PROJECT_ROOT / p
-            if full_path.exists():
+            if _path_exists(p):
                 valid_paths += 1
             else:
                 result.passed = False
@@ -372,19 +425,88 @@ def d8_orphan_spec_detection(registry: dict) -> CheckResult:
     return result
 
 
-def run_all_checks(registry: dict) -> ValidationReport:
-    """全8項目の検証を実行"""
+def d9_context_json_schema_compliance(registry: dict) -> CheckResult:
+    """D9: 各 CONTEXT.json が context_schema.json に準拠すること (情報提供のみ)"""
+    result = CheckResult(
+        id="D9", name="CONTEXT.json Schema Compliance",
+        severity="Warning", passed=True
+    )
+    if not HAS_SCHEMA_COMPILER:
+        result.details.append("schema_compiler が読み込めないためスキップ")
+        return result
+    try:
+        validator = schema_compiler.load_validator(CONTEXT_SCHEMA_PATH)
+    except (OSError, ValueError) as e:
+        # ValueError: JSON 不正 / SchemaCompileError (jsonschema 未インストールかつコンパイル不可)
+        result.details.append(f"{CONTEXT_SCHEMA_PATH.relative_to(PROJECT_ROOT)} を読み込めないためスキップ: {e}")
+        return result
+
+    mappings = registry.get("mappings", {})
+    for src_name, doc_id in sorted(mappings.items()):
+        context_path = FEATURES_DOCS_DIR / doc_id / "CONTEXT.json"
+        if not context_path.exists():
+            continue  # D4 で報告
+
+        ctx = load_json(context_path)
+        if ctx is None:
+            continue  # D4 で報告
+
+        result.total += 1
+        errors = validator.iter_errors(ctx)
+        if not errors:
+            result.ok_count += 1
+            continue
+        result.passed = False
+        for e in errors[:D9_MAX_DETAILS_PER_FILE]:
+            path = " > ".join(str(p) for p in e.absolute_path) or "(root)"
+            result.details.append(f"docs/features/{doc_id}/CONTEXT.json [{path}] {e.message}")
+        if len(errors) > D9_MAX_DETAILS_PER_FILE:
+            result.details.append(
+                f"docs/features/{doc_id}/CONTEXT.json: 他 {len(errors) - D9_MAX_DETAILS_PER_FILE} 件"
+            )
+    return result
+
+
+def _cached_d5(registry: dict, cache) -> CheckResult:
+    """D5 を index.md + mappings をキーに結果キャッシュ経由で実行"""
+    mappings_key = json.dumps(registry.get("mappings", {}), sort_keys=True, ensure_ascii=False)
+    check, hit = cache.cached(
+        "docs-consistency/D5", (INDEX_MD_PATH, mappings_key), script_version(__file__),
+        lambda: d5_index_md_feature_completeness(registry),
+        encode=asdict, decode=lambda d: CheckResult(**d))
+    check.cached = hit
+    return check
+
+
+def run_all_checks(registry: dict, scope=None, cache=None) -> ValidationReport:
+    """全9項目の検証を実行
+
+    scope (changed_scope.ChangeScope) 指定時、Feature単位の D2/D3/D4/D6/D7/D9 は
+    影響 Feature のみ検証する。全体チェック D1/D5/D8 は常に全件。
+    cache (check_cache.CheckCache) 指定時、入力ファイルの純関数である D5 は
+    入力不変なら保存済みの結果を返す (CheckResult.cached=True)。
+    """
     report = ValidationReport()
 
+    scoped = registry
+    if scope is not None and not scope.full:
+        mappings = registry.get("mappings", {})
+        scoped = {**registry, "mappings": {
+            src_name: doc_id for src_name, doc_id in mappings.items() if scope.includes(doc_id)
+        }}
+    if scope is not None:
+        report.scope = scope.describe()
+
     checks = [
         d1_feature_directory_coverage(registry),
-        d2_spec_directory_existence(registry),
-        d3_spec_file_existence(registry),
-        d4_context_json_required_fields(registry),
-        d5_index_md_feature_completeness(registry),
-        d6_spec_minimum_structure(registry),
-        d7_related_code_path_validity(registry),
+        d2_spec_directory_existence(scoped),
+        d3_spec_file_existence(scoped),
+        d4_context_json_required_fields(scoped),
+        _cached_d5(registry, cache) if cache is not None else d5_index_md_feature_completeness(registry),
+        d6_spec_minimum_structure(scoped),
+        d7_related_code_path_validity(scoped),
         d8_orphan_spec_detection(registry),
+        d9_context_json_schema_compliance(scoped),
     ]
 
     for check in checks:
@@ -403,6 +525,9 @@ def run_all_checks(registry: dict) -> ValidationReport:
 def print_report_text(report: ValidationReport) -> None:
     """テキスト形式でレポート出力"""
     print()
+    if report.scope:
+        print(f"  Scope: {report.scope}")
+        print()
     mvs_count = sum(1 for r in report.results if r.severity == "MVS")
     tier_count = sum(1 for r in report.results if r.severity == "Tier")
     warn_count = sum(1 for r in report.results if r.severity == "Warning")
@@ -422,6 +547,8 @@ def print_report_text(report: ValidationReport) -> None:
         count_info = ""
         if r.total > 0:
             count_info = f"  ({r.ok_count}/{r.total})"
+        if r.cached:
+            count_info += "  (cache)"
 
         print(f"  {r.id} {r.name:<30s} {icon}{count_info}")
 
@@ -458,6 +585,7 @@ def print_report_json(report: ValidationReport) -> None:
         "mvs_failures": report.mvs_failures,
         "tier_failures": report.tier_failures,
         "warnings": report.warnings,
+        "scope": report.scope,
         "results": [
             {
                 "id": r.id,
@@ -467,6 +595,7 @@ def print_report_json(report: ValidationReport) -> None:
                 "total": r.total,
                 "ok_count": r.ok_count,
                 "details": r.details,
+                "cached": r.cached,
             }
             for r in report.results
         ],
@@ -482,10 +611,15 @@ def main() -> None:
 例:
   python3 scripts/validate_docs_consistency.py
   python3 scripts/validate_docs_consistency.py --json
+  python3 scripts/validate_docs_consistency.py --staged
         """,
     )
     parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+    parser.add_argument("--no-cache", action="store_true", help="結果キャッシュを使わず全チェックを実行")
+    if HAS_CHANGED_SCOPE:
+        changed_scope.add_scope_arguments(parser)
     args = parser.parse_args()
+    scope = changed_scope.scope_from_args(args, parser) if HAS_CHANGED_SCOPE else None
 
     # feature-registry.json 読み込み
     registry = load_json(REGISTRY_PATH)
@@ -494,7 +628,13 @@ def main() -> None:
         sys.exit(1)
 
     # 検証実行
-    report = run_all_checks(registry)
+    cache = CheckCache() if HAS_CHECK_CACHE and not args.no_cache else None
+    report = run_all_checks(registry, scope, cache)
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: 結果キャッシュ保存失敗: {e}", file=sys.stderr)
 
     # レポート出力
     if args.json:
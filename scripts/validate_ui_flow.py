@@ -10,20 +10,21 @@ UI Flow Graph Validator — ui-flow.json の構造・整合性を検証するス
 使用法:
     python3 scripts/validate_ui_flow.py docs/ui-flow/ui-flow.json
     python3 scripts/validate_ui_flow.py docs/ui-flow/ui-flow.json --json
+    python3 scripts/validate_ui_flow.py docs/ui-flow/ui-flow.json --no-cache   # 結果キャッシュを使わない
 """
 
 import argparse
 import json
 import sys
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Optional
 
 try:
     from jsonschema import Draft202012Validator
+    HAS_JSONSCHEMA = True
 except ImportError:
-    print("❌ jsonschema パッケージが必要です: pip install jsonschema")
-    sys.exit(1)
+    HAS_JSONSCHEMA = False
 
 # プロジェクトルート
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -31,6 +32,33 @@ SCHEMA_PATH = PROJECT_ROOT / "docs" / "ui-flow" / "ui-flow.schema.json"
 FEATURES_DIR = PROJECT_ROOT / "src" / "features"
 PAGE_TSX = PROJECT_ROOT / "src" / "app" / "page.tsx"
 
+# 入力ハッシュによる結果キャッシュ (入力が変わらなければチェックを実行しない)
+sys.path.insert(0, str(PROJECT_ROOT / ".quality" / "scripts"))
+try:
+    from check_cache import CheckCache, Listing, script_version
+    HAS_CHECK_CACHE = True
+except ImportError:
+    HAS_CHECK_CACHE = False
+
+# orjson があれば高速パース (出力書式は標準 json と同一)
+try:
+    import json_codec
+    HAS_JSON_CODEC = True
+except ImportError:
+    HAS_JSON_CODEC = False
+
+# スキーマからコンパイルした検証コード (jsonschema と同一エラー, 数十倍高速)
+SCHEMA_COMPILER_PATH = PROJECT_ROOT / ".quality" / "scripts" / "schema_compiler.py"
+try:
+    from schema_compiler import SchemaCompileError, get_validator
+    HAS_SCHEMA_COMPILER = True
+except ImportError:
+    HAS_SCHEMA_COMPILER = False
+
+if not (HAS_JSONSCHEMA or HAS_SCHEMA_COMPILER):
+    print("❌ jsonschema パッケージが必要です: pip install jsonschema")
+    sys.exit(1)
+
 # 期待値定数
 EXPECTED_STATES = {"idle", "analyzing", "explaining", "diffReady", "quizzing", "complete"}
 EXPECTED_PANELS = {
@@ -54,6 +82,7 @@ class CheckResult:
     severity: str  # "MVS" | "Tier" | "Warning"
     passed: bool
     details: list = field(default_factory=list)
+    cached: bool = False  # 結果キャッシュから返した (チェック未実行)
 
 
 @dataclass
@@ -77,16 +106,43 @@ class ValidationReport:
 def load_json(path: Path) -> Optional[dict]:
     """JSONファイルの読み込み"""
     try:
+        if HAS_JSON_CODEC:
+            return json_codec.load_path(path)
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except (json.JSONDecodeError, FileNotFoundError) as e:
         return None
 
 
+# 常駐プロセス (validation_daemon.py) 向け: 同一スキーマ dict のコンパイル済み Validator を再利用
+_VALIDATOR_CACHE: dict = {}
+
+
+def _schema_validator(schema: dict):
+    """schema_compiler の検証器 (コンパイル不可なら jsonschema)。
+
+    どちらも使えなければ SchemaCompileError。
+    """
+    cached = _VALIDATOR_CACHE.get("schema")
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    if HAS_SCHEMA_COMPILER:
+        validator = get_validator(schema)
+    else:
+        validator = Draft202012Validator(schema)
+    _VALIDATOR_CACHE["schema"] = (schema, validator)
+    return validator
+
+
 def v1_schema_validation(data: dict, schema: dict) -> CheckResult:
     """V1: JSON Schema構造検証"""
     result = CheckResult(id="V1", name="JSON Schema構造検証", severity="MVS", passed=True)
-    validator = Draft202012Validator(schema)
+    try:
+        validator = _schema_validator(schema)
+    except SchemaCompileError as e:
+        result.passed = False
+        result.details.append(f"スキーマを検証できません (jsonschema 未インストール): {e}")
+        return result
     errors = list(validator.iter_errors(data))
     if errors:
         result.passed = False
@@ -287,26 +343,54 @@ def v12_user_actions_handler_exists(data: dict) -> CheckResult:
     return result
 
 
-def run_all_checks(data: dict, schema: dict) -> ValidationReport:
-    """全12項目の検証を実行"""
+def _check_inputs(check_id: str) -> tuple:
+    """ui-flow.json 以外に各チェックが読む入力 (結果キャッシュのキー)"""
+    if check_id == "V1":
+        return (SCHEMA_PATH,)
+    if check_id == "V8":
+        return (Listing(FEATURES_DIR),)
+    if check_id == "V12":
+        return (PAGE_TSX,)
+    return ()
+
+
+def run_all_checks(data: dict, schema: dict, cache=None,
+                   target_path: Optional[Path] = None) -> ValidationReport:
+    """全12項目の検証を実行
+
+    cache (check_cache.CheckCache) 指定時は target_path (data の読み込み元) と
+    各チェックの入力が前回と同一なら保存済みの結果を返す (CheckResult.cached=True)。
+    schema は SCHEMA_PATH から読み込んだものであること。
+    """
     report = ValidationReport(file_path="ui-flow.json")
 
     checks = [
-        v1_schema_validation(data, schema),
-        v2_statechart_completeness(data),
-        v3_panels_completeness(data),
-        v4_phases_completeness(data),
-        v5_sse_mapping_completeness(data),
-        v6_sse_panel_ref_integrity(data),
-        v7_phase_panel_ref_integrity(data),
-        v8_panel_feature_dir_exists(data),
-        v9_transition_coverage(data),
-        v10_xstate_compatibility(data),
-        v11_auto_scroll_ref_integrity(data),
-        v12_user_actions_handler_exists(data),
+        ("V1", lambda: v1_schema_validation(data, schema)),
+        ("V2", lambda: v2_statechart_completeness(data)),
+        ("V3", lambda: v3_panels_completeness(data)),
+        ("V4", lambda: v4_phases_completeness(data)),
+        ("V5", lambda: v5_sse_mapping_completeness(data)),
+        ("V6", lambda: v6_sse_panel_ref_integrity(data)),
+        ("V7", lambda: v7_phase_panel_ref_integrity(data)),
+        ("V8", lambda: v8_panel_feature_dir_exists(data)),
+        ("V9", lambda: v9_transition_coverage(data)),
+        ("V10", lambda: v10_xstate_compatibility(data)),
+        ("V11", lambda: v11_auto_scroll_ref_integrity(data)),
+        ("V12", lambda: v12_user_actions_handler_exists(data)),
     ]
-
-    for check in checks:
+    if target_path is None:
+        cache = None  # 入力元が不明ならキャッシュしない
+    # V1 はコンパイル済み検証コードで実行するため、コンパイラの変更でも無効化
+    version = script_version(__file__, SCHEMA_COMPILER_PATH) if cache is not None else None
+
+    for check_id, run_check in checks:
+        if cache is None:
+            check = run_check()
+        else:
+            check, hit = cache.cached(
+                f"ui-flow/{check_id}", (target_path, *_check_inputs(check_id)), version, run_check,
+                encode=asdict, decode=lambda d: CheckResult(**d))
+            check.cached = hit
         report.results.append(check)
         if not check.passed:
             if check.severity == "MVS":
@@ -332,6 +416,8 @@ def print_report_markdown(report: ValidationReport) -> None:
             icon = "⚠️"
         else:
             icon = "❌"
+        if r.cached:
+            icon += " (cache)"
         print(f"| {r.id} | {r.name} | {r.severity} | {icon} |")
 
     # 詳細（失敗項目のみ）
@@ -380,11 +466,15 @@ def print_report_json(report: ValidationReport) -> None:
                 "severity": r.severity,
                 "passed": r.passed,
                 "details": r.details,
+                "cached": r.cached,
             }
             for r in report.results
         ],
     }
-    print(json.dumps(output, ensure_ascii=False, indent=2))
+    if HAS_JSON_CODEC:
+        print(json_codec.dumps(output))
+    else:
+        print(json.dumps(output, ensure_ascii=False, indent=2))
 
 
 def main() -> None:
@@ -399,6 +489,7 @@ def main() -> None:
     )
     parser.add_argument("target", help="ui-flow.json ファイルパス")
     parser.add_argument("--json", action="store_true", help="JSON形式で出力")
+    parser.add_argument("--no-cache", action="store_true", help="結果キャッシュを使わず全チェックを実行")
     args = parser.parse_args()
 
     # ui-flow.json 読み込み
@@ -417,7 +508,13 @@ def main() -> None:
         sys.exit(1)
 
     # 検証実行
-    report = run_all_checks(data, schema)
+    cache = CheckCache() if HAS_CHECK_CACHE and not args.no_cache else None
+    report = run_all_checks(data, schema, cache, target_path)
+    if cache is not None:
+        try:
+            cache.save()
+        except OSError as e:
+            print(f"WARNING: 結果キャッシュ保存失敗: {e}", file=sys.stderr)
 
     # レポート出力
     if args.json: